@@ -0,0 +1,31 @@
+VSVersionInfo(
+  ffi=FixedFileInfo(
+    filevers=(3, 6, 1, 0),
+    prodvers=(3, 6, 1, 0),
+    mask=0x3F,
+    flags=0x0,
+    OS=0x40004,
+    fileType=0x1,
+    subtype=0x0,
+    date=(0, 0),
+  ),
+  kids=[
+    StringFileInfo(
+      [
+        StringTable(
+          '080404B0',
+          [
+            StringStruct('CompanyName', 'Virace'),
+            StringStruct('FileDescription', 'Lol Audio Unpack GUI'),
+            StringStruct('FileVersion', '3.6.1'),
+            StringStruct('InternalName', 'LolAudioUnpack'),
+            StringStruct('OriginalFilename', 'LolAudioUnpack.exe'),
+            StringStruct('ProductName', 'lol-audio-unpack'),
+            StringStruct('ProductVersion', '3.6.1'),
+          ],
+        )
+      ]
+    ),
+    VarFileInfo([VarStruct('Translation', [2052, 1200])]),
+  ],
+)
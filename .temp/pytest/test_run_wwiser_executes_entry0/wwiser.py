@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+out = Path(sys.argv[sys.argv.index('-dn') + 1])
+out.with_suffix('.xml').write_text('<root/>')
+with Path(__file__).with_name('calls.txt').open('a') as calls:
+    calls.write('x')
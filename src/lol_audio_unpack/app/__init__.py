@@ -10,8 +10,10 @@ from .types import (
     AppContext,
     AppContextValidationError,
     AppPaths,
+    ExtractFilterOptions,
     OperationOptions,
     RemoteSnapshotConfig,
+    RemoteWadMode,
     SourceMode,
     WavOutputOptions,
 )
@@ -21,11 +23,13 @@ __all__ = [
     "AppContext",
     "AppContextValidationError",
     "AppPaths",
+    "ExtractFilterOptions",
     "LolAudioUnpackApp",
     "OperationOptions",
     "RemoteEntityCallbackPayload",
     "RemoteEntityWorkItem",
     "RemoteSnapshotConfig",
+    "RemoteWadMode",
     "SourceMode",
     "WavOutputOptions",
     "create_app_context",
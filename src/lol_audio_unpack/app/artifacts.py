@@ -7,6 +7,7 @@ from pathlib import Path
 from lol_audio_unpack.app.path_layout import format_entity_folder_name, get_output_dir_name
 from lol_audio_unpack.manager.files import find_data_file
 from lol_audio_unpack.model import AudioEntityData
+from lol_audio_unpack.utils.columnar import COLUMNAR_SUFFIX
 
 from .types import AppContext
 
@@ -91,9 +92,9 @@ def resolve_mapping_path(
 
     suffix = ".yml" if dev_mode else ".msgpack"
     for base_path in base_paths:
-        candidate = base_path.with_suffix(suffix)
-        if candidate.exists():
-            return candidate
+        for candidate in (base_path.with_suffix(suffix), base_path.with_suffix(COLUMNAR_SUFFIX)):
+            if candidate.exists():
+                return candidate
     return None
 
 
@@ -10,6 +10,7 @@ from loguru import logger
 from riotmanifest import LeagueManifestError, LeagueManifestResolver
 
 from lol_audio_unpack.config import (
+    DEFAULT_HIRC_STORE_MB,
     DEFAULT_REMOTE_LIVE_REGION,
     DEFAULT_SHARED_SETTINGS,
     SUPPORTED_SETTING_KEYS,
@@ -29,6 +30,7 @@ from .types import (
     AppPaths,
     OperationOptions,
     RemoteSnapshotConfig,
+    RemoteWadMode,
     SourceMode,
     WavOutputOptions,
 )
@@ -76,6 +78,51 @@ def _parse_source_mode(value: Any) -> SourceMode:
         raise AppContextValidationError(f"{SettingKey.SOURCE_MODE} 无效: {raw_value}，可选值: {valid_modes}") from exc
 
 
+def _parse_remote_wad_mode(value: Any) -> RemoteWadMode:
+    """解析远端 GAME WAD 准备方式。"""
+    if isinstance(value, RemoteWadMode):
+        return value
+
+    raw_value = str(value or RemoteWadMode.FULL.value).strip().lower()
+    try:
+        return RemoteWadMode(raw_value)
+    except ValueError as exc:
+        valid_modes = ", ".join(mode.value for mode in RemoteWadMode)
+        raise AppContextValidationError(
+            f"{SettingKey.REMOTE_WAD_MODE} 无效: {raw_value}，可选值: {valid_modes}"
+        ) from exc
+
+
+def _parse_cache_mb(value: Any, *, key: str, default: int = 0) -> int:
+    """解析磁盘缓存上限（MB），``0`` 表示关闭。"""
+    raw_value = str(value if value is not None else default).strip() or str(default)
+    try:
+        parsed = int(raw_value)
+    except ValueError as exc:
+        raise AppContextValidationError(f"{key} 必须是整数: {raw_value}") from exc
+    if parsed < 0:
+        raise AppContextValidationError(f"{key} 不能为负数: {parsed}")
+    return parsed
+
+
+def _parse_download_concurrency(value: Any) -> tuple[int, int] | None:
+    """解析 ``MIN-MAX`` 形式的自适应下载并发上下限，留空表示关闭。"""
+    raw_value = str(value if value is not None else "").strip()
+    if not raw_value:
+        return None
+    low_text, _, high_text = raw_value.partition("-")
+    try:
+        low = int(low_text)
+        high = int(high_text) if high_text else low
+    except ValueError as exc:
+        raise AppContextValidationError(
+            f"{SettingKey.REMOTE_DOWNLOAD_CONCURRENCY} 格式应为 MIN-MAX: {raw_value}"
+        ) from exc
+    if low < 1 or high < low:
+        raise AppContextValidationError(f"{SettingKey.REMOTE_DOWNLOAD_CONCURRENCY} 上下限不合法: {raw_value}")
+    return low, high
+
+
 def _normalize_live_region(value: Any) -> str:
     """标准化远端 live 区服。"""
     text = str(value or DEFAULT_REMOTE_LIVE_REGION).strip()
@@ -150,10 +197,52 @@ def _resolve_game_path(
     return _to_runtime_path(settings.get(SettingKey.GAME_PATH), SettingKey.GAME_PATH, runtime_root=runtime_root)
 
 
+def _resolve_offline_snapshot(*, offline_root: Path, version: str | None) -> RemoteSnapshotConfig:
+    """从离线镜像目录中已导入的快照记录解析远端快照。"""
+    # 延迟导入：runtime.remote 包在导入时依赖 app 层
+    from lol_audio_unpack.runtime.remote.offline import load_mirror_state  # noqa: PLC0415
+
+    state = load_mirror_state(offline_root)
+    target = normalize_patch_version(version) if version is not None else state["latest"]
+    snapshot = state["snapshots"].get(target) if target is not None else None
+    if snapshot is None:
+        imported = ", ".join(state["snapshots"]) or "无"
+        raise AppContextValidationError(
+            f"离线镜像 {offline_root} 中没有快照 {target or '(未导入)'}；已导入的版本: {imported}。"
+            "请先执行 `snapshot import` 导入对应的快照包。"
+        )
+    logger.info(f"使用离线镜像中的远端快照: version={target}, root={offline_root}")
+    return RemoteSnapshotConfig(
+        version=target,
+        lcu_manifest_url=snapshot["lcu_manifest_url"],
+        game_manifest_url=snapshot["game_manifest_url"],
+    )
+
+
+def _check_offline_wad_mode(*, offline_root: Path, version: str, wad_mode: RemoteWadMode) -> None:
+    """确认离线镜像中的快照包含当前 WAD 准备方式所需的 chunk。"""
+    # 延迟导入，原因同 _resolve_offline_snapshot
+    from lol_audio_unpack.runtime.remote.offline import load_mirror_state  # noqa: PLC0415
+
+    snapshot = load_mirror_state(offline_root)["snapshots"].get(version, {})
+    exported_mode = snapshot.get("remote_wad_mode")
+    if exported_mode is None:
+        logger.warning(f"离线镜像中的快照 {version} 未记录导出时的 remote_wad_mode，跳过一致性检查")
+        return
+    # entries 方式导出的包只含所需条目所在的 chunk，整包读取时其余区间都是空洞；full 方式导出的包两种方式都能用
+    if exported_mode == RemoteWadMode.ENTRIES.value and wad_mode is not RemoteWadMode.ENTRIES:
+        raise AppContextValidationError(
+            f"离线镜像 {offline_root} 中的快照 {version} 以 {SettingKey.REMOTE_WAD_MODE}=entries 导出，"
+            f"不能以 {SettingKey.REMOTE_WAD_MODE}={wad_mode.value} 使用；"
+            "请改用 entries，或以 full 方式重新导出并导入快照包。"
+        )
+
+
 def _build_snapshot(
     *,
     settings: Mapping[str, Any],
     source_mode: SourceMode,
+    offline_root: Path | None = None,
 ) -> RemoteSnapshotConfig | None:
     """根据原始设置构建远端快照配置。"""
     if source_mode is not SourceMode.REMOTE_SNAPSHOT:
@@ -162,6 +251,9 @@ def _build_snapshot(
     version = _to_optional_text(settings.get(SettingKey.REMOTE_VERSION))
     lcu_manifest_url = _to_optional_text(settings.get(SettingKey.REMOTE_LCU_MANIFEST_URL))
     game_manifest_url = _to_optional_text(settings.get(SettingKey.REMOTE_GAME_MANIFEST_URL))
+    if offline_root is not None and lcu_manifest_url is None and game_manifest_url is None:
+        # 离线镜像无法访问版本解析接口，只按已导入的快照记录解析
+        return _resolve_offline_snapshot(offline_root=offline_root, version=version)
     snapshot_fields = {
         SettingKey.REMOTE_VERSION: version,
         SettingKey.REMOTE_LCU_MANIFEST_URL: lcu_manifest_url,
@@ -232,7 +324,16 @@ def _build_config(*, settings: Mapping[str, Any], dev_mode: bool) -> AppConfig:
         source_mode=source_mode,
         runtime_root=runtime_root,
     )
-    remote_snapshot = _build_snapshot(settings=settings, source_mode=source_mode)
+    offline_root_raw = _to_optional_text(settings.get(SettingKey.REMOTE_OFFLINE_ROOT))
+    remote_offline_root = (
+        resolve_runtime_path(offline_root_raw, relative_to=runtime_root) if offline_root_raw is not None else None
+    )
+    remote_snapshot = _build_snapshot(settings=settings, source_mode=source_mode, offline_root=remote_offline_root)
+    remote_wad_mode = _parse_remote_wad_mode(settings.get(SettingKey.REMOTE_WAD_MODE))
+    if remote_offline_root is not None and remote_snapshot is not None:
+        _check_offline_wad_mode(
+            offline_root=remote_offline_root, version=remote_snapshot.version, wad_mode=remote_wad_mode
+        )
 
     game_region = str(settings.get(SettingKey.GAME_REGION, "zh_CN") or "zh_CN")
     if game_region.lower() == "en_us":
@@ -252,6 +353,14 @@ def _build_config(*, settings: Mapping[str, Any], dev_mode: bool) -> AppConfig:
         cleanup_remote=_parse_bool(settings.get(SettingKey.CLEANUP_REMOTE, True)),
         source_mode=source_mode,
         remote_snapshot=remote_snapshot,
+        remote_wad_mode=remote_wad_mode,
+        remote_chunk_cache_mb=_parse_cache_mb(
+            settings.get(SettingKey.REMOTE_CHUNK_CACHE_MB), key=SettingKey.REMOTE_CHUNK_CACHE_MB
+        ),
+        remote_download_concurrency=_parse_download_concurrency(
+            settings.get(SettingKey.REMOTE_DOWNLOAD_CONCURRENCY)
+        ),
+        remote_offline_root=remote_offline_root,
         group_by_type=_parse_bool(settings.get(SettingKey.GROUP_BY_TYPE, False)),
         with_bp_vo=_parse_bool(settings.get(SettingKey.WITH_BP_VO, False)),
         wwiser_path=(
@@ -259,6 +368,11 @@ def _build_config(*, settings: Mapping[str, Any], dev_mode: bool) -> AppConfig:
             if wwiser_path_raw
             else None
         ),
+        hirc_store_mb=_parse_cache_mb(
+            settings.get(SettingKey.HIRC_STORE_MB),
+            key=SettingKey.HIRC_STORE_MB,
+            default=DEFAULT_HIRC_STORE_MB,
+        ),
         dev_mode=dev_mode,
     )
 
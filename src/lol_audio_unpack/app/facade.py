@@ -7,33 +7,58 @@ Manager 与流程函数。
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import replace
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
 from riotmanifest import DecompressError, DownloadBatchError, DownloadError
 
 from lol_audio_unpack.manager import BinUpdater, DataReader, DataUpdater
 from lol_audio_unpack.mapping import (
+    REVERSE_INDEX_FILE_NAME,
+    AudioRef,
+    MappingDiffSummary,
+    ReverseIndex,
     build_all,
     build_champions,
     build_maps,
+    create_entity_mapper,
     describe_hirc_backend,
+    diff_mapping_versions,
+    refresh_reverse_index,
 )
-from lol_audio_unpack.model import AudioEntityData
+from lol_audio_unpack.model import AudioEntityData, generate_champion_tasks, generate_map_tasks
 from lol_audio_unpack.runtime.remote import RemotePreparer
+from lol_audio_unpack.runtime.remote.cleanup import prune_empty_tree
+from lol_audio_unpack.runtime.remote.offline import (
+    ChunkRecorder,
+    SnapshotExportResult,
+    SnapshotImportResult,
+    import_snapshot_bundle,
+    write_snapshot_bundle,
+)
+from lol_audio_unpack.runtime.remote.prefetch import DEFAULT_PREFETCH_BUDGET_BYTES, WadPrefetcher
+from lol_audio_unpack.runtime.remote.session import close_session, get_session
 from lol_audio_unpack.runtime.wav import TranscodeTarget, run_tree
-from lol_audio_unpack.unpack import unpack_all, unpack_champions, unpack_maps
+from lol_audio_unpack.unpack import ExtractPlan, plan_tasks, unpack_all, unpack_champions, unpack_maps
+from lol_audio_unpack.unpack.report import RunReportWriter, finish_run_report, open_run_report
+from lol_audio_unpack.utils.disk_usage import DirectoryUsageMonitor
 
 from .artifacts import resolve_audio_paths, resolve_mapping_path
 from .path_layout import get_output_dir_name
 from .remote import RemoteEntityCallbackPayload, RemoteEntityWorkItem
 from .targets import iter_entity_refs
-from .types import AppContext, OperationOptions, SourceMode
+from .types import AppContext, OperationOptions, RemoteWadMode, SourceMode
 
 DEFAULT_DOWNLOAD_RETRIES = 3
 DEFAULT_ENTITY_RETRIES = 3
 UPDATE_PREPARED_KEY = "update_data_prepared_force"
+DEFAULT_SCRATCH_BUDGET_BYTES = 20 * 1024 * 1024 * 1024
+# 并行工作项各自的最小运行目录位于 game_path 下的该子目录
+REMOTE_ITEMS_DIR_NAME = "items"
+SCRATCH_POLL_SECONDS = 1.0
 
 
 class LolAudioUnpackApp:
@@ -324,6 +349,70 @@ class LolAudioUnpackApp:
                     exc,
                 )
 
+    @staticmethod
+    def _plan_work_item_wads(
+        remote_preparer: RemotePreparer,
+        *,
+        reader: DataReader,
+        work_item: RemoteEntityWorkItem,
+    ) -> set[str]:
+        """规划单个实体工作项需要的原始 WAD 路径，不下载文件。"""
+        is_champion = work_item.entity_type == "champion"
+        return remote_preparer.plan_entity_wads(
+            reader=reader,
+            champion_ids=(work_item.entity_id,) if is_champion else None,
+            map_ids=(work_item.entity_id,) if not is_champion else None,
+            include_champions=is_champion,
+            include_maps=not is_champion,
+            need_extract=work_item.need_extract,
+            need_mapping=work_item.need_mapping,
+        )
+
+    def _register_wad_consumers(
+        self,
+        remote_preparer: RemotePreparer,
+        *,
+        reader: DataReader,
+        work_items: Sequence[RemoteEntityWorkItem],
+        budget_bytes: int,
+    ) -> None:
+        """登记全部工作项的 WAD 消费关系，让共享 WAD 保留到最后一个消费者完成。"""
+        plans: list[set[str]] = []
+        for work_item in work_items:
+            try:
+                plans.append(self._plan_work_item_wads(remote_preparer, reader=reader, work_item=work_item))
+            except Exception as exc:  # noqa: BLE001
+                # 规划失败的工作项不登记消费关系，它用到的 WAD 仍按原方式在处理后删除
+                logger.warning(
+                    "remote 实体 {} {} WAD 规划失败，不参与共享 WAD 保留：{}",
+                    work_item.entity_type,
+                    work_item.entity_id,
+                    exc,
+                )
+                plans.append(set())
+        remote_preparer.register_wad_consumers(plans, budget_bytes=budget_bytes)
+
+    def _submit_prefetch(
+        self,
+        prefetcher: WadPrefetcher,
+        remote_preparer: RemotePreparer,
+        *,
+        reader: DataReader,
+        work_items: Sequence[RemoteEntityWorkItem],
+    ) -> None:
+        """为后续实体工作项提交 WAD 预下载；规划失败只影响预下载本身。"""
+        for work_item in work_items:
+            try:
+                wad_paths = self._plan_work_item_wads(remote_preparer, reader=reader, work_item=work_item)
+                prefetcher.submit((work_item.entity_type, work_item.entity_id), wad_paths)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "remote 实体 {} {} 预下载提交失败，将在处理该实体时正常下载：{}",
+                    work_item.entity_type,
+                    work_item.entity_id,
+                    exc,
+                )
+
     def _raise_entity_failure(
         self,
         *,
@@ -422,6 +511,11 @@ class LolAudioUnpackApp:
         progress_callback: Callable[[int, int, str], None] | None = None,
         download_retry_attempts: int = DEFAULT_DOWNLOAD_RETRIES,
         entity_retry_attempts: int = DEFAULT_ENTITY_RETRIES,
+        prefetch_depth: int = 0,
+        prefetch_budget_bytes: int = DEFAULT_PREFETCH_BUDGET_BYTES,
+        retain_budget_bytes: int = 0,
+        parallel_items: int = 1,
+        scratch_budget_bytes: int = DEFAULT_SCRATCH_BUDGET_BYTES,
     ) -> None:
         """按实体拆批执行 remote 流程，并在每轮后清理远端产物。
 
@@ -438,9 +532,16 @@ class LolAudioUnpackApp:
             progress_callback: 每个实体处理结束后的可选进度回调。
             download_retry_attempts: 单次实体尝试内，WAD 下载类错误的最大重试次数。
             entity_retry_attempts: 单实体完整流程失败时的最大重试次数。
+            prefetch_depth: 当前实体解包/映射期间，后台提前下载后续多少个实体的 WAD；``0`` 表示关闭。
+            prefetch_budget_bytes: 预下载暂存 WAD 的总字节上限。
+            retain_budget_bytes: 逐实体清理时，仍被后续实体需要的共享 WAD 可保留的总字节数；
+                ``0`` 表示不保留，每个实体结束后删除其全部 WAD。
+            parallel_items: 同时执行的实体工作项数量；大于 1 时各实体使用独立的最小运行目录，
+                ``progress_callback`` 与 ``on_entity_complete`` 会在工作线程中调用。
+            scratch_budget_bytes: 并行执行时各实体最小运行目录的总字节上限；超出时暂缓启动新实体。
 
         Raises:
-            ValueError: 当前不是 ``remote_snapshot`` 模式。
+            ValueError: 当前不是 ``remote_snapshot`` 模式，或参数取值非法。
         """
         if self.ctx.config.source_mode is not SourceMode.REMOTE_SNAPSHOT:
             raise ValueError("仅 remote_snapshot 模式支持按实体拆批执行。")
@@ -448,6 +549,14 @@ class LolAudioUnpackApp:
             raise ValueError("download_retry_attempts 必须大于等于 1。")
         if entity_retry_attempts < 1:
             raise ValueError("entity_retry_attempts 必须大于等于 1。")
+        if prefetch_depth < 0:
+            raise ValueError("prefetch_depth 必须大于等于 0。")
+        if retain_budget_bytes < 0:
+            raise ValueError("retain_budget_bytes 必须大于等于 0。")
+        if parallel_items < 1:
+            raise ValueError("parallel_items 必须大于等于 1。")
+        if scratch_budget_bytes < 1:
+            raise ValueError("scratch_budget_bytes 必须大于等于 1。")
 
         if update_options is not None:
             self.update(update_options, target=update_target)
@@ -472,58 +581,324 @@ class LolAudioUnpackApp:
         logger.info(f"remote 模式启用单位驱动执行，共 {total_work_items} 个实体工作项。")
         reader = self._create_reader()
         remote_preparer = RemotePreparer(ctx=self.ctx)
+        retain_wads = retain_budget_bytes > 0 and self.ctx.config.cleanup_remote
+        if retain_wads:
+            self._register_wad_consumers(
+                remote_preparer,
+                reader=reader,
+                work_items=work_items,
+                budget_bytes=retain_budget_bytes,
+            )
+        prefetcher: WadPrefetcher | None = None
+        if prefetch_depth > 0:
+            if parallel_items > 1:
+                # 并行实体本身已让下载与解包重叠，不再额外预下载
+                logger.info("remote 并行执行实体时不启用 WAD 预下载。")
+            elif self.ctx.config.remote_wad_mode is RemoteWadMode.ENTRIES:
+                # 按条目准备只下载少量 chunk，整包预下载反而更慢
+                logger.info("remote_wad_mode=entries 时不启用 WAD 预下载。")
+            else:
+                prefetcher = WadPrefetcher(remote_preparer, budget_bytes=prefetch_budget_bytes)
+                logger.info(f"remote 预下载已启用：提前 {prefetch_depth} 个实体，预算 {prefetch_budget_bytes} 字节")
+        # 逐实体解包会多次调用 extract，整轮共用一个报告写入器，避免每个实体各写一份运行报告
+        run_report = open_run_report(self.ctx, reader.version) if extract_options is not None else None
+
+        try:
+            if parallel_items > 1:
+                self._run_work_items_parallel(
+                    work_items,
+                    reader=reader,
+                    parallel_items=parallel_items,
+                    scratch_budget_bytes=scratch_budget_bytes,
+                    retain_wads=retain_wads,
+                    extract_options=extract_options,
+                    mapping_options=mapping_options,
+                    on_entity_complete=on_entity_complete,
+                    progress_callback=progress_callback,
+                    download_retry_attempts=download_retry_attempts,
+                    entity_retry_attempts=entity_retry_attempts,
+                    run_report=run_report,
+                )
+            else:
+                self._run_work_items(
+                    work_items,
+                    reader=reader,
+                    remote_preparer=remote_preparer,
+                    prefetcher=prefetcher,
+                    prefetch_depth=prefetch_depth,
+                    retain_wads=retain_wads,
+                    extract_options=extract_options,
+                    mapping_options=mapping_options,
+                    on_entity_complete=on_entity_complete,
+                    progress_callback=progress_callback,
+                    download_retry_attempts=download_retry_attempts,
+                    entity_retry_attempts=entity_retry_attempts,
+                    run_report=run_report,
+                )
+        finally:
+            if run_report is not None:
+                finish_run_report(run_report, self.ctx)
+            if prefetcher is not None:
+                prefetcher.close()
+            if retain_wads:
+                # 中途失败时仍有 WAD 处于保留状态，撤销登记后统一清理
+                remote_preparer.clear_wad_consumers()
+                self.cleanup_remote_artifacts()
+            close_session(self.ctx.runtime_cache)
+
+        if mapping_options is not None:
+            # 逐实体映射时不刷新反向索引，整轮结束后统一汇总一次
+            refresh_reverse_index(self.ctx, reader.version)
+        logger.success(f"remote 实体工作流完成：共处理 {total_work_items} 个实体工作项")
 
-        for index, work_item in enumerate(work_items, start=1):
-            logger.info(
-                "remote 单位进度 {}/{}: {} {} (extract={}, mapping={})",
+    def _run_work_items(  # noqa: PLR0913
+        self,
+        work_items: list[RemoteEntityWorkItem],
+        *,
+        reader: DataReader,
+        remote_preparer: RemotePreparer,
+        prefetcher: WadPrefetcher | None,
+        prefetch_depth: int,
+        retain_wads: bool,
+        extract_options: OperationOptions | None,
+        mapping_options: OperationOptions | None,
+        on_entity_complete: Callable[[RemoteEntityCallbackPayload], None] | None,
+        progress_callback: Callable[[int, int, str], None] | None,
+        download_retry_attempts: int,
+        entity_retry_attempts: int,
+        run_report: RunReportWriter | None = None,
+    ) -> None:
+        """逐个执行实体工作项，并在当前实体处理期间预下载后续实体的 WAD。"""
+        for index in range(1, len(work_items) + 1):
+            self._run_work_item(
+                work_items,
                 index,
-                total_work_items,
-                work_item.entity_type,
-                work_item.entity_id,
-                work_item.need_extract,
-                work_item.need_mapping,
+                reader=reader,
+                remote_preparer=remote_preparer,
+                prefetcher=prefetcher,
+                prefetch_depth=prefetch_depth,
+                retain_wads=retain_wads,
+                extract_options=extract_options,
+                mapping_options=mapping_options,
+                on_entity_complete=on_entity_complete,
+                progress_callback=progress_callback,
+                download_retry_attempts=download_retry_attempts,
+                entity_retry_attempts=entity_retry_attempts,
+                run_report=run_report,
             )
 
-            for entity_attempt in range(1, entity_retry_attempts + 1):
-                is_champion = work_item.entity_type == "champion"
-                entity_data = self._build_entity_data(
-                    reader,
-                    entity_type=work_item.entity_type,
-                    entity_id=work_item.entity_id,
-                )
-                champion_ids = (work_item.entity_id,) if is_champion else None
-                map_ids = (work_item.entity_id,) if not is_champion else None
-                try:
-                    self._prepare_entity_wads(
-                        remote_preparer,
+    def _fork_item_context(self, work_item: RemoteEntityWorkItem) -> AppContext:
+        """为并行工作项构建使用独立最小运行目录的上下文。"""
+        game_path = self.ctx.config.game_path
+        item_game_path = game_path / REMOTE_ITEMS_DIR_NAME / f"{work_item.entity_type}_{work_item.entity_id}"
+        return AppContext(
+            config=replace(self.ctx.config, game_path=item_game_path),
+            paths=replace(
+                self.ctx.paths,
+                game_champion_path=item_game_path / self.ctx.paths.game_champion_path.relative_to(game_path),
+                game_maps_path=item_game_path / self.ctx.paths.game_maps_path.relative_to(game_path),
+                game_lcu_path=item_game_path / self.ctx.paths.game_lcu_path.relative_to(game_path),
+            ),
+            runtime_cache=RemotePreparer.fork_runtime_cache(self.ctx.runtime_cache),
+        )
+
+    def _run_isolated_work_item(
+        self,
+        work_items: list[RemoteEntityWorkItem],
+        index: int,
+        **run_options: Any,
+    ) -> None:
+        """在独立上下文中执行单个工作项，结束后回收其最小运行目录。"""
+        work_item = work_items[index - 1]
+        item_ctx = self._fork_item_context(work_item)
+        item_app = LolAudioUnpackApp(item_ctx)
+        logger.debug(f"remote 并行实体开始: {work_item.entity_type} {work_item.entity_id} -> {item_ctx.game_path}")
+        try:
+            item_app._run_work_item(
+                work_items,
+                index,
+                remote_preparer=RemotePreparer(ctx=item_ctx),
+                prefetcher=None,
+                prefetch_depth=0,
+                **run_options,
+            )
+        except Exception:
+            logger.error(f"remote 并行实体失败: {work_item.entity_type} {work_item.entity_id}")
+            raise
+        finally:
+            RemotePreparer.join_runtime_cache(item_ctx.runtime_cache, self.ctx.runtime_cache)
+            if self.ctx.config.cleanup_remote:
+                prune_empty_tree(item_ctx.game_path)
+        logger.debug(f"remote 并行实体完成: {work_item.entity_type} {work_item.entity_id}")
+
+    def _run_work_items_parallel(  # noqa: PLR0913
+        self,
+        work_items: list[RemoteEntityWorkItem],
+        *,
+        reader: DataReader,
+        parallel_items: int,
+        scratch_budget_bytes: int,
+        retain_wads: bool,
+        extract_options: OperationOptions | None,
+        mapping_options: OperationOptions | None,
+        on_entity_complete: Callable[[RemoteEntityCallbackPayload], None] | None,
+        progress_callback: Callable[[int, int, str], None] | None,
+        download_retry_attempts: int,
+        entity_retry_attempts: int,
+        run_report: RunReportWriter | None = None,
+    ) -> None:
+        """同时执行多个实体工作项，最小运行目录总占用超出预算时暂缓启动新实体。
+
+        任一实体重试耗尽后不再启动新实体，等待已启动的实体结束后抛出首个失败。
+        """
+        scratch_root = self.ctx.config.game_path / REMOTE_ITEMS_DIR_NAME
+        monitor = DirectoryUsageMonitor(scratch_root, label="remote_items", interval_seconds=SCRATCH_POLL_SECONDS)
+        running: dict[Future[None], RemoteEntityWorkItem] = {}
+        failure: BaseException | None = None
+
+        def collect(done: set[Future[None]]) -> None:
+            nonlocal failure
+            for future in done:
+                running.pop(future)
+                exc = future.exception()
+                if exc is not None and failure is None:
+                    failure = exc
+
+        logger.info(f"remote 并行执行实体：并发 {parallel_items}，最小运行目录预算 {scratch_budget_bytes} 字节")
+        monitor.start()
+        try:
+            with ThreadPoolExecutor(max_workers=parallel_items, thread_name_prefix="remote-item") as executor:
+                for index, work_item in enumerate(work_items, start=1):
+                    budget_logged = False
+                    while running and (len(running) >= parallel_items or monitor.current_bytes >= scratch_budget_bytes):
+                        if len(running) < parallel_items and not budget_logged:
+                            logger.info(
+                                f"最小运行目录占用 {monitor.current_bytes} 字节已达预算，"
+                                f"{work_item.entity_type} {work_item.entity_id} 等待运行中的实体完成"
+                            )
+                            budget_logged = True
+                        done, _ = wait(running, timeout=SCRATCH_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    if failure is not None:
+                        logger.warning("remote 并行实体已有失败，不再启动后续实体")
+                        break
+                    future = executor.submit(
+                        self._run_isolated_work_item,
+                        work_items,
+                        index,
                         reader=reader,
-                        champion_ids=champion_ids,
-                        map_ids=map_ids,
-                        include_champions=is_champion,
-                        include_maps=not is_champion,
-                        need_extract=work_item.need_extract,
-                        need_mapping=work_item.need_mapping,
+                        retain_wads=retain_wads,
+                        extract_options=extract_options,
+                        mapping_options=mapping_options,
+                        on_entity_complete=on_entity_complete,
+                        progress_callback=progress_callback,
                         download_retry_attempts=download_retry_attempts,
-                        work_item=work_item,
-                        entity_attempt=entity_attempt,
                         entity_retry_attempts=entity_retry_attempts,
+                        run_report=run_report,
                     )
+                    running[future] = work_item
+                collect(wait(running).done)
+        finally:
+            report = monitor.stop()
+            logger.info(f"remote 并行实体最小运行目录峰值占用 {report.peak_bytes} 字节")
+            if self.ctx.config.cleanup_remote:
+                prune_empty_tree(scratch_root)
+        if failure is not None:
+            raise failure
+
+    def _run_work_item(  # noqa: PLR0913
+        self,
+        work_items: list[RemoteEntityWorkItem],
+        index: int,
+        *,
+        reader: DataReader,
+        remote_preparer: RemotePreparer,
+        prefetcher: WadPrefetcher | None,
+        prefetch_depth: int,
+        retain_wads: bool,
+        extract_options: OperationOptions | None,
+        mapping_options: OperationOptions | None,
+        on_entity_complete: Callable[[RemoteEntityCallbackPayload], None] | None,
+        progress_callback: Callable[[int, int, str], None] | None,
+        download_retry_attempts: int,
+        entity_retry_attempts: int,
+        run_report: RunReportWriter | None = None,
+    ) -> None:
+        """按重试策略执行第 ``index`` 个（从 1 开始）实体工作项。"""
+        work_item = work_items[index - 1]
+        logger.info(
+            "remote 单位进度 {}/{}: {} {} (extract={}, mapping={})",
+            index,
+            len(work_items),
+            work_item.entity_type,
+            work_item.entity_id,
+            work_item.need_extract,
+            work_item.need_mapping,
+        )
 
-                    extract_output_paths: tuple[Path, ...] = ()
-                    mapping_output_path: Path | None = None
-                    if work_item.need_extract and extract_options is not None:
-                        self.extract(
-                            self._build_entity_options(
-                                extract_options,
-                                entity_type=work_item.entity_type,
-                                entity_id=work_item.entity_id,
-                            ),
-                            include_champions=is_champion,
-                            include_maps=not is_champion,
-                            prepare_remote=False,
+        for entity_attempt in range(1, entity_retry_attempts + 1):
+            is_champion = work_item.entity_type == "champion"
+            entity_data = self._build_entity_data(
+                reader,
+                entity_type=work_item.entity_type,
+                entity_id=work_item.entity_id,
+            )
+            champion_ids = (work_item.entity_id,) if is_champion else None
+            map_ids = (work_item.entity_id,) if not is_champion else None
+            try:
+                if prefetcher is not None:
+                    prefetcher.wait((work_item.entity_type, work_item.entity_id))
+                self._prepare_entity_wads(
+                    remote_preparer,
+                    reader=reader,
+                    champion_ids=champion_ids,
+                    map_ids=map_ids,
+                    include_champions=is_champion,
+                    include_maps=not is_champion,
+                    need_extract=work_item.need_extract,
+                    need_mapping=work_item.need_mapping,
+                    download_retry_attempts=download_retry_attempts,
+                    work_item=work_item,
+                    entity_attempt=entity_attempt,
+                    entity_retry_attempts=entity_retry_attempts,
+                )
+                if prefetcher is not None:
+                    # 当前实体的 WAD 已就位，后台下载与本实体的解包/映射重叠
+                    self._submit_prefetch(
+                        prefetcher,
+                        remote_preparer,
+                        reader=reader,
+                        work_items=work_items[index : index + prefetch_depth],
+                    )
+
+                extract_output_paths: tuple[Path, ...] = ()
+                mapping_output_path: Path | None = None
+                # 同一实体既要解包又要映射时合并为一次 WAD 读取，映射直接复用解包读出的 events bnk
+                run_mapping = work_item.need_mapping and mapping_options is not None
+                combine_mapping = run_mapping and work_item.need_extract and extract_options is not None
+                if work_item.need_extract and extract_options is not None:
+                    self.extract(
+                        self._build_entity_options(
+                            extract_options,
+                            entity_type=work_item.entity_type,
+                            entity_id=work_item.entity_id,
+                        ),
+                        include_champions=is_champion,
+                        include_maps=not is_champion,
+                        prepare_remote=False,
+                        mapping_options=self._build_entity_options(
+                            mapping_options,
+                            entity_type=work_item.entity_type,
+                            entity_id=work_item.entity_id,
                         )
-                        extract_output_paths = self._resolve_audio_paths(entity_data)
-                    if work_item.need_mapping and mapping_options is not None:
+                        if combine_mapping
+                        else None,
+                        refresh_index=False,
+                        run_report=run_report,
+                    )
+                    extract_output_paths = self._resolve_audio_paths(entity_data)
+                if run_mapping:
+                    if not combine_mapping:
                         self.mapping(
                             self._build_entity_options(
                                 mapping_options,
@@ -533,68 +908,84 @@ class LolAudioUnpackApp:
                             include_champions=is_champion,
                             include_maps=not is_champion,
                             prepare_remote=False,
+                            refresh_index=False,
                         )
-                        mapping_output_path = self._resolve_mapping_path(
+                    mapping_output_path = self._resolve_mapping_path(
+                        entity_type=work_item.entity_type,
+                        entity_id=work_item.entity_id,
+                        integrate_data=mapping_options.integrate_data,
+                    )
+                if progress_callback is not None:
+                    operation_name = "解包/映射"
+                    if work_item.need_extract and not work_item.need_mapping:
+                        operation_name = "解包"
+                    elif work_item.need_mapping and not work_item.need_extract:
+                        operation_name = "映射"
+                    progress_callback(
+                        index,
+                        len(work_items),
+                        f"{entity_data.entity_name} {operation_name}完成",
+                    )
+                if on_entity_complete is not None and (extract_output_paths or mapping_output_path is not None):
+                    on_entity_complete(
+                        RemoteEntityCallbackPayload(
                             entity_type=work_item.entity_type,
                             entity_id=work_item.entity_id,
-                            integrate_data=mapping_options.integrate_data,
-                        )
-                    if progress_callback is not None:
-                        operation_name = "解包/映射"
-                        if work_item.need_extract and not work_item.need_mapping:
-                            operation_name = "解包"
-                        elif work_item.need_mapping and not work_item.need_extract:
-                            operation_name = "映射"
-                        progress_callback(
-                            index,
-                            total_work_items,
-                            f"{entity_data.entity_name} {operation_name}完成",
+                            audio_output_paths=extract_output_paths,
+                            mapping_output_path=mapping_output_path,
                         )
-                    if on_entity_complete is not None and (extract_output_paths or mapping_output_path is not None):
-                        on_entity_complete(
-                            RemoteEntityCallbackPayload(
-                                entity_type=work_item.entity_type,
-                                entity_id=work_item.entity_id,
-                                audio_output_paths=extract_output_paths,
-                                mapping_output_path=mapping_output_path,
-                            )
-                        )
-                    break
-                except Exception as exc:
-                    if entity_attempt >= entity_retry_attempts:
-                        self._raise_entity_failure(
-                            work_item=work_item,
-                            entity_retry_attempts=entity_retry_attempts,
-                            exc=exc,
-                        )
-                    logger.warning(
-                        "remote 实体 {} {} 执行失败，准备重试 {}/{}：{}",
-                        work_item.entity_type,
-                        work_item.entity_id,
-                        entity_attempt + 1,
-                        entity_retry_attempts,
-                        exc,
                     )
-                finally:
-                    self.cleanup_remote_artifacts()
-
-        logger.success(f"remote 实体工作流完成：共处理 {total_work_items} 个实体工作项")
+                if retain_wads:
+                    remote_preparer.release_wad_consumer(index - 1)
+                break
+            except Exception as exc:
+                if entity_attempt >= entity_retry_attempts:
+                    self._raise_entity_failure(
+                        work_item=work_item,
+                        entity_retry_attempts=entity_retry_attempts,
+                        exc=exc,
+                    )
+                logger.warning(
+                    "remote 实体 {} {} 执行失败，准备重试 {}/{}：{}",
+                    work_item.entity_type,
+                    work_item.entity_id,
+                    entity_attempt + 1,
+                    entity_retry_attempts,
+                    exc,
+                )
+            finally:
+                self.cleanup_remote_artifacts()
 
     def update(self, opts: OperationOptions, *, target: str = "all") -> None:
         """执行更新流程。"""
+        try:
+            self._run_update(opts, target=target)
+        finally:
+            # 单独执行 update 时没有外层工作流收尾，这里关闭 remote 会话，输出下载统计并停止事件循环线程
+            close_session(self.ctx.runtime_cache)
+
+    def _run_update(self, opts: OperationOptions, *, target: str) -> None:
+        """执行更新流程，不关闭 remote 会话；供需要在同一会话内继续准备的流程复用。"""
         logger.info(
             f"开始执行更新流程：target={target}，英雄 {len(opts.champion_ids or ())} 个，"
             f"地图 {len(opts.map_ids or ())} 个，事件处理={'开启' if opts.process_events else '关闭'}"
         )
         remote_preparer = self.prepare_update_data(force_update=opts.force_update)
+        bin_payloads: dict[str, bytes] | None = None
         if remote_preparer is not None:
-            remote_preparer.prepare_bin_inputs(
+            # BIN 直接以内存形式交给 BinUpdater，不再经 bin_input 目录中转
+            bin_payloads = remote_preparer.extract_bin_payloads(
                 reader=self._create_reader(),
                 target=target,
                 champion_ids=opts.champion_ids,
                 map_ids=opts.map_ids,
             )
-        updater = BinUpdater(force_update=opts.force_update, process_events=opts.process_events, ctx=self.ctx)
+        updater = BinUpdater(
+            force_update=opts.force_update,
+            process_events=opts.process_events,
+            ctx=self.ctx,
+            bin_payloads=bin_payloads or None,
+        )
         updater.update(
             target=target,
             champion_ids=self._to_str_ids(opts.champion_ids),
@@ -669,6 +1060,9 @@ class LolAudioUnpackApp:
         prepare_remote: bool = True,
         progress_callback: Callable[[str, int, int, str], None] | None = None,
         persisted_wem_callback: Callable[[Path], None] | None = None,
+        mapping_options: OperationOptions | None = None,
+        refresh_index: bool = True,
+        run_report: RunReportWriter | None = None,
     ) -> None:
         """执行解包流程。
 
@@ -678,6 +1072,12 @@ class LolAudioUnpackApp:
             include_maps: 是否包含地图。
             prepare_remote: 是否在 remote 模式下预准备所需资源。
             progress_callback: 每个实体处理结束后的可选进度回调。
+            mapping_options: 提供时在同一轮中逐实体构建事件映射，复用解包已读出的 events bnk。
+            refresh_index: 同轮映射结束后是否刷新当前版本的反向索引。
+            run_report: 调用方持有的运行级报告写入器；为 ``None`` 时本次解包单独产出一份报告。
+
+        Raises:
+            ValueError: 同轮映射的 wwiser 配置无效时抛出。
         """
         reader = self._create_reader()
         remote_preparer = self._create_remote_preparer()
@@ -689,43 +1089,137 @@ class LolAudioUnpackApp:
                 include_champions=include_champions,
                 include_maps=include_maps,
             )
+
+        entity_done_callback = None
+        map_separately = False
+        if mapping_options is not None:
+            if opts.extract_filter is not None and opts.extract_filter.active:
+                # 选择性解包只读取部分容器，同轮映射会得到不完整的结果，这里改回解包后单独映射
+                logger.info("选择性解包只读取部分容器，事件映射将在解包结束后单独执行")
+                map_separately = True
+            elif mapping_options.mapping_executor == "process" and mapping_options.max_workers > 1:
+                # 同轮映射在解包线程内进行，无法使用多进程后端，改回解包后单独映射
+                logger.info("映射使用多进程后端，事件映射将在解包结束后单独执行")
+                map_separately = True
+            else:
+                if prepare_remote and remote_preparer is not None:
+                    remote_preparer.prepare_mapping_wads(
+                        reader=reader,
+                        champion_ids=opts.champion_ids,
+                        map_ids=opts.map_ids,
+                        include_champions=include_champions,
+                        include_maps=include_maps,
+                    )
+                entity_done_callback = create_entity_mapper(
+                    reader,
+                    ctx=self.ctx,
+                    integrate_data=mapping_options.integrate_data,
+                    max_workers=opts.max_workers,
+                    keep_bnk_cache=mapping_options.keep_bnk_cache,
+                    wwiser_workers=mapping_options.wwiser_workers,
+                    incremental=not mapping_options.rebuild_mapping,
+                    columnar=mapping_options.mapping_format == "columnar",
+                )
         logger.info(
             f"音频类型配置 - 包含: {list(self.ctx.config.include_types)}, 排除: {list(self.ctx.config.exclude_types)}"
         )
         logger.info(f"输出路径: {self.ctx.config.output_path}")
         logger.info(f"语言: {self.ctx.config.game_region}")
 
-        if opts.champion_ids is not None:
-            return unpack_champions(
-                reader=reader,
-                champion_ids=list(opts.champion_ids),
-                max_workers=opts.max_workers,
-                ctx=self.ctx,
-                progress_callback=progress_callback,
-                persisted_wem_callback=persisted_wem_callback,
-            )
-        if opts.map_ids is not None:
-            unpack_maps(
-                reader=reader,
-                map_ids=list(opts.map_ids),
-                max_workers=opts.max_workers,
-                ctx=self.ctx,
-                progress_callback=progress_callback,
-                persisted_wem_callback=persisted_wem_callback,
+        try:
+            if opts.champion_ids is not None:
+                unpack_champions(
+                    reader=reader,
+                    champion_ids=list(opts.champion_ids),
+                    max_workers=opts.max_workers,
+                    ctx=self.ctx,
+                    progress_callback=progress_callback,
+                    persisted_wem_callback=persisted_wem_callback,
+                    entity_yaml_report=opts.entity_yaml_report,
+                    extract_filter=opts.extract_filter,
+                    entity_done_callback=entity_done_callback,
+                    run_report=run_report,
+                )
+            elif opts.map_ids is not None:
+                unpack_maps(
+                    reader=reader,
+                    map_ids=list(opts.map_ids),
+                    max_workers=opts.max_workers,
+                    ctx=self.ctx,
+                    progress_callback=progress_callback,
+                    persisted_wem_callback=persisted_wem_callback,
+                    entity_yaml_report=opts.entity_yaml_report,
+                    extract_filter=opts.extract_filter,
+                    entity_done_callback=entity_done_callback,
+                    run_report=run_report,
+                )
+            else:
+                unpack_all(
+                    reader=reader,
+                    max_workers=opts.max_workers,
+                    include_champions=include_champions,
+                    include_maps=include_maps,
+                    ctx=self.ctx,
+                    progress_callback=progress_callback,
+                    persisted_wem_callback=persisted_wem_callback,
+                    entity_yaml_report=opts.entity_yaml_report,
+                    extract_filter=opts.extract_filter,
+                    entity_done_callback=entity_done_callback,
+                    run_report=run_report,
+                )
+        finally:
+            if entity_done_callback is not None:
+                entity_done_callback.close()
+
+        if entity_done_callback is not None and refresh_index:
+            refresh_reverse_index(self.ctx, reader.version)
+        if map_separately and mapping_options is not None:
+            self.mapping(
+                mapping_options,
+                include_champions=include_champions,
+                include_maps=include_maps,
+                prepare_remote=prepare_remote,
+                refresh_index=refresh_index,
             )
-            return
 
-        unpack_all(
-            reader=reader,
-            max_workers=opts.max_workers,
-            include_champions=include_champions,
-            include_maps=include_maps,
+    def plan_extract(
+        self,
+        opts: OperationOptions,
+        *,
+        include_champions: bool = True,
+        include_maps: bool = True,
+    ) -> ExtractPlan:
+        """预演解包流程，只读取 WAD 目录表与容器头部，不解压也不写出任何文件。
+
+        目标范围与 ``extract`` 保持一致；remote 模式下不会为预演下载 WAD，
+        本地尚不存在的 WAD 只统计容器数量。
+
+        Args:
+            opts: 解包操作选项。
+            include_champions: 是否包含英雄。
+            include_maps: 是否包含地图。
+
+        Returns:
+            ExtractPlan: 预演结果。
+        """
+        reader = self._create_reader()
+        if opts.champion_ids is not None:
+            tasks = generate_champion_tasks(reader, list(opts.champion_ids))
+        elif opts.map_ids is not None:
+            tasks = generate_map_tasks(reader, list(opts.map_ids))
+        else:
+            tasks = generate_champion_tasks(reader) if include_champions else []
+            tasks += generate_map_tasks(reader) if include_maps else []
+
+        return plan_tasks(
+            tasks,
+            reader,
             ctx=self.ctx,
-            progress_callback=progress_callback,
-            persisted_wem_callback=persisted_wem_callback,
+            max_workers=opts.max_workers,
+            extract_filter=opts.extract_filter,
         )
 
-    def mapping(
+    def mapping(  # noqa: PLR0913
         self,
         opts: OperationOptions,
         *,
@@ -733,8 +1227,12 @@ class LolAudioUnpackApp:
         include_maps: bool = True,
         prepare_remote: bool = True,
         progress_callback: Callable[[str, int, int, str], None] | None = None,
+        refresh_index: bool = True,
     ) -> None:
-        """执行映射流程。"""
+        """执行映射流程。
+
+        ``refresh_index`` 为 ``True`` 时，映射结束后重新汇总当前版本的反向索引。
+        """
         backend_label = self._describe_mapping_backend()
         reader = self._create_reader()
         remote_preparer = self._create_remote_preparer()
@@ -760,9 +1258,13 @@ class LolAudioUnpackApp:
                 integrate_data=opts.integrate_data,
                 ctx=self.ctx,
                 progress_callback=progress_callback,
+                keep_bnk_cache=opts.keep_bnk_cache,
+                executor=opts.mapping_executor,
+                wwiser_workers=opts.wwiser_workers,
+                incremental=not opts.rebuild_mapping,
+                columnar=opts.mapping_format == "columnar",
             )
-            return
-        if opts.map_ids is not None:
+        elif opts.map_ids is not None:
             build_maps(
                 reader=reader,
                 map_ids=list(opts.map_ids),
@@ -770,18 +1272,163 @@ class LolAudioUnpackApp:
                 integrate_data=opts.integrate_data,
                 ctx=self.ctx,
                 progress_callback=progress_callback,
+                keep_bnk_cache=opts.keep_bnk_cache,
+                executor=opts.mapping_executor,
+                wwiser_workers=opts.wwiser_workers,
+                incremental=not opts.rebuild_mapping,
+                columnar=opts.mapping_format == "columnar",
+            )
+        else:
+            build_all(
+                reader=reader,
+                max_workers=opts.max_workers,
+                include_champions=include_champions,
+                include_maps=include_maps,
+                integrate_data=opts.integrate_data,
+                ctx=self.ctx,
+                progress_callback=progress_callback,
+                keep_bnk_cache=opts.keep_bnk_cache,
+                executor=opts.mapping_executor,
+                wwiser_workers=opts.wwiser_workers,
+                incremental=not opts.rebuild_mapping,
+                columnar=opts.mapping_format == "columnar",
             )
-            return
 
-        build_all(
-            reader=reader,
-            max_workers=opts.max_workers,
-            include_champions=include_champions,
-            include_maps=include_maps,
-            integrate_data=opts.integrate_data,
-            ctx=self.ctx,
-            progress_callback=progress_callback,
+        if refresh_index:
+            # 反向索引覆盖整个版本目录，只映射部分实体时也要重新汇总一次
+            refresh_reverse_index(self.ctx, reader.version)
+
+    def export_snapshot(  # noqa: PLR0913
+        self,
+        output_path: Path,
+        opts: OperationOptions,
+        *,
+        target: str = "all",
+        include_champions: bool = True,
+        include_maps: bool = True,
+        base_paths: Sequence[Path] = (),
+    ) -> SnapshotExportResult:
+        """按计划实体执行一遍远端准备，把读取到的 manifest 与 chunk 写成离线快照包。
+
+        覆盖 update 所需的 LCU 文件与 BIN，以及 extract 与 mapping 所需的 GAME WAD。
+
+        Args:
+            output_path: 快照包输出路径。
+            opts: 实体范围等操作选项，语义与 ``update`` 相同。
+            target: update 阶段目标。
+            include_champions: 是否包含英雄 WAD。
+            include_maps: 是否包含地图 WAD。
+            base_paths: 作为增量基准的先前快照包；其中已有的内容不再写入。
+
+        Returns:
+            SnapshotExportResult: 写入的 chunk 数量与体积。
+
+        Raises:
+            ValueError: 当前不是 ``remote_snapshot`` 模式，或配置了离线镜像目录。
+        """
+        if self.ctx.config.source_mode is not SourceMode.REMOTE_SNAPSHOT:
+            raise ValueError("仅 remote_snapshot 模式支持导出快照包。")
+        if self.ctx.config.remote_offline_root is not None:
+            raise ValueError("导出快照包需要访问 CDN，不能与 REMOTE_OFFLINE_ROOT 同时使用。")
+
+        session = get_session(
+            self.ctx.runtime_cache,
+            download_concurrency=self.ctx.config.remote_download_concurrency,
         )
+        # chunk 暂存在输出目录旁，与快照包位于同一磁盘
+        recorder = ChunkRecorder(spool_dir=output_path.parent)
+        # 记录器需在创建准备器之前挂上，准备器据此改为逐 chunk 读取并停用 chunk 缓存
+        session.recorder = recorder
+        try:
+            # 导出需在同一会话内继续记录，不能让 update 收尾时关闭会话
+            self._run_update(opts, target=target)
+            work_items = self.build_work_items(
+                extract_options=opts,
+                mapping_options=opts,
+                extract_include_champions=include_champions,
+                extract_include_maps=include_maps,
+                mapping_include_champions=include_champions,
+                mapping_include_maps=include_maps,
+            )
+            reader = self._create_reader()
+            remote_preparer = RemotePreparer(ctx=self.ctx)
+            # 逐实体准备并随即清理，磁盘上同一时刻只保留一个实体的 WAD；chunk 已写入记录器
+            for work_item in work_items:
+                is_champion = work_item.entity_type == "champion"
+                remote_preparer.prepare_entity_wads(
+                    reader=reader,
+                    champion_ids=(work_item.entity_id,) if is_champion else None,
+                    map_ids=(work_item.entity_id,) if not is_champion else None,
+                    include_champions=is_champion,
+                    include_maps=not is_champion,
+                    need_extract=work_item.need_extract,
+                    need_mapping=work_item.need_mapping,
+                )
+                self.cleanup_remote_artifacts()
+            return write_snapshot_bundle(
+                output_path,
+                snapshot=remote_preparer.snapshot,
+                manifest_paths=remote_preparer.manifest_cache_paths(),
+                chunks=recorder,
+                wad_mode=self.ctx.config.remote_wad_mode,
+                base_paths=base_paths,
+            )
+        finally:
+            session.recorder = None
+            recorder.close()
+            self.cleanup_remote_artifacts()
+            close_session(self.ctx.runtime_cache)
+
+    @staticmethod
+    def import_snapshot(bundle_path: Path, mirror_root: Path) -> SnapshotImportResult:
+        """把快照包导入离线镜像目录，之后以 ``REMOTE_OFFLINE_ROOT`` 指向该目录即可离线运行。
+
+        导入不依赖运行上下文：首次导入前镜像目录中还没有可用的快照。
+
+        Args:
+            bundle_path: 快照包路径。
+            mirror_root: 离线镜像根目录。
+
+        Returns:
+            SnapshotImportResult: 导入的快照版本与 chunk 数量。
+
+        Raises:
+            SnapshotBundleError: 包格式不符或其基准尚未导入时抛出。
+        """
+        return import_snapshot_bundle(bundle_path, mirror_root)
+
+    def diff_mappings(self, old_version: str, new_version: str) -> MappingDiffSummary:
+        """逐实体对比两个版本的映射，并在 ``reports/<new_version>/`` 写出 JSONL 差异报告。
+
+        Args:
+            old_version: 旧版本号。
+            new_version: 新版本号。
+
+        Returns:
+            MappingDiffSummary: 对比汇总，包含报告路径。
+
+        Raises:
+            FileNotFoundError: 任一版本的映射目录不存在时抛出。
+        """
+        return diff_mapping_versions(self.ctx, old_version, new_version)
+
+    def query_audio_ids(self, audio_ids: Sequence[int]) -> dict[int, list[AudioRef]]:
+        """在当前版本的反向索引中查询音频 ID 的来源。
+
+        Args:
+            audio_ids: wem / 音频 ID 列表。
+
+        Returns:
+            dict[int, list[AudioRef]]: 每个音频 ID 对应的实体、子实体、类别与事件。
+
+        Raises:
+            FileNotFoundError: 当前版本尚未生成反向索引时抛出。
+        """
+        index_path = self.ctx.hash_path / self._create_reader().version / REVERSE_INDEX_FILE_NAME
+        if not index_path.exists():
+            raise FileNotFoundError(f"当前版本尚未生成反向索引，请先执行 mapping: {index_path}")
+        with ReverseIndex(index_path) as index:
+            return {audio_id: index.lookup(audio_id) for audio_id in audio_ids}
 
 
 __all__ = ["LolAudioUnpackApp", "RemoteEntityCallbackPayload", "RemoteEntityWorkItem"]
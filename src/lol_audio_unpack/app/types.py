@@ -7,6 +7,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from lol_audio_unpack.config.schema import DEFAULT_HIRC_STORE_MB
+
 
 class AppContextValidationError(ValueError):
     """应用上下文构建失败异常。"""
@@ -19,6 +21,15 @@ class SourceMode(str, Enum):
     REMOTE_SNAPSHOT = "remote_snapshot"
 
 
+class RemoteWadMode(str, Enum):
+    """远端 GAME WAD 的准备方式。"""
+
+    # 下载完整 WAD 文件
+    FULL = "full"
+    # 只下载目标条目所在的 chunk，写出精简 WAD
+    ENTRIES = "entries"
+
+
 @dataclass(frozen=True)
 class RemoteSnapshotConfig:
     """远端快照配置。"""
@@ -40,9 +51,14 @@ class AppConfig:
     cleanup_remote: bool = True
     source_mode: SourceMode = SourceMode.LOCAL_PATH
     remote_snapshot: RemoteSnapshotConfig | None = None
+    remote_wad_mode: RemoteWadMode = RemoteWadMode.FULL
+    remote_chunk_cache_mb: int = 0
+    remote_download_concurrency: tuple[int, int] | None = None
+    remote_offline_root: Path | None = None
     group_by_type: bool = False
     with_bp_vo: bool = False
     wwiser_path: Path | None = None
+    hirc_store_mb: int = DEFAULT_HIRC_STORE_MB
     dev_mode: bool = False
 
 
@@ -57,6 +73,24 @@ class WavOutputOptions:
     format: str = "pcm16"
 
 
+@dataclass(frozen=True)
+class ExtractFilterOptions:
+    """选择性解包过滤条件。
+
+    三类条件同时给出时取交集：``categories`` 先限定类别，
+    ``events`` 与 ``wem_ids`` 再限定最终写出的 WEM。
+    """
+
+    wem_ids: tuple[int, ...] = ()
+    events: tuple[str, ...] = ()
+    categories: tuple[str, ...] = ()
+
+    @property
+    def active(self) -> bool:
+        """是否设置了任意过滤条件。"""
+        return bool(self.wem_ids or self.events or self.categories)
+
+
 @dataclass(frozen=True)
 class AppPaths:
     """派生路径快照。"""
@@ -86,6 +120,13 @@ class OperationOptions:
     champion_ids: tuple[int, ...] | None = None
     map_ids: tuple[int, ...] | None = None
     wav_output: WavOutputOptions = field(default_factory=WavOutputOptions)
+    entity_yaml_report: bool = False
+    extract_filter: ExtractFilterOptions | None = None
+    keep_bnk_cache: bool = False
+    mapping_executor: str = "thread"
+    wwiser_workers: int = 0
+    rebuild_mapping: bool = False
+    mapping_format: str = "nested"
 
 
 @dataclass
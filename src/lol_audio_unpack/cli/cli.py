@@ -15,15 +15,32 @@ from .dispatch import (
     _has_mapping,
     _has_update,
     _has_wav,
+    _is_diff,
+    _is_plan,
+    _is_query,
+    _is_snapshot_export,
+    _is_snapshot_import,
     _log_top_error,
     run_extract,
+    run_extract_plan,
     run_mapping,
+    run_mapping_diff,
+    run_mapping_query,
     run_remote_workflow,
+    run_snapshot_export,
+    run_snapshot_import,
     run_update,
     run_wav,
 )
 from .parser import EntryMode, create_parser
-from .runtime import _apply_config_profile, _validate_config_argv, initialize_app, validate_args
+from .runtime import (
+    _apply_config_profile,
+    _validate_config_argv,
+    extract_mapping_subcommand,
+    extract_snapshot_subcommand,
+    initialize_app,
+    validate_args,
+)
 
 
 def _detect_mode(argv0: str) -> EntryMode:
@@ -43,16 +60,45 @@ def main() -> None:
         args = parser.parse_args(argv)
         if mode == "mapping" and not args.actions:
             args.actions = ["mapping"]
+        extract_mapping_subcommand(args, mode=mode)
+        extract_snapshot_subcommand(args)
 
         _validate_config_argv(argv)
         _apply_config_profile(args)
         validate_args(args, parser)
+        if _is_snapshot_import(args):
+            # 导入只写离线镜像目录；首次导入前镜像中没有快照，无法初始化运行上下文
+            run_snapshot_import(args)
+            return
 
         app_context = initialize_app(args)
         app = LolAudioUnpackApp(app_context)
         run_summary = get_or_create_run_summary(app_context.runtime_cache)
         summary_sink_id = attach_run_summary_sink(run_summary)
 
+        if _is_query(args):
+            # 查询只读取已生成的反向索引，不执行任何其他动作
+            run_mapping_query(args, app)
+            return
+        if _is_diff(args):
+            # 对比只读取两个版本已生成的映射文件
+            run_mapping_diff(args, app)
+            return
+
+        if _is_snapshot_export(args):
+            with run_summary.stage_context("snapshot_export", label="快照包导出"):
+                run_snapshot_export(args, app)
+            return
+
+        if _is_plan(args):
+            # 预演是纯只读的 dry-run，其余动作都会写盘或下载，这里一律不执行
+            skipped = [action for action in args.actions if action != "extract"]
+            if skipped:
+                logger.info(f"预演模式下跳过其他动作: {skipped}")
+            with run_summary.stage_context("extract_plan", label="解包预演"):
+                run_extract_plan(args, app)
+            return
+
         if app_context.config.source_mode is SourceMode.REMOTE_SNAPSHOT and (
             _has_extract(args) or _has_mapping(args)
         ):
@@ -72,7 +118,8 @@ def main() -> None:
         if _has_wav(args):
             with run_summary.stage_context("wav", label="WAV 转码"):
                 run_wav(args, app)
-        if _has_mapping(args):
+        # 同时请求 extract 时，映射已在解包阶段逐实体完成
+        if _has_mapping(args) and not _has_extract(args):
             with run_summary.stage_context("mapping", label="事件映射"):
                 run_mapping(args, app)
         app.cleanup_remote_artifacts()
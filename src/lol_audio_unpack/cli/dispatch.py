@@ -7,12 +7,16 @@ from __future__ import annotations
 
 import argparse
 import sys
+from pathlib import Path
 
 from loguru import logger
 
 from ..app.facade import LolAudioUnpackApp
 from ..app.targets import resolve_scope
 from ..config import SettingKey
+from ..runtime.remote.offline import SnapshotBundleError
+from ..utils.run_summary import record_runtime_note
+from ..utils.runtime_paths import resolve_runtime_path
 from .runtime import build_options, parse_int_ids, resolve_champion_ids
 
 
@@ -36,6 +40,31 @@ def _has_wav(args: argparse.Namespace) -> bool:
     return "wav" in getattr(args, "actions", [])
 
 
+def _is_query(args: argparse.Namespace) -> bool:
+    """返回是否只查询反向索引。"""
+    return getattr(args, "query_ids", None) is not None
+
+
+def _is_diff(args: argparse.Namespace) -> bool:
+    """返回是否只对比两个版本的映射。"""
+    return getattr(args, "diff_versions", None) is not None
+
+
+def _is_snapshot_export(args: argparse.Namespace) -> bool:
+    """返回是否导出离线快照包。"""
+    return getattr(args, "snapshot_export", None) is not None
+
+
+def _is_snapshot_import(args: argparse.Namespace) -> bool:
+    """返回是否导入离线快照包。"""
+    return getattr(args, "snapshot_import", None) is not None
+
+
+def _is_plan(args: argparse.Namespace) -> bool:
+    """返回是否只预演解包。"""
+    return bool(getattr(args, "plan", False)) and _has_extract(args)
+
+
 def _resolve_targets(
     args: argparse.Namespace,
     *,
@@ -127,6 +156,11 @@ def run_remote_workflow(args: argparse.Namespace, app: LolAudioUnpackApp) -> Non
         extract_include_maps=extract_include_maps,
         mapping_include_champions=extract_include_champions,
         mapping_include_maps=extract_include_maps,
+        prefetch_depth=args.remote_prefetch,
+        prefetch_budget_bytes=args.remote_prefetch_budget_mb * 1024 * 1024,
+        retain_budget_bytes=args.remote_retain_budget_mb * 1024 * 1024,
+        parallel_items=args.remote_parallel,
+        scratch_budget_bytes=args.remote_scratch_budget_mb * 1024 * 1024,
     )
 
 
@@ -175,12 +209,47 @@ def run_extract(args: argparse.Namespace, app: LolAudioUnpackApp) -> None:
         map_detail="指定地图音频",
     )
     _log_stage_start("音频解包", detail)
-    app.extract(
+    extract_options = build_options(args, champion_ids=champion_ids, map_ids=map_ids)
+    if not _has_mapping(args):
+        app.extract(extract_options, include_champions=include_champions, include_maps=include_maps)
+        _log_stage_done("音频解包", detail)
+        return
+
+    # extract 与 mapping 同时请求时合并为一轮，映射直接复用解包读出的 events bnk
+    logger.info("解包与事件映射合并执行，每个实体只读取一次 WAD")
+    try:
+        app.extract(
+            extract_options,
+            include_champions=include_champions,
+            include_maps=include_maps,
+            mapping_options=extract_options,
+        )
+    except ValueError as exc:
+        _log_mapping_error(exc)
+        sys.exit(1)
+    _log_stage_done("音频解包", detail)
+
+
+def run_extract_plan(args: argparse.Namespace, app: LolAudioUnpackApp) -> None:
+    """预演音频解包，输出逐实体与整轮的读写估算。"""
+    try:
+        champion_ids, map_ids = _resolve_targets(args, app=app)
+    except ValueError as exc:
+        logger.error(f"解包目标失败: {exc}")
+        return
+
+    _, include_champions, include_maps = _target_scope(champion_ids=champion_ids, map_ids=map_ids)
+    _log_stage_start("解包预演")
+    plan = app.plan_extract(
         build_options(args, champion_ids=champion_ids, map_ids=map_ids),
         include_champions=include_champions,
         include_maps=include_maps,
     )
-    _log_stage_done("音频解包", detail)
+    for entity_plan in plan.entities:
+        logger.info(entity_plan.format_line())
+    summary = plan.format_summary()
+    record_runtime_note(app.ctx.runtime_cache, "extract_plan", summary, label="解包预演")
+    _log_stage_done("解包预演", summary)
 
 
 def run_wav(args: argparse.Namespace, app: LolAudioUnpackApp) -> None:
@@ -261,17 +330,106 @@ def run_mapping(
     _log_stage_done("事件映射", detail)
 
 
+def run_snapshot_export(args: argparse.Namespace, app: LolAudioUnpackApp) -> None:
+    """按所选实体导出离线快照包，可指定先前的快照包作为增量基准。"""
+    output_text, *base_texts = args.snapshot_export
+    champion_ids, map_ids = _resolve_targets(args, app=app)
+    target, include_champions, include_maps = _target_scope(champion_ids=champion_ids, map_ids=map_ids)
+    detail = _target_detail(
+        champion_ids=champion_ids,
+        map_ids=map_ids,
+        all_detail="所有实体（英雄和地图）",
+        champion_detail="指定英雄",
+        map_detail="指定地图",
+    )
+    _log_stage_start("快照包导出", detail)
+    try:
+        result = app.export_snapshot(
+            Path(output_text),
+            build_options(args, champion_ids=champion_ids, map_ids=map_ids),
+            target=target,
+            include_champions=include_champions,
+            include_maps=include_maps,
+            base_paths=[Path(base_text) for base_text in base_texts],
+        )
+    except (FileNotFoundError, SnapshotBundleError, ValueError) as exc:
+        logger.error(f"快照包导出失败: {exc}")
+        sys.exit(1)
+    summary = (
+        f"{result.bundle_path}：chunk {result.chunk_count} 个（{result.chunk_bytes / 1024 / 1024:.1f} MB），"
+        f"基准中已有 {result.skipped_chunks} 个"
+    )
+    record_runtime_note(app.ctx.runtime_cache, "snapshot_export", summary, label="快照包导出")
+    _log_stage_done("快照包导出", summary)
+
+
+def run_snapshot_import(args: argparse.Namespace) -> None:
+    """把快照包导入 ``--remote-offline-root`` 指定的离线镜像目录。
+
+    导入在初始化运行上下文之前执行：首次导入前镜像目录中还没有可解析的快照。
+    """
+    mirror_root = resolve_runtime_path(args.remote_offline_root)
+    try:
+        result = LolAudioUnpackApp.import_snapshot(Path(args.snapshot_import[0]), mirror_root)
+    except (FileNotFoundError, SnapshotBundleError) as exc:
+        logger.error(f"快照包导入失败: {exc}")
+        sys.exit(1)
+    logger.success(
+        f"快照包导入完成：version={result.version}，chunk {result.chunk_count} 个；"
+        f"之后以 --source-mode remote_snapshot --remote-offline-root {mirror_root} 离线运行"
+    )
+
+
+def run_mapping_query(args: argparse.Namespace, app: LolAudioUnpackApp) -> None:
+    """在反向索引中查询音频 ID，逐条输出所属实体、子实体、类别与事件。"""
+    try:
+        results = app.query_audio_ids(args.query_ids)
+    except (FileNotFoundError, ValueError) as exc:
+        logger.error(f"反向索引查询失败: {exc}")
+        sys.exit(1)
+
+    for audio_id, refs in results.items():
+        if not refs:
+            logger.warning(f"{audio_id}: 未在反向索引中找到")
+            continue
+        for ref in refs:
+            logger.info(
+                f"{audio_id}: {ref.entity_type} {ref.entity_id} ({ref.entity_name}) "
+                f"/ {ref.sub_id} / {ref.category} / {ref.event}"
+            )
+
+
+def run_mapping_diff(args: argparse.Namespace, app: LolAudioUnpackApp) -> None:
+    """逐实体对比两个版本的映射，变化明细写入 JSONL 报告。"""
+    old_version, new_version = args.diff_versions
+    try:
+        app.diff_mappings(old_version, new_version)
+    except FileNotFoundError as exc:
+        logger.error(f"映射对比失败: {exc}")
+        sys.exit(1)
+
+
 __all__ = [
     "_has_extract",
     "_has_mapping",
     "_has_update",
     "_has_wav",
+    "_is_diff",
+    "_is_plan",
+    "_is_query",
+    "_is_snapshot_export",
+    "_is_snapshot_import",
     "_log_stage_done",
     "_log_stage_start",
     "_log_top_error",
     "run_extract",
+    "run_extract_plan",
     "run_mapping",
+    "run_mapping_diff",
+    "run_mapping_query",
     "run_remote_workflow",
+    "run_snapshot_export",
+    "run_snapshot_import",
     "run_update",
     "run_wav",
 ]
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from lol_audio_unpack.app.facade import DEFAULT_SCRATCH_BUDGET_BYTES
 from lol_audio_unpack.app.types import OperationOptions, SourceMode, WavOutputOptions
 from lol_audio_unpack.config import DEFAULT_REMOTE_LIVE_REGION, DEFAULT_SHARED_SETTINGS, SettingKey
+from lol_audio_unpack.runtime.remote.prefetch import DEFAULT_PREFETCH_BUDGET_BYTES
 from lol_audio_unpack.utils.runtime_paths import (
     RuntimePaths,
     detect_runtime_paths,
@@ -15,6 +17,11 @@ from lol_audio_unpack.utils.runtime_paths import (
 )
 
 DEFAULT_CLI_MAX_WORKERS = OperationOptions().max_workers
+DEFAULT_REMOTE_PREFETCH = 1
+DEFAULT_REMOTE_PREFETCH_BUDGET_MB = DEFAULT_PREFETCH_BUDGET_BYTES // (1024 * 1024)
+DEFAULT_REMOTE_RETAIN_BUDGET_MB = 8192
+DEFAULT_REMOTE_PARALLEL = 1
+DEFAULT_REMOTE_SCRATCH_BUDGET_MB = DEFAULT_SCRATCH_BUDGET_BYTES // (1024 * 1024)
 _DEFAULT_WAV_OPTIONS = WavOutputOptions()
 DEFAULT_WAV_WORKERS = _DEFAULT_WAV_OPTIONS.worker_count
 DEFAULT_WAV_TIMEOUT = _DEFAULT_WAV_OPTIONS.timeout_seconds
@@ -10,8 +10,15 @@ import argparse
 from typing import Literal
 
 from .. import __version__
-from ..app.types import SourceMode
-from .invocation import DEFAULT_CLI_MAX_WORKERS
+from ..app.types import RemoteWadMode, SourceMode
+from .invocation import (
+    DEFAULT_CLI_MAX_WORKERS,
+    DEFAULT_REMOTE_PARALLEL,
+    DEFAULT_REMOTE_PREFETCH,
+    DEFAULT_REMOTE_PREFETCH_BUDGET_MB,
+    DEFAULT_REMOTE_RETAIN_BUDGET_MB,
+    DEFAULT_REMOTE_SCRATCH_BUDGET_MB,
+)
 from .text import text
 
 EntryMode = Literal["unpack", "mapping"]
@@ -40,6 +47,41 @@ def _create_shared_parser() -> argparse.ArgumentParser:
         metavar="N",
         help=text("help.max_workers"),
     )
+    parser.add_argument(
+        "--remote-prefetch",
+        type=int,
+        default=DEFAULT_REMOTE_PREFETCH,
+        metavar="N",
+        help=text("help.remote_prefetch"),
+    )
+    parser.add_argument(
+        "--remote-prefetch-budget-mb",
+        type=int,
+        default=DEFAULT_REMOTE_PREFETCH_BUDGET_MB,
+        metavar="MB",
+        help=text("help.remote_prefetch_budget_mb"),
+    )
+    parser.add_argument(
+        "--remote-retain-budget-mb",
+        type=int,
+        default=DEFAULT_REMOTE_RETAIN_BUDGET_MB,
+        metavar="MB",
+        help=text("help.remote_retain_budget_mb"),
+    )
+    parser.add_argument(
+        "--remote-parallel",
+        type=int,
+        default=DEFAULT_REMOTE_PARALLEL,
+        metavar="N",
+        help=text("help.remote_parallel"),
+    )
+    parser.add_argument(
+        "--remote-scratch-budget-mb",
+        type=int,
+        default=DEFAULT_REMOTE_SCRATCH_BUDGET_MB,
+        metavar="MB",
+        help=text("help.remote_scratch_budget_mb"),
+    )
     parser.add_argument(
         "-f",
         "--force",
@@ -134,6 +176,33 @@ def _create_shared_parser() -> argparse.ArgumentParser:
         metavar="URL",
         help=text("help.remote_game_manifest_url"),
     )
+    config_group.add_argument(
+        "--remote-wad-mode",
+        choices=[RemoteWadMode.FULL.value, RemoteWadMode.ENTRIES.value],
+        help=text("help.remote_wad_mode"),
+    )
+    config_group.add_argument(
+        "--remote-chunk-cache-mb",
+        type=int,
+        metavar="MB",
+        help=text("help.remote_chunk_cache_mb"),
+    )
+    config_group.add_argument(
+        "--remote-download-concurrency",
+        metavar="MIN-MAX",
+        help=text("help.remote_download_concurrency"),
+    )
+    config_group.add_argument(
+        "--remote-offline-root",
+        metavar="PATH",
+        help=text("help.remote_offline_root"),
+    )
+    config_group.add_argument(
+        "--hirc-store-mb",
+        type=int,
+        metavar="MB",
+        help=text("help.hirc_store_mb"),
+    )
     return parser
 
 
@@ -278,6 +347,20 @@ def create_parser(mode: EntryMode = "unpack") -> argparse.ArgumentParser:
         wav_timeout=None,
         wav_retries=None,
         wav_format=None,
+        entity_yaml_report=None,
+        wem_ids=None,
+        events=None,
+        categories=None,
+        plan=None,
+        keep_bnk_cache=None,
+        mapping_executor=None,
+        wwiser_workers=None,
+        rebuild_mapping=None,
+        mapping_format=None,
+        query_ids=None,
+        diff_versions=None,
+        snapshot_export=None,
+        snapshot_import=None,
     )
     parser.add_argument(
         "--integrate-data",
@@ -285,6 +368,53 @@ def create_parser(mode: EntryMode = "unpack") -> argparse.ArgumentParser:
         default=None,
         help=text("help.mapping.integrate_data_global"),
     )
+    parser.add_argument(
+        "--keep-bnk-cache",
+        action="store_true",
+        default=None,
+        help=text("help.mapping.keep_bnk_cache"),
+    )
+    parser.add_argument(
+        "--mapping-executor",
+        choices=("thread", "process"),
+        default=None,
+        help=text("help.mapping.executor"),
+    )
+    parser.add_argument(
+        "--wwiser-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help=text("help.mapping.wwiser_workers"),
+    )
+    parser.add_argument(
+        "--rebuild-mapping",
+        action="store_true",
+        default=None,
+        help=text("help.mapping.rebuild_mapping"),
+    )
+    parser.add_argument(
+        "--mapping-format",
+        choices=("nested", "columnar"),
+        default=None,
+        help=text("help.mapping.format"),
+    )
+    parser.add_argument(
+        "--entity-yaml-report",
+        action="store_true",
+        default=None,
+        help=text("help.extract.entity_yaml_report"),
+    )
+    parser.add_argument("--wem-ids", default=None, metavar="IDs", help=text("help.extract.wem_ids"))
+    parser.add_argument("--event", dest="events", default=None, metavar="NAMES", help=text("help.extract.events"))
+    parser.add_argument(
+        "--category",
+        dest="categories",
+        default=None,
+        metavar="GLOBS",
+        help=text("help.extract.categories"),
+    )
+    parser.add_argument("--plan", action="store_true", default=None, help=text("help.extract.plan"))
     parser.add_argument("--wav-workers", type=int, default=None, metavar="N", help=text("help.wav_workers"))
     parser.add_argument(
         "--wav-timeout",
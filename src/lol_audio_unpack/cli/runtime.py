@@ -14,7 +14,14 @@ from loguru import logger
 
 from .. import setup_app
 from ..app.facade import LolAudioUnpackApp
-from ..app.types import AppContext, AppContextValidationError, OperationOptions, SourceMode, WavOutputOptions
+from ..app.types import (
+    AppContext,
+    AppContextValidationError,
+    ExtractFilterOptions,
+    OperationOptions,
+    SourceMode,
+    WavOutputOptions,
+)
 from ..config import (
     COMMAND_CONFIG_FIELDS,
     CONTEXT_OPTION_ATTRS,
@@ -163,6 +170,50 @@ def _apply_config_profile(args: argparse.Namespace) -> None:
         setattr(args, attr_name, value)
 
 
+def extract_mapping_subcommand(args: argparse.Namespace, *, mode: str) -> None:
+    """把 ``mapping query <ID>...`` / ``mapping diff <old> <new>`` 从动作列表中拆出来。
+
+    这两个都不是独立动作，只是 mapping 的只读子命令；拆出后动作列表只保留 ``mapping``，
+    参数以字符串形式放在 ``args.query_ids`` / ``args.diff_versions`` 中，由 ``validate_args`` 统一校验。
+
+    Args:
+        args: `argparse` 解析后的命名空间对象。
+        mode: 当前入口脚本模式。
+    """
+    actions = list(args.actions)
+    if mode == "mapping" and actions[:1] in (["query"], ["diff"]):
+        subcommand, operands = actions[0], actions[1:]
+    elif actions[:1] == ["mapping"] and actions[1:2] in (["query"], ["diff"]):
+        subcommand, operands = actions[1], actions[2:]
+    else:
+        return
+    args.actions = ["mapping"]
+    if subcommand == "query":
+        args.query_ids = operands
+    else:
+        args.diff_versions = operands
+
+
+def extract_snapshot_subcommand(args: argparse.Namespace) -> None:
+    """把 ``snapshot export <包> [基准包...]`` / ``snapshot import <包>`` 从动作列表中拆出来。
+
+    导出需要先执行一遍 update 才能规划实体，拆出后动作列表记为 ``update``；
+    导入不依赖运行上下文，同样记为 ``update`` 只为通过动作校验，由 CLI 入口提前分发。
+    参数以字符串形式放在 ``args.snapshot_export`` / ``args.snapshot_import`` 中，由 ``validate_args`` 统一校验。
+
+    Args:
+        args: `argparse` 解析后的命名空间对象。
+    """
+    actions = list(args.actions)
+    if actions[:1] != ["snapshot"] or actions[1:2] not in (["export"], ["import"]):
+        return
+    args.actions = ["update"]
+    if actions[1] == "export":
+        args.snapshot_export = actions[2:]
+    else:
+        args.snapshot_import = actions[2:]
+
+
 def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
     """验证动作式 CLI 参数的有效性。
 
@@ -180,6 +231,35 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
         parser.print_help()
         sys.exit(1)
 
+    query_ids = getattr(args, "query_ids", None)
+    if query_ids is not None:
+        if not query_ids:
+            logger.error("错误：mapping query 至少需要一个音频 ID。")
+            sys.exit(1)
+        try:
+            args.query_ids = tuple(int(item) for item in query_ids)
+        except ValueError:
+            logger.error(f"错误：mapping query 只接受整数音频 ID，收到: {query_ids}")
+            sys.exit(1)
+
+    diff_versions = getattr(args, "diff_versions", None)
+    if diff_versions is not None and len(diff_versions) != 2:  # noqa: PLR2004
+        logger.error(f"错误：mapping diff 需要旧版本与新版本两个参数，收到: {diff_versions}")
+        sys.exit(1)
+
+    snapshot_export = getattr(args, "snapshot_export", None)
+    if snapshot_export is not None and not snapshot_export:
+        logger.error("错误：snapshot export 需要快照包输出路径，可再跟若干个作为增量基准的先前快照包。")
+        sys.exit(1)
+    snapshot_import = getattr(args, "snapshot_import", None)
+    if snapshot_import is not None:
+        if len(snapshot_import) != 1:
+            logger.error(f"错误：snapshot import 只接受一个快照包路径，收到: {snapshot_import}")
+            sys.exit(1)
+        if getattr(args, "remote_offline_root", None) is None:
+            logger.error("错误：snapshot import 需要通过 --remote-offline-root 指定离线镜像目录。")
+            sys.exit(1)
+
     invalid_actions = [action for action in args.actions if action not in {"update", "extract", "wav", "mapping"}]
     if invalid_actions:
         logger.error(f"错误：存在不支持的动作: {invalid_actions}")
@@ -188,6 +268,22 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
 
     args.actions = list(dict.fromkeys(args.actions))
 
+    if args.remote_prefetch < 0:
+        logger.error(f"错误：--remote-prefetch 不能为负数，收到: {args.remote_prefetch}")
+        sys.exit(1)
+    if args.remote_prefetch_budget_mb < 1:
+        logger.error(f"错误：--remote-prefetch-budget-mb 必须大于等于 1，收到: {args.remote_prefetch_budget_mb}")
+        sys.exit(1)
+    if args.remote_retain_budget_mb < 0:
+        logger.error(f"错误：--remote-retain-budget-mb 不能为负数，收到: {args.remote_retain_budget_mb}")
+        sys.exit(1)
+    if args.remote_parallel < 1:
+        logger.error(f"错误：--remote-parallel 必须大于等于 1，收到: {args.remote_parallel}")
+        sys.exit(1)
+    if args.remote_scratch_budget_mb < 1:
+        logger.error(f"错误：--remote-scratch-budget-mb 必须大于等于 1，收到: {args.remote_scratch_budget_mb}")
+        sys.exit(1)
+
     if args.config_file is not None and any(getattr(args, attr) is not None for attr in CONTEXT_OPTION_ATTRS):
         logger.error("错误：-c/--config-file 模式不能与共享配置参数同时使用。")
         sys.exit(1)
@@ -201,6 +297,48 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
         logger.error(f"错误：{exc}")
         sys.exit(1)
 
+    try:
+        extract_filter = build_extract_filter(args)
+    except ValueError as exc:
+        logger.error(f"错误：--wem-ids 只能包含整数 ID: {exc}")
+        sys.exit(1)
+    if extract_filter is not None and "extract" not in args.actions:
+        logger.error("错误：--wem-ids / --event / --category 只能与 extract 动作一起使用。")
+        sys.exit(1)
+    if getattr(args, "plan", None) and "extract" not in args.actions:
+        logger.error("错误：--plan 只能与 extract 动作一起使用。")
+        sys.exit(1)
+    if getattr(args, "keep_bnk_cache", None) and "mapping" not in args.actions:
+        logger.error("错误：--keep-bnk-cache 只能与 mapping 动作一起使用。")
+        sys.exit(1)
+    if getattr(args, "rebuild_mapping", None) and "mapping" not in args.actions:
+        logger.error("错误：--rebuild-mapping 只能与 mapping 动作一起使用。")
+        sys.exit(1)
+    mapping_executor = getattr(args, "mapping_executor", None)
+    if mapping_executor is not None:
+        if mapping_executor not in ("thread", "process"):
+            logger.error(f"错误：--mapping-executor 只支持 thread 或 process，收到: {mapping_executor}")
+            sys.exit(1)
+        if "mapping" not in args.actions:
+            logger.error("错误：--mapping-executor 只能与 mapping 动作一起使用。")
+            sys.exit(1)
+    mapping_format = getattr(args, "mapping_format", None)
+    if mapping_format is not None:
+        if mapping_format not in ("nested", "columnar"):
+            logger.error(f"错误：--mapping-format 只支持 nested 或 columnar，收到: {mapping_format}")
+            sys.exit(1)
+        if "mapping" not in args.actions:
+            logger.error("错误：--mapping-format 只能与 mapping 动作一起使用。")
+            sys.exit(1)
+    wwiser_workers = getattr(args, "wwiser_workers", None)
+    if wwiser_workers is not None:
+        if wwiser_workers < 0:
+            logger.error("错误：--wwiser-workers 不能为负数。")
+            sys.exit(1)
+        if "mapping" not in args.actions:
+            logger.error("错误：--wwiser-workers 只能与 mapping 动作一起使用。")
+            sys.exit(1)
+
     if args.integrate_data is True and "mapping" in args.actions:
         logger.info("检测到 --integrate-data 参数，将生成整合数据文件")
 
@@ -414,15 +552,45 @@ def build_options(
             max_retries=DEFAULT_WAV_RETRIES if getattr(args, "wav_retries", None) is None else args.wav_retries,
             format=DEFAULT_WAV_FORMAT if getattr(args, "wav_format", None) is None else args.wav_format,
         ),
+        entity_yaml_report=bool(getattr(args, "entity_yaml_report", False)),
+        extract_filter=build_extract_filter(args),
+        keep_bnk_cache=bool(getattr(args, "keep_bnk_cache", False)),
+        mapping_executor=getattr(args, "mapping_executor", None) or "thread",
+        wwiser_workers=getattr(args, "wwiser_workers", None) or 0,
+        rebuild_mapping=bool(getattr(args, "rebuild_mapping", False)),
+        mapping_format=getattr(args, "mapping_format", None) or "nested",
+    )
+
+
+def build_extract_filter(args: argparse.Namespace) -> ExtractFilterOptions | None:
+    """从 CLI 参数构建选择性解包过滤条件。
+
+    Args:
+        args: `argparse` 解析后的命名空间对象。
+
+    Returns:
+        过滤条件；未指定任何过滤参数时返回 `None`。
+
+    Raises:
+        ValueError: `--wem-ids` 含非整数项时抛出。
+    """
+    extract_filter = ExtractFilterOptions(
+        wem_ids=parse_int_ids(getattr(args, "wem_ids", None)) or (),
+        events=tuple(parse_ids(getattr(args, "events", None)) or ()),
+        categories=tuple(parse_ids(getattr(args, "categories", None)) or ()),
     )
+    return extract_filter if extract_filter.active else None
 
 
 __all__ = [
     "_apply_config_profile",
     "_config_path",
     "_validate_config_argv",
+    "build_extract_filter",
     "build_invocation_request",
     "build_settings",
+    "extract_mapping_subcommand",
+    "extract_snapshot_subcommand",
     "build_options",
     "initialize_app",
     "parse_ids",
@@ -13,6 +13,11 @@ _TEXTS: dict[str, dict[str, str]] = {
         "help.log_level": "设置日志输出等级，默认为 INFO。",
         "help.dev": "启用开发者模式，默认配置文件名切换为 dev 版本并保留临时文件。",
         "help.max_workers": "批量运行时使用的最大线程数。默认为 4。",
+        "help.remote_prefetch": "remote 模式下，处理当前实体时后台预下载后续多少个实体的 WAD；0 表示关闭。默认为 1。",
+        "help.remote_prefetch_budget_mb": "remote 预下载暂存 WAD 的磁盘上限（MB）。默认为 4096。",
+        "help.remote_retain_budget_mb": "remote 逐实体清理时，保留仍被后续实体使用的共享 WAD 的磁盘上限（MB）；0 表示不保留。默认为 8192。",
+        "help.remote_parallel": "remote 模式下同时处理的实体数量；大于 1 时各实体使用独立的最小运行目录。默认为 1。",
+        "help.remote_scratch_budget_mb": "remote 并行处理时各实体最小运行目录的总磁盘上限（MB），超出时暂缓启动新实体。默认为 20480。",
         "help.force": "强制更新数据，忽略版本检查。",
         "help.skip_events": "跳过事件数据处理，仅对 update 流程生效。",
         "help.with_bp_vo": "是否附带大厅选用/禁用语音资源。",
@@ -36,16 +41,37 @@ _TEXTS: dict[str, dict[str, str]] = {
         "help.remote_version": "显式指定远端快照版本。",
         "help.remote_lcu_manifest_url": "显式指定远端 LCU manifest URL。",
         "help.remote_game_manifest_url": "显式指定远端 GAME manifest URL。",
+        "help.remote_wad_mode": "remote_snapshot 模式下 GAME WAD 的准备方式：full 下载整个 WAD，entries 只下载所需条目所在的 chunk。",
+        "help.remote_chunk_cache_mb": "跨快照共享的 manifest chunk 缓存上限（MB），补丁间未变化的 chunk 不再重复下载；0 表示关闭。默认为 0。",
+        "help.remote_download_concurrency": "按实测吞吐与失败数在 MIN-MAX 范围内逐批调整远端下载并发；留空时使用 riotmanifest 的固定并发。默认为空。",
+        "help.remote_offline_root": "离线镜像目录：remote_snapshot 模式从这里读取已导入的快照包而不访问 CDN，"
+        "`snapshot import` 也导入到这里。默认为空。",
+        "help.hirc_store_mb": "跨版本共享的 HIRC 解析结果缓存上限（MB），超出时按最近访问时间淘汰；0 表示关闭。默认为 512。",
         "help.update.champions": "更新英雄数据；无参数时更新所有英雄。",
         "help.update.maps": "更新地图数据；无参数时更新所有地图。",
         "help.extract.champions": "解包英雄音频；无参数时解包所有英雄。",
         "help.extract.maps": "解包地图音频；无参数时解包所有地图。",
+        "help.extract.entity_yaml_report": "在运行级 JSONL 报告之外，额外为每个实体输出 YAML 报告。",
+        "help.extract.wem_ids": "只解包指定 WEM ID（逗号分隔）所在的容器，并只写出这些 WEM。",
+        "help.extract.events": "只解包指定事件（逗号分隔，支持 glob）对应的 WEM；依赖已生成的映射结果。",
+        "help.extract.categories": "只解包匹配的音频类别（逗号分隔 glob，例如 'VO_*'）。",
+        "help.extract.plan": "只预演解包：读取 WAD 目录表估算读写字节、WEM 数量与耗时，不解压也不写出文件。",
         "help.mapping.champions": "构建英雄事件映射；无参数时构建所有英雄。",
         "help.mapping.maps": "构建地图事件映射；无参数时构建所有地图。",
         "help.mapping.integrate_data": "生成整合数据文件（包含完整实体信息、banks 和 mapping 数据）。",
         "help.version": "显示当前脚本的版本号。",
-        "help.actions": "要执行的动作列表，支持顺序提供多个动作，如 `update extract wav`。",
+        "help.actions": "要执行的动作列表，支持顺序提供多个动作，如 `update extract wav`；"
+        "`mapping query <ID>...` 在当前版本的反向索引中查询音频 ID 所属的实体与事件；"
+        "`mapping diff <旧版本> <新版本>` 逐实体对比两个版本的映射并写出差异报告；"
+        "`snapshot export <快照包> [基准包...]` 按所选实体导出离线快照包，"
+        "`snapshot import <快照包>` 把快照包导入 --remote-offline-root 指定的离线镜像目录。",
         "help.mapping.integrate_data_global": "mapping 阶段是否生成整合数据文件；未显式指定时默认开启。",
+        "help.mapping.keep_bnk_cache": "把 mapping 提取的 events bnk 保留在 cache/<version>；默认直接在内存中解析。",
+        "help.mapping.wwiser_workers": "配置 wwiser 时使用的常驻 wwiser 进程数；0（默认）表示每个 bank 单独调用一次 wwiser。",
+        "help.mapping.rebuild_mapping": "忽略映射文件中记录的输入指纹，重建全部实体映射；默认跳过输入未变化的实体。",
+        "help.mapping.format": "映射文件格式：nested（默认，嵌套字典）或 columnar（事件名驻留 + 扁平 ID 数组，"
+        "加载更快、占用内存更少，文件后缀 .colmap）。",
+        "help.mapping.executor": "mapping 的并发后端：thread（默认）或 process；HIRC 解析为 CPU 密集型，多核时 process 更快。",
         "help.wav_workers": "设置 wav 动作使用的转码并发进程数。",
         "help.wav_timeout": "设置单个 WAV 转码任务的超时时间（秒）。",
         "help.wav_retries": "设置单个 WAV 转码任务的最大重试次数。",
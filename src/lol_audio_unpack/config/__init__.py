@@ -16,6 +16,7 @@ from .ini import (
 from .schema import (
     COMMAND_CONFIG_FIELDS,
     CONTEXT_OPTION_ATTRS,
+    DEFAULT_HIRC_STORE_MB,
     DEFAULT_REMOTE_LIVE_REGION,
     DEFAULT_SHARED_SETTINGS,
     SHARED_FIELDS_BY_CLI_ATTR,
@@ -36,6 +37,7 @@ __all__ = [
     "CONTEXT_OPTION_ATTRS",
     "DEFAULT_CONFIG_FILENAME",
     "DEFAULT_DEV_CONFIG_FILENAME",
+    "DEFAULT_HIRC_STORE_MB",
     "DEFAULT_REMOTE_LIVE_REGION",
     "DEFAULT_SHARED_SETTINGS",
     "SHARED_FIELDS_BY_CLI_ATTR",
@@ -31,8 +31,13 @@ class SettingKey:
     REMOTE_VERSION = "REMOTE_VERSION"
     REMOTE_LCU_MANIFEST_URL = "REMOTE_LCU_MANIFEST_URL"
     REMOTE_GAME_MANIFEST_URL = "REMOTE_GAME_MANIFEST_URL"
+    REMOTE_WAD_MODE = "REMOTE_WAD_MODE"
+    REMOTE_CHUNK_CACHE_MB = "REMOTE_CHUNK_CACHE_MB"
+    REMOTE_DOWNLOAD_CONCURRENCY = "REMOTE_DOWNLOAD_CONCURRENCY"
+    REMOTE_OFFLINE_ROOT = "REMOTE_OFFLINE_ROOT"
     WITH_BP_VO = "WITH_BP_VO"
     WWISER_PATH = "WWISER_PATH"
+    HIRC_STORE_MB = "HIRC_STORE_MB"
 
 
 class ConfigSection:
@@ -48,6 +53,8 @@ class ConfigSection:
 
 
 DEFAULT_REMOTE_LIVE_REGION = "EUW"
+# 跨版本 HIRC 解析结果缓存的默认容量上限（MB）
+DEFAULT_HIRC_STORE_MB = 512
 
 
 @dataclass(frozen=True)
@@ -94,8 +101,18 @@ SHARED_SETTING_FIELDS: tuple[SharedSettingField, ...] = (
         "remote_game_manifest_url",
         "remote_game_manifest_url",
     ),
+    SharedSettingField(SettingKey.REMOTE_WAD_MODE, "remote_wad_mode", "remote_wad_mode", "full"),
+    SharedSettingField(SettingKey.REMOTE_CHUNK_CACHE_MB, "remote_chunk_cache_mb", "remote_chunk_cache_mb", 0),
+    SharedSettingField(
+        SettingKey.REMOTE_DOWNLOAD_CONCURRENCY,
+        "remote_download_concurrency",
+        "remote_download_concurrency",
+        "",
+    ),
+    SharedSettingField(SettingKey.REMOTE_OFFLINE_ROOT, "remote_offline_root", "remote_offline_root"),
     SharedSettingField(SettingKey.WITH_BP_VO, "with_bp_vo", "with_bp_vo", False),
     SharedSettingField(SettingKey.WWISER_PATH, "wwiser_path", "wwiser_path"),
+    SharedSettingField(SettingKey.HIRC_STORE_MB, "hirc_store_mb", "hirc_store_mb", DEFAULT_HIRC_STORE_MB),
 )
 
 SHARED_FIELDS_BY_KEY: dict[str, SharedSettingField] = {
@@ -121,6 +138,11 @@ COMMAND_CONFIG_FIELDS: dict[str, tuple[CommandConfigField, ...]] = {
     ),
     ConfigSection.RUNTIME: (
         CommandConfigField("max_workers", "max_workers", "int"),
+        CommandConfigField("remote_prefetch", "remote_prefetch", "int"),
+        CommandConfigField("remote_prefetch_budget_mb", "remote_prefetch_budget_mb", "int"),
+        CommandConfigField("remote_retain_budget_mb", "remote_retain_budget_mb", "int"),
+        CommandConfigField("remote_parallel", "remote_parallel", "int"),
+        CommandConfigField("remote_scratch_budget_mb", "remote_scratch_budget_mb", "int"),
     ),
     ConfigSection.UPDATE: (
         CommandConfigField("_update_enabled", "enable", "bool"),
@@ -129,6 +151,11 @@ COMMAND_CONFIG_FIELDS: dict[str, tuple[CommandConfigField, ...]] = {
     ),
     ConfigSection.EXTRACT: (
         CommandConfigField("_extract_enabled", "enable", "bool"),
+        CommandConfigField("entity_yaml_report", "entity_yaml_report", "bool"),
+        CommandConfigField("wem_ids", "wem_ids", "text"),
+        CommandConfigField("events", "events", "text"),
+        CommandConfigField("categories", "categories", "text"),
+        CommandConfigField("plan", "plan", "bool"),
     ),
     ConfigSection.WAV: (
         CommandConfigField("wav", "enable", "bool"),
@@ -140,6 +167,11 @@ COMMAND_CONFIG_FIELDS: dict[str, tuple[CommandConfigField, ...]] = {
     ConfigSection.MAPPING: (
         CommandConfigField("_mapping_enabled", "enable", "bool"),
         CommandConfigField("integrate_data", "integrate_data", "bool"),
+        CommandConfigField("keep_bnk_cache", "keep_bnk_cache", "bool"),
+        CommandConfigField("mapping_executor", "executor", "text"),
+        CommandConfigField("wwiser_workers", "wwiser_workers", "int"),
+        CommandConfigField("rebuild_mapping", "rebuild", "bool"),
+        CommandConfigField("mapping_format", "format", "text"),
     ),
 }
 
@@ -156,6 +188,7 @@ def build_settings(args: Any) -> dict[str, Any]:
 __all__ = [
     "COMMAND_CONFIG_FIELDS",
     "CONTEXT_OPTION_ATTRS",
+    "DEFAULT_HIRC_STORE_MB",
     "DEFAULT_REMOTE_LIVE_REGION",
     "DEFAULT_SHARED_SETTINGS",
     "SHARED_FIELDS_BY_CLI_ATTR",
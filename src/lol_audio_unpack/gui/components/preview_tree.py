@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -195,6 +196,11 @@ class _PreviewTreeNode:
         return self.parent.children.index(self)
 
 
+def _is_audio_id_sequence(value: object) -> bool:
+    """判断事件值是否为音频 ID 序列；列式映射里是 ``memoryview`` 切片而不是 list。"""
+    return isinstance(value, Sequence | memoryview) and not isinstance(value, str | bytes)
+
+
 def extract_tree_groups(mapping_data: dict[str, Any] | None) -> dict[str, Any]:
     """从英雄或地图 mapping 中提取统一的首层分组。
 
@@ -247,12 +253,12 @@ def collect_tree_stats(
             continue
 
         for event_group in events_payload.values():
-            if not isinstance(event_group, dict):
+            if not isinstance(event_group, Mapping):
                 continue
 
             audio_type_count += 1
             for audio_ids in event_group.values():
-                if not isinstance(audio_ids, list | tuple):
+                if not _is_audio_id_sequence(audio_ids):
                     continue
 
                 event_count += 1
@@ -326,7 +332,7 @@ def filter_preview_mapping_data(
 
         filtered_audio_types: dict[str, dict[str, list[str]]] = {}
         for audio_type_name, event_payload in events_payload.items():
-            if not isinstance(event_payload, dict):
+            if not isinstance(event_payload, Mapping):
                 continue
 
             audio_type = str(audio_type_name).strip()
@@ -335,7 +341,7 @@ def filter_preview_mapping_data(
 
             filtered_events: dict[str, list[str]] = {}
             for event_name, audio_ids in event_payload.items():
-                if not isinstance(audio_ids, list | tuple):
+                if not _is_audio_id_sequence(audio_ids):
                     continue
 
                 event_label = str(event_name)
@@ -720,7 +726,7 @@ class PreviewTreeModel(QAbstractItemModel):
 
         children: list[_PreviewTreeNode] = []
         for audio_type_name, event_payload in payload.items():
-            if not isinstance(event_payload, dict):
+            if not isinstance(event_payload, Mapping):
                 continue
             children.append(
                 _PreviewTreeNode(
@@ -735,12 +741,12 @@ class PreviewTreeModel(QAbstractItemModel):
     def _build_event_children(self, node: _PreviewTreeNode) -> list[_PreviewTreeNode]:
         """构造音频类别节点下的事件子节点。"""
         payload = node.payload
-        if not isinstance(payload, dict):
+        if not isinstance(payload, Mapping):
             return []
 
         children: list[_PreviewTreeNode] = []
         for event_name, audio_ids in payload.items():
-            if not isinstance(audio_ids, list | tuple):
+            if not _is_audio_id_sequence(audio_ids):
                 continue
             children.append(
                 _PreviewTreeNode(
@@ -780,7 +786,7 @@ class PreviewTreeModel(QAbstractItemModel):
     def _node_has_children(self, kind: str, payload: Any) -> bool:
         """判断一个节点是否还有下一层可展开内容。"""
         if kind in {"group", "audio_type"}:
-            return isinstance(payload, dict) and bool(payload)
+            return isinstance(payload, Mapping) and bool(payload)
         if kind == "event":
             return isinstance(payload, list | tuple) and any(str(item).strip() for item in payload)
         return False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
@@ -19,6 +20,7 @@ from lol_audio_unpack.app.targets import get_default_visible_champions
 from lol_audio_unpack.manager.data_reader import DataReader
 from lol_audio_unpack.manager.files import read_data
 from lol_audio_unpack.model import AudioEntityData
+from lol_audio_unpack.utils.columnar import EventTable
 
 if TYPE_CHECKING:
     from lol_audio_unpack.app.types import AppContext
@@ -31,16 +33,26 @@ def _build_mapping_preview_base(metadata: dict[str, object] | None) -> dict[str,
     return {"metadata": dict(metadata) if isinstance(metadata, dict) else {}}
 
 
-def _normalize_integrated_events(events_payload: object) -> dict[str, dict[str, list[object]]]:
+def _encode_lazy_mapping(value: object) -> object:
+    """供 ``json.dumps`` 序列化列式映射的惰性视图，逐表展开而不预先复制整份映射。"""
+    if isinstance(value, EventTable):
+        return dict(value.iter_rows())
+    if isinstance(value, Sequence | memoryview) and not isinstance(value, str | bytes):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _normalize_integrated_events(events_payload: object) -> dict[str, dict[str, list[object]] | EventTable]:
     """把整合版事件节点还原成预览树可消费的 mapping 结构。
 
     Args:
         events_payload: 整合版 ``events`` 原始节点。
 
     Returns:
-        与普通 mapping 对齐的 ``{category: {event_name: [audio_ids]}}`` 结构。
+        与普通 mapping 对齐的 ``{category: {event_name: [audio_ids]}}`` 结构；列式映射的类别保留为
+        ``EventTable`` 视图。
     """
-    normalized_events: dict[str, dict[str, list[object]]] = {}
+    normalized_events: dict[str, dict[str, list[object]] | EventTable] = {}
     if not isinstance(events_payload, dict):
         return normalized_events
 
@@ -48,6 +60,10 @@ def _normalize_integrated_events(events_payload: object) -> dict[str, dict[str,
         if not isinstance(category_payload, dict):
             continue
         mapping_payload = category_payload.get("mapping")
+        if isinstance(mapping_payload, EventTable):
+            # 列式映射的事件表本身就是只读视图，交给预览树展开节点时再解码
+            normalized_events[str(category)] = mapping_payload
+            continue
         if not isinstance(mapping_payload, dict):
             continue
         normalized_events[str(category)] = {
@@ -91,7 +107,7 @@ def _normalize_integrated_mapping_data(
 
         normalized["championId"] = data_payload.get("championId", entity_id)
         normalized["alias"] = data_payload.get("alias", "")
-        normalized_skins: dict[str, dict[str, dict[str, list[object]]]] = {}
+        normalized_skins: dict[str, dict[str, dict[str, dict[str, list[object]] | EventTable]]] = {}
         for skin_payload in skins_payload:
             if not isinstance(skin_payload, dict):
                 continue
@@ -341,13 +357,18 @@ class EntityDataLoader:
         if mapping_path is None:
             return None, None, ""
 
-        raw_mapping_data = read_data(mapping_path, dev_mode=getattr(self.ctx.config, "dev_mode", False))
+        raw_mapping_data = read_data(
+            mapping_path,
+            dev_mode=getattr(self.ctx.config, "dev_mode", False),
+            lazy=True,
+        )
         mapping_data = _normalize_integrated_mapping_data(
             raw_mapping_data,
             entity_type=entity_type,
             entity_id=str(entity_id),
         )
-        return mapping_path, mapping_data, json.dumps(raw_mapping_data, ensure_ascii=False, indent=2)
+        preview_text = json.dumps(raw_mapping_data, ensure_ascii=False, indent=2, default=_encode_lazy_mapping)
+        return mapping_path, mapping_data, preview_text
 
     def load_available_audio_ids(self, entity_type: GuiEntityType, entity_id: str) -> set[str]:
         """加载当前实体在本地已存在的音频 ID 集合。
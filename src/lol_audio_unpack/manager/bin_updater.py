@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -40,6 +41,7 @@ class BinUpdater:
         process_events: bool = True,
         *,
         ctx: AppContext,
+        bin_payloads: Mapping[str, bytes] | None = None,
     ):
         """
         初始化BIN音频更新器
@@ -47,8 +49,10 @@ class BinUpdater:
         :param force_update: 是否强制更新，忽略版本检查
         :param process_events: 是否处理事件数据（默认True，设置为False可大幅提升处理速度）
         :param ctx: 运行时上下文。
+        :param bin_payloads: 可选的内存 BIN 输入（binPath -> 内容）；WAD 不存在时优先使用，无需经过 `bin_input` 目录。
         """
         self.ctx = ctx
+        self.bin_payloads = bin_payloads
         self.game_path = Path(self.ctx.config.game_path)
         self.manifest_path = Path(self.ctx.paths.manifest_path)
 
@@ -97,7 +101,7 @@ class BinUpdater:
             raise FileNotFoundError(f"数据文件不存在: {self.data_file_base}")
 
         self.languages = data.get("metadata", {}).get("languages", [])
-        local_bin_mode_enabled = self._is_local_bin_mode_enabled()
+        local_bin_mode_enabled = self.bin_payloads is not None or self._is_local_bin_mode_enabled()
 
         # 根据传入的IDs构建筛选后的数据
         if champion_ids or map_ids:
@@ -180,8 +184,9 @@ class BinUpdater:
 
         优先级:
         1) WAD 文件存在时，强制走 WAD 提取。
-        2) WAD 不存在时，若存在 `.use_local_bin` 标志，则走本地目录读取。
-        3) 其余情况返回空结果。
+        2) WAD 不存在时，若提供了内存 BIN 输入，则直接读取内存。
+        3) WAD 不存在时，若存在 `.use_local_bin` 标志，则走本地目录读取。
+        4) 其余情况返回空结果。
 
         :param wad_path: 待提取的 WAD 路径；为空表示无可用 WAD 信息。
         :param bin_paths: 目标 BIN 路径列表。
@@ -198,6 +203,14 @@ class BinUpdater:
             logger.trace(f"{entity_label} 使用 WAD 读取 BIN: {wad_path}")
             return WAD(wad_path).extract(bin_paths, raw=True)
 
+        if self.bin_payloads is not None:
+            logger.trace(f"{entity_label} 的WAD文件不可用，使用内存中的BIN输入")
+            bin_raws = [self.bin_payloads.get(bin_path) or None for bin_path in bin_paths]
+            missing_count = bin_raws.count(None)
+            if missing_count > 0:
+                logger.debug(f"{entity_label} 内存BIN输入存在缺失，已按缺失处理: {missing_count}/{len(bin_paths)}")
+            return bin_raws
+
         if not self._is_local_bin_mode_enabled():
             if wad_path:
                 logger.warning(f"{entity_label} 的WAD文件不存在，且未启用本地BIN模式: {wad_path}")
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from loguru import logger
 
+from lol_audio_unpack.utils.columnar import COLUMNAR_SUFFIX, dump_columnar, load_columnar, load_columnar_data
 from lol_audio_unpack.utils.common import (
     dump_json,
     dump_msgpack,
@@ -33,7 +34,11 @@ def find_data_file(path: Path, *, dev_mode: bool) -> Path | None:
     if path.suffix:
         files_to_check.append(path)
     else:
-        formats_priority = [".yml", ".json", ".msgpack"] if dev_mode else [".msgpack", ".yml", ".json"]
+        formats_priority = (
+            [".yml", ".json", ".msgpack", COLUMNAR_SUFFIX]
+            if dev_mode
+            else [".msgpack", COLUMNAR_SUFFIX, ".yml", ".json"]
+        )
         files_to_check = [path.with_suffix(suffix) for suffix in formats_priority]
 
     for file_to_try in files_to_check:
@@ -43,12 +48,14 @@ def find_data_file(path: Path, *, dev_mode: bool) -> Path | None:
     return None
 
 
-def read_data(path: Path, *, dev_mode: bool = False) -> dict:
+def read_data(path: Path, *, dev_mode: bool = False, lazy: bool = False) -> dict:
     """按环境优先级读取数据文件。
 
     Args:
         path: 文件路径，可带或不带后缀。
         dev_mode: 是否启用开发模式。
+        lazy: 为 ``True`` 时列式映射的事件表保留为 ``EventTable`` 惰性视图，只适合只读调用方；
+            其他格式不受影响。
 
     Returns:
         读取到的数据字典；读取失败时返回空字典。
@@ -78,6 +85,8 @@ def read_data(path: Path, *, dev_mode: bool = False) -> dict:
         loader = load_msgpack
     elif suffix in [".yaml", ".yml"]:
         loader = load_yaml
+    elif suffix == COLUMNAR_SUFFIX:
+        loader = load_columnar if lazy else load_columnar_data
 
     if not loader:
         logger.error(f"不支持的文件格式: {suffix} (来自: {actual_file})")
@@ -110,24 +119,38 @@ def read_data(path: Path, *, dev_mode: bool = False) -> dict:
         return {}
 
 
-def write_data(data: dict, base_path: Path, *, dev_mode: bool) -> None:
+def _remove_stale_variants(path: Path, *, columnar: bool) -> None:
+    """删除同名的另一种映射格式文件，避免按格式优先级读到过期内容。"""
+    stale_suffixes = (".msgpack", ".yml", ".json") if columnar else (COLUMNAR_SUFFIX,)
+    for suffix in stale_suffixes:
+        stale_path = path.with_suffix(suffix)
+        if stale_path != path and stale_path.exists():
+            stale_path.unlink()
+            logger.debug(f"已删除过期的数据文件: {stale_path}")
+
+
+def write_data(data: dict, base_path: Path, *, dev_mode: bool, columnar: bool = False) -> None:
     """根据环境选择格式并写入数据文件。
 
     Args:
         data: 要写入的数据。
         base_path: 不带后缀的基础文件路径。
         dev_mode: 是否启用开发模式。
+        columnar: 是否以列式格式写出映射数据；开启时忽略 ``dev_mode`` 的格式选择。
     """
-    fmt = "yml" if dev_mode else "msgpack"
+    fmt = COLUMNAR_SUFFIX.lstrip(".") if columnar else "yml" if dev_mode else "msgpack"
     path = base_path.with_suffix(f".{fmt}")
     try:
-        if fmt == "yml":
+        if columnar:
+            dump_columnar(data, path)
+        elif fmt == "yml":
             dump_yaml(data, path)
         elif fmt == "json":
             dump_json(data, path)
         else:
             dump_msgpack(data, path)
         logger.trace(f"成功写入数据到: {path}")
+        _remove_stale_variants(path, columnar=columnar)
     except Exception as exc:
         logger.opt(exception=True).error(f"写入文件失败: {path}, 错误: {exc}")
 
@@ -5,12 +5,24 @@ from __future__ import annotations
 from loguru import logger
 
 from lol_audio_unpack.manager import DataReader
+from lol_audio_unpack.utils.columnar import EventTable, load_columnar
 
-from .batch import build_all, build_champions, build_maps, execute_tasks
+from .batch import EntityMapper, build_all, build_champions, build_maps, create_entity_mapper, execute_tasks
+from .diff import MappingDiffSummary, diff_mapping_versions
 from .entity import build_champion, build_entity, build_map, integrate_entity
-from .session import RuntimeCache, describe_hirc_backend
+from .hirc_store import HircStore, create_hirc_store
+from .reverse_index import REVERSE_INDEX_FILE_NAME, AudioRef, ReverseIndex, build_reverse_index, refresh_reverse_index
+from .session import EventBanks, RuntimeCache, describe_hirc_backend
 
 __all__ = [
+    "REVERSE_INDEX_FILE_NAME",
+    "AudioRef",
+    "EntityMapper",
+    "EventBanks",
+    "EventTable",
+    "HircStore",
+    "MappingDiffSummary",
+    "ReverseIndex",
     "RuntimeCache",
     "build_all",
     "build_champion",
@@ -18,10 +30,16 @@ __all__ = [
     "build_entity",
     "build_map",
     "build_maps",
+    "build_reverse_index",
+    "create_entity_mapper",
+    "create_hirc_store",
     "describe_hirc_backend",
+    "diff_mapping_versions",
     "execute_tasks",
     "integrate_entity",
+    "load_columnar",
     "main",
+    "refresh_reverse_index",
 ]
 
 
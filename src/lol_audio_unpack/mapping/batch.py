@@ -11,10 +11,14 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from lol_audio_unpack.manager import DataReader
-from lol_audio_unpack.model import generate_champion_tasks, generate_map_tasks
+from lol_audio_unpack.model import AudioEntityData, generate_champion_tasks, generate_map_tasks
+from lol_audio_unpack.utils.run_summary import record_runtime_note
 
 from . import session as mapping_session
-from .entity import build_champion, build_map
+from .entity import build_champion, build_entity, build_map
+from .hirc_store import create_hirc_store
+from .process_pool import MAPPING_EXECUTORS, run_tasks_in_processes
+from .wwiser_pool import WwiserPool
 
 if TYPE_CHECKING:
     from lol_audio_unpack.app.types import AppContext
@@ -145,6 +149,160 @@ def _emit_running_progress(  # noqa: PLR0913
     )
 
 
+def _log_mapping_summary(
+    runtime_cache: mapping_session.RuntimeCache,
+    summary_message: str,
+    *,
+    failed_count: int,
+    total_tasks: int,
+) -> None:
+    """输出整轮映射的缓存统计与成功/失败汇总。"""
+    logger.info(runtime_cache.describe_hirc_stats())
+    if runtime_cache.incremental:
+        logger.info(f"输入指纹未变化而复用的实体: {runtime_cache.reused_entity_count} 个")
+    if runtime_cache.hirc_store is not None:
+        logger.info(runtime_cache.hirc_store.describe())
+    if failed_count == 0:
+        logger.success(summary_message)
+    elif failed_count < total_tasks:
+        logger.warning(summary_message)
+    else:
+        logger.error(summary_message)
+
+
+class EntityMapper:
+    """供解包阶段逐实体调用的映射回调。
+
+    解包与映射同轮执行时，解包已经读出并解压了 events bnk，
+    回调直接把这些字节交给映射，避免对同一个 WAD 再读一遍。
+    整轮结束后由调用方 ``close``，关闭 wwiser 进程池并输出与单独映射一致的汇总。
+
+    Args:
+        reader: 数据读取器实例。
+        ctx: 运行时上下文。
+        integrate_data: 是否生成整合数据。
+        max_workers: 解包阶段的并发线程数，决定缓存是否需要加锁。
+        keep_bnk_cache: 是否把 events bnk 保留在 ``cache/<version>``。
+        wwiser_workers: 常驻 wwiser 进程数；为 0 时每个 bank 单独调用一次 wwiser。
+        incremental: 是否跳过输入指纹未变化的实体。
+        columnar: 是否以列式格式写出映射文件。
+
+    Raises:
+        ValueError: wwiser 配置无效时抛出。
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        reader: DataReader,
+        *,
+        ctx: AppContext,
+        integrate_data: bool = False,
+        max_workers: int = 4,
+        keep_bnk_cache: bool = False,
+        wwiser_workers: int = 0,
+        incremental: bool = True,
+        columnar: bool = False,
+    ) -> None:
+        logger.info(f"解包与映射同轮执行，HIRC 后端: {mapping_session.describe_hirc_backend(ctx)}")
+        self._reader = reader
+        self._ctx = ctx
+        self._integrate_data = integrate_data
+        # 与 execute_tasks 一致，manager 与缓存按整轮复用
+        self._wwiser_manager = mapping_session._create_wwiser_manager(ctx, pool_size=wwiser_workers)
+        self.runtime_cache = mapping_session.RuntimeCache(
+            cache_lock=threading.Lock() if max_workers > 1 else None,
+            hirc_store=create_hirc_store(ctx),
+            keep_bnk_files=keep_bnk_cache,
+            incremental=incremental,
+            columnar=columnar,
+        )
+        self._lock = threading.Lock()
+        self._start_time = time.time()
+        self.mapped_count = 0
+        self.failed_count = 0
+
+    def __call__(self, entity_data: AudioEntityData, event_banks: mapping_session.EventBanks) -> None:
+        """映射单个实体；失败计数后继续抛出，由解包侧记录告警。"""
+        logger.debug(f"{entity_data.entity_name} 复用解包阶段的 {len(event_banks)} 个 events bnk 构建映射")
+        try:
+            build_entity(
+                entity_data,
+                self._reader,
+                self._wwiser_manager,
+                self._integrate_data,
+                runtime_cache=self.runtime_cache,
+                ctx=self._ctx,
+                event_banks=event_banks,
+            )
+        except Exception:
+            with self._lock:
+                self.failed_count += 1
+            raise
+        with self._lock:
+            self.mapped_count += 1
+
+    def close(self) -> None:
+        """关闭 wwiser 进程池并输出整轮映射汇总。"""
+        if isinstance(self._wwiser_manager, WwiserPool):
+            self._wwiser_manager.close()
+        total = self.mapped_count + self.failed_count
+        if total == 0:
+            return
+        summary_message = (
+            f"映射完成: {total} 个实体，成功 {self.mapped_count} 个，失败 {self.failed_count} 个，"
+            f"耗时 {time.time() - self._start_time:.2f}s"
+        )
+        _log_mapping_summary(self.runtime_cache, summary_message, failed_count=self.failed_count, total_tasks=total)
+        # 同轮映射没有单独的 mapping 阶段，结果记在解包阶段的运行摘要里
+        record_runtime_note(
+            self._ctx.runtime_cache,
+            "extract",
+            f"同轮事件映射: 成功 {self.mapped_count} 个，失败 {self.failed_count} 个",
+            label="音频解包",
+        )
+
+
+def create_entity_mapper(  # noqa: PLR0913
+    reader: DataReader,
+    *,
+    ctx: AppContext,
+    integrate_data: bool = False,
+    max_workers: int = 4,
+    keep_bnk_cache: bool = False,
+    wwiser_workers: int = 0,
+    incremental: bool = True,
+    columnar: bool = False,
+) -> EntityMapper:
+    """创建供解包阶段逐实体调用的映射回调。
+
+    Args:
+        reader: 数据读取器实例。
+        ctx: 运行时上下文。
+        integrate_data: 是否生成整合数据。
+        max_workers: 解包阶段的并发线程数，决定缓存是否需要加锁。
+        keep_bnk_cache: 是否把 events bnk 保留在 ``cache/<version>``。
+        wwiser_workers: 常驻 wwiser 进程数；为 0 时每个 bank 单独调用一次 wwiser。
+        incremental: 是否跳过输入指纹未变化的实体。
+        columnar: 是否以列式格式写出映射文件。
+
+    Returns:
+        EntityMapper: 映射回调；整轮结束后需调用 ``close``。
+
+    Raises:
+        ValueError: wwiser 配置无效时抛出。
+    """
+    return EntityMapper(
+        reader,
+        ctx=ctx,
+        integrate_data=integrate_data,
+        max_workers=max_workers,
+        keep_bnk_cache=keep_bnk_cache,
+        wwiser_workers=wwiser_workers,
+        incremental=incremental,
+        columnar=columnar,
+    )
+
+
 def execute_tasks(  # noqa: PLR0913
     tasks: list[EntityTask],
     reader: DataReader,
@@ -153,21 +311,37 @@ def execute_tasks(  # noqa: PLR0913
     *,
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
+    keep_bnk_cache: bool = False,
+    executor: str = "thread",
+    wwiser_workers: int = 0,
+    incremental: bool = True,
+    columnar: bool = False,
 ) -> None:
     """执行映射任务集。
 
     Args:
         tasks: 任务元组列表 ``[(entity_type, id, description), ...]``。
         reader: 数据读取器实例。
-        max_workers: 最大工作线程数。
+        max_workers: 最大工作线程数（``executor="process"`` 时为进程数）。
         integrate_data: 是否生成整合数据。
         ctx: 运行时上下文。
         progress_callback: 每个实体完成后的可选进度回调。
+        keep_bnk_cache: 是否把提取的 events bnk 保留在 ``cache/<version>``。
+        executor: 并发后端，``thread`` 或 ``process``；单 worker 时始终串行执行。
+        wwiser_workers: 常驻 wwiser 进程数；为 0 时每个 bank 单独调用一次 wwiser。
+        incremental: 是否跳过输入指纹未变化的实体；关闭时全部重建。
+        columnar: 是否以列式格式写出映射文件。
+
+    Raises:
+        ValueError: ``executor`` 不受支持时抛出。
     """
 
+    if executor not in MAPPING_EXECUTORS:
+        raise ValueError(f"不支持的映射执行后端: {executor}")
     if not tasks:
         logger.warning("没有任何任务需要执行")
         return
+    use_processes = executor == "process" and max_workers > 1
 
     start_time = time.time()
     total_tasks = len(tasks)
@@ -175,7 +349,7 @@ def execute_tasks(  # noqa: PLR0913
 
     logger.info(
         f"开始构建 {total_tasks} 个实体的事件映射 ({' 和 '.join(summary_parts)})，"
-        f"模式: {'多线程' if max_workers > 1 else '单线程'} (workers: {max_workers})"
+        f"模式: {'多进程' if use_processes else '多线程' if max_workers > 1 else '单线程'} (workers: {max_workers})"
     )
     logger.info(f"HIRC 后端: {mapping_session.describe_hirc_backend(ctx)}")
 
@@ -183,17 +357,23 @@ def execute_tasks(  # noqa: PLR0913
     show_exception = bool(getattr(ctx.config, "dev_mode", False))
     # manager 和 runtime_cache 都按“整轮任务”复用，
     # 否则多实体并发时会重复创建 wwiser 进程态和 WAD/HIRC 缓存。
-    wwiser_manager = mapping_session._create_wwiser_manager(ctx)
-    runtime_cache = mapping_session.RuntimeCache(cache_lock=threading.Lock() if max_workers > 1 else None)
+    if use_processes and wwiser_workers > 0:
+        logger.info("多进程后端下每个映射进程各自调用 wwiser，不启用 wwiser 常驻进程池")
+    wwiser_manager = mapping_session._create_wwiser_manager(ctx, pool_size=0 if use_processes else wwiser_workers)
+    runtime_cache = mapping_session.RuntimeCache(
+        cache_lock=threading.Lock() if max_workers > 1 else None,
+        hirc_store=create_hirc_store(ctx),
+        keep_bnk_files=keep_bnk_cache,
+        incremental=incremental,
+        columnar=columnar,
+    )
     progress_lock = threading.Lock() if max_workers > 1 else None
 
-    if max_workers > 1:
-        def build_entity_with_progress(
-            entity_type: str,
-            entity_id: int,
-            description: str,
-        ) -> None:
-            if progress_lock is None:
+    try:
+        if use_processes:
+            completed_count = 0
+
+            def on_process_start(entity_type: str, description: str) -> None:
                 _emit_running_progress(
                     progress_callback,
                     entity_type,
@@ -202,8 +382,49 @@ def execute_tasks(  # noqa: PLR0913
                     total_tasks,
                     description,
                 )
-            else:
-                with progress_lock:
+
+            def on_process_done(entity_type: str, description: str, error: BaseException | None) -> None:
+                nonlocal completed_count
+                completed_count += 1
+                finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
+                if error is None:
+                    progress_message = f"{description} 映射完成"
+                    logger.info(f"进度: {completed_count}/{total_tasks} - {progress_message}。")
+                else:
+                    progress_message = f"{description} 映射失败"
+                    logger.opt(exception=error if show_exception else False).warning(
+                        f"{description} 映射失败，将继续后续任务: {error}"
+                    )
+                _emit_progress(
+                    progress_callback,
+                    entity_type,
+                    finished_by_type,
+                    totals_by_type,
+                    completed_count,
+                    total_tasks,
+                    progress_message,
+                )
+
+            # 子进程各自创建 wwiser 管理器与缓存，父进程的 runtime_cache 只用于汇总计数
+            failed_count = run_tasks_in_processes(
+                tasks,
+                ctx=ctx,
+                max_workers=max_workers,
+                integrate_data=integrate_data,
+                keep_bnk_cache=keep_bnk_cache,
+                incremental=incremental,
+                columnar=columnar,
+                runtime_cache=runtime_cache,
+                on_start=on_process_start,
+                on_done=on_process_done,
+            )
+        elif max_workers > 1:
+            def build_entity_with_progress(
+                entity_type: str,
+                entity_id: int,
+                description: str,
+            ) -> None:
+                if progress_lock is None:
                     _emit_running_progress(
                         progress_callback,
                         entity_type,
@@ -212,34 +433,82 @@ def execute_tasks(  # noqa: PLR0913
                         total_tasks,
                         description,
                     )
-            _build_entity(
-                entity_type,
-                entity_id,
-                reader,
-                wwiser_manager,
-                integrate_data,
-                runtime_cache,
-                ctx=ctx,
-            )
+                else:
+                    with progress_lock:
+                        _emit_running_progress(
+                            progress_callback,
+                            entity_type,
+                            finished_by_type,
+                            totals_by_type,
+                            total_tasks,
+                            description,
+                        )
+                _build_entity(
+                    entity_type,
+                    entity_id,
+                    reader,
+                    wwiser_manager,
+                    integrate_data,
+                    runtime_cache,
+                    ctx=ctx,
+                )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {
-                executor.submit(build_entity_with_progress, entity_type, entity_id, description): (entity_type, description)
-                for entity_type, entity_id, description in tasks
-            }
+            with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+                future_to_task = {
+                    thread_pool.submit(build_entity_with_progress, entity_type, entity_id, description): (entity_type, description)
+                    for entity_type, entity_id, description in tasks
+                }
+                completed_count = 0
+                for future in as_completed(future_to_task):
+                    entity_type, description = future_to_task[future]
+                    completed_count += 1
+                    finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
+                    try:
+                        future.result()
+                        progress_message = f"{description} 映射完成"
+                        logger.info(f"进度: {completed_count}/{total_tasks} - {progress_message}。")
+                    except Exception as exc:  # noqa: BLE001
+                        failed_count += 1
+                        progress_message = f"{description} 映射失败"
+                        logger.opt(exception=show_exception).warning(f"{description} 映射失败，将继续后续任务: {exc}")
+                    _emit_progress(
+                        progress_callback,
+                        entity_type,
+                        finished_by_type,
+                        totals_by_type,
+                        completed_count,
+                        total_tasks,
+                        progress_message,
+                    )
+        else:
             completed_count = 0
-            for future in as_completed(future_to_task):
-                entity_type, description = future_to_task[future]
-                completed_count += 1
-                finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
+            for entity_type, entity_id, description in tasks:
                 try:
-                    future.result()
+                    _emit_running_progress(
+                        progress_callback,
+                        entity_type,
+                        finished_by_type,
+                        totals_by_type,
+                        total_tasks,
+                        description,
+                    )
+                    _build_entity(
+                        entity_type,
+                        entity_id,
+                        reader,
+                        wwiser_manager,
+                        integrate_data,
+                        runtime_cache,
+                        ctx=ctx,
+                    )
                     progress_message = f"{description} 映射完成"
+                    completed_count += 1
                     logger.info(f"进度: {completed_count}/{total_tasks} - {progress_message}。")
                 except Exception as exc:  # noqa: BLE001
                     failed_count += 1
                     progress_message = f"{description} 映射失败"
                     logger.opt(exception=show_exception).warning(f"{description} 映射失败，将继续后续任务: {exc}")
+                finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
                 _emit_progress(
                     progress_callback,
                     entity_type,
@@ -249,44 +518,9 @@ def execute_tasks(  # noqa: PLR0913
                     total_tasks,
                     progress_message,
                 )
-    else:
-        completed_count = 0
-        for entity_type, entity_id, description in tasks:
-            try:
-                _emit_running_progress(
-                    progress_callback,
-                    entity_type,
-                    finished_by_type,
-                    totals_by_type,
-                    total_tasks,
-                    description,
-                )
-                _build_entity(
-                    entity_type,
-                    entity_id,
-                    reader,
-                    wwiser_manager,
-                    integrate_data,
-                    runtime_cache,
-                    ctx=ctx,
-                )
-                progress_message = f"{description} 映射完成"
-                completed_count += 1
-                logger.info(f"进度: {completed_count}/{total_tasks} - {progress_message}。")
-            except Exception as exc:  # noqa: BLE001
-                failed_count += 1
-                progress_message = f"{description} 映射失败"
-                logger.opt(exception=show_exception).warning(f"{description} 映射失败，将继续后续任务: {exc}")
-            finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
-            _emit_progress(
-                progress_callback,
-                entity_type,
-                finished_by_type,
-                totals_by_type,
-                completed_count,
-                total_tasks,
-                progress_message,
-            )
+    finally:
+        if isinstance(wwiser_manager, WwiserPool):
+            wwiser_manager.close()
 
     duration = time.time() - start_time
     summary_message = (
@@ -294,12 +528,7 @@ def execute_tasks(  # noqa: PLR0913
         f"成功 {total_tasks - failed_count} 个，失败 {failed_count} 个，"
         f"耗时 {duration:.2f}s"
     )
-    if failed_count == 0:
-        logger.success(summary_message)
-    elif failed_count < total_tasks:
-        logger.warning(summary_message)
-    else:
-        logger.error(summary_message)
+    _log_mapping_summary(runtime_cache, summary_message, failed_count=failed_count, total_tasks=total_tasks)
 
 
 def build_all(  # noqa: PLR0913
@@ -311,6 +540,11 @@ def build_all(  # noqa: PLR0913
     *,
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
+    keep_bnk_cache: bool = False,
+    executor: str = "thread",
+    wwiser_workers: int = 0,
+    incremental: bool = True,
+    columnar: bool = False,
 ) -> None:
     """构建所有实体的事件映射。
 
@@ -322,6 +556,11 @@ def build_all(  # noqa: PLR0913
         integrate_data: 是否生成整合数据。
         ctx: 运行时上下文。
         progress_callback: 每个实体完成后的可选进度回调。
+        keep_bnk_cache: 是否把提取的 events bnk 保留在 ``cache/<version>``。
+        executor: 并发后端，``thread`` 或 ``process``。
+        wwiser_workers: 常驻 wwiser 进程数；为 0 时不启用进程池。
+        incremental: 是否跳过输入指纹未变化的实体。
+        columnar: 是否以列式格式写出映射文件。
     """
 
     tasks: list[EntityTask] = []
@@ -344,6 +583,11 @@ def build_all(  # noqa: PLR0913
         integrate_data,
         ctx=ctx,
         progress_callback=progress_callback,
+        keep_bnk_cache=keep_bnk_cache,
+        executor=executor,
+        wwiser_workers=wwiser_workers,
+        incremental=incremental,
+        columnar=columnar,
     )
 
 
@@ -355,6 +599,11 @@ def build_champions(  # noqa: PLR0913
     *,
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
+    keep_bnk_cache: bool = False,
+    executor: str = "thread",
+    wwiser_workers: int = 0,
+    incremental: bool = True,
+    columnar: bool = False,
 ) -> None:
     """构建指定英雄的事件映射。
 
@@ -365,6 +614,11 @@ def build_champions(  # noqa: PLR0913
         integrate_data: 是否生成整合数据。
         ctx: 运行时上下文。
         progress_callback: 每个实体完成后的可选进度回调。
+        keep_bnk_cache: 是否把提取的 events bnk 保留在 ``cache/<version>``。
+        executor: 并发后端，``thread`` 或 ``process``。
+        wwiser_workers: 常驻 wwiser 进程数；为 0 时不启用进程池。
+        incremental: 是否跳过输入指纹未变化的实体。
+        columnar: 是否以列式格式写出映射文件。
     """
 
     execute_tasks(
@@ -374,6 +628,11 @@ def build_champions(  # noqa: PLR0913
         integrate_data,
         ctx=ctx,
         progress_callback=progress_callback,
+        keep_bnk_cache=keep_bnk_cache,
+        executor=executor,
+        wwiser_workers=wwiser_workers,
+        incremental=incremental,
+        columnar=columnar,
     )
 
 
@@ -385,6 +644,11 @@ def build_maps(  # noqa: PLR0913
     *,
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
+    keep_bnk_cache: bool = False,
+    executor: str = "thread",
+    wwiser_workers: int = 0,
+    incremental: bool = True,
+    columnar: bool = False,
 ) -> None:
     """构建指定地图的事件映射。
 
@@ -395,6 +659,11 @@ def build_maps(  # noqa: PLR0913
         integrate_data: 是否生成整合数据。
         ctx: 运行时上下文。
         progress_callback: 每个实体完成后的可选进度回调。
+        keep_bnk_cache: 是否把提取的 events bnk 保留在 ``cache/<version>``。
+        executor: 并发后端，``thread`` 或 ``process``。
+        wwiser_workers: 常驻 wwiser 进程数；为 0 时不启用进程池。
+        incremental: 是否跳过输入指纹未变化的实体。
+        columnar: 是否以列式格式写出映射文件。
     """
 
     execute_tasks(
@@ -404,6 +673,11 @@ def build_maps(  # noqa: PLR0913
         integrate_data,
         ctx=ctx,
         progress_callback=progress_callback,
+        keep_bnk_cache=keep_bnk_cache,
+        executor=executor,
+        wwiser_workers=wwiser_workers,
+        incremental=incremental,
+        columnar=columnar,
     )
 
 
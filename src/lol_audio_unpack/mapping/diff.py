@@ -0,0 +1,255 @@
+"""版本间映射差异报告。
+
+逐实体比较两个 ``hash/<version>`` 目录：两边都只先列出映射文件路径，再按实体 ID 依次
+读取一对文件、比较后立即写出一行记录并释放，内存占用只与单个实体的映射大小有关。
+
+报告为 JSONL，每行一条记录：
+
+- ``diff_start``：旧版本、新版本
+- ``entity``：单个有变化的实体；``status`` 为 ``added`` / ``removed`` / ``changed``
+- ``diff_end``：整体计数
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from lol_audio_unpack.manager.files import read_data
+from lol_audio_unpack.utils.columnar import COLUMNAR_SUFFIX, load_columnar
+
+from .reverse_index import _ENTITY_DIRS, _iter_entity_files, _iter_integrated_mapping, _iter_raw_mapping
+
+if TYPE_CHECKING:
+    from lol_audio_unpack.app.types import AppContext
+
+RECORD_DIFF_START = "diff_start"
+RECORD_ENTITY = "entity"
+RECORD_DIFF_END = "diff_end"
+
+EventKey = tuple[str, str]
+SubEvents = dict[str, dict[EventKey, frozenset[int]]]
+
+
+@dataclass
+class MappingDiffSummary:
+    """一次版本对比的汇总。"""
+
+    report_path: Path
+    entities_compared: int = 0
+    entities_added: int = 0
+    entities_removed: int = 0
+    entities_changed: int = 0
+    subs_added: int = 0
+    subs_removed: int = 0
+    events_added: int = 0
+    events_removed: int = 0
+    events_changed: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可序列化字典。"""
+        payload = asdict(self)
+        payload["report_path"] = str(self.report_path)
+        return payload
+
+
+def build_diff_report_path(report_root: Path, old_version: str, new_version: str) -> Path:
+    """生成版本对比报告路径。
+
+    Args:
+        report_root: 报告根目录，通常为 ``ctx.report_path``。
+        old_version: 旧版本号。
+        new_version: 新版本号。
+
+    Returns:
+        Path: ``<report_root>/<new_version>/_mapping_diff_<old_version>.jsonl``。
+    """
+    return report_root / new_version / f"_mapping_diff_{old_version}.jsonl"
+
+
+def _entity_sort_key(entity_id: str) -> tuple[int, int, str]:
+    return (0, int(entity_id), entity_id) if entity_id.isdigit() else (1, 0, entity_id)
+
+
+def _list_entity_files(version_hash_dir: Path, entity_dir: str, *, dev_mode: bool) -> dict[str, tuple[Path, bool]]:
+    """列出版本目录下某类实体的映射文件，只记录路径不读取内容。"""
+    return {
+        path.stem: (path, integrated)
+        for path, integrated in _iter_entity_files(version_hash_dir, entity_dir, dev_mode=dev_mode)
+    }
+
+
+def _load_entity_events(path: Path, integrated: bool, entity_type: str, *, dev_mode: bool) -> tuple[str, SubEvents]:
+    """读取单个实体映射，归一化为 ``{子实体: {(类别, 事件): 音频 ID 集合}}``。"""
+    data = load_columnar(path) if path.suffix == COLUMNAR_SUFFIX else read_data(path, dev_mode=dev_mode)
+    iterator = _iter_integrated_mapping if integrated else _iter_raw_mapping
+    entity_name = ""
+    sub_events: SubEvents = {}
+    for name, sub_id, categories in iterator(entity_type, data):
+        entity_name = name
+        events = sub_events.setdefault(sub_id, {})
+        for category, table in categories.items():
+            for event, audio_ids in table.items():
+                events[str(category), str(event)] = frozenset(int(audio_id) for audio_id in audio_ids)
+    return entity_name, sub_events
+
+
+def _event_rows(events: dict[EventKey, frozenset[int]], keys: set[EventKey]) -> list[dict[str, Any]]:
+    return [
+        {"category": category, "event": event, "ids": sorted(events[category, event])}
+        for category, event in sorted(keys)
+    ]
+
+
+def diff_entity_events(old: SubEvents, new: SubEvents) -> dict[str, Any] | None:
+    """比较同一实体在两个版本中的事件映射。
+
+    Args:
+        old: 旧版本的归一化映射。
+        new: 新版本的归一化映射。
+
+    Returns:
+        dict[str, Any] | None: 新增/删除的子实体与逐子实体的事件变化；完全一致时返回 ``None``。
+    """
+    subs: dict[str, dict[str, list[dict[str, Any]]]] = {}
+    for sub_id in sorted(old.keys() & new.keys(), key=_entity_sort_key):
+        old_events, new_events = old[sub_id], new[sub_id]
+        changed = [
+            {
+                "category": category,
+                "event": event,
+                "added_ids": sorted(new_events[category, event] - old_events[category, event]),
+                "removed_ids": sorted(old_events[category, event] - new_events[category, event]),
+            }
+            for category, event in sorted(old_events.keys() & new_events.keys())
+            if old_events[category, event] != new_events[category, event]
+        ]
+        added = _event_rows(new_events, new_events.keys() - old_events.keys())
+        removed = _event_rows(old_events, old_events.keys() - new_events.keys())
+        if added or removed or changed:
+            subs[sub_id] = {"added_events": added, "removed_events": removed, "changed_events": changed}
+
+    added_subs = sorted(new.keys() - old.keys(), key=_entity_sort_key)
+    removed_subs = sorted(old.keys() - new.keys(), key=_entity_sort_key)
+    if not (added_subs or removed_subs or subs):
+        return None
+    return {"added_subs": added_subs, "removed_subs": removed_subs, "subs": subs}
+
+
+def _apply_counts(summary: MappingDiffSummary, status: str, changes: dict[str, Any]) -> None:
+    if status == "added":
+        summary.entities_added += 1
+    elif status == "removed":
+        summary.entities_removed += 1
+    else:
+        summary.entities_changed += 1
+    summary.subs_added += len(changes["added_subs"])
+    summary.subs_removed += len(changes["removed_subs"])
+    for sub_changes in changes["subs"].values():
+        summary.events_added += len(sub_changes["added_events"])
+        summary.events_removed += len(sub_changes["removed_events"])
+        summary.events_changed += len(sub_changes["changed_events"])
+
+
+def diff_mapping_versions(
+    ctx: AppContext,
+    old_version: str,
+    new_version: str,
+    *,
+    report_path: Path | None = None,
+) -> MappingDiffSummary:
+    """逐实体比较两个版本的映射，并流式写出 JSONL 差异报告。
+
+    Args:
+        ctx: 运行时上下文。
+        old_version: 旧版本号，对应 ``hash/<old_version>``。
+        new_version: 新版本号，对应 ``hash/<new_version>``。
+        report_path: 报告路径；为 ``None`` 时写入 ``reports/<new_version>/``。
+
+    Returns:
+        MappingDiffSummary: 对比汇总。
+
+    Raises:
+        FileNotFoundError: 任一版本的映射目录不存在时抛出。
+    """
+    dev_mode = bool(getattr(ctx.config, "dev_mode", False))
+    old_dir, new_dir = ctx.hash_path / old_version, ctx.hash_path / new_version
+    for version_dir in (old_dir, new_dir):
+        if not version_dir.is_dir():
+            raise FileNotFoundError(f"映射目录不存在: {version_dir}")
+
+    summary = MappingDiffSummary(
+        report_path=report_path or build_diff_report_path(ctx.report_path, old_version, new_version)
+    )
+    summary.report_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"开始对比映射: {old_version} -> {new_version}")
+
+    with summary.report_path.open("w", encoding="utf-8") as report:
+
+        def write(record: dict[str, Any]) -> None:
+            report.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        write({"kind": RECORD_DIFF_START, "old_version": old_version, "new_version": new_version})
+        for entity_type, entity_dir in _ENTITY_DIRS:
+            old_files = _list_entity_files(old_dir, entity_dir, dev_mode=dev_mode)
+            new_files = _list_entity_files(new_dir, entity_dir, dev_mode=dev_mode)
+            for entity_id in sorted(old_files.keys() | new_files.keys(), key=_entity_sort_key):
+                summary.entities_compared += 1
+                old_name, old_events = (
+                    _load_entity_events(*old_files[entity_id], entity_type, dev_mode=dev_mode)
+                    if entity_id in old_files
+                    else ("", {})
+                )
+                new_name, new_events = (
+                    _load_entity_events(*new_files[entity_id], entity_type, dev_mode=dev_mode)
+                    if entity_id in new_files
+                    else ("", {})
+                )
+                changes = diff_entity_events(old_events, new_events)
+                if changes is None:
+                    continue
+
+                status = (
+                    "added" if entity_id not in old_files else "removed" if entity_id not in new_files else "changed"
+                )
+                _apply_counts(summary, status, changes)
+                entity_name = new_name or old_name
+                write(
+                    {
+                        "kind": RECORD_ENTITY,
+                        "entity_type": entity_type,
+                        "entity_id": entity_id,
+                        "entity_name": entity_name,
+                        "status": status,
+                        **changes,
+                    }
+                )
+                logger.info(
+                    f"{entity_type} {entity_id} ({entity_name}) {status}: 子实体 +{len(changes['added_subs'])} "
+                    f"-{len(changes['removed_subs'])}，变化子实体 {len(changes['subs'])} 个"
+                )
+
+        write({"kind": RECORD_DIFF_END, **summary.to_dict()})
+
+    logger.success(
+        f"映射对比完成: {old_version} -> {new_version}，共 {summary.entities_compared} 个实体，"
+        f"新增 {summary.entities_added}、删除 {summary.entities_removed}、变化 {summary.entities_changed}；"
+        f"事件新增 {summary.events_added}、删除 {summary.events_removed}、ID 变化 {summary.events_changed}；"
+        f"报告: {summary.report_path}"
+    )
+    return summary
+
+
+__all__ = [
+    "RECORD_DIFF_END",
+    "RECORD_DIFF_START",
+    "RECORD_ENTITY",
+    "MappingDiffSummary",
+    "build_diff_report_path",
+    "diff_entity_events",
+    "diff_mapping_versions",
+]
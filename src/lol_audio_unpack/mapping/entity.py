@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from league_tools import AudioEventMapper, WwiserManager
+from league_tools import AudioEventMapper
 from loguru import logger
 
 from lol_audio_unpack.manager import DataReader
@@ -15,6 +17,7 @@ from lol_audio_unpack.model import AudioEntityData
 from lol_audio_unpack.utils.logging import performance_monitor
 
 from . import session as mapping_session
+from .fingerprint import FINGERPRINT_METADATA_KEY, compute_entity_fingerprint, reuse_unchanged_mapping
 
 if TYPE_CHECKING:
     from lol_audio_unpack.app.types import AppContext
@@ -97,16 +100,72 @@ def _resolve_wad_path(entity_data: AudioEntityData, category: str, *, ctx: AppCo
     return None
 
 
+def _prefetch_entity_banks(
+    entity_data: AudioEntityData,
+    version_cache_dir: Path,
+    wwiser_manager: mapping_session.WwiserBackend | None,
+    runtime_cache: mapping_session.RuntimeCache | None,
+    *,
+    ctx: AppContext,
+) -> mapping_session.EventBanks | None:
+    """在解析 HIRC 之前，按 WAD 一次性提取实体需要的全部 events bnk。
+
+    Args:
+        entity_data: 包含 events 的实体数据。
+        version_cache_dir: 版本化 cache 目录。
+        wwiser_manager: 可选的 wwiser 管理器；配置时 bank 必须落盘。
+        runtime_cache: 映射流程共享缓存。
+        ctx: 运行时上下文。
+
+    Returns:
+        mapping_session.EventBanks | None: 内存模式下读出的 bnk 字节；没有可用字节时返回 ``None``。
+    """
+
+    banks_by_wad: dict[Path, set[str]] = {}
+    for sub_id, sub_data in entity_data.sub_entities.items():
+        events_data = entity_data.events.get(sub_id, {}).get("events", {})
+        for category, paths_list in sub_data["categories"].items():
+            if not events_data.get(category):
+                continue
+            audio_type = "VO" if "VO" in category else "SFX"
+            wad_path = entity_data.get_wad_path(audio_type, ctx=ctx)
+            if wad_path is None:
+                continue
+            for path_group in paths_list:
+                bnk_paths = [path for path in path_group if path.endswith("_events.bnk")]
+                if len(bnk_paths) == 1:
+                    banks_by_wad.setdefault(wad_path, set()).add(bnk_paths[0])
+
+    keep_bnk_files = runtime_cache is not None and runtime_cache.keep_bnk_files
+    in_memory = wwiser_manager is None and not keep_bnk_files
+    event_banks: mapping_session.EventBanks = {}
+    for wad_path, bnk_rel_paths in banks_by_wad.items():
+        try:
+            event_banks.update(
+                mapping_session.prefetch_event_banks(
+                    wad_path,
+                    bnk_rel_paths,
+                    out_dir=version_cache_dir,
+                    in_memory=in_memory,
+                    runtime_cache=runtime_cache,
+                )
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"批量提取 {wad_path.name} 中的 events bnk 失败，改为逐个路径组提取: {exc}")
+    return event_banks or None
+
+
 def _build_category_mapping(  # noqa: PLR0913
     entity_data: AudioEntityData,
     category: str,
     paths_list: list[list[str]],
     event_list: list[str],
     version_cache_dir: Path,
-    wwiser_manager: WwiserManager | None,
+    wwiser_manager: mapping_session.WwiserBackend | None,
     runtime_cache: mapping_session.RuntimeCache | None,
     *,
     ctx: AppContext,
+    event_banks: mapping_session.EventBanks | None = None,
 ) -> tuple[Any | None, int]:
     """构建单个类别的映射结果。
 
@@ -119,6 +178,7 @@ def _build_category_mapping(  # noqa: PLR0913
         wwiser_manager: 可选的 wwiser 管理器。
         runtime_cache: 映射流程共享缓存。
         ctx: 运行时上下文。
+        event_banks: 解包阶段已读出的 events bnk；命中时直接使用内存字节。
 
     Returns:
         tuple[Any | None, int]: 合并后的映射对象与异常路径组数量。
@@ -148,23 +208,44 @@ def _build_category_mapping(  # noqa: PLR0913
             continue
 
         try:
-            wad_obj = mapping_session._get_wad(wad_path, runtime_cache=runtime_cache)
             bnk_rel_path = bnk_paths[0]
             extract_key = (wad_path, bnk_rel_path)
-            if not mapping_session._is_bnk_extracted(extract_key, runtime_cache=runtime_cache):
-                wad_obj.extract(bnk_paths, out_dir=version_cache_dir)
-                mapping_session._mark_bnk_extracted(extract_key, runtime_cache=runtime_cache)
-
             bnk_path = version_cache_dir / bnk_rel_path
-            if not bnk_path.exists():
-                logger.warning(f"提取的BNK文件不存在: {bnk_path}")
-                continue
+            bnk_data = event_banks.get(extract_key) if event_banks else None
+            load_bnk = None
+            if bnk_data is not None and runtime_cache is not None and runtime_cache.keep_bnk_files:
+                # 同轮映射直接用解包读出的字节，要求保留 bnk 缓存时顺手落盘一份
+                if not bnk_path.exists():
+                    bnk_path.parent.mkdir(parents=True, exist_ok=True)
+                    bnk_path.write_bytes(bnk_data)
+                mapping_session._mark_bnk_extracted(extract_key, runtime_cache=runtime_cache)
+            if bnk_data is None:
+                if event_banks is not None:
+                    # 解包阶段排除了该类型或选择了不同的 WAD，退回单独提取；
+                    # 批量预读时本轮已提取过的 bank 也会走到这里，由 HIRC 缓存兜底
+                    logger.debug(f"预先读出的 events bnk 中没有 {bnk_rel_path}，改为从 WAD 单独提取")
+                wad_obj = mapping_session._get_wad(wad_path, runtime_cache=runtime_cache)
+                keep_bnk_files = runtime_cache is not None and runtime_cache.keep_bnk_files
+                if wwiser_manager is None and not keep_bnk_files:
+                    # NativeHIRC 可以直接解析字节，不再经 cache 目录写一遍再读回来；
+                    # 读取延迟到 HIRC 缓存未命中时，共享 bank 只解压一次
+                    load_bnk = partial(mapping_session.read_bnk_bytes, wad_obj, bnk_rel_path)
+                else:
+                    if not mapping_session._is_bnk_extracted(extract_key, runtime_cache=runtime_cache):
+                        wad_obj.extract(bnk_paths, out_dir=version_cache_dir)
+                        mapping_session._mark_bnk_extracted(extract_key, runtime_cache=runtime_cache)
+
+                    if not bnk_path.exists():
+                        logger.warning(f"提取的BNK文件不存在: {bnk_path}")
+                        continue
 
             hirc = mapping_session._get_cached_hirc(
                 bnk_path=bnk_path,
                 hirc_cache_dir=hirc_cache_dir,
                 wwiser_manager=wwiser_manager,
                 runtime_cache=runtime_cache,
+                bnk_data=bnk_data,
+                load_bnk=load_bnk,
             )
             current_mapping = AudioEventMapper(event_list, hirc).build_mapping()
 
@@ -190,6 +271,7 @@ def _write_integrated_result(
     version_hash_dir: Path,
     *,
     ctx: AppContext,
+    columnar: bool = False,
 ) -> None:
     """保存整合结果到文件。
 
@@ -198,6 +280,7 @@ def _write_integrated_result(
         integrated_result: 已整合的完整输出。
         version_hash_dir: 版本化 hash 目录。
         ctx: 运行时上下文。
+        columnar: 是否以列式格式写出。
     """
 
     data_key = "skins" if entity_data.entity_type == "champion" else "map"
@@ -208,17 +291,18 @@ def _write_integrated_result(
     integration_save_dir = version_hash_dir / "integrated" / entity_group
     integration_save_dir.mkdir(parents=True, exist_ok=True)
     integration_file_base = integration_save_dir / entity_data.entity_id
-    write_data(integrated_result, integration_file_base, dev_mode=ctx.config.dev_mode)
+    write_data(integrated_result, integration_file_base, dev_mode=ctx.config.dev_mode, columnar=columnar)
     logger.debug(f"整合数据已保存: {integration_file_base}")
 
 
-def _write_mapping_result(
+def _write_mapping_result(  # noqa: PLR0913
     mapping_result: dict[str, Any],
     mapping_data_key: str,
     mapping_save_dir: Path,
     entity_data: AudioEntityData,
     *,
     ctx: AppContext,
+    columnar: bool = False,
 ) -> None:
     """保存纯 mapping 结果到文件。
 
@@ -228,6 +312,7 @@ def _write_mapping_result(
         mapping_save_dir: 目标输出目录。
         entity_data: 当前实体数据。
         ctx: 运行时上下文。
+        columnar: 是否以列式格式写出。
     """
 
     metadata = mapping_result.get("metadata", {})
@@ -236,13 +321,38 @@ def _write_mapping_result(
 
     if mapping_result[mapping_data_key]:
         mapping_file_base = mapping_save_dir / entity_data.entity_id
-        write_data(mapping_result, mapping_file_base, dev_mode=ctx.config.dev_mode)
+        write_data(mapping_result, mapping_file_base, dev_mode=ctx.config.dev_mode, columnar=columnar)
         logger.debug(f"映射结果已保存: {mapping_file_base}")
         return
 
     logger.warning(f"{entity_data.entity_name} 没有找到任何有效映射数据")
 
 
+def _resolve_entity_fingerprint(  # noqa: PLR0913
+    entity_data: AudioEntityData,
+    reader: DataReader,
+    manager: mapping_session.WwiserBackend | None,
+    integrate_data: bool,
+    runtime_cache: mapping_session.RuntimeCache,
+    *,
+    ctx: AppContext,
+) -> str | None:
+    """计算实体的输入指纹；失败时返回 ``None`` 并按完整构建处理。"""
+
+    try:
+        return compute_entity_fingerprint(
+            entity_data,
+            reader,
+            backend="native" if manager is None else "wwiser",
+            integrate_data=integrate_data,
+            runtime_cache=runtime_cache,
+            ctx=ctx,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"计算 {entity_data.entity_name} 的输入指纹失败，将完整构建映射: {exc}")
+        return None
+
+
 def _log_entity_summary(
     entity_name: str,
     *,
@@ -280,11 +390,12 @@ def _log_entity_summary(
 def build_entity(  # noqa: PLR0913
     entity_data: AudioEntityData,
     reader: DataReader,
-    wwiser_manager: WwiserManager | None = None,
+    wwiser_manager: mapping_session.WwiserBackend | None = None,
     integrate_data: bool = False,
     runtime_cache: mapping_session.RuntimeCache | None = None,
     *,
     ctx: AppContext,
+    event_banks: mapping_session.EventBanks | None = None,
 ) -> dict[str, Any]:
     """构建单个实体的事件映射。
 
@@ -293,8 +404,12 @@ def build_entity(  # noqa: PLR0913
         reader: 数据读取器实例。
         wwiser_manager: 可复用的 wwiser 管理器；为 ``None`` 时按 ``ctx`` 自动选择后端。
         integrate_data: 是否输出整合数据。
-        runtime_cache: 映射流程共享缓存，用于复用 WAD/HIRC 解析结果。
+        runtime_cache: 映射流程共享缓存，用于复用 WAD/HIRC 解析结果；
+            开启 ``incremental`` 时输入指纹未变化的实体直接复用已有映射；
+            开启 ``columnar`` 时映射文件以列式格式写出。
         ctx: 运行时上下文。
+        event_banks: 解包阶段顺带读出的 events bnk；提供时不再重复读取并解压 WAD，
+            未提供时先按 WAD 一次性预读实体需要的全部 events bnk。
 
     Returns:
         dict[str, Any]: 映射结果或整合结果。
@@ -309,6 +424,28 @@ def build_entity(  # noqa: PLR0913
     logger.info(f"构建 {entity_data.entity_name} (ID:{entity_data.entity_id}) 的事件映射")
     manager = mapping_session._create_wwiser_manager(ctx) if wwiser_manager is None else wwiser_manager
     version_cache_dir, version_hash_dir = _ensure_version_dirs(reader, ctx=ctx)
+    columnar = runtime_cache is not None and runtime_cache.columnar
+
+    fingerprint = None
+    if runtime_cache is not None and runtime_cache.incremental:
+        fingerprint = _resolve_entity_fingerprint(entity_data, reader, manager, integrate_data, runtime_cache, ctx=ctx)
+    if fingerprint is not None:
+        reused = reuse_unchanged_mapping(
+            entity_data,
+            fingerprint,
+            version=reader.version,
+            integrate_data=integrate_data,
+            ctx=ctx,
+            columnar=columnar,
+        )
+        if reused is not None:
+            with runtime_cache.cache_lock or nullcontext():
+                runtime_cache.reused_entity_count += 1
+            return reused
+
+    if event_banks is None:
+        event_banks = _prefetch_entity_banks(entity_data, version_cache_dir, manager, runtime_cache, ctx=ctx)
+
     mapping_result, mapping_data_key = _build_mapping_result(entity_data, reader)
     entity_group = "champions" if entity_data.entity_type == "champion" else "maps"
     mapping_save_dir = version_hash_dir / entity_group
@@ -342,6 +479,7 @@ def build_entity(  # noqa: PLR0913
                 manager,
                 runtime_cache,
                 ctx=ctx,
+                event_banks=event_banks,
             )
 
             if category_mapping is not None and category_mapping.forward_mapping:
@@ -373,9 +511,16 @@ def build_entity(  # noqa: PLR0913
         else:
             logger.debug(f"子实体 {sub_id} 无有效映射数据，跳过保存")
 
+    if fingerprint is not None:
+        if errored_event_count > 0:
+            # 有异常事件时不写指纹，下次运行会重新构建而不是复用残缺结果
+            logger.debug(f"{entity_data.entity_name} 存在异常事件，不记录输入指纹")
+        else:
+            mapping_result["metadata"][FINGERPRINT_METADATA_KEY] = fingerprint
+
     if integrate_data:
         integrated_result = integrate_entity(entity_data, reader, mapping_result)
-        _write_integrated_result(entity_data, integrated_result, version_hash_dir, ctx=ctx)
+        _write_integrated_result(entity_data, integrated_result, version_hash_dir, ctx=ctx, columnar=columnar)
         _log_entity_summary(
             entity_data.entity_name,
             mapped_count=mapped_event_count,
@@ -385,7 +530,7 @@ def build_entity(  # noqa: PLR0913
         )
         return integrated_result
 
-    _write_mapping_result(mapping_result, mapping_data_key, mapping_save_dir, entity_data, ctx=ctx)
+    _write_mapping_result(mapping_result, mapping_data_key, mapping_save_dir, entity_data, ctx=ctx, columnar=columnar)
     _log_entity_summary(
         entity_data.entity_name,
         mapped_count=mapped_event_count,
@@ -509,7 +654,7 @@ def integrate_entity(
 def build_champion(  # noqa: PLR0913
     champion_id: int,
     reader: DataReader,
-    wwiser_manager: WwiserManager | None = None,
+    wwiser_manager: mapping_session.WwiserBackend | None = None,
     integrate_data: bool = False,
     runtime_cache: mapping_session.RuntimeCache | None = None,
     *,
@@ -553,7 +698,7 @@ def build_champion(  # noqa: PLR0913
 def build_map(  # noqa: PLR0913
     map_id: int,
     reader: DataReader,
-    wwiser_manager: WwiserManager | None = None,
+    wwiser_manager: mapping_session.WwiserBackend | None = None,
     integrate_data: bool = False,
     runtime_cache: mapping_session.RuntimeCache | None = None,
     *,
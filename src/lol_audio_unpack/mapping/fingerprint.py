@@ -0,0 +1,227 @@
+"""映射输入指纹与增量复用。
+
+实体映射只取决于涉及的 events bnk、实体的事件列表和映射器版本。把这些输入的摘要
+写进映射文件的 ``metadata``，再次运行时指纹一致就直接复用已有文件；
+新版本目录还可以从上一个版本的同名文件播种，只重建真正变化过的实体。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from lol_audio_unpack.app.artifacts import resolve_mapping_path
+from lol_audio_unpack.manager.files import read_data, write_data
+from lol_audio_unpack.runtime.wad import lookup_sections
+
+from . import session as mapping_session
+from .hirc_store import _resolve_parser_tag
+
+if TYPE_CHECKING:
+    from lol_audio_unpack.app.types import AppContext
+    from lol_audio_unpack.manager import DataReader
+    from lol_audio_unpack.model import AudioEntityData
+
+FINGERPRINT_METADATA_KEY = "inputFingerprint"
+# 映射结构或指纹组成变化时递增，旧文件会因指纹不同而自然重建
+MAPPING_FINGERPRINT_VERSION = 1
+_MISSING_BANK = "missing"
+
+
+def _version_sort_key(version: str) -> tuple[int, ...]:
+    """把 ``15.20.123`` 这类版本目录名转成可比较的数字元组。"""
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
+def _collect_event_banks(entity_data: AudioEntityData, *, ctx: AppContext) -> dict[Path, set[str]]:
+    """按 WAD 汇总实体涉及的全部 events bnk。"""
+    banks_by_wad: dict[Path, set[str]] = {}
+    for sub_data in entity_data.sub_entities.values():
+        for category, paths_list in sub_data["categories"].items():
+            audio_type = "VO" if "VO" in category else "SFX"
+            wad_path = entity_data.get_wad_path(audio_type, ctx=ctx)
+            if wad_path is None:
+                continue
+            for path_group in paths_list:
+                banks_by_wad.setdefault(wad_path, set()).update(
+                    path for path in path_group if path.endswith("_events.bnk")
+                )
+    return banks_by_wad
+
+
+def _bank_checksums(
+    entity_data: AudioEntityData,
+    runtime_cache: mapping_session.RuntimeCache,
+    *,
+    ctx: AppContext,
+) -> dict[str, str]:
+    """读取实体涉及的 events bnk 校验和。
+
+    优先使用 WAD 目录表里的条目校验和，不需要解压任何数据；
+    旧格式 WAD 没有校验和时才回退为读取 bnk 内容计算哈希。
+    """
+    checksums: dict[str, str] = {}
+    for wad_path, bnk_paths in _collect_event_banks(entity_data, ctx=ctx).items():
+        wad_obj = mapping_session._get_wad(wad_path, runtime_cache=runtime_cache)
+        sorted_paths = sorted(bnk_paths)
+        for bnk_rel_path, section in zip(sorted_paths, lookup_sections(wad_obj, sorted_paths), strict=True):
+            key = f"{wad_path.name}:{bnk_rel_path}"
+            if section is None:
+                checksums[key] = _MISSING_BANK
+            elif section.sha256:
+                checksums[key] = f"xxh3:{section.sha256:016x}"
+            else:
+                logger.debug(f"WAD 条目没有校验和，改为按内容计算指纹: {bnk_rel_path}")
+                bnk_data = mapping_session.read_bnk_bytes(wad_obj, bnk_rel_path)
+                checksums[key] = f"sha256:{hashlib.sha256(bnk_data).hexdigest()}"
+    return checksums
+
+
+def _integration_inputs(entity_data: AudioEntityData, reader: DataReader) -> dict[str, Any]:
+    """整合模式额外依赖的实体信息与语言列表。"""
+    entity_id = int(entity_data.entity_id)
+    if entity_data.entity_type == "champion":
+        entity_info = reader.get_champion(entity_id)
+        banks_data = reader.get_champion_banks(entity_id)
+    else:
+        entity_info = reader.get_map(entity_id)
+        banks_data = reader.get_map_banks(entity_id)
+    return {"info": entity_info, "banks": banks_data, "languages": reader.get_languages()}
+
+
+def compute_entity_fingerprint(  # noqa: PLR0913
+    entity_data: AudioEntityData,
+    reader: DataReader,
+    *,
+    backend: str,
+    integrate_data: bool,
+    runtime_cache: mapping_session.RuntimeCache,
+    ctx: AppContext,
+) -> str:
+    """计算实体映射的输入指纹。
+
+    Args:
+        entity_data: 包含 events 的实体数据。
+        reader: 数据读取器实例。
+        backend: HIRC 后端标识，``native`` 或 ``wwiser``。
+        integrate_data: 是否输出整合数据。
+        runtime_cache: 映射流程共享缓存，用于复用已打开的 WAD。
+        ctx: 运行时上下文。
+
+    Returns:
+        str: 输入指纹。
+    """
+    payload: dict[str, Any] = {
+        "format": MAPPING_FINGERPRINT_VERSION,
+        "mapper": _resolve_parser_tag(),
+        "backend": backend,
+        "integrate": integrate_data,
+        "wad": [entity_data.wad_root, entity_data.wad_language],
+        "categories": {sub_id: sub_data["categories"] for sub_id, sub_data in entity_data.sub_entities.items()},
+        "events": entity_data.events,
+        "banks": _bank_checksums(entity_data, runtime_cache, ctx=ctx),
+    }
+    if integrate_data:
+        payload["integration"] = _integration_inputs(entity_data, reader)
+    if runtime_cache.columnar:
+        # 只在列式输出时写入该键，切换格式会触发重建，嵌套格式的已有指纹保持不变
+        payload["layout"] = "columnar"
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _load_matching_mapping(path: Path | None, fingerprint: str, *, dev_mode: bool) -> dict[str, Any] | None:
+    """读取指纹一致的映射文件；不存在或指纹不同返回 ``None``。"""
+    if path is None:
+        return None
+    data = read_data(path, dev_mode=dev_mode)
+    if data.get("metadata", {}).get(FINGERPRINT_METADATA_KEY) != fingerprint:
+        return None
+    return data
+
+
+def _find_seed_version(ctx: AppContext, version: str) -> str | None:
+    """返回比当前版本更早的最近一个映射版本目录。"""
+    hash_root = ctx.hash_path
+    if not hash_root.is_dir():
+        return None
+    current_key = _version_sort_key(version)
+    older = [
+        entry.name
+        for entry in hash_root.iterdir()
+        if entry.is_dir() and entry.name != version and _version_sort_key(entry.name) < current_key
+    ]
+    return max(older, key=_version_sort_key, default=None)
+
+
+def reuse_unchanged_mapping(  # noqa: PLR0913
+    entity_data: AudioEntityData,
+    fingerprint: str,
+    *,
+    version: str,
+    integrate_data: bool,
+    ctx: AppContext,
+    columnar: bool = False,
+) -> dict[str, Any] | None:
+    """尝试复用指纹一致的已有映射。
+
+    先看当前版本目录；没有命中时再看上一个版本目录，命中后把结果写入当前版本，
+    完成新版本目录的播种。
+
+    Args:
+        entity_data: 当前实体数据。
+        fingerprint: 本次计算的输入指纹。
+        version: 当前数据版本号。
+        integrate_data: 是否输出整合数据。
+        ctx: 运行时上下文。
+        columnar: 播种写入当前版本时是否使用列式格式。
+
+    Returns:
+        dict[str, Any] | None: 可复用的映射结果；需要重建时返回 ``None``。
+    """
+    dev_mode = bool(getattr(ctx.config, "dev_mode", False))
+    entity_dir = "champions" if entity_data.entity_type == "champion" else "maps"
+
+    current_path = resolve_mapping_path(
+        ctx, entity_dir=entity_dir, entity_id=entity_data.entity_id, version=version, integrate_data=integrate_data
+    )
+    if (existing := _load_matching_mapping(current_path, fingerprint, dev_mode=dev_mode)) is not None:
+        logger.info(f"{entity_data.entity_name} 输入指纹未变化，跳过映射")
+        return existing
+
+    seed_version = _find_seed_version(ctx, version)
+    if seed_version is None:
+        return None
+    seed_path = resolve_mapping_path(
+        ctx,
+        entity_dir=entity_dir,
+        entity_id=entity_data.entity_id,
+        version=seed_version,
+        integrate_data=integrate_data,
+    )
+    seeded = _load_matching_mapping(seed_path, fingerprint, dev_mode=dev_mode)
+    if seeded is None:
+        return None
+
+    seeded["metadata"]["gameVersion"] = version
+    target_dir = ctx.hash_path / version
+    if integrate_data:
+        target_dir /= "integrated"
+    target_dir /= entity_dir
+    target_dir.mkdir(parents=True, exist_ok=True)
+    write_data(seeded, target_dir / entity_data.entity_id, dev_mode=dev_mode, columnar=columnar)
+    logger.info(f"{entity_data.entity_name} 输入指纹与 {seed_version} 一致，已从旧版本复制映射")
+    return seeded
+
+
+__all__ = [
+    "FINGERPRINT_METADATA_KEY",
+    "MAPPING_FINGERPRINT_VERSION",
+    "compute_entity_fingerprint",
+    "reuse_unchanged_mapping",
+]
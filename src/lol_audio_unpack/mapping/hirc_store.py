@@ -0,0 +1,206 @@
+"""跨版本共享的 HIRC 解析结果缓存。
+
+大部分 ``_events.bnk`` 在相邻版本之间逐字节不变，按 bnk 内容哈希缓存解析结果后，
+新版本的 mapping 只需要解析真正变化过的 bank。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as get_package_version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from lol_audio_unpack.config.schema import DEFAULT_HIRC_STORE_MB
+
+if TYPE_CHECKING:
+    from lol_audio_unpack.app.types import AppContext
+
+HIRC_STORE_DIR_NAME = "hirc_store"
+# 缓存条目结构变化时递增，旧条目会因目录不同而自然失效并被容量淘汰
+HIRC_STORE_FORMAT = 1
+DEFAULT_HIRC_STORE_LIMIT_BYTES = DEFAULT_HIRC_STORE_MB * 1024 * 1024
+_ENTRY_SUFFIX = ".pkl"
+
+
+def _resolve_parser_tag() -> str:
+    """返回解析器版本标签，league_tools 升级后旧条目不再命中。"""
+    try:
+        league_tools_version = get_package_version("league-tools")
+    except PackageNotFoundError:
+        league_tools_version = "unknown"
+        logger.debug("无法获取 league-tools 版本，HIRC 共享缓存使用 unknown 作为解析器标签")
+    return f"v{HIRC_STORE_FORMAT}-{league_tools_version}"
+
+
+class HircStore:
+    """按 ``(bnk 内容哈希, 后端, 解析器版本)`` 存放 HIRC 解析结果的磁盘缓存。
+
+    条目按访问时间做 LRU 淘汰，总大小超过 ``max_bytes`` 时从最久未用的条目开始删除。
+    多线程共享同一实例是安全的；写入采用临时文件加原子替换，不会读到半截条目。
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = DEFAULT_HIRC_STORE_LIMIT_BYTES,
+        parser_tag: str | None = None,
+    ) -> None:
+        """初始化缓存。
+
+        Args:
+            root: 缓存根目录，与游戏版本无关。
+            max_bytes: 缓存总大小上限（字节）。
+            parser_tag: 解析器版本标签；默认由 league_tools 版本推导。
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.parser_tag = parser_tag or _resolve_parser_tag()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # 首次写入时才扫描目录统计大小，之后只做增量累加
+        self._total_bytes: int | None = None
+
+    @staticmethod
+    def digest(bnk_data: bytes) -> str:
+        """计算 bnk 内容哈希。"""
+        return hashlib.sha256(bnk_data).hexdigest()
+
+    def _entry_path(self, digest: str, backend: str) -> Path:
+        return self.root / self.parser_tag / backend / digest[:2] / f"{digest}{_ENTRY_SUFFIX}"
+
+    def load(self, digest: str, backend: str) -> Any | None:
+        """读取缓存条目。
+
+        Args:
+            digest: bnk 内容哈希。
+            backend: HIRC 后端标识。
+
+        Returns:
+            Any | None: 命中时返回解析结果，否则返回 ``None``。
+        """
+        path = self._entry_path(digest, backend)
+        try:
+            with path.open("rb") as file:
+                parsed = pickle.load(file)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception as exc:  # noqa: BLE001
+            # 条目损坏时删掉重建，不影响本次解析
+            logger.warning(f"HIRC 共享缓存条目损坏，将重新解析: {path} ({exc})")
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            # 刷新访问时间，供 LRU 淘汰使用
+            os.utime(path)
+        except OSError as exc:
+            logger.debug(f"刷新 HIRC 共享缓存访问时间失败: {path} ({exc})")
+        with self._lock:
+            self.hits += 1
+        return parsed
+
+    def save(self, digest: str, backend: str, parsed: Any) -> None:
+        """写入缓存条目，必要时按容量淘汰旧条目。
+
+        Args:
+            digest: bnk 内容哈希。
+            backend: HIRC 后端标识。
+            parsed: 解析结果。
+        """
+        path = self._entry_path(digest, backend)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            payload = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except Exception as exc:  # noqa: BLE001
+            # 缓存写失败只影响下次命中率，不中断映射
+            logger.warning(f"写入 HIRC 共享缓存失败: {path} ({exc})")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(payload)
+            if self._total_bytes > self.max_bytes:
+                self._prune_locked()
+
+    def _iter_entries(self) -> list[Path]:
+        if not self.root.exists():
+            return []
+        return list(self.root.rglob(f"*{_ENTRY_SUFFIX}"))
+
+    def _scan_total_bytes(self) -> int:
+        total = 0
+        for entry in self._iter_entries():
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _prune_locked(self) -> None:
+        """按访问时间从旧到新删除条目，直到总大小回到上限以内。"""
+        entries: list[tuple[float, int, Path]] = []
+        for entry in self._iter_entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort(key=lambda item: item[0])
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        logger.debug(f"HIRC 共享缓存超出上限，已淘汰 {removed} 个条目，剩余 {total} 字节")
+
+    def describe(self) -> str:
+        """返回本轮命中统计，用于日志汇总。"""
+        return f"HIRC 共享缓存: 命中 {self.hits}，未命中 {self.misses}"
+
+
+def create_hirc_store(ctx: AppContext) -> HircStore | None:
+    """按上下文创建跨版本共享的 HIRC 缓存。
+
+    Args:
+        ctx: 运行时上下文；容量上限取自 ``HIRC_STORE_MB``。
+
+    Returns:
+        HircStore | None: 位于 ``cache/hirc_store`` 下的缓存实例；上限为 ``0`` 时返回 ``None`` 表示关闭。
+    """
+    limit_mb = ctx.config.hirc_store_mb
+    if limit_mb <= 0:
+        logger.debug("HIRC_STORE_MB 为 0，不启用 HIRC 共享缓存")
+        return None
+    return HircStore(ctx.cache_path / HIRC_STORE_DIR_NAME, max_bytes=limit_mb * 1024 * 1024)
+
+
+__all__ = [
+    "DEFAULT_HIRC_STORE_LIMIT_BYTES",
+    "HIRC_STORE_DIR_NAME",
+    "HircStore",
+    "create_hirc_store",
+]
@@ -0,0 +1,221 @@
+"""映射批处理的多进程执行后端。
+
+HIRC 解析与 ``AudioEventMapper.build_mapping()`` 都是纯 Python 的 CPU 密集操作，
+线程池受 GIL 限制难以用满多核。这里把实体分发到独立进程，每个进程持有自己的
+``DataReader``、wwiser 管理器与 ``RuntimeCache``，映射文件仍由各进程按实体写出，
+父进程只负责调度、进度回传与汇总计数。
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from . import session as mapping_session
+from .hirc_store import create_hirc_store
+
+if TYPE_CHECKING:
+    from lol_audio_unpack.app.types import AppContext
+
+    from .batch import EntityTask
+
+MAPPING_EXECUTORS = ("thread", "process")
+# 子进程只输出告警以上的日志，逐实体进度由父进程统一记录
+_WORKER_LOG_LEVEL = "WARNING"
+
+
+@dataclass
+class _WorkerState:
+    """单个映射子进程内复用的状态。"""
+
+    ctx: AppContext
+    reader: Any
+    wwiser_manager: Any
+    runtime_cache: mapping_session.RuntimeCache
+
+
+_worker_state: _WorkerState | None = None
+
+
+def _picklable_context(ctx: AppContext) -> AppContext:
+    """复制一份可跨进程传递的上下文。
+
+    ``runtime_cache`` 里可能有锁、注册表等无法序列化的对象，只保留版本号这类简单值。
+    """
+    simple_cache = {
+        key: value for key, value in ctx.runtime_cache.items() if isinstance(value, str | int | float | bool)
+    }
+    return replace(ctx, runtime_cache=simple_cache)
+
+
+def _init_worker(ctx: AppContext, keep_bnk_cache: bool, incremental: bool, columnar: bool) -> None:
+    """子进程初始化：创建本进程独享的读取器与缓存。
+
+    Args:
+        ctx: 可序列化的运行时上下文。
+        keep_bnk_cache: 是否把提取的 events bnk 保留在 ``cache/<version>``。
+        incremental: 是否跳过输入指纹未变化的实体。
+        columnar: 是否以列式格式写出映射文件。
+    """
+    global _worker_state  # noqa: PLW0603
+
+    from lol_audio_unpack.manager import DataReader  # noqa: PLC0415
+
+    logger.remove()
+    logger.add(sys.stderr, level=_WORKER_LOG_LEVEL)
+    logger.disable("league_tools")
+
+    _worker_state = _WorkerState(
+        ctx=ctx,
+        reader=DataReader(ctx=ctx),
+        wwiser_manager=mapping_session._create_wwiser_manager(ctx),
+        # 单个进程内串行处理实体，不需要缓存锁
+        runtime_cache=mapping_session.RuntimeCache(
+            hirc_store=create_hirc_store(ctx),
+            keep_bnk_files=keep_bnk_cache,
+            incremental=incremental,
+            columnar=columnar,
+        ),
+    )
+
+
+def _snapshot_counts(runtime_cache: mapping_session.RuntimeCache) -> dict[str, int]:
+    store = runtime_cache.hirc_store
+    return {
+        "hirc_parse_count": runtime_cache.hirc_parse_count,
+        "hirc_store_hit_count": runtime_cache.hirc_store_hit_count,
+        "hirc_dedup_count": runtime_cache.hirc_dedup_count,
+        "reused_entity_count": runtime_cache.reused_entity_count,
+        "store_hits": 0 if store is None else store.hits,
+        "store_misses": 0 if store is None else store.misses,
+    }
+
+
+def _run_worker_task(entity_type: str, entity_id: int, integrate_data: bool) -> dict[str, int]:
+    """在子进程中构建单个实体的映射。
+
+    Args:
+        entity_type: 实体类型。
+        entity_id: 实体 ID。
+        integrate_data: 是否输出整合数据。
+
+    Returns:
+        dict[str, int]: 本次任务带来的 HIRC 解析、共享缓存与指纹复用计数增量。
+    """
+    from .batch import _build_entity  # noqa: PLC0415
+
+    if _worker_state is None:
+        raise RuntimeError("映射子进程尚未初始化")
+    state = _worker_state
+    before = _snapshot_counts(state.runtime_cache)
+    _build_entity(
+        entity_type,
+        entity_id,
+        state.reader,
+        state.wwiser_manager,
+        integrate_data,
+        state.runtime_cache,
+        ctx=state.ctx,
+    )
+    after = _snapshot_counts(state.runtime_cache)
+    return {key: after[key] - before[key] for key in after}
+
+
+def _create_process_pool(
+    max_workers: int,
+    ctx: AppContext,
+    keep_bnk_cache: bool,
+    incremental: bool,
+    columnar: bool,
+) -> Executor:
+    """创建映射进程池；统一使用 spawn，保证各平台行为一致。"""
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(_picklable_context(ctx), keep_bnk_cache, incremental, columnar),
+    )
+
+
+def _merge_counts(runtime_cache: mapping_session.RuntimeCache, counts: dict[str, int]) -> None:
+    runtime_cache.hirc_parse_count += counts.get("hirc_parse_count", 0)
+    runtime_cache.hirc_store_hit_count += counts.get("hirc_store_hit_count", 0)
+    runtime_cache.hirc_dedup_count += counts.get("hirc_dedup_count", 0)
+    runtime_cache.reused_entity_count += counts.get("reused_entity_count", 0)
+    if runtime_cache.hirc_store is not None:
+        runtime_cache.hirc_store.hits += counts.get("store_hits", 0)
+        runtime_cache.hirc_store.misses += counts.get("store_misses", 0)
+
+
+def run_tasks_in_processes(  # noqa: PLR0913
+    tasks: list[EntityTask],
+    *,
+    ctx: AppContext,
+    max_workers: int,
+    integrate_data: bool,
+    keep_bnk_cache: bool,
+    incremental: bool,
+    columnar: bool,
+    runtime_cache: mapping_session.RuntimeCache,
+    on_start: Callable[[str, str], None],
+    on_done: Callable[[str, str, BaseException | None], None],
+) -> int:
+    """用进程池执行映射任务。
+
+    同一时间最多只提交 ``max_workers`` 个任务，这样 ``on_start`` 回传的
+    "正在处理" 进度与实际运行中的实体保持一致。
+
+    Args:
+        tasks: 任务元组列表 ``[(entity_type, id, description), ...]``。
+        ctx: 运行时上下文。
+        max_workers: 进程数。
+        integrate_data: 是否生成整合数据。
+        keep_bnk_cache: 是否把提取的 events bnk 保留在 ``cache/<version>``。
+        incremental: 是否跳过输入指纹未变化的实体。
+        columnar: 是否以列式格式写出映射文件。
+        runtime_cache: 父进程的运行时缓存，只用于汇总各子进程的计数。
+        on_start: 任务提交时的回调 ``(entity_type, description)``。
+        on_done: 任务结束时的回调 ``(entity_type, description, error)``。
+
+    Returns:
+        int: 失败的任务数。
+    """
+    logger.info(f"映射进程池启动 (processes: {max_workers})")
+    failed_count = 0
+    pending_tasks = list(tasks)
+    running: dict[Future[dict[str, int]], tuple[str, str]] = {}
+
+    try:
+        with _create_process_pool(max_workers, ctx, keep_bnk_cache, incremental, columnar) as executor:
+            while pending_tasks or running:
+                while pending_tasks and len(running) < max_workers:
+                    entity_type, entity_id, description = pending_tasks.pop(0)
+                    on_start(entity_type, description)
+                    future = executor.submit(_run_worker_task, entity_type, entity_id, integrate_data)
+                    running[future] = (entity_type, description)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entity_type, description = running.pop(future)
+                    try:
+                        _merge_counts(runtime_cache, future.result())
+                    except Exception as exc:  # noqa: BLE001
+                        failed_count += 1
+                        on_done(entity_type, description, exc)
+                        continue
+                    on_done(entity_type, description, None)
+    except Exception:
+        logger.exception("映射进程池异常退出")
+        raise
+
+    logger.info(f"映射进程池结束，失败 {failed_count} 个")
+    return failed_count
+
+
+__all__ = ["MAPPING_EXECUTORS", "run_tasks_in_processes"]
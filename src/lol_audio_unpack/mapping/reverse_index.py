@@ -0,0 +1,295 @@
+"""版本级音频 ID 反向索引。
+
+逐实体的映射文件回答的是"这个事件播放哪些音频"，排查时更常见的问题却是反过来的
+"这个 wem 属于哪个事件、哪个英雄"。映射阶段结束后把当前版本的全部映射汇总成一个
+按音频 ID 排序的二进制文件，查询时 mmap 打开后二分查找，不需要读取任何映射文件。
+
+文件布局（小端）::
+
+    header   : magic(4s) format(I) record_count(I) ref_count(I) string_count(I)
+    records  : record_count × (audio_id(I), ref_index(I))，按 audio_id 升序
+    refs     : ref_count × 6 个字符串下标（实体类型、实体 ID、实体名、子实体 ID、类别、事件）
+    offsets  : (string_count + 1) × 字符串起始偏移(I)
+    strings  : UTF-8 字符串拼接
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from lol_audio_unpack.manager.files import find_data_file, read_data
+from lol_audio_unpack.utils.columnar import COLUMNAR_SUFFIX, load_columnar
+
+if TYPE_CHECKING:
+    from lol_audio_unpack.app.types import AppContext
+
+REVERSE_INDEX_FILE_NAME = "reverse_index.bin"
+_MAGIC = b"LARI"
+# 文件布局变化时递增，旧文件会被拒绝并在下次 mapping 时重建
+_FORMAT = 1
+_HEADER = struct.Struct("<4sIIII")
+_RECORD = struct.Struct("<II")
+_REF = struct.Struct("<6I")
+_OFFSET = struct.Struct("<I")
+_MAX_AUDIO_ID = 0xFFFFFFFF
+_ENTITY_DIRS = (("champion", "champions"), ("map", "maps"))
+
+
+@dataclass(frozen=True)
+class AudioRef:
+    """反向索引中的一条引用：某个音频 ID 出现在哪个实体的哪个事件里。"""
+
+    entity_type: str
+    entity_id: str
+    entity_name: str
+    sub_id: str
+    category: str
+    event: str
+
+
+def _iter_raw_mapping(entity_type: str, data: dict[str, Any]) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """遍历普通映射文件，产出 ``(实体名, 子实体 ID, {类别: {事件: [音频 ID]}})``。"""
+    if entity_type == "champion":
+        name, sub_entities = data.get("alias", ""), data.get("skins", {})
+    else:
+        name, sub_entities = data.get("name", ""), data.get("map", {})
+    for sub_id, sub_data in sub_entities.items():
+        yield str(name), str(sub_id), sub_data.get("events", {})
+
+
+def _iter_integrated_mapping(entity_type: str, data: dict[str, Any]) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """遍历整合映射文件，结构与 ``integrate_entity`` 的输出一致。"""
+    payload = data.get("data", {})
+    if entity_type == "champion":
+        name, items = payload.get("alias", ""), payload.get("skins", [])
+    else:
+        map_item = payload.get("map")
+        name, items = payload.get("name", ""), [map_item] if map_item else []
+    for item in items:
+        events = {category: info.get("mapping", {}) for category, info in item.get("events", {}).items()}
+        yield str(name), str(item.get("id", "")), events
+
+
+def _iter_entity_files(version_hash_dir: Path, entity_dir: str, *, dev_mode: bool) -> Iterator[tuple[Path, bool]]:
+    """列出实体映射文件；同一实体同时有整合版与普通版时只取整合版。"""
+    seen: set[str] = set()
+    for base_dir, integrated in (
+        (version_hash_dir / "integrated" / entity_dir, True),
+        (version_hash_dir / entity_dir, False),
+    ):
+        if not base_dir.is_dir():
+            continue
+        for entity_id in sorted({path.stem for path in base_dir.iterdir() if path.is_file()}):
+            if entity_id in seen:
+                continue
+            if (resolved := find_data_file(base_dir / entity_id, dev_mode=dev_mode)) is None:
+                continue
+            seen.add(entity_id)
+            yield resolved, integrated
+
+
+def collect_audio_refs(version_hash_dir: Path, *, dev_mode: bool = False) -> list[tuple[int, AudioRef]]:
+    """从版本目录下的映射文件收集 ``(音频 ID, 引用)``。
+
+    Args:
+        version_hash_dir: ``hash/<version>`` 目录。
+        dev_mode: 是否启用开发模式，决定映射文件的格式优先级。
+
+    Returns:
+        list[tuple[int, AudioRef]]: 未排序的全部引用。
+    """
+    entries: list[tuple[int, AudioRef]] = []
+    for entity_type, entity_dir in _ENTITY_DIRS:
+        for path, integrated in _iter_entity_files(version_hash_dir, entity_dir, dev_mode=dev_mode):
+            # 列式文件直接遍历惰性视图，不展开成音频 ID 列表
+            data = load_columnar(path) if path.suffix == COLUMNAR_SUFFIX else read_data(path, dev_mode=dev_mode)
+            iterator = _iter_integrated_mapping if integrated else _iter_raw_mapping
+            for name, sub_id, categories in iterator(entity_type, data):
+                for category, events in categories.items():
+                    for event, audio_ids in events.items():
+                        ref = AudioRef(entity_type, path.stem, name, sub_id, str(category), str(event))
+                        for audio_id in audio_ids:
+                            if not 0 <= int(audio_id) <= _MAX_AUDIO_ID:
+                                logger.warning(f"音频 ID 超出 32 位范围，未写入反向索引: {audio_id} ({path.name})")
+                                continue
+                            entries.append((int(audio_id), ref))
+    return entries
+
+
+def write_reverse_index(entries: list[tuple[int, AudioRef]], path: Path) -> None:
+    """把引用写成按音频 ID 排序的二进制索引。
+
+    Args:
+        entries: ``(音频 ID, 引用)`` 列表。
+        path: 目标文件路径；通过临时文件原子替换，不会被读到半截内容。
+    """
+    strings: dict[str, int] = {}
+    refs: dict[AudioRef, int] = {}
+
+    def string_index(value: str) -> int:
+        return strings.setdefault(value, len(strings))
+
+    records: set[tuple[int, int]] = set()
+    for audio_id, ref in entries:
+        if ref not in refs:
+            refs[ref] = len(refs)
+        records.add((audio_id, refs[ref]))
+
+    ref_rows = [
+        _REF.pack(
+            *(
+                string_index(value)
+                for value in (ref.entity_type, ref.entity_id, ref.entity_name, ref.sub_id, ref.category, ref.event)
+            )
+        )
+        for ref in refs
+    ]
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with tmp_path.open("wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _FORMAT, len(records), len(refs), len(encoded)))
+            file.writelines(_RECORD.pack(*record) for record in sorted(records))
+            file.writelines(ref_rows)
+            file.writelines(_OFFSET.pack(offset) for offset in offsets)
+            file.writelines(encoded)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def build_reverse_index(version_hash_dir: Path, *, dev_mode: bool = False) -> Path | None:
+    """重建版本目录下的反向索引。
+
+    Args:
+        version_hash_dir: ``hash/<version>`` 目录。
+        dev_mode: 是否启用开发模式。
+
+    Returns:
+        Path | None: 索引文件路径；版本目录不存在时返回 ``None``。
+    """
+    if not version_hash_dir.is_dir():
+        logger.debug(f"映射目录不存在，跳过反向索引: {version_hash_dir}")
+        return None
+    entries = collect_audio_refs(version_hash_dir, dev_mode=dev_mode)
+    index_path = version_hash_dir / REVERSE_INDEX_FILE_NAME
+    write_reverse_index(entries, index_path)
+    logger.info(f"反向索引已更新: {len({audio_id for audio_id, _ in entries})} 个音频 ID -> {index_path}")
+    return index_path
+
+
+def refresh_reverse_index(ctx: AppContext, version: str) -> Path | None:
+    """映射结束后刷新当前版本的反向索引；失败只告警，不影响映射结果。
+
+    Args:
+        ctx: 运行时上下文。
+        version: 当前数据版本号。
+
+    Returns:
+        Path | None: 索引文件路径；未生成时返回 ``None``。
+    """
+    try:
+        return build_reverse_index(ctx.hash_path / version, dev_mode=bool(getattr(ctx.config, "dev_mode", False)))
+    except Exception as exc:  # noqa: BLE001
+        logger.opt(exception=bool(getattr(ctx.config, "dev_mode", False))).warning(f"生成反向索引失败: {exc}")
+        return None
+
+
+class ReverseIndex:
+    """以 mmap 方式只读打开的反向索引，查询为一次二分查找。"""
+
+    def __init__(self, path: Path) -> None:
+        """打开索引文件。
+
+        Args:
+            path: 索引文件路径。
+
+        Raises:
+            FileNotFoundError: 文件不存在时抛出。
+            ValueError: 文件不是受支持的反向索引时抛出。
+        """
+        self.path = path
+        with path.open("rb") as file:
+            if path.stat().st_size < _HEADER.size:
+                raise ValueError(f"反向索引文件不完整: {path}")
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, self._record_count, ref_count, string_count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or fmt != _FORMAT:
+            self._mm.close()
+            raise ValueError(f"不支持的反向索引格式: {path}")
+        self._records_offset = _HEADER.size
+        self._refs_offset = self._records_offset + self._record_count * _RECORD.size
+        self._offsets_offset = self._refs_offset + ref_count * _REF.size
+        self._strings_offset = self._offsets_offset + (string_count + 1) * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def __enter__(self) -> ReverseIndex:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """释放 mmap。"""
+        self._mm.close()
+
+    def _audio_id_at(self, index: int) -> int:
+        return _RECORD.unpack_from(self._mm, self._records_offset + index * _RECORD.size)[0]
+
+    def _string(self, index: int) -> str:
+        start, end = struct.unpack_from("<II", self._mm, self._offsets_offset + index * _OFFSET.size)
+        return self._mm[self._strings_offset + start : self._strings_offset + end].decode("utf-8")
+
+    def lookup(self, audio_id: int) -> list[AudioRef]:
+        """查询音频 ID 的全部引用。
+
+        Args:
+            audio_id: wem / 音频 ID。
+
+        Returns:
+            list[AudioRef]: 引用列表；未收录时为空。
+        """
+        low, high = 0, self._record_count
+        while low < high:
+            mid = (low + high) // 2
+            if self._audio_id_at(mid) < audio_id:
+                low = mid + 1
+            else:
+                high = mid
+
+        refs: list[AudioRef] = []
+        index = low
+        while index < self._record_count:
+            current_id, ref_index = _RECORD.unpack_from(self._mm, self._records_offset + index * _RECORD.size)
+            if current_id != audio_id:
+                break
+            string_ids = _REF.unpack_from(self._mm, self._refs_offset + ref_index * _REF.size)
+            refs.append(AudioRef(*(self._string(string_id) for string_id in string_ids)))
+            index += 1
+        return refs
+
+
+__all__ = [
+    "REVERSE_INDEX_FILE_NAME",
+    "AudioRef",
+    "ReverseIndex",
+    "build_reverse_index",
+    "collect_audio_refs",
+    "refresh_reverse_index",
+    "write_reverse_index",
+]
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from league_tools import WAD, NativeHIRC, WwiserHIRC, WwiserManager
+from league_tools.core.binary import BinaryReader
+from league_tools.formats.bnk.native_hirc import NativeBank
+from loguru import logger
 
-from lol_audio_unpack.runtime.wad import get_wad
+from lol_audio_unpack.mapping.hirc_store import HircStore
+from lol_audio_unpack.mapping.wwiser_pool import WwiserPool
+from lol_audio_unpack.runtime.wad import get_wad, lookup_sections
 
 if TYPE_CHECKING:
     from lol_audio_unpack.app.types import AppContext
 
 
 ParsedHIRC = NativeHIRC | WwiserHIRC
+# 每个 bank 起一次 wwiser 的管理器，或常驻 wwiser 进程池
+WwiserBackend = WwiserManager | WwiserPool
+# 解包阶段顺带读出的 events bnk：``{(wad_path, bnk_rel_path): 已解压字节}``
+EventBanks = dict[tuple[Path, str], bytes]
 
 
 def _resolve_wwiser_path(ctx: AppContext) -> Path | None:
@@ -57,20 +68,27 @@ def describe_hirc_backend(ctx: AppContext) -> str:
     return f"WwiserHIRC ({wwiser_path})"
 
 
-def _create_wwiser_manager(ctx: AppContext) -> WwiserManager | None:
+def _create_wwiser_manager(ctx: AppContext, *, pool_size: int = 0) -> WwiserBackend | None:
     """按上下文创建可选的 wwiser 管理器。
 
     Args:
         ctx: 运行时上下文。
+        pool_size: 常驻 wwiser 进程数；大于 0 时返回 ``WwiserPool``，
+            否则沿用每个 bank 起一次 wwiser 的 ``WwiserManager``。
 
     Returns:
-        WwiserManager | None: 可复用的 wwiser 管理器。
+        WwiserBackend | None: 可复用的 wwiser 管理器或进程池；需要由调用方在结束时关闭进程池。
     """
 
     wwiser_path = _resolve_wwiser_path(ctx)
     if wwiser_path is None:
         return None
-    return WwiserManager(wwiser_path)
+    manager = WwiserManager(wwiser_path)
+    if pool_size <= 0:
+        return manager
+    # 复用 WwiserManager 的路径解析与版本校验，进程池只负责执行
+    logger.info(f"启用 wwiser 常驻进程池 (processes: {pool_size})")
+    return WwiserPool(manager.wwiser_path or wwiser_path, size=pool_size)
 
 
 @dataclass
@@ -82,12 +100,41 @@ class RuntimeCache:
         extract_cache: 本轮已提取的 ``(wad_path, bnk_rel_path)`` 集合。
         hirc_cache: 已解析的 HIRC 缓存。
         cache_lock: 多线程模式下的缓存互斥锁。
+        hirc_store: 跨版本共享的 HIRC 磁盘缓存；为 ``None`` 时每轮都重新解析。
+        hirc_inflight: 正在解析中的 HIRC，后到的线程等待同一个结果。
+        hirc_parse_count: 本轮实际执行的 HIRC 解析次数。
+        hirc_store_hit_count: 由跨版本共享缓存直接提供、未实际解析的次数。
+        hirc_dedup_count: 等待他人解析结果而省掉的解析次数。
+        hirc_contended_keys: 出现过并发等待的缓存键。
+        keep_bnk_files: 是否把从 WAD 提取的 events bnk 写入 ``cache/<version>``；
+            关闭时 NativeHIRC 直接在内存中解析。
+        incremental: 是否按输入指纹跳过未变化的实体。
+        reused_entity_count: 本轮因指纹一致而复用已有映射的实体数。
+        columnar: 是否以列式格式写出映射文件。
     """
 
     wad_cache: dict[Path, WAD] = field(default_factory=dict)
     extract_cache: set[tuple[Path, str]] = field(default_factory=set)
     hirc_cache: dict[tuple[Path, str], ParsedHIRC] = field(default_factory=dict)
     cache_lock: threading.Lock | None = None
+    hirc_store: HircStore | None = None
+    hirc_inflight: dict[tuple[Path, str], Future[ParsedHIRC]] = field(default_factory=dict)
+    hirc_parse_count: int = 0
+    hirc_store_hit_count: int = 0
+    hirc_dedup_count: int = 0
+    hirc_contended_keys: set[tuple[Path, str]] = field(default_factory=set)
+    keep_bnk_files: bool = False
+    incremental: bool = False
+    reused_entity_count: int = 0
+    columnar: bool = False
+
+    def describe_hirc_stats(self) -> str:
+        """返回本轮 HIRC 解析与去重统计，用于映射汇总日志。"""
+        return (
+            f"HIRC 解析 {self.hirc_parse_count} 次，共享缓存命中 {self.hirc_store_hit_count} 次，"
+            f"并发去重 {self.hirc_dedup_count} 次"
+            f"（{len(self.hirc_contended_keys)} 个 bank 出现争用）"
+        )
 
 
 def _get_wad(
@@ -159,11 +206,159 @@ def _mark_bnk_extracted(
         extract_cache.add(key)
 
 
-def _get_cached_hirc(
+def prefetch_event_banks(
+    wad_path: Path,
+    bnk_rel_paths: Iterable[str],
+    *,
+    out_dir: Path,
+    in_memory: bool,
+    runtime_cache: RuntimeCache | None,
+) -> EventBanks:
+    """按 WAD 目录表中的偏移顺序，一次提取同一 WAD 内的多个 events bnk。
+
+    逐路径组提取时同一个 WAD 会被反复 seek 和调用；这里把一个实体需要的 bank 合并成
+    一次顺序读取，并在 ``extract_cache`` 中各记录一次，本轮后续实体不会再提取同一个 bank。
+
+    Args:
+        wad_path: WAD 文件绝对路径。
+        bnk_rel_paths: WAD 内的 events bnk 路径。
+        out_dir: 落盘模式下的输出目录。
+        in_memory: 为 ``True`` 时只解压到内存并返回字节，否则写入 ``out_dir``。
+        runtime_cache: 映射过程共享缓存。
+
+    Returns:
+        EventBanks: 内存模式下读出的 bnk 字节；落盘模式下为空字典。
+    """
+
+    pending = sorted({path for path in bnk_rel_paths if not _is_bnk_extracted((wad_path, path), runtime_cache)})
+    if not pending:
+        return {}
+
+    wad_obj = _get_wad(wad_path, runtime_cache=runtime_cache)
+    located = [
+        (path, section)
+        for path, section in zip(pending, lookup_sections(wad_obj, pending), strict=True)
+        if section is not None
+    ]
+    if len(located) < len(pending):
+        # 缺失的 bank 交给逐路径组流程，由它输出原有的告警
+        logger.debug(f"{wad_path.name} 中有 {len(pending) - len(located)} 个 events bnk 不存在，跳过预读")
+    ordered = [path for path, _section in sorted(located, key=lambda item: item[1].offset)]
+    if not ordered:
+        return {}
+
+    banks: EventBanks = {}
+    if in_memory:
+        for path, data in zip(ordered, wad_obj.extract(ordered, raw=True), strict=True):
+            if data is not None:
+                banks[wad_path, path] = data
+    else:
+        wad_obj.extract(ordered, out_dir=out_dir)
+    for path in ordered:
+        _mark_bnk_extracted((wad_path, path), runtime_cache=runtime_cache)
+    logger.debug(f"{wad_path.name}: 按偏移顺序一次提取 {len(ordered)} 个 events bnk")
+    return banks
+
+
+def _parse_native_hirc_bytes(bnk_path: Path, bnk_data: bytes, hirc_cache_dir: Path) -> NativeHIRC:
+    """直接在内存中解析 events bnk，不经过磁盘。
+
+    Args:
+        bnk_path: bnk 的逻辑路径，仅用于 bank 命名与缓存键。
+        bnk_data: 已解压的 bnk 字节。
+        hirc_cache_dir: hirc 缓存目录。
+
+    Returns:
+        NativeHIRC: 解析后的 HIRC 对象。
+    """
+
+    hirc = NativeHIRC(cache_dir=hirc_cache_dir)
+    if not hasattr(hirc, "_parse_sections"):
+        # 旧版 league_tools 只支持按文件解析，回退为先落盘再解析
+        logger.debug(f"当前 NativeHIRC 不支持内存解析，回退为落盘解析: {bnk_path}")
+        _write_bnk_bytes(bnk_path, bnk_data)
+        return NativeHIRC.from_bnk(bnk_path, cache_dir=hirc_cache_dir)
+
+    bank = NativeBank(filename=bnk_path.name, path=str(bnk_path))
+    reader = BinaryReader(bnk_data)
+    try:
+        hirc._parse_sections(reader, bank)
+    finally:
+        reader.close()
+    hirc.add_bank(bank)
+    return hirc
+
+
+def read_bnk_bytes(wad_obj: WAD, bnk_rel_path: str) -> bytes:
+    """从 WAD 中把单个 bnk 解压到内存。
+
+    Args:
+        wad_obj: 已打开的 WAD。
+        bnk_rel_path: bnk 在 WAD 内的路径。
+
+    Returns:
+        bytes: 解压后的 bnk 字节。
+
+    Raises:
+        FileNotFoundError: WAD 中不存在该 bnk 时抛出。
+    """
+
+    data = wad_obj.extract([bnk_rel_path], raw=True)[0]
+    if data is None:
+        raise FileNotFoundError(f"WAD 中不存在 BNK 文件: {bnk_rel_path}")
+    return data
+
+
+def _write_bnk_bytes(bnk_path: Path, bnk_data: bytes) -> None:
+    """把内存中的 bnk 写到 cache 目录，供只能按文件解析的后端使用。"""
+    if bnk_path.exists():
+        return
+    bnk_path.parent.mkdir(parents=True, exist_ok=True)
+    bnk_path.write_bytes(bnk_data)
+
+
+def _parse_hirc(
+    bnk_path: Path,
+    hirc_cache_dir: Path,
+    wwiser_manager: WwiserBackend | None,
+    bnk_data: bytes | None,
+) -> ParsedHIRC:
+    """按后端解析单个 events bnk。
+
+    Args:
+        bnk_path: bnk 文件路径。
+        hirc_cache_dir: hirc 缓存目录。
+        wwiser_manager: 可选的 wwiser 管理器；为 ``None`` 时走 ``NativeHIRC``。
+        bnk_data: 已读出的 bnk 字节；为 ``None`` 时从 ``bnk_path`` 读取。
+
+    Returns:
+        ParsedHIRC: 解析后的 HIRC 对象。
+    """
+
+    if wwiser_manager is None:
+        if bnk_data is not None:
+            return _parse_native_hirc_bytes(bnk_path, bnk_data, hirc_cache_dir)
+        return NativeHIRC.from_bnk(bnk_path, cache_dir=hirc_cache_dir)
+    if bnk_data is not None:
+        # wwiser 是外部进程，只能读文件；这里落盘的是已解压字节，仍然省掉了第二次 WAD 读取与解压
+        _write_bnk_bytes(bnk_path, bnk_data)
+    if isinstance(wwiser_manager, WwiserPool):
+        return wwiser_manager.parse(bnk_path, hirc_cache_dir)
+    return WwiserHIRC.from_bnk(
+        bnk_path,
+        cache_dir=hirc_cache_dir,
+        wwiser_manager=wwiser_manager,
+    )
+
+
+def _get_cached_hirc(  # noqa: PLR0913
     bnk_path: Path,
     hirc_cache_dir: Path,
-    wwiser_manager: WwiserManager | None,
+    *,
+    wwiser_manager: WwiserBackend | None,
     runtime_cache: RuntimeCache | None,
+    bnk_data: bytes | None = None,
+    load_bnk: Callable[[], bytes] | None = None,
 ) -> ParsedHIRC:
     """获取 HIRC 对象并复用缓存。
 
@@ -172,6 +367,8 @@ def _get_cached_hirc(
         hirc_cache_dir: hirc 缓存目录。
         wwiser_manager: 可选的 wwiser 管理器；为 ``None`` 时走 ``NativeHIRC``。
         runtime_cache: 映射过程共享缓存。
+        bnk_data: 解包阶段已经读出的 bnk 字节；提供时不再依赖 ``bnk_path`` 上的文件。
+        load_bnk: 按需读取 bnk 字节的回调；只在缓存未命中、真正需要解析时调用。
 
     Returns:
         ParsedHIRC: 解析后的 HIRC 对象。
@@ -179,18 +376,36 @@ def _get_cached_hirc(
 
     backend_key = "wwiser" if wwiser_manager is not None else "native"
     cache_key = (bnk_path, backend_key)
-
-    def parse_hirc() -> ParsedHIRC:
-        if wwiser_manager is None:
-            return NativeHIRC.from_bnk(bnk_path, cache_dir=hirc_cache_dir)
-        return WwiserHIRC.from_bnk(
-            bnk_path,
-            cache_dir=hirc_cache_dir,
-            wwiser_manager=wwiser_manager,
-        )
+    hirc_store = None if runtime_cache is None else runtime_cache.hirc_store
+
+    def parse_hirc() -> tuple[ParsedHIRC, bool]:
+        """返回解析结果，以及它是否直接取自共享缓存（未实际解析）。"""
+        data = bnk_data
+        if data is None and load_bnk is not None:
+            data = load_bnk()
+        if hirc_store is None:
+            return _parse_hirc(bnk_path, hirc_cache_dir, wwiser_manager, data), False
+
+        # 共享缓存按 bnk 内容寻址，同一个 bank 跨版本不变时直接复用上个版本的解析结果
+        if data is None:
+            data = bnk_path.read_bytes()
+        digest = hirc_store.digest(data)
+        cached = hirc_store.load(digest, backend_key)
+        if cached is not None:
+            logger.debug(f"HIRC 共享缓存命中: {bnk_path.name} ({digest[:12]})")
+            return cached, True
+        parsed = _parse_hirc(bnk_path, hirc_cache_dir, wwiser_manager, data)
+        hirc_store.save(digest, backend_key, parsed)
+        return parsed, False
+
+    def count_result(from_store: bool) -> None:
+        if from_store:
+            runtime_cache.hirc_store_hit_count += 1
+        else:
+            runtime_cache.hirc_parse_count += 1
 
     if runtime_cache is None:
-        return parse_hirc()
+        return parse_hirc()[0]
 
     hirc_cache = runtime_cache.hirc_cache
     cache_lock = runtime_cache.cache_lock
@@ -199,25 +414,46 @@ def _get_cached_hirc(
         cached = hirc_cache.get(cache_key)
         if cached is not None:
             return cached
-        parsed = parse_hirc()
+        parsed, from_store = parse_hirc()
+        count_result(from_store)
         hirc_cache[cache_key] = parsed
         return parsed
 
-    # 这里刻意不用“持锁解析”：
-    # HIRC 解析本身可能较慢，若全程占锁会把其他类别处理全部阻塞住。
+    # 单飞解析：同一个 cache_key 只允许一个线程解析，其余线程等待它的结果。
+    # 解析本身仍在锁外进行，避免慢解析把其他 bank 的处理一起阻塞住。
     with cache_lock:
         cached = hirc_cache.get(cache_key)
+        pending = None
+        is_owner = False
+        if cached is None:
+            pending = runtime_cache.hirc_inflight.get(cache_key)
+            if pending is None:
+                pending = Future()
+                runtime_cache.hirc_inflight[cache_key] = pending
+                is_owner = True
+            else:
+                runtime_cache.hirc_dedup_count += 1
+                runtime_cache.hirc_contended_keys.add(cache_key)
     if cached is not None:
         return cached
 
-    parsed = parse_hirc()
-    with cache_lock:
-        # 二次确认是为了兼容并发场景：
-        # 可能在当前线程解析期间，其他线程已经把同一个 cache_key 填进缓存。
-        existing = hirc_cache.get(cache_key)
-        if existing is not None:
-            return existing
-        hirc_cache[cache_key] = parsed
-        return parsed
+    if not is_owner:
+        logger.debug(f"等待其他线程完成 HIRC 解析: {bnk_path.name}")
+        # 解析失败时 result() 会把同一个异常抛给等待者，由调用方按路径组计入错误
+        return pending.result()
 
+    try:
+        parsed, from_store = parse_hirc()
+    except BaseException as exc:
+        with cache_lock:
+            runtime_cache.hirc_inflight.pop(cache_key, None)
+        logger.debug(f"HIRC 解析失败，通知等待中的线程: {bnk_path.name} ({exc})")
+        pending.set_exception(exc)
+        raise
 
+    with cache_lock:
+        count_result(from_store)
+        hirc_cache[cache_key] = parsed
+        runtime_cache.hirc_inflight.pop(cache_key, None)
+    pending.set_result(parsed)
+    return parsed
@@ -0,0 +1,225 @@
+"""常驻 wwiser 解析进程池。
+
+``WwiserManager`` 对每个 bank 都起一次 ``python wwiser.pyz``，解释器启动与 wwiser
+导入开销按 bank 计。这里让若干个常驻子进程在首次任务时导入 wwiser，之后通过管道
+接收 bnk 路径，生成 XML 并直接解析成 ``WwiserHIRC`` 回传，全量运行时只付一次启动成本。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import multiprocessing as mp
+import os
+import queue
+import runpy
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_WWISER_TIMEOUT = 120
+_JOB_OK = "ok"
+_JOB_ERROR = "error"
+
+
+def _run_wwiser(wwiser_path: str, bnk_path: Path) -> Path:
+    """在当前进程内执行一次 wwiser，把 bnk 转成同目录下的 XML。
+
+    wwiser 模块在首次执行后留在 ``sys.modules`` 中，后续调用只重新执行入口脚本。
+
+    Args:
+        wwiser_path: ``wwiser.pyz`` 路径。
+        bnk_path: 待转换的 bnk 文件。
+
+    Returns:
+        Path: 生成（或复用）的 XML 路径。
+
+    Raises:
+        RuntimeError: wwiser 非零退出或没有生成 XML 时抛出。
+    """
+    xml_path = bnk_path.with_suffix(".xml")
+    # 与 WwiserHIRC 的判定一致：XML 比 bnk 新时直接复用
+    if xml_path.exists() and xml_path.stat().st_mtime >= bnk_path.stat().st_mtime:
+        return xml_path
+
+    argv = [wwiser_path, "-d", "xml", "-dn", str(bnk_path.with_suffix("")), str(bnk_path)]
+    saved_argv = sys.argv
+    sys.argv = argv
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(wwiser_path, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            raise RuntimeError(f"wwiser 退出码 {exc.code}: {bnk_path}") from exc
+    finally:
+        sys.argv = saved_argv
+
+    if not xml_path.exists():
+        raise RuntimeError(f"wwiser 未生成 XML: {xml_path}")
+    return xml_path
+
+
+def _worker_main(conn: Any, wwiser_path: str) -> None:
+    """wwiser 常驻子进程入口：循环处理管道中的 ``(bnk_path, cache_dir)`` 任务。
+
+    Args:
+        conn: 与父进程通信的管道端点。
+        wwiser_path: ``wwiser.pyz`` 路径。
+    """
+    from league_tools import WwiserHIRC  # noqa: PLC0415
+
+    logger.disable("league_tools")
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        bnk_path, cache_dir = job
+        try:
+            xml_path = _run_wwiser(wwiser_path, Path(bnk_path))
+            conn.send((_JOB_OK, WwiserHIRC.from_xml(xml_path, cache_dir=cache_dir)))
+        except Exception as exc:  # noqa: BLE001
+            conn.send((_JOB_ERROR, f"{type(exc).__name__}: {exc}"))
+
+
+class _PoolWorker:
+    """单个常驻子进程及其管道。"""
+
+    def __init__(self, mp_context: Any, target: Any, wwiser_path: str) -> None:
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(target=target, args=(child_conn, wwiser_path), daemon=True)
+        self.process.start()
+        child_conn.close()
+        logger.debug(f"wwiser 常驻进程已启动 (pid: {self.process.pid})")
+
+    def stop(self, *, force: bool = False) -> None:
+        if not force:
+            with contextlib.suppress(OSError, BrokenPipeError):
+                self.conn.send(None)
+            self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+        logger.debug(f"wwiser 常驻进程已退出 (pid: {self.process.pid}, exitcode: {self.process.exitcode})")
+
+
+class WwiserPool:
+    """常驻 wwiser 进程池，线程安全。
+
+    子进程按需启动，数量不超过 ``size``。单个 bank 超过 ``timeout_seconds`` 未返回时，
+    对应进程会被强制结束并在下次取用时重建，当前任务抛出 ``TimeoutError``。
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        wwiser_path: Path,
+        *,
+        size: int = 2,
+        timeout_seconds: float = DEFAULT_WWISER_TIMEOUT,
+        mp_context: Any | None = None,
+        worker_target: Any = _worker_main,
+    ) -> None:
+        """初始化进程池。
+
+        Args:
+            wwiser_path: ``wwiser.pyz`` 路径。
+            size: 常驻进程数。
+            timeout_seconds: 单个 bank 的超时时间（秒）。
+            mp_context: 可注入的 multiprocessing context；测试时可替换。
+            worker_target: 子进程入口；测试时可替换。
+        """
+        self.wwiser_path = str(wwiser_path)
+        self.size = max(size, 1)
+        self.timeout_seconds = timeout_seconds
+        self.restart_count = 0
+        self._ctx = mp_context or mp.get_context("spawn")
+        self._worker_target = worker_target
+        self._idle: queue.Queue[_PoolWorker | None] = queue.Queue()
+        self._workers: list[_PoolWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        # 用占位符表示“可启动一个新进程”的名额，实际进程在首次取用时才创建
+        for _ in range(self.size):
+            self._idle.put(None)
+
+    def _acquire(self) -> _PoolWorker:
+        worker = self._idle.get()
+        if worker is not None and worker.process.is_alive():
+            return worker
+        if worker is not None:
+            logger.warning(f"wwiser 常驻进程已意外退出，重新启动 (pid: {worker.process.pid})")
+            self._discard(worker, release_slot=False)
+        try:
+            worker = _PoolWorker(self._ctx, self._worker_target, self.wwiser_path)
+        except Exception:
+            # 启动失败时归还名额，避免池子永久缩小
+            self._idle.put(None)
+            raise
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _discard(self, worker: _PoolWorker, *, release_slot: bool = True) -> None:
+        """强制结束异常进程；默认归还一个空名额，下次取用时重建。"""
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            self.restart_count += 1
+        worker.stop(force=True)
+        if release_slot:
+            self._idle.put(None)
+
+    def parse(self, bnk_path: Path, cache_dir: Path) -> Any:
+        """把单个 bnk 交给常驻进程解析。
+
+        Args:
+            bnk_path: bnk 文件路径。
+            cache_dir: ``WwiserHIRC`` 的缓存目录。
+
+        Returns:
+            WwiserHIRC: 解析后的 HIRC 对象。
+
+        Raises:
+            TimeoutError: 超时未返回时抛出，对应进程会被重启。
+            RuntimeError: wwiser 处理失败或进程异常退出时抛出。
+        """
+        if self._closed:
+            raise RuntimeError("wwiser 进程池已关闭")
+        worker = self._acquire()
+        try:
+            worker.conn.send((str(bnk_path), str(cache_dir)))
+            result = worker.conn.recv() if worker.conn.poll(self.timeout_seconds) else None
+        except (EOFError, OSError) as exc:
+            logger.warning(f"wwiser 常驻进程通信失败，重启该进程: {exc}")
+            self._discard(worker)
+            raise RuntimeError(f"wwiser 常驻进程异常退出: {bnk_path}") from exc
+
+        if result is None:
+            logger.warning(f"wwiser 处理 {bnk_path.name} 超过 {self.timeout_seconds}s，重启该进程")
+            self._discard(worker)
+            raise TimeoutError(f"wwiser 处理超时: {bnk_path}")
+
+        self._idle.put(worker)
+        status, payload = result
+        if status != _JOB_OK:
+            raise RuntimeError(payload)
+        return payload
+
+    def close(self) -> None:
+        """结束所有常驻进程。"""
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+        logger.debug(f"wwiser 进程池已关闭，共重启 {self.restart_count} 次 (pid: {os.getpid()})")
+
+
+__all__ = ["DEFAULT_WWISER_TIMEOUT", "WwiserPool"]
@@ -0,0 +1,243 @@
+"""跨快照共享的 manifest chunk 缓存。
+
+manifest 中的 chunk ID 由解压后的内容决定，相邻补丁之间未改动的 chunk ID 不变。
+这里把解压后的 chunk 按 ID 存放在 ``<cache>/remote/chunks/`` 下，与具体快照版本无关；
+准备新快照时，已缓存的 chunk 直接从本地读取，只下载变化的部分。
+
+缓存按最近使用时间（文件 mtime）做 LRU 淘汰，总大小不超过给定上限。首次淘汰检查时扫描一次
+目录得到总大小，之后由本实例的写入与删除累计维护；只有累计值超出上限时才重新扫描并淘汰。
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from .wad_entries import DEFAULT_CHUNK_RETRIES, BundleSource, _ChunkReader
+
+if TYPE_CHECKING:
+    from .session import RemoteSession
+
+CHUNK_CACHE_DIR_NAME = "chunks"
+CHUNK_SUFFIX = ".chunk"
+
+
+@dataclass(frozen=True)
+class ChunkFileResult:
+    """单个文件经 chunk 缓存准备的结果。"""
+
+    output_path: Path
+    cached_chunks: int
+    downloaded_chunks: int
+    downloaded_bytes: int
+
+
+class ChunkCache:
+    """按 chunk ID 寻址的持久化缓存。"""
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        """初始化缓存。
+
+        Args:
+            root: 缓存根目录。
+            max_bytes: 缓存总大小上限。
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        # 预下载线程与前台会同时写入，累计大小与淘汰都串行执行
+        self._lock = threading.Lock()
+        # 缓存目录的总字节数；首次 prune 扫描前为 None，此前的写入由那次扫描计入
+        self._total_bytes: int | None = None
+
+    def _add_bytes(self, delta: int) -> None:
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += delta
+
+    def _path(self, chunk_id: int) -> Path:
+        name = f"{chunk_id:016X}"
+        return self.root / name[:2] / f"{name}{CHUNK_SUFFIX}"
+
+    def contains(self, chunk_id: int) -> bool:
+        """判断 chunk 是否已缓存。"""
+        return self._path(chunk_id).exists()
+
+    def get(self, chunk_id: int) -> bytes | None:
+        """读取缓存的 chunk，并刷新其最近使用时间。
+
+        Args:
+            chunk_id: manifest 中的 chunk ID。
+
+        Returns:
+            bytes | None: 解压后的 chunk 数据；未缓存时返回 ``None``。
+        """
+        path = self._path(chunk_id)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning(f"读取 chunk 缓存失败，按未命中处理: {path}: {exc}")
+            return None
+        return data
+
+    def put(self, chunk_id: int, data: bytes) -> None:
+        """写入 chunk；已存在时只刷新最近使用时间。
+
+        Args:
+            chunk_id: manifest 中的 chunk ID。
+            data: 解压后的 chunk 数据。
+        """
+        path = self._path(chunk_id)
+        if path.exists():
+            os.utime(path)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            temp_path.write_bytes(data)
+            temp_path.replace(path)
+        except OSError as exc:
+            temp_path.unlink(missing_ok=True)
+            logger.warning(f"写入 chunk 缓存失败，已跳过: {path}: {exc}")
+            return
+        self._add_bytes(len(data))
+
+    def discard(self, chunk_id: int) -> None:
+        """删除单个 chunk（例如校验失败时）。"""
+        path = self._path(chunk_id)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+        self._add_bytes(-size)
+
+    def ingest(self, file: Any, path: Path) -> int:
+        """把已下载的完整文件按 chunk 边界切分写入缓存。
+
+        Args:
+            file: manifest 中的文件对象（``PatcherFile``）。
+            path: 已下载文件的路径。
+
+        Returns:
+            int: 新写入缓存的 chunk 数量。
+        """
+        added = 0
+        with path.open("rb") as source:
+            for chunk in file.chunks:
+                data = source.read(chunk.target_size)
+                if len(data) != chunk.target_size:
+                    logger.warning(f"{path.name} 长度与 manifest 不符，停止写入 chunk 缓存")
+                    break
+                if self.contains(chunk.chunk_id):
+                    continue
+                self.put(chunk.chunk_id, data)
+                added += 1
+        return added
+
+    def prune(self) -> int:
+        """按最近使用时间淘汰 chunk，直到总大小不超过上限。
+
+        累计大小未超出上限时直接返回，不扫描缓存目录。
+
+        Returns:
+            int: 删除的 chunk 数量。
+        """
+        with self._lock:
+            if self._total_bytes is not None and self._total_bytes <= self.max_bytes:
+                return 0
+            entries: list[tuple[float, int, Path]] = []
+            total = 0
+            for path in self.root.glob(f"*/*{CHUNK_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            self._total_bytes = total
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            self._total_bytes = total
+            logger.info(f"chunk 缓存超出上限 {self.max_bytes} 字节，已淘汰最久未使用的 {removed} 个 chunk")
+            return removed
+
+
+def assemble_file(  # noqa: PLR0913
+    file: Any,
+    output_path: Path,
+    *,
+    chunk_cache: ChunkCache | None,
+    bundle_source: BundleSource | None = None,
+    retry_limit: int = DEFAULT_CHUNK_RETRIES,
+    session: RemoteSession | None = None,
+) -> ChunkFileResult:
+    """用缓存中的 chunk 与按需下载的 chunk 拼出完整文件。
+
+    Args:
+        file: manifest 中的文件对象（``PatcherFile``）。
+        output_path: 输出路径。
+        chunk_cache: chunk 缓存；为 ``None`` 时全部 chunk 按需下载。
+        bundle_source: bundle 基础 URL 或本地目录；为 ``None`` 时使用 manifest 的 ``bundle_url``。
+        retry_limit: 单次范围请求的最大尝试次数。
+        session: 可选的共享 remote 会话；提供时范围请求复用其连接池。
+
+    Returns:
+        ChunkFileResult: 缓存命中与下载统计。
+
+    Raises:
+        DownloadError: chunk 下载重试耗尽时抛出。
+        DecompressError: chunk 解压失败或大小不符时抛出。
+    """
+    reader = _ChunkReader(
+        file,
+        bundle_source=bundle_source if bundle_source is not None else file.manifest.bundle_url,
+        retry_limit=retry_limit,
+        chunk_cache=chunk_cache,
+        session=session,
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f"{output_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with temp_path.open("wb") as target:
+            for data in reader.iter_chunks():
+                target.write(data)
+        temp_path.replace(output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    logger.debug(
+        f"经 chunk 缓存准备 {file.name}: 命中 {reader.cached_chunks}/{len(file.chunks)} 个，"
+        f"下载 {reader.downloaded_bytes} 字节"
+    )
+    return ChunkFileResult(
+        output_path=output_path,
+        cached_chunks=reader.cached_chunks,
+        downloaded_chunks=reader.downloaded_chunks,
+        downloaded_bytes=reader.downloaded_bytes,
+    )
+
+
+__all__ = [
+    "CHUNK_CACHE_DIR_NAME",
+    "ChunkCache",
+    "ChunkFileResult",
+    "assemble_file",
+]
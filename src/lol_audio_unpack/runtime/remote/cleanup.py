@@ -6,6 +6,8 @@ import asyncio
 import os
 import shutil
 import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Any
 
@@ -124,18 +126,21 @@ def track_paths(
     registry[key].update(str(path) for path in paths)
 
 
-def remove_paths(paths: set[str], *, dry_run: bool) -> int:
+def remove_paths(paths: set[str], *, dry_run: bool, keep: set[str] | frozenset[str] = frozenset()) -> int:
     """删除或统计已登记路径数量。
 
     Args:
         paths: 已登记的原始路径字符串集合。
         dry_run: 为 `True` 时只统计不删除。
+        keep: 本次保留的路径；既不删除，也保留在登记表中。
 
     Returns:
         实际删除或将要删除的路径数量。
     """
     removed_count = 0
     for raw_path in list(paths):
+        if raw_path in keep:
+            continue
         path = Path(raw_path)
         if dry_run:
             if path.exists():
@@ -172,3 +177,79 @@ def prune_empty_tree(root: Path) -> None:
             current_path.rmdir()
         except OSError:
             continue
+
+
+@dataclass
+class WadConsumers:
+    """GAME WAD 的待处理消费者登记。
+
+    Attributes:
+        pending: 规范化 WAD 路径到仍需要它的工作项序号（升序）。
+        budget_bytes: 保留 WAD 的总字节上限，超出时按下次使用最晚者优先淘汰。
+    """
+
+    pending: dict[str, list[int]]
+    budget_bytes: int
+
+
+def build_consumers(plans: Iterable[Iterable[str]], *, budget_bytes: int) -> WadConsumers:
+    """按工作项顺序登记每个 WAD 的消费者。
+
+    Args:
+        plans: 按执行顺序排列的各工作项 WAD 路径集合（已规范化）。
+        budget_bytes: 保留 WAD 的总字节上限。
+
+    Returns:
+        WadConsumers: 消费者登记。
+    """
+    pending: dict[str, list[int]] = {}
+    for index, wad_paths in enumerate(plans):
+        for wad_path in wad_paths:
+            pending.setdefault(wad_path, []).append(index)
+    return WadConsumers(pending=pending, budget_bytes=budget_bytes)
+
+
+def release_consumer(consumers: WadConsumers, index: int) -> None:
+    """标记某个工作项已完成，不再需要其 WAD。
+
+    Args:
+        consumers: 消费者登记。
+        index: 已完成工作项的序号。
+    """
+    for wad_path in list(consumers.pending):
+        remaining = [item for item in consumers.pending[wad_path] if item != index]
+        if remaining:
+            consumers.pending[wad_path] = remaining
+        else:
+            del consumers.pending[wad_path]
+
+
+def select_retained(consumers: WadConsumers, sizes: dict[str, int]) -> set[str]:
+    """选出清理时应保留的 WAD。
+
+    仍有消费者的 WAD 默认保留；总大小超出预算时，按下次使用最晚者优先淘汰，
+    让紧接着要用的共享 WAD 留在磁盘上。
+
+    Args:
+        consumers: 消费者登记。
+        sizes: 当前磁盘上的 WAD 路径到字节数。
+
+    Returns:
+        set[str]: 需要保留的规范化 WAD 路径。
+    """
+    candidates = sorted(
+        (wad_path for wad_path in sizes if wad_path in consumers.pending),
+        key=lambda wad_path: consumers.pending[wad_path][0],
+    )
+    retained: set[str] = set()
+    total = 0
+    for wad_path in candidates:
+        if total + sizes[wad_path] > consumers.budget_bytes:
+            logger.info(
+                f"保留 WAD 超出预算 {consumers.budget_bytes} 字节，淘汰 {wad_path}"
+                f"（下次使用于第 {consumers.pending[wad_path][0] + 1} 个工作项）"
+            )
+            continue
+        retained.add(wad_path)
+        total += sizes[wad_path]
+    return retained
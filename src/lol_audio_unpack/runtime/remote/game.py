@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path, PurePosixPath
 from typing import Any
 
@@ -9,6 +10,11 @@ from loguru import logger
 
 from lol_audio_unpack.app.targets import iter_entity_refs
 
+from .wad_entries import build_partial_wad
+
+# 后台预下载的暂存目录，位于 `game_cache_root` 下；不参与逐实体清理
+PREFETCH_DIR_NAME = "prefetch"
+
 
 def build_bin_plan(
     *,
@@ -53,13 +59,14 @@ def build_bin_plan(
     return {wad_path: bin_paths for wad_path, bin_paths in extraction_plan.items() if bin_paths}
 
 
-def build_extract_plan(
+def build_extract_plan(  # noqa: PLR0913
     *,
     reader: Any,
     champion_ids: tuple[int, ...] | None,
     map_ids: tuple[int, ...] | None,
     include_champions: bool,
     include_maps: bool,
+    wad_entries: dict[str, set[str]] | None = None,
 ) -> set[str]:
     """构建 `extract` 阶段所需的 WAD 清单。
 
@@ -69,6 +76,8 @@ def build_extract_plan(
         map_ids: 指定地图 ID 集合。
         include_champions: 是否包含英雄。
         include_maps: 是否包含地图。
+        wad_entries: 可选的 WAD 条目收集表；提供时同时记录每个 WAD 需要的内部路径。
+
     Returns:
         需要准备的 WAD 路径集合。
     """
@@ -89,6 +98,7 @@ def build_extract_plan(
                 champion_banks=reader.get_champion_banks(entity_id),
                 reader=reader,
                 include_types=include_types,
+                wad_entries=wad_entries,
             )
             continue
         if entity_type == "map":
@@ -98,17 +108,19 @@ def build_extract_plan(
                 map_banks=reader.get_map_banks(entity_id),
                 reader=reader,
                 include_types=include_types,
+                wad_entries=wad_entries,
             )
     return wad_paths
 
 
-def build_mapping_plan(
+def build_mapping_plan(  # noqa: PLR0913
     *,
     reader: Any,
     champion_ids: tuple[int, ...] | None,
     map_ids: tuple[int, ...] | None,
     include_champions: bool,
     include_maps: bool,
+    wad_entries: dict[str, set[str]] | None = None,
 ) -> set[str]:
     """构建 `mapping` 阶段所需的 WAD 清单。
 
@@ -118,6 +130,7 @@ def build_mapping_plan(
         map_ids: 指定地图 ID 集合。
         include_champions: 是否包含英雄。
         include_maps: 是否包含地图。
+        wad_entries: 可选的 WAD 条目收集表；提供时只记录每个 WAD 需要的 ``_events.bnk``。
 
     Returns:
         需要准备的 WAD 路径集合。
@@ -138,6 +151,7 @@ def build_mapping_plan(
                 champion_banks=reader.get_champion_banks(entity_id),
                 champion_events=reader.get_champion_events(entity_id),
                 reader=reader,
+                wad_entries=wad_entries,
             )
             continue
         if entity_type == "map":
@@ -147,11 +161,36 @@ def build_mapping_plan(
                 map_banks=reader.get_map_banks(entity_id),
                 map_events=reader.get_map_events(entity_id),
                 reader=reader,
+                wad_entries=wad_entries,
             )
 
     return wad_paths
 
 
+def _collect_entries(entries: set[str], path_groups: Any, *, events_only: bool = False) -> None:
+    """把类别下各路径组的 WAD 内部路径并入集合；映射只需要 ``_events.bnk``。"""
+    for path_group in path_groups or []:
+        entries.update(path for path in path_group if not events_only or path.endswith("_events.bnk"))
+
+
+def _add_planned_wads(  # noqa: PLR0913
+    wad_paths: set[str],
+    wad_entries: dict[str, set[str]] | None,
+    *,
+    wad_root: str,
+    root_entries: set[str],
+    wad_language: str,
+    language_entries: set[str],
+) -> None:
+    """登记根 WAD / 语言 WAD；收集条目时一并记录各自需要的内部路径。"""
+    for wad_path, entries in ((wad_root, root_entries), (wad_language, language_entries)):
+        if not wad_path:
+            continue
+        wad_paths.add(wad_path)
+        if wad_entries is not None:
+            wad_entries.setdefault(wad_path, set()).update(entries)
+
+
 def add_champion_bins(extraction_plan: dict[str, list[str]], champion: dict[str, Any]) -> None:
     """把单个英雄的 BIN 需求追加到提取计划。
 
@@ -175,13 +214,14 @@ def add_champion_bins(extraction_plan: dict[str, list[str]], champion: dict[str,
         extraction_plan.setdefault(str(wad_root), []).extend(bin_paths)
 
 
-def add_champion_extract_wads(
+def add_champion_extract_wads(  # noqa: PLR0913
     *,
     wad_paths: set[str],
     champion: dict[str, Any],
     champion_banks: dict[str, Any] | None,
     reader: Any,
     include_types: set[str],
+    wad_entries: dict[str, set[str]] | None = None,
 ) -> None:
     """根据英雄 banks 数据规划 `extract` 所需 WAD。
 
@@ -191,6 +231,7 @@ def add_champion_extract_wads(
         champion_banks: 英雄 banks 数据。
         reader: 数据读取器。
         include_types: 当前启用的音频类型集合。
+        wad_entries: 可选的 WAD 条目收集表。
     """
     if not champion or not champion_banks:
         return
@@ -201,29 +242,39 @@ def add_champion_extract_wads(
     needs_root = False
     needs_language = False
 
+    root_entries: set[str] = set()
+    language_entries: set[str] = set()
+
     for categories in (champion_banks.get("skins") or {}).values():
-        for category in categories:
+        for category, path_groups in categories.items():
             audio_type = reader.get_audio_type(category)
             if audio_type not in include_types:
                 continue
             if audio_type == "VO":
                 needs_language = True
+                _collect_entries(language_entries, path_groups)
             else:
                 needs_root = True
-
-    if needs_root and wad_root:
-        wad_paths.add(wad_root)
-    if needs_language and wad_language:
-        wad_paths.add(wad_language)
+                _collect_entries(root_entries, path_groups)
+
+    _add_planned_wads(
+        wad_paths,
+        wad_entries,
+        wad_root=wad_root if needs_root else "",
+        root_entries=root_entries,
+        wad_language=wad_language if needs_language else "",
+        language_entries=language_entries,
+    )
 
 
-def add_map_extract_wads(
+def add_map_extract_wads(  # noqa: PLR0913
     *,
     wad_paths: set[str],
     map_data: dict[str, Any],
     map_banks: dict[str, Any] | None,
     reader: Any,
     include_types: set[str],
+    wad_entries: dict[str, set[str]] | None = None,
 ) -> None:
     """根据地图 banks 数据规划 `extract` 所需 WAD。
 
@@ -233,6 +284,7 @@ def add_map_extract_wads(
         map_banks: 地图 banks 数据。
         reader: 数据读取器。
         include_types: 当前启用的音频类型集合。
+        wad_entries: 可选的 WAD 条目收集表。
     """
     if not map_data or not map_banks:
         return
@@ -243,28 +295,38 @@ def add_map_extract_wads(
     needs_root = False
     needs_language = False
 
-    for category in map_banks.get("banks") or {}:
+    root_entries: set[str] = set()
+    language_entries: set[str] = set()
+
+    for category, path_groups in (map_banks.get("banks") or {}).items():
         audio_type = reader.get_audio_type(category)
         if audio_type not in include_types:
             continue
         if audio_type == "VO":
             needs_language = True
+            _collect_entries(language_entries, path_groups)
         else:
             needs_root = True
-
-    if needs_root and wad_root:
-        wad_paths.add(wad_root)
-    if needs_language and wad_language:
-        wad_paths.add(wad_language)
+            _collect_entries(root_entries, path_groups)
+
+    _add_planned_wads(
+        wad_paths,
+        wad_entries,
+        wad_root=wad_root if needs_root else "",
+        root_entries=root_entries,
+        wad_language=wad_language if needs_language else "",
+        language_entries=language_entries,
+    )
 
 
-def add_champion_mapping_wads(
+def add_champion_mapping_wads(  # noqa: PLR0913
     *,
     wad_paths: set[str],
     champion: dict[str, Any],
     champion_banks: dict[str, Any] | None,
     champion_events: dict[str, Any] | None,
     reader: Any,
+    wad_entries: dict[str, set[str]] | None = None,
 ) -> None:
     """根据英雄 banks/events 数据规划 `mapping` 所需 WAD。
 
@@ -274,6 +336,7 @@ def add_champion_mapping_wads(
         champion_banks: 英雄 banks 数据。
         champion_events: 英雄 events 数据。
         reader: 数据读取器。
+        wad_entries: 可选的 WAD 条目收集表。
     """
     if not champion or not champion_banks or not champion_events:
         return
@@ -286,31 +349,41 @@ def add_champion_mapping_wads(
 
     bank_skins = champion_banks.get("skins") or {}
     event_skins = champion_events.get("skins") or {}
+    root_entries: set[str] = set()
+    language_entries: set[str] = set()
+
     for skin_id, categories in bank_skins.items():
         event_categories = (event_skins.get(skin_id) or {}).get("events", {})
         if not event_categories:
             continue
-        for category in categories:
+        for category, path_groups in categories.items():
             if not event_categories.get(category):
                 continue
             if "VO" in category:
                 needs_language = True
+                _collect_entries(language_entries, path_groups, events_only=True)
             else:
                 needs_root = True
-
-    if needs_root and wad_root:
-        wad_paths.add(wad_root)
-    if needs_language and wad_language:
-        wad_paths.add(wad_language)
+                _collect_entries(root_entries, path_groups, events_only=True)
+
+    _add_planned_wads(
+        wad_paths,
+        wad_entries,
+        wad_root=wad_root if needs_root else "",
+        root_entries=root_entries,
+        wad_language=wad_language if needs_language else "",
+        language_entries=language_entries,
+    )
 
 
-def add_map_mapping_wads(
+def add_map_mapping_wads(  # noqa: PLR0913
     *,
     wad_paths: set[str],
     map_data: dict[str, Any],
     map_banks: dict[str, Any] | None,
     map_events: dict[str, Any] | None,
     reader: Any,
+    wad_entries: dict[str, set[str]] | None = None,
 ) -> None:
     """根据地图 banks/events 数据规划 `mapping` 所需 WAD。
 
@@ -320,6 +393,7 @@ def add_map_mapping_wads(
         map_banks: 地图 banks 数据。
         map_events: 地图 events 数据。
         reader: 数据读取器。
+        wad_entries: 可选的 WAD 条目收集表。
     """
     if not map_data or not map_banks or not map_events:
         return
@@ -330,19 +404,28 @@ def add_map_mapping_wads(
     needs_root = False
     needs_language = False
 
+    root_entries: set[str] = set()
+    language_entries: set[str] = set()
+
     event_categories = map_events.get("events", {})
-    for category in map_banks.get("banks") or {}:
+    for category, path_groups in (map_banks.get("banks") or {}).items():
         if not event_categories.get(category):
             continue
         if "VO" in category:
             needs_language = True
+            _collect_entries(language_entries, path_groups, events_only=True)
         else:
             needs_root = True
-
-    if needs_root and wad_root:
-        wad_paths.add(wad_root)
-    if needs_language and wad_language:
-        wad_paths.add(wad_language)
+            _collect_entries(root_entries, path_groups, events_only=True)
+
+    _add_planned_wads(
+        wad_paths,
+        wad_entries,
+        wad_root=wad_root if needs_root else "",
+        root_entries=root_entries,
+        wad_language=wad_language if needs_language else "",
+        language_entries=language_entries,
+    )
 
 
 def add_map_bins(extraction_plan: dict[str, list[str]], map_data: dict[str, Any]) -> None:
@@ -380,6 +463,46 @@ def normalize_wad_path(wad_root: Any) -> str | None:
     return PurePosixPath(*parts).as_posix()
 
 
+def adopt_prefetched_files(
+    manifest: Any,
+    files: list[Any],
+    *,
+    prefetch_root: Path,
+    is_staged: Callable[[str], bool],
+) -> int:
+    """把后台预下载好的文件移入下载缓存，省去前台再次下载。
+
+    Args:
+        manifest: 指向下载缓存目录的 manifest。
+        files: 本次需要的文件条目。
+        prefetch_root: 预下载暂存目录。
+        is_staged: 判断暂存文件是否已由其所属任务成功写完；未就绪的文件保持原位，由前台自行下载。
+
+    Returns:
+        实际移入的文件数量。
+    """
+    adopted = 0
+    for file in files:
+        staged_path = prefetch_root / PurePosixPath(file.name)
+        if not staged_path.exists():
+            continue
+        if not is_staged(file.name):
+            # 其他工作项的预下载仍在写这个文件，不能当成已完成的下载
+            logger.debug(f"{file.name} 的预下载尚未完成，前台自行下载")
+            continue
+        target_path = Path(manifest.file_output(file))
+        if target_path.exists():
+            # 前台已自行下载过同一文件，暂存副本直接丢弃
+            staged_path.unlink(missing_ok=True)
+            continue
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        staged_path.replace(target_path)
+        adopted += 1
+    if adopted:
+        logger.debug(f"已复用 {adopted} 个预下载的 GAME WAD")
+    return adopted
+
+
 def prepare_wads(
     *,
     preparer: Any,
@@ -408,7 +531,7 @@ def prepare_wads(
         manifest_cache_dir=preparer.game_manifest_cache_dir,
     )
     download_root = preparer.game_cache_root / "downloads"
-    manifest = manifest_class(file=manifest_cache_path, path=download_root)
+    manifest = preparer._load_manifest(manifest_class, manifest_cache_path, download_root)
 
     missing_paths = [path for path in sorted(normalized_paths) if path not in manifest.files]
     if missing_paths:
@@ -416,6 +539,13 @@ def prepare_wads(
         raise FileNotFoundError(f"远端 GAME manifest 中缺少以下 WAD 文件: {missing_text}")
 
     wad_files = [manifest.files[path] for path in sorted(normalized_paths)]
+    if preparer.prefetcher is not None:
+        adopt_prefetched_files(
+            manifest,
+            wad_files,
+            prefetch_root=preparer.game_cache_root / PREFETCH_DIR_NAME,
+            is_staged=preparer.prefetcher.is_staged,
+        )
     cached_paths = preparer._ensure_files_downloaded(manifest, wad_files)
     prepared_paths = tuple(preparer._sync_game_file(path, download_root) for path in cached_paths)
     preparer._track_cleanup_paths("cached_game_wads", cached_paths)
@@ -426,3 +556,74 @@ def prepare_wads(
         prepared_wad_count=len(prepared_paths),
         prepared_file_paths=prepared_paths,
     )
+
+
+def prepare_wad_entries(
+    *,
+    preparer: Any,
+    wad_entries: dict[str, set[str]],
+    manifest_class: type[Any],
+    result_class: type[Any],
+) -> Any:
+    """只下载目标条目所在的 chunk，在最小运行目录写出精简 WAD。
+
+    Args:
+        preparer: 当前远端准备器实例。
+        wad_entries: 原始 WAD 路径到所需内部路径的映射。
+        manifest_class: 需要构造的 manifest 类型。
+        result_class: 结果对象类型。
+
+    Returns:
+        `GameWadResult` 或 `None`。
+    """
+    normalized_entries: dict[str, set[str]] = {}
+    for path, entries in wad_entries.items():
+        if (normalized := normalize_wad_path(path)) is not None:
+            normalized_entries.setdefault(normalized, set()).update(entries)
+    if not normalized_entries:
+        logger.warning("远端 GAME 快照未规划到任何 WAD 下载目标，已跳过实体 WAD 准备。")
+        return None
+
+    manifest_cache_path = preparer._ensure_manifest_cached(
+        manifest_url=preparer.snapshot.game_manifest_url,
+        manifest_cache_dir=preparer.game_manifest_cache_dir,
+    )
+    manifest = preparer._load_manifest(manifest_class, manifest_cache_path, preparer.game_cache_root / "downloads")
+
+    missing_paths = [path for path in sorted(normalized_entries) if path not in manifest.files]
+    if missing_paths:
+        missing_text = ", ".join(missing_paths)
+        raise FileNotFoundError(f"远端 GAME manifest 中缺少以下 WAD 文件: {missing_text}")
+
+    prepared_paths: list[Path] = []
+    downloaded_bytes = 0
+    full_bytes = 0
+    for wad_path in sorted(normalized_entries):
+        wad_file = manifest.files[wad_path]
+        result = build_partial_wad(
+            wad_file,
+            sorted(normalized_entries[wad_path]),
+            output_path=preparer.ctx.config.game_path / "Game" / wad_path,
+            bundle_source=preparer.bundle_source,
+            chunk_cache=preparer.chunk_cache,
+            session=preparer.session,
+            name_hints=preparer.wad_entry_names.setdefault(wad_path, {}),
+        )
+        prepared_paths.append(result.output_path)
+        downloaded_bytes += result.downloaded_bytes
+        full_bytes += wad_file.size
+
+    if preparer.chunk_cache is not None:
+        preparer.chunk_cache.prune()
+    preparer._track_cleanup_paths("prepared_game_wads", prepared_paths)
+    logger.info(
+        "远端 GAME WAD 按条目准备完成：共 {} 个文件，下载 {} 字节（整包合计 {} 字节）。",
+        len(prepared_paths),
+        downloaded_bytes,
+        full_bytes,
+    )
+    return result_class(
+        manifest_cache_path=manifest_cache_path,
+        prepared_wad_count=len(prepared_paths),
+        prepared_file_paths=tuple(prepared_paths),
+    )
@@ -4,12 +4,23 @@ from __future__ import annotations
 
 import json
 import shutil
+import time
 from collections.abc import Callable
 from pathlib import Path, PurePosixPath
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.request import Request
 
 from loguru import logger
+from riotmanifest import DownloadError
+
+from .chunk_cache import ChunkCache, assemble_file
+
+if TYPE_CHECKING:
+    from .session import RemoteSession
+    from .wad_entries import BundleSource
+
+# 启用自适应并发时按该大小切分批次，每批结束后据实测吞吐调整下一批的并发
+ADAPTIVE_BATCH_BYTES = 256 * 1024 * 1024
 
 
 def ensure_manifest_cached(
@@ -155,28 +166,142 @@ def resolve_bundle_files(bundle_names: list[str], lcu_files: dict[str, Any]) ->
     return resolved_files
 
 
-def ensure_files_downloaded(
+def _split_batches(files: list[Any], *, batch_bytes: int) -> list[list[Any]]:
+    """按文件大小把待下载文件切成若干批，单个超大文件独占一批。"""
+    batches: list[list[Any]] = []
+    current: list[Any] = []
+    current_bytes = 0
+    for file in files:
+        if current and current_bytes + file.size > batch_bytes:
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(file)
+        current_bytes += file.size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _download_batches(
+    manifest: Any,
+    files: list[Any],
+    *,
+    run_coroutine_sync: Callable[[Any], Any],
+    session: RemoteSession | None,
+) -> None:
+    """调用 manifest 并发下载，并把耗时与字节数记入会话统计。
+
+    会话启用了自适应并发时，分批下载并在每批结束后按吞吐与失败数调整下一批的并发数。
+    """
+    if session is None:
+        run_coroutine_sync(manifest.download_files_concurrently(files, raise_on_error=True))
+        return
+
+    controller = session.concurrency
+    batches = [files] if controller is None else _split_batches(files, batch_bytes=ADAPTIVE_BATCH_BYTES)
+    for batch in batches:
+        progress: list[Any] = []
+        options: dict[str, Any] = {}
+        if controller is not None:
+            options = {"concurrency_limit": controller.current, "progress_callback": progress.append}
+        started = time.perf_counter()
+        try:
+            run_coroutine_sync(manifest.download_files_concurrently(batch, raise_on_error=True, **options))
+        except DownloadError:
+            failures = progress[-1].failed_jobs if progress else 1
+            elapsed = time.perf_counter() - started
+            downloaded = progress[-1].finished_bytes if progress else 0
+            session.stats.record_batch(downloaded_bytes=downloaded, elapsed_seconds=elapsed, failures=failures)
+            if controller is not None:
+                limit = controller.update(downloaded_bytes=downloaded, elapsed_seconds=elapsed, failures=failures)
+                logger.warning(f"批量下载有 {failures} 个作业失败，后续批次并发调整为 {limit}")
+            raise
+        elapsed = time.perf_counter() - started
+        if progress:
+            downloaded = progress[-1].finished_bytes
+        else:
+            downloaded = sum(Path(manifest.file_output(file)).stat().st_size for file in batch)
+        session.stats.record_batch(downloaded_bytes=downloaded, elapsed_seconds=elapsed)
+        if controller is not None:
+            controller.update(downloaded_bytes=downloaded, elapsed_seconds=elapsed)
+
+
+def ensure_files_downloaded(  # noqa: PLR0913
     manifest: Any,
     files: list[Any],
     *,
     run_coroutine_sync: Callable[[Any], Any],
+    chunk_cache: ChunkCache | None = None,
+    session: RemoteSession | None = None,
+    bundle_source: BundleSource | None = None,
+    chunk_reads: bool = False,
 ) -> list[Path]:
     """确保目标文件已下载到缓存目录。
 
+    配置了 ``chunk_cache`` 时，已有部分 chunk 被缓存的文件只下载缺失的 chunk；
+    完全未命中的文件仍走 manifest 的并发下载，下载完成后切分写入缓存。
+    ``chunk_reads`` 为 ``True`` 时所有文件都逐 chunk 拼出，不经 manifest 的批量下载，
+    用于从离线镜像读取或导出快照包时记录 chunk。
+
     Args:
         manifest: `PatcherManifest` 实例。
         files: 需要确保存在的文件条目。
         run_coroutine_sync: 同步执行 manifest 下载协程的回调。
+        chunk_cache: 可选的跨快照 chunk 缓存。
+        session: 可选的共享 remote 会话；从缓存补齐文件时，缺失 chunk 的范围请求复用其连接池，
+            批量下载的统计记入会话，会话启用自适应并发时按批调整并发数。
+        bundle_source: 逐 chunk 读取时的 bundle 基础 URL 或本地目录；为 ``None`` 时使用 manifest 的 ``bundle_url``。
+        chunk_reads: 是否全部文件都逐 chunk 读取。
 
     Returns:
         对应的缓存文件路径列表。
     """
     output_paths = [Path(manifest.file_output(file)) for file in files]
-    missing_files = [file for file, output_path in zip(files, output_paths, strict=True) if not output_path.exists()]
+    # 导出快照包时已缓存的文件也要重新读取一遍，其 chunk 才会被记录
+    recording = chunk_reads and session is not None and session.recorder is not None
+    missing_files = [
+        file for file, output_path in zip(files, output_paths, strict=True) if recording or not output_path.exists()
+    ]
+    if not missing_files:
+        return output_paths
+
+    if chunk_reads:
+        for file in missing_files:
+            assemble_file(
+                file,
+                Path(manifest.file_output(file)),
+                chunk_cache=chunk_cache,
+                bundle_source=bundle_source,
+                session=session,
+            )
+        logger.info(f"已逐 chunk 准备 {len(missing_files)} 个文件")
+        missing_files = []
+
+    if chunk_cache is not None:
+        batch_files = []
+        cached_chunks = downloaded_bytes = 0
+        for file in missing_files:
+            if not any(chunk_cache.contains(chunk.chunk_id) for chunk in file.chunks):
+                batch_files.append(file)
+                continue
+            result = assemble_file(file, Path(manifest.file_output(file)), chunk_cache=chunk_cache, session=session)
+            cached_chunks += result.cached_chunks
+            downloaded_bytes += result.downloaded_bytes
+        if len(batch_files) < len(missing_files):
+            logger.info(
+                f"chunk 缓存命中 {len(missing_files) - len(batch_files)} 个文件：复用 chunk {cached_chunks} 个，"
+                f"补充下载 {downloaded_bytes} 字节"
+            )
+        missing_files = batch_files
 
     if missing_files:
         for output_path in output_paths:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-        run_coroutine_sync(manifest.download_files_concurrently(missing_files, raise_on_error=True))
+        _download_batches(manifest, missing_files, run_coroutine_sync=run_coroutine_sync, session=session)
+        if chunk_cache is not None:
+            for file in missing_files:
+                chunk_cache.ingest(file, Path(manifest.file_output(file)))
 
+    if chunk_cache is not None:
+        chunk_cache.prune()
     return output_paths
@@ -0,0 +1,363 @@
+"""离线快照包的导出与导入。
+
+构建机无法访问 CDN 时，先在可联网的机器上按计划实体执行一遍远端准备，记录期间读取到的
+全部压缩 chunk，连同 manifest 与索引写进单个快照包（zip，不再压缩）。导入时把 chunk
+按原偏移写回 ``<root>/bundles/<bundle_id:016X>.bundle``（稀疏文件），manifest 放到
+``<root>/manifests/``；``remote_snapshot`` 模式指定该目录后即把它当作 CDN 读取。
+
+导出时可指定先前的快照包作为基准，基准中已有的 chunk 与 manifest 不再写入，
+补丁之间只需分发增量包；导入增量包前必须已导入其基准。
+
+索引记录导出时的 ``remote_wad_mode``：entries 方式导出的快照只含所需条目所在的 chunk，
+离线使用时也必须以 entries 方式运行。
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import uuid
+import zipfile
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from urllib.request import Request
+
+    from lol_audio_unpack.app.types import RemoteSnapshotConfig, RemoteWadMode
+
+BUNDLE_FORMAT_VERSION = 1
+INDEX_MEMBER = "index.json"
+MANIFEST_MEMBER_DIR = "manifests"
+CHUNK_MEMBER_DIR = "chunks"
+MIRROR_BUNDLE_DIR = "bundles"
+MIRROR_MANIFEST_DIR = "manifests"
+MIRROR_STATE_FILE = "snapshots.json"
+
+ChunkKey = tuple[int, int]
+
+
+class SnapshotBundleError(ValueError):
+    """快照包格式不符或导入前置条件不满足。"""
+
+
+@dataclass(frozen=True)
+class SnapshotExportResult:
+    """快照包导出结果。"""
+
+    bundle_path: Path
+    bundle_id: str
+    chunk_count: int
+    chunk_bytes: int
+    skipped_chunks: int
+    base_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SnapshotImportResult:
+    """快照包导入结果。"""
+
+    mirror_root: Path
+    bundle_id: str
+    version: str
+    chunk_count: int
+    manifest_count: int
+
+
+class ChunkRecorder(Mapping[ChunkKey, bytes]):
+    """记录远端准备期间读取的压缩 chunk，按 ``(bundle_id, offset)`` 去重。
+
+    chunk 追加写入磁盘上的暂存文件，内存中只保留各 chunk 在暂存文件中的位置；
+    按映射读取时再从暂存文件取回字节。
+    """
+
+    def __init__(self, spool_dir: Path | None = None) -> None:
+        """创建空记录。
+
+        Args:
+            spool_dir: 暂存文件所在目录；为 ``None`` 时使用系统临时目录。
+        """
+        if spool_dir is not None:
+            spool_dir.mkdir(parents=True, exist_ok=True)
+        self._spool = tempfile.TemporaryFile(dir=spool_dir)  # noqa: SIM115
+        self._positions: dict[ChunkKey, tuple[int, int]] = {}
+        self._spool_size = 0
+        self._lock = threading.Lock()
+
+    def record(self, bundle_id: int, offset: int, data: bytes) -> None:
+        """记录一个压缩 chunk。
+
+        Args:
+            bundle_id: chunk 所在 bundle。
+            offset: chunk 在 bundle 中的偏移。
+            data: 压缩字节，与 CDN 返回的内容一致。
+        """
+        key = (bundle_id, offset)
+        with self._lock:
+            if key in self._positions:
+                return
+            self._spool.seek(self._spool_size)
+            self._spool.write(data)
+            self._positions[key] = (self._spool_size, len(data))
+            self._spool_size += len(data)
+
+    def __getitem__(self, key: ChunkKey) -> bytes:
+        """从暂存文件读回一个已记录的 chunk。"""
+        with self._lock:
+            position, size = self._positions[key]
+            self._spool.seek(position)
+            return self._spool.read(size)
+
+    def __iter__(self) -> Iterator[ChunkKey]:
+        """遍历已记录的 chunk 键。"""
+        with self._lock:
+            return iter(list(self._positions))
+
+    def __len__(self) -> int:
+        """返回已记录的 chunk 数量。"""
+        return len(self._positions)
+
+    def close(self) -> None:
+        """关闭并删除暂存文件。"""
+        with self._lock:
+            self._spool.close()
+            self._positions.clear()
+
+
+def _chunk_member(key: ChunkKey) -> str:
+    bundle_id, offset = key
+    return f"{CHUNK_MEMBER_DIR}/{bundle_id:016X}/{offset:X}"
+
+
+def manifest_id(manifest_url: str) -> str:
+    """从 manifest URL 取出文件名，与 manifest 缓存目录使用的命名一致。"""
+    return manifest_url.rstrip("/").rsplit("/", maxsplit=1)[-1]
+
+
+def read_index(bundle: zipfile.ZipFile) -> dict[str, Any]:
+    """读取并校验快照包索引。
+
+    Args:
+        bundle: 已打开的快照包。
+
+    Returns:
+        索引字典。
+
+    Raises:
+        SnapshotBundleError: 缺少索引或格式版本不受支持时抛出。
+    """
+    try:
+        index = json.loads(bundle.read(INDEX_MEMBER))
+    except KeyError as exc:
+        raise SnapshotBundleError(f"快照包缺少 {INDEX_MEMBER}: {bundle.filename}") from exc
+    if index.get("format") != BUNDLE_FORMAT_VERSION:
+        raise SnapshotBundleError(f"不支持的快照包格式: {index.get('format')}（当前支持 {BUNDLE_FORMAT_VERSION}）")
+    return index
+
+
+def _index_keys(index: Mapping[str, Any]) -> set[ChunkKey]:
+    return {(int(bundle_hex, 16), offset) for bundle_hex, offset, _ in index["chunks"]}
+
+
+def write_snapshot_bundle(  # noqa: PLR0913
+    output_path: Path,
+    *,
+    snapshot: RemoteSnapshotConfig,
+    manifest_paths: Mapping[str, Path],
+    chunks: Mapping[ChunkKey, bytes],
+    wad_mode: RemoteWadMode,
+    base_paths: Sequence[Path] = (),
+) -> SnapshotExportResult:
+    """写出快照包，基准包中已有的 chunk 与 manifest 不再重复写入。
+
+    Args:
+        output_path: 快照包输出路径。
+        snapshot: 导出的远端快照配置。
+        manifest_paths: manifest URL 到本地缓存文件的映射。
+        chunks: ``(bundle_id, offset)`` 到压缩字节的映射，可直接传入 ``ChunkRecorder``。
+        wad_mode: 导出时 GAME WAD 的准备方式，写入索引供离线使用时核对。
+        base_paths: 作为增量基准的先前快照包。
+
+    Returns:
+        SnapshotExportResult: 写入的 chunk 数量与体积。
+
+    Raises:
+        SnapshotBundleError: 基准包格式不符时抛出。
+    """
+    base_ids: list[str] = []
+    base_keys: set[ChunkKey] = set()
+    base_manifests: set[str] = set()
+    for base_path in base_paths:
+        with zipfile.ZipFile(base_path) as base:
+            base_index = read_index(base)
+        base_ids.append(base_index["id"])
+        base_keys |= _index_keys(base_index)
+        base_manifests.update(base_index["manifests"])
+
+    bundle_id = uuid.uuid4().hex
+    written = sorted(key for key in chunks if key not in base_keys)
+    manifests = {
+        manifest_id(url): path for url, path in manifest_paths.items() if manifest_id(url) not in base_manifests
+    }
+    index = {
+        "format": BUNDLE_FORMAT_VERSION,
+        "id": bundle_id,
+        "base": base_ids,
+        "version": snapshot.version,
+        "lcu_manifest_url": snapshot.lcu_manifest_url,
+        "game_manifest_url": snapshot.game_manifest_url,
+        "remote_wad_mode": wad_mode.value,
+        "manifests": sorted(manifests),
+        "chunks": [],
+    }
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f"{output_path.name}.{bundle_id}.tmp")
+    try:
+        # chunk 本身已是 zstd 压缩，整包只做存储
+        with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_STORED) as bundle:
+            for name, path in sorted(manifests.items()):
+                bundle.write(path, f"{MANIFEST_MEMBER_DIR}/{name}")
+            # 逐个取出 chunk 写入，记录器的暂存文件不会整体读进内存
+            for chunk_bundle, offset in written:
+                data = chunks[(chunk_bundle, offset)]
+                bundle.writestr(_chunk_member((chunk_bundle, offset)), data)
+                index["chunks"].append([f"{chunk_bundle:016X}", offset, len(data)])
+            bundle.writestr(INDEX_MEMBER, json.dumps(index, ensure_ascii=False, indent=2))
+        temp_path.replace(output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    chunk_bytes = sum(size for _, _, size in index["chunks"])
+    logger.info(
+        f"已导出快照包 {output_path.name}：version={snapshot.version}，chunk {len(written)} 个（{chunk_bytes} 字节），"
+        f"基准中已有 {len(chunks) - len(written)} 个"
+    )
+    return SnapshotExportResult(
+        bundle_path=output_path,
+        bundle_id=bundle_id,
+        chunk_count=len(written),
+        chunk_bytes=chunk_bytes,
+        skipped_chunks=len(chunks) - len(written),
+        base_ids=tuple(base_ids),
+    )
+
+
+def load_mirror_state(mirror_root: Path) -> dict[str, Any]:
+    """读取离线镜像目录中已导入的快照记录。
+
+    Args:
+        mirror_root: 离线镜像根目录。
+
+    Returns:
+        包含 ``imported``（已导入的快照包 ID）、``snapshots``（版本到 manifest URL）
+        与 ``latest``（最近导入的版本）的字典；目录尚未导入任何快照包时各字段为空。
+    """
+    state_path = mirror_root / MIRROR_STATE_FILE
+    if not state_path.exists():
+        return {"imported": [], "snapshots": {}, "latest": None}
+    return json.loads(state_path.read_text(encoding="utf-8"))
+
+
+def import_snapshot_bundle(bundle_path: Path, mirror_root: Path) -> SnapshotImportResult:
+    """把快照包导入离线镜像目录；同一镜像可先后导入完整包与增量包。
+
+    Args:
+        bundle_path: 快照包路径。
+        mirror_root: 离线镜像根目录。
+
+    Returns:
+        SnapshotImportResult: 导入的快照版本与 chunk 数量。
+
+    Raises:
+        SnapshotBundleError: 包格式不符或其基准尚未导入时抛出。
+    """
+    state = load_mirror_state(mirror_root)
+    with zipfile.ZipFile(bundle_path) as bundle:
+        index = read_index(bundle)
+        missing_bases = [base_id for base_id in index["base"] if base_id not in state["imported"]]
+        if missing_bases:
+            raise SnapshotBundleError(f"{bundle_path.name} 是增量包，请先导入其基准快照包: {missing_bases}")
+
+        manifest_dir = mirror_root / MIRROR_MANIFEST_DIR
+        manifest_dir.mkdir(parents=True, exist_ok=True)
+        for name in index["manifests"]:
+            (manifest_dir / name).write_bytes(bundle.read(f"{MANIFEST_MEMBER_DIR}/{name}"))
+
+        bundle_dir = mirror_root / MIRROR_BUNDLE_DIR
+        bundle_dir.mkdir(parents=True, exist_ok=True)
+        by_bundle: dict[str, list[int]] = {}
+        for bundle_hex, offset, _ in index["chunks"]:
+            by_bundle.setdefault(bundle_hex, []).append(offset)
+        for bundle_hex, offsets in by_bundle.items():
+            target = bundle_dir / f"{bundle_hex}.bundle"
+            target.touch()
+            # 只写入导出的 chunk，其余区间保持为空洞，读取偏移与 CDN 上的 bundle 一致
+            with target.open("r+b") as bundle_file:
+                for offset in sorted(offsets):
+                    bundle_file.seek(offset)
+                    bundle_file.write(bundle.read(_chunk_member((int(bundle_hex, 16), offset))))
+
+    if index["id"] not in state["imported"]:
+        state["imported"].append(index["id"])
+    state["snapshots"][index["version"]] = {
+        "lcu_manifest_url": index["lcu_manifest_url"],
+        "game_manifest_url": index["game_manifest_url"],
+        "remote_wad_mode": index.get("remote_wad_mode"),
+    }
+    state["latest"] = index["version"]
+    (mirror_root / MIRROR_STATE_FILE).write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    logger.info(
+        f"已导入快照包 {bundle_path.name} 到 {mirror_root}：version={index['version']}，"
+        f"chunk {len(index['chunks'])} 个，manifest {len(index['manifests'])} 个"
+    )
+    return SnapshotImportResult(
+        mirror_root=mirror_root,
+        bundle_id=index["id"],
+        version=index["version"],
+        chunk_count=len(index["chunks"]),
+        manifest_count=len(index["manifests"]),
+    )
+
+
+def mirror_request_open(mirror_root: Path) -> Callable[[Request], IO[bytes]]:
+    """返回从离线镜像读取 manifest 的请求函数，用于替代 ``urlopen``。
+
+    Args:
+        mirror_root: 离线镜像根目录。
+
+    Returns:
+        接收 ``Request`` 并返回本地 manifest 文件对象的函数。
+    """
+
+    def request_open(request: Request) -> IO[bytes]:
+        name = manifest_id(request.full_url)
+        path = mirror_root / MIRROR_MANIFEST_DIR / name
+        if not path.exists():
+            raise FileNotFoundError(f"离线镜像中没有 manifest {name}，请先导入包含该快照的快照包: {mirror_root}")
+        return path.open("rb")
+
+    return request_open
+
+
+__all__ = [
+    "ChunkRecorder",
+    "MIRROR_BUNDLE_DIR",
+    "SnapshotBundleError",
+    "SnapshotExportResult",
+    "SnapshotImportResult",
+    "import_snapshot_bundle",
+    "load_mirror_state",
+    "manifest_id",
+    "mirror_request_open",
+    "read_index",
+    "write_snapshot_bundle",
+]
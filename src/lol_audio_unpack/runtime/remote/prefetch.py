@@ -0,0 +1,180 @@
+"""remote 工作流的 GAME WAD 后台预下载。
+
+逐实体执行时，前台按「准备 WAD → 解包 → 映射 → 清理」顺序推进：下载时 CPU 空闲，
+解析时网络空闲。预下载器在单个后台线程里提前下载后续工作项的 WAD，与前台处理重叠。
+
+预下载的文件写入独立的暂存目录，不进入清理登记表，逐实体清理不会删到它们；
+前台准备该实体时再由 ``adopt_prefetched_files`` 移入下载缓存。暂存文件只有在写入它的
+任务成功结束后才会被复用：下载中的半截文件与失败任务留下的文件都不算就绪。已占用的暂存
+字节数受磁盘预算约束，超出预算的工作项不预下载，留给前台按原流程下载。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import Any
+
+from loguru import logger
+
+from .cleanup import prune_empty_tree
+from .game import PREFETCH_DIR_NAME, normalize_wad_path
+
+DEFAULT_PREFETCH_BUDGET_BYTES = 4 * 1024 * 1024 * 1024
+
+
+@dataclass
+class _PrefetchTask:
+    """一个工作项的预下载任务。"""
+
+    files: list[Any]
+    size: int
+    future: Future[bool]
+
+
+class WadPrefetcher:
+    """在后台为后续工作项预下载 GAME WAD。"""
+
+    def __init__(self, preparer: Any, *, budget_bytes: int = DEFAULT_PREFETCH_BUDGET_BYTES) -> None:
+        """初始化预下载器。
+
+        Args:
+            preparer: 当前远端准备器实例。
+            budget_bytes: 暂存目录允许占用的最大字节数。
+        """
+        self.preparer = preparer
+        self.budget_bytes = budget_bytes
+        self.prefetch_root = preparer.game_cache_root / PREFETCH_DIR_NAME
+        self.download_root = preparer.game_cache_root / "downloads"
+        self._manifest: Any | None = None
+        self._tasks: dict[Hashable, _PrefetchTask] = {}
+        # 暂存文件 → 写入它的任务；任务成功结束前该文件不可复用
+        self._owners: dict[str, Future[bool]] = {}
+        self._claimed: set[str] = set()
+        self._reserved_bytes = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="remote-prefetch")
+        # 前台准备 WAD 时经由准备器查询暂存文件是否就绪
+        preparer.prefetcher = self
+
+    def is_staged(self, file_name: str) -> bool:
+        """判断暂存文件是否已由其所属任务完整写出。
+
+        Args:
+            file_name: manifest 中的文件名。
+
+        Returns:
+            bool: 所属任务已成功结束时返回 ``True``；仍在下载、已失败或不属于任何任务时返回 ``False``。
+        """
+        future = self._owners.get(file_name)
+        return future is not None and future.done() and not future.cancelled() and future.result()
+
+    def _is_present(self, file: Any) -> bool:
+        relative_path = PurePosixPath(file.name)
+        if self.is_staged(file.name) and (self.prefetch_root / relative_path).exists():
+            return True
+        # 开启清理时，下载缓存里没有后续消费者登记的 WAD 会在当前实体结束后删除，仍需预下载一份
+        kept = not self.preparer.ctx.config.cleanup_remote or self.preparer.is_wad_retained(file.name)
+        return kept and (self.download_root / relative_path).exists()
+
+    def submit(self, key: Hashable, wad_paths: set[str]) -> bool:
+        """为一个工作项提交预下载。
+
+        已在缓存、已被其他工作项认领或超出磁盘预算的文件不会重复下载。
+
+        Args:
+            key: 工作项标识，之后用同一标识调用 ``wait``。
+            wad_paths: 该工作项规划出的原始 WAD 路径集合。
+
+        Returns:
+            bool: 是否提交了后台下载。
+        """
+        if key in self._tasks:
+            return True
+        if self._manifest is None:
+            _, self._manifest = self.preparer.open_game_manifest(self.prefetch_root)
+
+        normalized_paths = sorted(
+            normalized for path in wad_paths if (normalized := normalize_wad_path(path)) is not None
+        )
+        files = [
+            self._manifest.files[path]
+            for path in normalized_paths
+            if path in self._manifest.files and path not in self._claimed
+        ]
+        files = [file for file in files if not self._is_present(file)]
+        if not files:
+            return False
+
+        size = sum(int(file.size) for file in files)
+        if self._reserved_bytes + size > self.budget_bytes:
+            logger.debug(
+                f"预下载 {key} 需要 {size} 字节，超出剩余预算 {self.budget_bytes - self._reserved_bytes} 字节，留给前台下载"
+            )
+            return False
+
+        for file in files:
+            # 没有就绪任务认领的暂存文件来源不明（例如上次中断留下的半截文件），不能续用
+            (self.prefetch_root / PurePosixPath(file.name)).unlink(missing_ok=True)
+        self._reserved_bytes += size
+        self._claimed.update(file.name for file in files)
+        future = self._executor.submit(self._download, key, files)
+        self._owners.update((file.name, future) for file in files)
+        self._tasks[key] = _PrefetchTask(files=files, size=size, future=future)
+        return True
+
+    def _download(self, key: Hashable, files: list[Any]) -> bool:
+        """后台线程：下载一个工作项的 WAD 到暂存目录，返回是否全部成功。"""
+        logger.info(f"开始预下载 {key} 的 GAME WAD：{len(files)} 个文件")
+        try:
+            self.preparer._ensure_files_downloaded(self._manifest, files)
+        except Exception as exc:  # noqa: BLE001
+            # 半截文件不能留给前台复用，统一删除后交给前台按原流程下载
+            for file in files:
+                (self.prefetch_root / PurePosixPath(file.name)).unlink(missing_ok=True)
+            logger.warning(f"预下载 {key} 的 GAME WAD 失败，将在处理该实体时重新下载: {exc}")
+            return False
+        logger.info(f"预下载 {key} 的 GAME WAD 完成")
+        return True
+
+    def wait(self, key: Hashable) -> None:
+        """等待工作项的预下载结束，并释放其预算。
+
+        Args:
+            key: ``submit`` 时使用的工作项标识。
+        """
+        task = self._tasks.pop(key, None)
+        if task is None:
+            return
+        if not task.future.done():
+            logger.debug(f"等待 {key} 的预下载完成")
+        task.future.result()
+        self._reserved_bytes -= task.size
+        self._claimed.difference_update(file.name for file in task.files)
+
+    def close(self) -> None:
+        """停止后台下载并删除未被使用的暂存文件。"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        leftover = 0
+        # 已 wait 过但前台没有取用的暂存文件也要删除，所以按归属表而不是未结束的任务清理
+        for file_name in self._owners:
+            staged_path = self.prefetch_root / PurePosixPath(file_name)
+            if staged_path.exists():
+                staged_path.unlink()
+                leftover += 1
+        self._tasks.clear()
+        self._owners.clear()
+        self._claimed.clear()
+        self._reserved_bytes = 0
+        if self.preparer.prefetcher is self:
+            self.preparer.prefetcher = None
+        prune_empty_tree(self.prefetch_root)
+        if leftover:
+            logger.info(f"已删除 {leftover} 个未使用的预下载 WAD")
+
+
+__all__ = [
+    "DEFAULT_PREFETCH_BUDGET_BYTES",
+    "WadPrefetcher",
+]
@@ -7,6 +7,10 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Any
@@ -15,9 +19,15 @@ from urllib.request import urlopen
 from loguru import logger
 from riotmanifest import PatcherManifest, WADExtractor
 
+from lol_audio_unpack.app.types import RemoteWadMode
+
 from . import cleanup as remote_cleanup
 from . import game as remote_game
 from . import lcu as remote_lcu
+from . import session as remote_session
+from .chunk_cache import CHUNK_CACHE_DIR_NAME, ChunkCache
+from .offline import MIRROR_BUNDLE_DIR, mirror_request_open
+from .wad_entries import read_entries
 
 if TYPE_CHECKING:
     from riotmanifest import PatcherFile
@@ -25,10 +35,82 @@ if TYPE_CHECKING:
     from lol_audio_unpack.app.types import AppContext
     from lol_audio_unpack.manager import DataReader
 
+    from .prefetch import WadPrefetcher
+
 LCU_PLUGIN_SUFFIX = "plugins/rcp-be-lol-game-data"
 DESCRIPTION_FILE_NAME = "description.json"
 CLEANUP_REGISTRY_KEY = "remote_cleanup_registry"
+WAD_CONSUMERS_KEY = "remote_wad_consumers"
+PARSED_MANIFESTS_KEY = "remote_parsed_manifests"
+# 预下载线程与前台可能同时请求同一 manifest，解析过程串行执行
+_MANIFEST_LOCK = threading.Lock()
+# 并行工作项共用下载缓存：硬链接、清理登记、消费者计数与清理本身串行执行，下载不在锁内
+_GAME_FILES_LOCK = threading.RLock()
+_REGISTRY_LOCK = threading.Lock()
+# 同一 WAD 的准备按路径串行，不同 WAD 的下载互不等待
+_WAD_PATH_LOCKS: dict[str, threading.Lock] = {}
+_WAD_PATH_LOCKS_GUARD = threading.Lock()
 MANIFEST_HEADERS = {"User-Agent": "Mozilla/5.0"}
+# BIN 单个文件较小，写入受磁盘延迟限制，线程数不必随 CPU 增长
+BIN_WRITE_WORKERS = 8
+
+
+class _GameFilesGate:
+    """GAME 文件准备（共享）与清理（独占）之间的读写闸门。
+
+    准备流程从检查缓存到硬链接完成期间持有共享权，多个工作项可同时下载；清理持有独占权，
+    等进行中的准备全部结束后才删除文件、修剪空目录，避免删掉别人刚检查过或刚建好的路径。
+    有清理在等待时新的准备先让行，清理不会被持续到来的下载饿死。
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._active = 0
+        self._waiting_writers = 0
+        self._writing = False
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._condition:
+            while self._writing or self._waiting_writers:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                if not self._active:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writing or self._active:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+_GAME_FILES_GATE = _GameFilesGate()
+
+
+@contextmanager
+def _hold_wad_paths(wad_paths: Iterable[str]) -> Iterator[None]:
+    """按固定顺序持有各 WAD 路径的锁，同一 WAD 的并发准备依次执行。"""
+    with _WAD_PATH_LOCKS_GUARD:
+        locks = [_WAD_PATH_LOCKS.setdefault(path, threading.Lock()) for path in sorted(set(wad_paths))]
+    with ExitStack() as stack:
+        for lock in locks:
+            stack.enter_context(lock)
+        yield
 
 
 @dataclass(frozen=True)
@@ -91,6 +173,31 @@ class RemotePreparer:
         self.game_manifest_cache_dir = self.game_cache_root / "manifests"
         self.download_root = self.lcu_cache_root / "downloads"
         self.prepared_lcu_root = self.ctx.paths.game_lcu_path
+        # 事件循环与 HTTP 连接池按上下文共享，跨实体、跨准备器实例复用连接
+        self.session = remote_session.get_session(
+            self.ctx.runtime_cache,
+            download_concurrency=self.ctx.config.remote_download_concurrency,
+        )
+        # 工作流开启预下载时由预下载器自行登记，前台准备 WAD 前据此复用已完成的暂存文件
+        self.prefetcher: WadPrefetcher | None = None
+        # 按条目准备的精简 WAD 已写入条目的路径，合并旧条目时据此保留原有存储方式
+        self.wad_entry_names: dict[str, dict[int, str]] = {}
+        # 离线镜像目录按 CDN 的 bundle 布局存放，直接作为本地 bundle 来源
+        self.offline_root = self.ctx.config.remote_offline_root
+        self.bundle_source = self.offline_root / MIRROR_BUNDLE_DIR if self.offline_root is not None else None
+        # 导出快照包时缓存命中的 chunk 不会经过记录器，记录期间不使用 chunk 缓存
+        recording = self.session.recorder is not None
+        # 离线镜像与导出记录都要求所有读取按 chunk 进行，不走 manifest 的批量下载
+        self.chunk_reads = self.offline_root is not None or recording
+        # chunk 缓存与快照版本无关，放在各版本目录之外
+        self.chunk_cache = (
+            ChunkCache(
+                self.ctx.paths.cache_path / "remote" / CHUNK_CACHE_DIR_NAME,
+                max_bytes=self.ctx.config.remote_chunk_cache_mb * 1024 * 1024,
+            )
+            if self.ctx.config.remote_chunk_cache_mb > 0 and not recording
+            else None
+        )
 
     def cleanup_artifacts(self, *, dry_run: bool = False) -> dict[str, int]:
         """清理本轮已登记的远端准备产物。
@@ -101,27 +208,139 @@ class RemotePreparer:
         Returns:
             各类产物删除数量统计。
         """
-        registry = self._load_cleanup_registry()
-        cleanup_counts = {
-            "prepared_lcu_wads": self._remove_paths(registry["prepared_lcu_wads"], dry_run=dry_run),
-            "cached_lcu_wads": self._remove_paths(registry["cached_lcu_wads"], dry_run=dry_run),
-            "bin_input_files": self._remove_paths(registry["bin_input_files"], dry_run=dry_run),
-            "bin_input_flags": self._remove_paths(registry["bin_input_flags"], dry_run=dry_run),
-            "prepared_game_wads": self._remove_paths(registry["prepared_game_wads"], dry_run=dry_run),
-            "cached_game_wads": self._remove_paths(registry["cached_game_wads"], dry_run=dry_run),
-        }
-
-        if not dry_run:
-            self._prune_empty_tree(self.ctx.paths.manifest_path / self.snapshot.version / "bin_input")
-            self._prune_empty_tree(self.prepared_lcu_root)
-            self._prune_empty_tree(self.game_cache_root / "downloads")
-            self._prune_empty_tree(self.lcu_cache_root / "downloads")
-            self._prune_empty_tree(self.ctx.config.game_path / "Game" / "DATA" / "FINAL" / "Champions")
-            self._prune_empty_tree(self.ctx.config.game_path / "Game" / "DATA" / "FINAL" / "Maps" / "Shipping")
-            self.ctx.runtime_cache.pop(CLEANUP_REGISTRY_KEY, None)
+        # 并行工作项共用下载缓存，等进行中的准备结束后再删除
+        with _GAME_FILES_GATE.exclusive(), _GAME_FILES_LOCK:
+            registry = self._load_cleanup_registry()
+            retained_paths = self._retained_game_paths(registry)
+            if retained_paths:
+                logger.info(f"保留 {len(retained_paths)} 个仍被后续工作项使用的 GAME WAD 文件")
+            cleanup_counts = {
+                "prepared_lcu_wads": self._remove_paths(registry["prepared_lcu_wads"], dry_run=dry_run),
+                "cached_lcu_wads": self._remove_paths(registry["cached_lcu_wads"], dry_run=dry_run),
+                "bin_input_files": self._remove_paths(registry["bin_input_files"], dry_run=dry_run),
+                "bin_input_flags": self._remove_paths(registry["bin_input_flags"], dry_run=dry_run),
+                "prepared_game_wads": self._remove_paths(
+                    registry["prepared_game_wads"], dry_run=dry_run, keep=retained_paths
+                ),
+                "cached_game_wads": self._remove_paths(
+                    registry["cached_game_wads"], dry_run=dry_run, keep=retained_paths
+                ),
+            }
+
+            if not dry_run:
+                self._prune_empty_tree(self.ctx.paths.manifest_path / self.snapshot.version / "bin_input")
+                self._prune_empty_tree(self.prepared_lcu_root)
+                self._prune_empty_tree(self.game_cache_root / "downloads")
+                self._prune_empty_tree(self.lcu_cache_root / "downloads")
+                self._prune_empty_tree(self.ctx.config.game_path / "Game" / "DATA" / "FINAL" / "Champions")
+                self._prune_empty_tree(self.ctx.config.game_path / "Game" / "DATA" / "FINAL" / "Maps" / "Shipping")
+                if not retained_paths:
+                    self.ctx.runtime_cache.pop(CLEANUP_REGISTRY_KEY, None)
 
         return cleanup_counts
 
+    def register_wad_consumers(self, plans: list[set[str]], *, budget_bytes: int) -> None:
+        """登记各工作项需要的 GAME WAD，使清理只删除已无后续消费者的文件。
+
+        Args:
+            plans: 按执行顺序排列的各工作项原始 WAD 路径集合。
+            budget_bytes: 清理时保留 WAD 的总字节上限。
+        """
+        normalized_plans = [
+            {normalized for path in wad_paths if (normalized := remote_game.normalize_wad_path(path)) is not None}
+            for wad_paths in plans
+        ]
+        consumers = remote_cleanup.build_consumers(normalized_plans, budget_bytes=budget_bytes)
+        self.ctx.runtime_cache[WAD_CONSUMERS_KEY] = consumers
+        shared_count = sum(1 for indexes in consumers.pending.values() if len(indexes) > 1)
+        logger.info(
+            f"已登记 {len(normalized_plans)} 个工作项的 GAME WAD 消费关系：共 {len(consumers.pending)} 个 WAD，"
+            f"其中 {shared_count} 个被多个工作项共享"
+        )
+
+    def release_wad_consumer(self, index: int) -> None:
+        """标记第 ``index`` 个工作项已完成，其独占的 WAD 在下次清理时删除。
+
+        Args:
+            index: 工作项在登记顺序中的序号（从 0 开始）。
+        """
+        consumers = self.ctx.runtime_cache.get(WAD_CONSUMERS_KEY)
+        if isinstance(consumers, remote_cleanup.WadConsumers):
+            with _GAME_FILES_LOCK:
+                remote_cleanup.release_consumer(consumers, index)
+
+    def clear_wad_consumers(self) -> None:
+        """清空消费者登记，之后的清理恢复为删除全部已登记产物。"""
+        self.ctx.runtime_cache.pop(WAD_CONSUMERS_KEY, None)
+
+    def is_wad_retained(self, wad_path: str) -> bool:
+        """判断规范化 WAD 路径是否仍有待处理的消费者。
+
+        Args:
+            wad_path: 规范化后的 WAD 路径。
+
+        Returns:
+            仍有后续工作项需要时返回 `True`。
+        """
+        consumers = self.ctx.runtime_cache.get(WAD_CONSUMERS_KEY)
+        return isinstance(consumers, remote_cleanup.WadConsumers) and wad_path in consumers.pending
+
+    @staticmethod
+    def fork_runtime_cache(runtime_cache: dict[str, Any]) -> dict[str, Any]:
+        """为并行工作项复制运行时缓存。
+
+        解析后的 manifest 与 WAD 消费者登记按引用共享；清理登记表各工作项独立，
+        完成后由 `join_runtime_cache` 合并回主缓存。
+
+        Args:
+            runtime_cache: 主运行时缓存。
+
+        Returns:
+            工作项专用的运行时缓存。
+        """
+        with _MANIFEST_LOCK:
+            runtime_cache.setdefault(PARSED_MANIFESTS_KEY, {})
+        return {key: value for key, value in runtime_cache.items() if key != CLEANUP_REGISTRY_KEY}
+
+    @staticmethod
+    def join_runtime_cache(forked_cache: dict[str, Any], runtime_cache: dict[str, Any]) -> None:
+        """把工作项未清理的登记路径合并回主运行时缓存，留给本轮最后一次清理。
+
+        Args:
+            forked_cache: `fork_runtime_cache` 返回的工作项缓存。
+            runtime_cache: 主运行时缓存。
+        """
+        forked_registry = forked_cache.get(CLEANUP_REGISTRY_KEY)
+        if not isinstance(forked_registry, dict):
+            return
+        with _REGISTRY_LOCK:
+            registry = remote_cleanup.load_registry(runtime_cache, cache_key=CLEANUP_REGISTRY_KEY)
+            for key, paths in forked_registry.items():
+                registry.setdefault(key, set()).update(paths)
+
+    def _game_wad_name(self, path: Path) -> str | None:
+        """把已登记的 GAME WAD 路径还原为规范化 WAD 路径。"""
+        for root in (self.game_cache_root / "downloads", self.ctx.config.game_path / "Game"):
+            if path.is_relative_to(root):
+                return path.relative_to(root).as_posix()
+        return None
+
+    def _retained_game_paths(self, registry: dict[str, set[str]]) -> set[str]:
+        """按消费者登记与磁盘预算，选出本次清理应保留的 GAME WAD 路径。"""
+        consumers = self.ctx.runtime_cache.get(WAD_CONSUMERS_KEY)
+        if not isinstance(consumers, remote_cleanup.WadConsumers):
+            return set()
+
+        paths_by_name: dict[str, list[Path]] = {}
+        for raw_path in registry["cached_game_wads"] | registry["prepared_game_wads"]:
+            path = Path(raw_path)
+            if (name := self._game_wad_name(path)) is not None and path.exists():
+                paths_by_name.setdefault(name, []).append(path)
+        # 缓存文件与最小运行目录通常是硬链接，按单个文件大小计入预算
+        sizes = {name: max(path.stat().st_size for path in paths) for name, paths in paths_by_name.items()}
+        retained = remote_cleanup.select_retained(consumers, sizes)
+        return {str(path) for name in retained for path in paths_by_name[name]}
+
     def prepare_lcu_data(self) -> LcuResult:
         """准备 `DataUpdater` 所需的 LCU 基础资源。
 
@@ -132,7 +351,7 @@ class RemotePreparer:
             manifest_url=self.snapshot.lcu_manifest_url,
             manifest_cache_dir=self.lcu_manifest_cache_dir,
         )
-        manifest = PatcherManifest(file=manifest_cache_path, path=self.download_root)
+        manifest = self._load_manifest(PatcherManifest, manifest_cache_path, self.download_root)
 
         lcu_files = remote_lcu.collect_files(manifest, get_relative_path=self._get_lcu_path)
         description_file = remote_lcu.find_description(lcu_files, description_file_name=DESCRIPTION_FILE_NAME)
@@ -173,7 +392,7 @@ class RemotePreparer:
         champion_ids: tuple[int, ...] | None = None,
         map_ids: tuple[int, ...] | None = None,
     ) -> BinInputResult | None:
-        """从远端 GAME manifest 提取 `BinUpdater` 所需的 BIN 输入。
+        """从远端 GAME manifest 提取 `BinUpdater` 所需的 BIN 输入并写入 `bin_input/`。
 
         Args:
             reader: 已初始化的数据读取器。
@@ -184,6 +403,73 @@ class RemotePreparer:
         Returns:
             提取结果；若没有任何目标 BIN，返回 `None`。
         """
+        extracted = self._extract_bins(reader=reader, target=target, champion_ids=champion_ids, map_ids=map_ids)
+        if extracted is None:
+            return None
+
+        manifest_cache_path, payloads = extracted
+        bin_input_root = self.ctx.paths.manifest_path / self.snapshot.version / "bin_input"
+        extracted_paths = self._write_bin_inputs(bin_input_root, payloads)
+        extracted_count = len(extracted_paths)
+
+        flag_file_path = self.ctx.paths.manifest_path / self.snapshot.version / ".use_local_bin"
+        if extracted_count > 0:
+            flag_file_path.parent.mkdir(parents=True, exist_ok=True)
+            flag_file_path.touch()
+            self._track_cleanup_paths("bin_input_files", extracted_paths)
+            self._track_cleanup_paths("bin_input_flags", [flag_file_path])
+            logger.info("远端 BIN 输入准备完成：共提取 {} 个文件。", extracted_count)
+            return BinInputResult(
+                manifest_cache_path=manifest_cache_path,
+                extracted_file_count=extracted_count,
+                flag_file_path=flag_file_path,
+            )
+
+        logger.warning("远端 BIN 输入准备未成功写入任何文件。")
+        return None
+
+    def extract_bin_payloads(
+        self,
+        *,
+        reader: DataReader,
+        target: str,
+        champion_ids: tuple[int, ...] | None = None,
+        map_ids: tuple[int, ...] | None = None,
+    ) -> dict[str, bytes]:
+        """从远端 GAME manifest 提取 BIN，直接以内存形式返回，供 `BinUpdater(bin_payloads=...)` 使用。
+
+        Args:
+            reader: 已初始化的数据读取器。
+            target: 当前更新目标，取值与 `BinUpdater.update()` 一致。
+            champion_ids: 指定英雄 ID 集合。
+            map_ids: 指定地图 ID 集合。
+
+        Returns:
+            BIN 相对路径到内容的映射；没有任何目标 BIN 时为空。
+        """
+        extracted = self._extract_bins(reader=reader, target=target, champion_ids=champion_ids, map_ids=map_ids)
+        if extracted is None:
+            return {}
+        payloads = extracted[1]
+        logger.info("远端 BIN 输入已提取到内存：共 {} 个文件。", len(payloads))
+        return payloads
+
+    def _extract_bins(
+        self,
+        *,
+        reader: DataReader,
+        target: str,
+        champion_ids: tuple[int, ...] | None,
+        map_ids: tuple[int, ...] | None,
+    ) -> tuple[Path, dict[str, bytes]] | None:
+        """按更新目标规划 BIN，并把整个计划交给一次 `extract_files` 调用。
+
+        `WADExtractor` 会对整个计划统一预取 chunk，逐 WAD 调用则只能串行等待。
+        逐 chunk 读取时（离线镜像或导出快照包）改为逐 WAD 读取目标条目。
+
+        Returns:
+            GAME manifest 缓存路径与 BIN 相对路径到内容的映射；没有任何目标 BIN 时返回 `None`。
+        """
         extraction_plan = remote_game.build_bin_plan(
             reader=reader,
             target=target,
@@ -207,40 +493,55 @@ class RemotePreparer:
             manifest_url=self.snapshot.game_manifest_url,
             manifest_cache_dir=self.game_manifest_cache_dir,
         )
-        manifest = PatcherManifest(file=manifest_cache_path, path=self.game_cache_root / "downloads")
-        extractor = WADExtractor(manifest)
-
-        bin_input_root = self.ctx.paths.manifest_path / self.snapshot.version / "bin_input"
-        extracted_count = 0
-        extracted_paths: list[Path] = []
+        manifest = self._load_manifest(PatcherManifest, manifest_cache_path, self.game_cache_root / "downloads")
+        if self.chunk_reads:
+            extraction_result = {
+                wad_path: read_entries(
+                    manifest.files[wad_path],
+                    bin_paths,
+                    bundle_source=self.bundle_source,
+                    chunk_cache=self.chunk_cache,
+                    session=self.session,
+                )
+                for wad_path, bin_paths in extraction_plan.items()
+                if wad_path in manifest.files
+            }
+        else:
+            extractor = WADExtractor(manifest)
+            extraction_result = extractor.extract_files(extraction_plan)
+
+        payloads: dict[str, bytes] = {}
         for wad_path, bin_paths in extraction_plan.items():
-            extraction_result = extractor.extract_files({wad_path: bin_paths})
             wad_results = extraction_result.get(wad_path, {})
-            for bin_path, payload in wad_results.items():
+            for bin_path in bin_paths:
+                payload = wad_results.get(bin_path)
                 if payload is None:
                     logger.warning(f"远端 BIN 提取失败或缺失: wad={wad_path}, bin={bin_path}")
                     continue
-                target_path = bin_input_root / bin_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                target_path.write_bytes(payload)
-                extracted_paths.append(target_path)
-                extracted_count += 1
-
-        flag_file_path = self.ctx.paths.manifest_path / self.snapshot.version / ".use_local_bin"
-        if extracted_count > 0:
-            flag_file_path.parent.mkdir(parents=True, exist_ok=True)
-            flag_file_path.touch()
-            self._track_cleanup_paths("bin_input_files", extracted_paths)
-            self._track_cleanup_paths("bin_input_flags", [flag_file_path])
-            logger.info("远端 BIN 输入准备完成：共提取 {} 个文件。", extracted_count)
-            return BinInputResult(
-                manifest_cache_path=manifest_cache_path,
-                extracted_file_count=extracted_count,
-                flag_file_path=flag_file_path,
-            )
+                payloads[bin_path] = payload
+        return manifest_cache_path, payloads
 
-        logger.warning("远端 BIN 输入准备未成功写入任何文件。")
-        return None
+    @staticmethod
+    def _write_bin_inputs(bin_input_root: Path, payloads: dict[str, bytes]) -> list[Path]:
+        """通过有界线程池把 BIN 写入 `bin_input/`。"""
+
+        def write(bin_path: str, payload: bytes) -> Path:
+            target_path = bin_input_root / bin_path
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            target_path.write_bytes(payload)
+            return target_path
+
+        if not payloads:
+            return []
+        logger.debug(f"开始写入 {len(payloads)} 个远端 BIN 输入: {bin_input_root}")
+        try:
+            with ThreadPoolExecutor(max_workers=BIN_WRITE_WORKERS, thread_name_prefix="bin-input-write") as executor:
+                written = list(executor.map(write, payloads, payloads.values()))
+        except OSError:
+            logger.error(f"写入远端 BIN 输入失败: {bin_input_root}")
+            raise
+        logger.debug(f"远端 BIN 输入写入完成: {len(written)} 个")
+        return written
 
     def prepare_extract_wads(
         self,
@@ -252,13 +553,17 @@ class RemotePreparer:
         include_maps: bool,
     ) -> GameWadResult | None:
         """准备远端 `extract` 阶段所需的实体 WAD。"""
+        wad_entries = self._new_wad_entries()
         wad_paths = remote_game.build_extract_plan(
             reader=reader,
             champion_ids=champion_ids,
             map_ids=map_ids,
             include_champions=include_champions,
             include_maps=include_maps,
+            wad_entries=wad_entries,
         )
+        if wad_entries is not None:
+            return self._prepare_wad_entries(wad_entries)
         return self._prepare_wads(wad_paths)
 
     def prepare_mapping_wads(
@@ -271,16 +576,20 @@ class RemotePreparer:
         include_maps: bool,
     ) -> GameWadResult | None:
         """准备远端 `mapping` 阶段所需的实体 WAD。"""
+        wad_entries = self._new_wad_entries()
         wad_paths = remote_game.build_mapping_plan(
             reader=reader,
             champion_ids=champion_ids,
             map_ids=map_ids,
             include_champions=include_champions,
             include_maps=include_maps,
+            wad_entries=wad_entries,
         )
+        if wad_entries is not None:
+            return self._prepare_wad_entries(wad_entries)
         return self._prepare_wads(wad_paths)
 
-    def prepare_entity_wads(  # noqa: PLR0913
+    def plan_entity_wads(  # noqa: PLR0913
         self,
         *,
         reader: DataReader,
@@ -290,8 +599,23 @@ class RemotePreparer:
         include_maps: bool,
         need_extract: bool,
         need_mapping: bool,
-    ) -> GameWadResult | None:
-        """为单个实体工作项准备所需 WAD 并集。"""
+        wad_entries: dict[str, set[str]] | None = None,
+    ) -> set[str]:
+        """规划单个实体工作项所需的 WAD 并集，不下载任何文件。
+
+        Args:
+            reader: 已初始化的数据读取器。
+            champion_ids: 指定英雄 ID 集合。
+            map_ids: 指定地图 ID 集合。
+            include_champions: 是否包含英雄。
+            include_maps: 是否包含地图。
+            need_extract: 是否需要 extract 阶段的 WAD。
+            need_mapping: 是否需要 mapping 阶段的 WAD。
+            wad_entries: 可选的 WAD 条目收集表。
+
+        Returns:
+            原始 WAD 路径集合。
+        """
         wad_paths: set[str] = set()
         if need_extract:
             wad_paths.update(
@@ -301,6 +625,7 @@ class RemotePreparer:
                     map_ids=map_ids,
                     include_champions=include_champions,
                     include_maps=include_maps,
+                    wad_entries=wad_entries,
                 )
             )
         if need_mapping:
@@ -311,8 +636,34 @@ class RemotePreparer:
                     map_ids=map_ids,
                     include_champions=include_champions,
                     include_maps=include_maps,
+                    wad_entries=wad_entries,
                 )
             )
+        return wad_paths
+
+    def prepare_entity_wads(  # noqa: PLR0913
+        self,
+        *,
+        reader: DataReader,
+        champion_ids: tuple[int, ...] | None,
+        map_ids: tuple[int, ...] | None,
+        include_champions: bool,
+        include_maps: bool,
+        need_extract: bool,
+        need_mapping: bool,
+    ) -> GameWadResult | None:
+        """为单个实体工作项准备所需 WAD 并集。"""
+        wad_entries = self._new_wad_entries()
+        wad_paths = self.plan_entity_wads(
+            reader=reader,
+            champion_ids=champion_ids,
+            map_ids=map_ids,
+            include_champions=include_champions,
+            include_maps=include_maps,
+            need_extract=need_extract,
+            need_mapping=need_mapping,
+            wad_entries=wad_entries,
+        )
         if wad_paths:
             logger.info(
                 "开始准备远端 GAME WAD：extract={}，mapping={}，目标 {} 个",
@@ -320,15 +671,72 @@ class RemotePreparer:
                 "开启" if need_mapping else "关闭",
                 len(wad_paths),
             )
+        if wad_entries is not None:
+            return self._prepare_wad_entries(wad_entries)
         return self._prepare_wads(wad_paths)
 
+    def open_game_manifest(self, download_root: Path) -> tuple[Path, PatcherManifest]:
+        """缓存并解析 GAME manifest，下载目标指向给定目录。
+
+        Args:
+            download_root: manifest 下载文件的根目录。
+
+        Returns:
+            manifest 缓存路径与解析后的 manifest。
+        """
+        manifest_cache_path = self._ensure_manifest_cached(
+            manifest_url=self.snapshot.game_manifest_url,
+            manifest_cache_dir=self.game_manifest_cache_dir,
+        )
+        return manifest_cache_path, self._load_manifest(PatcherManifest, manifest_cache_path, download_root)
+
+    def _load_manifest(self, manifest_class: type[Any], manifest_cache_path: Path, download_root: Path) -> Any:
+        """返回已解析的 manifest；同一次运行内按文件与下载目录复用，避免逐实体重复解析。
+
+        Args:
+            manifest_class: 需要构造的 manifest 类型。
+            manifest_cache_path: 本地 manifest 缓存路径。
+            download_root: manifest 下载文件的根目录。
+
+        Returns:
+            解析后的 manifest 实例。
+        """
+        # 带上文件大小与修改时间，manifest 重新下载后不会误用旧的解析结果
+        try:
+            stat = manifest_cache_path.stat()
+            file_version = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            file_version = None
+        key = (manifest_class, str(manifest_cache_path), file_version, str(download_root))
+        with _MANIFEST_LOCK:
+            parsed = self.ctx.runtime_cache.setdefault(PARSED_MANIFESTS_KEY, {})
+            manifest = parsed.get(key)
+            if manifest is None:
+                manifest = manifest_class(file=manifest_cache_path, path=download_root)
+                parsed[key] = manifest
+                logger.debug(f"已解析 manifest: {manifest_cache_path.name} -> {download_root}")
+            return manifest
+
+    def manifest_cache_paths(self) -> dict[str, Path]:
+        """缓存本快照的 LCU 与 GAME manifest，返回 URL 到缓存文件的映射，供导出快照包使用。"""
+        return {
+            self.snapshot.lcu_manifest_url: self._ensure_manifest_cached(
+                manifest_url=self.snapshot.lcu_manifest_url,
+                manifest_cache_dir=self.lcu_manifest_cache_dir,
+            ),
+            self.snapshot.game_manifest_url: self._ensure_manifest_cached(
+                manifest_url=self.snapshot.game_manifest_url,
+                manifest_cache_dir=self.game_manifest_cache_dir,
+            ),
+        }
+
     def _ensure_manifest_cached(self, *, manifest_url: str, manifest_cache_dir: Path) -> Path:
-        """缓存远端 manifest 文件。"""
+        """缓存远端 manifest 文件；配置了离线镜像时从镜像读取。"""
         return remote_lcu.ensure_manifest_cached(
             manifest_url=manifest_url,
             manifest_cache_dir=manifest_cache_dir,
             headers=MANIFEST_HEADERS,
-            request_open=urlopen,
+            request_open=mirror_request_open(self.offline_root) if self.offline_root is not None else urlopen,
         )
 
     def _ensure_files_downloaded(
@@ -341,16 +749,35 @@ class RemotePreparer:
             manifest,
             files,
             run_coroutine_sync=self._run_sync,
+            chunk_cache=self.chunk_cache,
+            session=self.session,
+            bundle_source=self.bundle_source,
+            chunk_reads=self.chunk_reads,
         )
 
+    def _new_wad_entries(self) -> dict[str, set[str]] | None:
+        """按条目准备时返回空的条目收集表，整包下载时不收集。"""
+        return {} if self.ctx.config.remote_wad_mode is RemoteWadMode.ENTRIES else None
+
+    def _prepare_wad_entries(self, wad_entries: dict[str, set[str]]) -> GameWadResult | None:
+        """只下载目标条目所在的 chunk，在最小运行目录写出精简 WAD。"""
+        with _hold_wad_paths(self._normalize_wad_paths(wad_entries)), _GAME_FILES_GATE.shared():
+            return remote_game.prepare_wad_entries(
+                preparer=self,
+                wad_entries=wad_entries,
+                manifest_class=PatcherManifest,
+                result_class=GameWadResult,
+            )
+
     def _prepare_wads(self, wad_paths: set[str]) -> GameWadResult | None:
         """下载并同步远端 GAME WAD 到最小运行目录。"""
-        return remote_game.prepare_wads(
-            preparer=self,
-            wad_paths=wad_paths,
-            manifest_class=PatcherManifest,
-            result_class=GameWadResult,
-        )
+        with _hold_wad_paths(self._normalize_wad_paths(wad_paths)), _GAME_FILES_GATE.shared():
+            return remote_game.prepare_wads(
+                preparer=self,
+                wad_paths=wad_paths,
+                manifest_class=PatcherManifest,
+                result_class=GameWadResult,
+            )
 
     def _sync_lcu_file(self, source_path: Path) -> Path:
         """把 LCU 缓存文件同步到最小运行目录。"""
@@ -366,13 +793,18 @@ class RemotePreparer:
         """把 GAME 缓存文件同步到最小运行目录。"""
         relative_path = source_path.relative_to(download_root)
         target_path = self.ctx.config.game_path / "Game" / relative_path
-        self._link_or_copy(source_path, target_path)
+        with _GAME_FILES_LOCK:
+            self._link_or_copy(source_path, target_path)
         return target_path
 
     @staticmethod
-    def _run_sync(coroutine: Any) -> Any:
-        """在同步上下文中执行协程。"""
-        return remote_cleanup.run_sync(coroutine)
+    def _normalize_wad_paths(wad_paths: Iterable[str]) -> set[str]:
+        """把原始 WAD 路径规范化为按路径加锁使用的键。"""
+        return {normalized for path in wad_paths if (normalized := remote_game.normalize_wad_path(path)) is not None}
+
+    def _run_sync(self, coroutine: Any) -> Any:
+        """在本轮共享的常驻事件循环上执行协程。"""
+        return self.session.run(coroutine)
 
     @staticmethod
     def _get_lcu_path(file_name: str) -> PurePosixPath | None:
@@ -386,19 +818,21 @@ class RemotePreparer:
 
     def _load_cleanup_registry(self) -> dict[str, set[str]]:
         """获取或初始化远端清理登记表。"""
-        return remote_cleanup.load_registry(
-            self.ctx.runtime_cache,
-            cache_key=CLEANUP_REGISTRY_KEY,
-        )
+        with _REGISTRY_LOCK:
+            return remote_cleanup.load_registry(
+                self.ctx.runtime_cache,
+                cache_key=CLEANUP_REGISTRY_KEY,
+            )
 
     def _track_cleanup_paths(self, key: str, paths: list[Path] | tuple[Path, ...]) -> None:
         """登记可清理文件路径。"""
-        remote_cleanup.track_paths(self._load_cleanup_registry(), key, paths)
+        with _GAME_FILES_LOCK:
+            remote_cleanup.track_paths(self._load_cleanup_registry(), key, paths)
 
     @staticmethod
-    def _remove_paths(paths: set[str], *, dry_run: bool) -> int:
+    def _remove_paths(paths: set[str], *, dry_run: bool, keep: set[str] | frozenset[str] = frozenset()) -> int:
         """删除或统计已登记路径数量。"""
-        return remote_cleanup.remove_paths(paths, dry_run=dry_run)
+        return remote_cleanup.remove_paths(paths, dry_run=dry_run, keep=keep)
 
     @staticmethod
     def _prune_empty_tree(root: Path) -> None:
@@ -0,0 +1,198 @@
+"""remote 运行期共享的事件循环与 HTTP 连接池。
+
+``run_sync`` 每次都新建事件循环（必要时再新建线程），逐实体准备时每批下载都从冷启动开始。
+这里为一次运行维护一个常驻事件循环线程和一个带连接池的 HTTP 客户端，
+存放在 ``ctx.runtime_cache`` 中，供同一上下文内的所有 `RemotePreparer` 共用；
+chunk 范围请求因此可以跨实体复用 keep-alive 连接。
+
+会话同时累计本次运行的下载统计，并持有可选的自适应并发控制器；
+关闭会话时把统计写入运行总结。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Mapping
+from typing import Any
+
+from loguru import logger
+from riotmanifest import DownloadError
+from riotmanifest.utils import HttpClient, HttpClientError
+
+from lol_audio_unpack.utils.run_summary import record_runtime_note
+
+from .offline import ChunkRecorder
+from .transfer import AdaptiveConcurrency, TransferStats
+
+SESSION_KEY = "remote_session"
+# 并行工作项与预下载线程会同时发起范围请求
+HTTP_POOL_SIZE = 32
+_SESSION_LOCK = threading.Lock()
+# 会话在工作流结束时关闭，统计归入 CLI 的远端工作流阶段
+SUMMARY_STAGE_KEY = "remote_workflow"
+SUMMARY_STAGE_LABEL = "远端实体工作流"
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """事件循环线程入口；不持有会话引用，会话被回收时循环随之停止。"""
+    logger.debug("remote 事件循环线程已启动")
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    except Exception:
+        logger.opt(exception=True).error("remote 事件循环线程异常退出")
+        raise
+    finally:
+        loop.close()
+        logger.debug("remote 事件循环线程已停止")
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop) -> None:
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class RemoteSession:
+    """一次运行内共享的常驻事件循环与 HTTP 连接池。"""
+
+    def __init__(self, *, download_concurrency: tuple[int, int] | None = None) -> None:
+        """初始化会话；事件循环线程在首次提交协程时启动。
+
+        Args:
+            download_concurrency: 自适应下载并发的 ``(下限, 上限)``；为 ``None`` 时不做调整。
+        """
+        self.http = HttpClient(maxsize=HTTP_POOL_SIZE)
+        self.stats = TransferStats()
+        self.concurrency = (
+            AdaptiveConcurrency(min_limit=download_concurrency[0], max_limit=download_concurrency[1])
+            if download_concurrency is not None
+            else None
+        )
+        # 导出离线快照包时记录读取到的压缩 chunk
+        self.recorder: ChunkRecorder | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=_run_loop, args=(loop,), name="remote-loop", daemon=True)
+                self._thread.start()
+                # 会话被回收时停止循环；解释器退出时守护线程直接结束，无需再停
+                weakref.finalize(self, _stop_loop, loop).atexit = False
+                self._loop = loop
+            return self._loop
+
+    def run(self, coroutine: Any) -> Any:
+        """在常驻事件循环上执行协程并等待结果。
+
+        Args:
+            coroutine: 待执行的协程对象。
+
+        Returns:
+            协程执行结果。
+
+        Raises:
+            RuntimeError: 在事件循环线程内部调用时抛出（同步等待会造成死锁）。
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("不能在 remote 事件循环线程内同步等待协程。")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def get_bytes(self, url: str, *, headers: Mapping[str, str]) -> bytes:
+        """通过连接池发起 GET 请求。
+
+        Args:
+            url: 请求地址。
+            headers: 请求头。
+
+        Returns:
+            响应字节。
+
+        Raises:
+            DownloadError: 请求失败或状态码异常时抛出。
+        """
+        started = time.perf_counter()
+        try:
+            data = self.http.get(url, headers=headers).data
+        except HttpClientError as exc:
+            self.stats.record_range(downloaded_bytes=0, elapsed_seconds=time.perf_counter() - started, failed=True)
+            raise DownloadError(str(exc)) from exc
+        self.stats.record_range(downloaded_bytes=len(data), elapsed_seconds=time.perf_counter() - started)
+        return data
+
+    def describe(self) -> str:
+        """生成本次运行的下载统计说明。"""
+        text = self.stats.describe()
+        if self.concurrency is not None:
+            text += (
+                f"，并发 {self.concurrency.min_limit}-{self.concurrency.max_limit}"
+                f"（峰值 {self.concurrency.peak_limit}，最终 {self.concurrency.current}）"
+            )
+        return text
+
+    def close(self) -> None:
+        """停止事件循环线程。"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        _stop_loop(loop)
+        thread.join()
+
+
+def get_session(
+    runtime_cache: dict[str, Any],
+    *,
+    download_concurrency: tuple[int, int] | None = None,
+) -> RemoteSession:
+    """获取或创建当前上下文共享的 remote 会话。
+
+    Args:
+        runtime_cache: 运行时缓存字典。
+        download_concurrency: 新建会话时使用的自适应下载并发上下限；会话已存在时忽略。
+
+    Returns:
+        RemoteSession: 共享会话。
+    """
+    with _SESSION_LOCK:
+        session = runtime_cache.get(SESSION_KEY)
+        if not isinstance(session, RemoteSession):
+            session = RemoteSession(download_concurrency=download_concurrency)
+            runtime_cache[SESSION_KEY] = session
+        return session
+
+
+def close_session(runtime_cache: dict[str, Any]) -> None:
+    """关闭并移除当前上下文的 remote 会话；之后再次使用时会重新创建。
+
+    会话期间有过下载时，把下载统计写入运行总结。
+
+    Args:
+        runtime_cache: 运行时缓存字典。
+    """
+    with _SESSION_LOCK:
+        session = runtime_cache.pop(SESSION_KEY, None)
+    if not isinstance(session, RemoteSession):
+        return
+    session.close()
+    if session.stats.batches or session.stats.range_requests:
+        summary = session.describe()
+        logger.info(f"remote 下载统计: {summary}")
+        record_runtime_note(runtime_cache, SUMMARY_STAGE_KEY, summary, label=SUMMARY_STAGE_LABEL)
+
+
+__all__ = [
+    "RemoteSession",
+    "close_session",
+    "get_session",
+]
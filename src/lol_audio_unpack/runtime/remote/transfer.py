@@ -0,0 +1,134 @@
+"""remote 下载的传输统计与自适应并发控制。
+
+``download_files_concurrently`` 在单次调用内使用固定的并发数；链路带宽与 CDN 状况各不相同，
+固定值要么跑不满带宽，要么在弱网下放大超时与重试。这里按批次测量吞吐与失败数，
+在配置的上下限内逐批调整下一批的并发数：失败时减半，吞吐仍在上升时继续加大，
+吞吐明显回落时收缩。
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+# 样本太小时吞吐受建连与尾部等待主导，不参与调整
+MIN_SAMPLE_BYTES = 4 * 1024 * 1024
+MIN_SAMPLE_SECONDS = 0.2
+# 吞吐至少提升该比例才继续加并发，低于峰值该比例则收缩
+GROWTH_MARGIN = 0.1
+DECLINE_MARGIN = 0.2
+
+
+@dataclass
+class TransferStats:
+    """一次运行内的 remote 下载统计。"""
+
+    downloaded_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    batches: int = 0
+    range_requests: int = 0
+    failures: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_batch(self, *, downloaded_bytes: int, elapsed_seconds: float, failures: int = 0) -> None:
+        """记录一次 manifest 批量下载。"""
+        with self._lock:
+            self.downloaded_bytes += downloaded_bytes
+            self.elapsed_seconds += elapsed_seconds
+            self.batches += 1
+            self.failures += failures
+
+    def record_range(self, *, downloaded_bytes: int, elapsed_seconds: float, failed: bool = False) -> None:
+        """记录一次 chunk 范围请求；失败的请求会由调用方重试。"""
+        with self._lock:
+            self.downloaded_bytes += downloaded_bytes
+            self.elapsed_seconds += elapsed_seconds
+            self.range_requests += 1
+            self.failures += int(failed)
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """累计下载耗时内的平均速度（MB/s）。"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.downloaded_bytes / 1024 / 1024 / self.elapsed_seconds
+
+    def describe(self) -> str:
+        """生成面向用户的一行统计文字。"""
+        return (
+            f"下载 {self.downloaded_bytes / 1024 / 1024:.1f} MB，平均 {self.megabytes_per_second:.1f} MB/s，"
+            f"批量下载 {self.batches} 次，范围请求 {self.range_requests} 次，失败重试 {self.failures} 次"
+        )
+
+
+class AdaptiveConcurrency:
+    """按批次吞吐与失败数调整下载并发数。"""
+
+    def __init__(self, *, min_limit: int, max_limit: int, initial: int | None = None) -> None:
+        """初始化控制器。
+
+        Args:
+            min_limit: 并发下限。
+            max_limit: 并发上限。
+            initial: 初始并发；为 ``None`` 时取上下限的中点。
+
+        Raises:
+            ValueError: 上下限不合法时抛出。
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError(f"下载并发上下限不合法: {min_limit}-{max_limit}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        start = initial if initial is not None else (min_limit + max_limit) // 2
+        self.current = min(max(start, min_limit), max_limit)
+        self.peak_limit = self.current
+        self._best_throughput = 0.0
+        self._lock = threading.Lock()
+
+    def _set(self, limit: int, reason: str) -> None:
+        limit = min(max(limit, self.min_limit), self.max_limit)
+        if limit != self.current:
+            logger.debug(f"下载并发 {self.current} -> {limit}（{reason}）")
+            self.current = limit
+            self.peak_limit = max(self.peak_limit, limit)
+
+    def update(self, *, downloaded_bytes: int, elapsed_seconds: float, failures: int = 0) -> int:
+        """根据一批下载的结果更新并发数。
+
+        Args:
+            downloaded_bytes: 本批下载的字节数。
+            elapsed_seconds: 本批耗时。
+            failures: 本批失败的作业数。
+
+        Returns:
+            int: 下一批应使用的并发数。
+        """
+        with self._lock:
+            if failures > 0:
+                # 失败说明链路或 CDN 已过载，此前测得的峰值也不再可信
+                self._best_throughput = 0.0
+                self._set(self.current // 2, f"{failures} 个作业失败")
+                return self.current
+            if downloaded_bytes < MIN_SAMPLE_BYTES or elapsed_seconds < MIN_SAMPLE_SECONDS:
+                return self.current
+
+            throughput = downloaded_bytes / elapsed_seconds
+            if throughput >= self._best_throughput * (1 + GROWTH_MARGIN):
+                self._best_throughput = throughput
+                self._set(self.current + max(1, self.current // 4), f"吞吐 {throughput / 1024 / 1024:.1f} MB/s")
+            elif throughput < self._best_throughput * (1 - DECLINE_MARGIN):
+                # 以回落后的吞吐为新基准，避免链路整体变慢时一路收缩到下限
+                self._best_throughput = throughput
+                self._set(
+                    self.current - max(1, self.current // 4),
+                    f"吞吐回落到 {throughput / 1024 / 1024:.1f} MB/s",
+                )
+            return self.current
+
+
+__all__ = [
+    "AdaptiveConcurrency",
+    "TransferStats",
+]
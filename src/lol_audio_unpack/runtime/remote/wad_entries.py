@@ -0,0 +1,432 @@
+"""按条目从远端 GAME manifest 准备精简 WAD。
+
+整包下载会把几百 MB 的地图 / 语言 WAD 全部拉到本地，而单个实体通常只用到其中几十个
+BNK/WPK。这里先按 manifest 的 chunk 表读出 WAD 头与目录表，再只下载覆盖目标条目的
+chunk，在内存中还原条目后打包成只含这些条目的 WAD；下游解包 / 映射照常按路径打开，
+无需区分 WAD 是整包还是精简版。
+
+bundle 来源既可以是 CDN 基础 URL，也可以是本地目录（按 ``<bundle_id:016X>.bundle``
+存放），后者用于离线验证。
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+import pyzstd
+from league_tools.formats import WAD, WadHeaderAnalyzer
+from league_tools.formats.wad.builder import WADBuilder
+from loguru import logger
+from riotmanifest import DecompressError, DownloadError
+
+from lol_audio_unpack.runtime.wad import lookup_sections
+
+if TYPE_CHECKING:
+    from .chunk_cache import ChunkCache
+    from .session import RemoteSession
+
+# v3 头部定长部分：魔数 + 版本 + 签名 + 校验和 + 条目数，足够推算完整目录表长度
+WAD_HEADER_PROBE_SIZE = 4 + 268 + 4
+DEFAULT_CHUNK_RETRIES = 3
+# 合并连续 chunk 时单次范围请求的上限，避免单次失败重试的代价过大
+MAX_RANGE_BYTES = 16 * 1024 * 1024
+BUNDLE_HEADERS = {"User-Agent": "Mozilla/5.0"}
+# 条目类型低 4 位为 0 表示未压缩存储
+WAD_RAW_ENTRY_TYPE = 0
+
+BundleSource = str | Path
+
+
+@dataclass(frozen=True)
+class PartialWadResult:
+    """单个精简 WAD 的准备结果。"""
+
+    output_path: Path
+    entry_count: int
+    missing_paths: tuple[str, ...]
+    chunk_count: int
+    downloaded_bytes: int
+
+
+def _is_local_source(bundle_source: BundleSource) -> bool:
+    return isinstance(bundle_source, Path) or "://" not in bundle_source
+
+
+def _read_bundle_range(bundle_source: BundleSource, bundle_id: int, offset: int, size: int) -> bytes:
+    """读取 bundle 中的一段压缩字节；本地目录直接 seek，远端走 HTTP Range。"""
+    bundle_name = f"{bundle_id:016X}.bundle"
+    if _is_local_source(bundle_source):
+        with (Path(bundle_source) / bundle_name).open("rb") as bundle:
+            bundle.seek(offset)
+            return bundle.read(size)
+
+    request = Request(
+        urljoin(str(bundle_source), bundle_name),
+        headers={**BUNDLE_HEADERS, "Range": f"bytes={offset}-{offset + size - 1}"},
+    )
+    with urlopen(request) as response:  # noqa: S310
+        return response.read()
+
+
+class _ChunkReader:
+    """按 WAD 内偏移读取解压后的字节，同一 chunk 只下载一次。
+
+    配置了 ``chunk_cache`` 时先查跨快照 chunk 缓存，未命中的 chunk 下载后写回缓存；
+    提供 ``session`` 时远端范围请求走其连接池，跨实体复用连接。
+    """
+
+    def __init__(
+        self,
+        wad_file: Any,
+        *,
+        bundle_source: BundleSource,
+        retry_limit: int,
+        chunk_cache: ChunkCache | None = None,
+        session: RemoteSession | None = None,
+    ) -> None:
+        self.wad_file = wad_file
+        self.bundle_source = bundle_source
+        self.retry_limit = max(1, retry_limit)
+        self.chunk_cache = chunk_cache
+        self.session = session
+        self.chunk_starts: list[int] = []
+        position = 0
+        for chunk in wad_file.chunks:
+            self.chunk_starts.append(position)
+            position += chunk.target_size
+        self._chunks: dict[int, bytes] = {}
+        self.downloaded_chunks = 0
+        self.downloaded_bytes = 0
+        self.cached_chunks = 0
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def _chunk_indexes(self, start: int, length: int) -> range:
+        first = bisect.bisect_right(self.chunk_starts, start) - 1
+        last = bisect.bisect_right(self.chunk_starts, start + length - 1) - 1
+        return range(max(first, 0), last + 1)
+
+    def _validate(self, chunk: Any, data: bytes) -> None:
+        self.wad_file.manifest.validate_chunk_hash(
+            chunk_data=data,
+            chunk_id=chunk.chunk_id,
+            hash_type=self.wad_file.chunk_hash_types.get(chunk.chunk_id, 0),
+        )
+
+    def _from_cache(self, index: int) -> bytes | None:
+        if self.chunk_cache is None:
+            return None
+        chunk = self.wad_file.chunks[index]
+        data = self.chunk_cache.get(chunk.chunk_id)
+        if data is None:
+            return None
+        try:
+            if len(data) != chunk.target_size:
+                raise DecompressError(f"缓存 chunk 大小不符: chunk_id={chunk.chunk_id:016X}")
+            self._validate(chunk, data)
+        except Exception as exc:  # noqa: BLE001
+            # 缓存文件损坏时丢弃并改为重新下载
+            logger.warning(f"chunk 缓存校验失败，改为重新下载: {exc}")
+            self.chunk_cache.discard(chunk.chunk_id)
+            return None
+        self.cached_chunks += 1
+        return data
+
+    def _read_range(self, bundle_id: int, offset: int, size: int) -> bytes:
+        if self.session is None or _is_local_source(self.bundle_source):
+            return _read_bundle_range(self.bundle_source, bundle_id, offset, size)
+        return self.session.get_bytes(
+            urljoin(str(self.bundle_source), f"{bundle_id:016X}.bundle"),
+            headers={**BUNDLE_HEADERS, "Range": f"bytes={offset}-{offset + size - 1}"},
+        )
+
+    def _download_run(self, indexes: list[int]) -> list[bytes]:
+        """用一次范围请求下载 bundle 中连续存放的若干 chunk。"""
+        chunks = [self.wad_file.chunks[index] for index in indexes]
+        first = chunks[0]
+        size = sum(chunk.size for chunk in chunks)
+        for attempt in range(1, self.retry_limit + 1):
+            try:
+                content = self._read_range(first.bundle.bundle_id, first.offset, size)
+                if len(content) != size:
+                    raise DownloadError(
+                        f"chunk 长度不符: chunk_id={first.chunk_id:016X}, 期望 {size}，实际 {len(content)}"
+                    )
+                break
+            except (OSError, DownloadError) as exc:
+                if attempt >= self.retry_limit:
+                    raise DownloadError(f"下载 chunk 失败: chunk_id={first.chunk_id:016X}: {exc}") from exc
+                logger.warning(f"下载 chunk {first.chunk_id:016X} 失败，重试 {attempt + 1}/{self.retry_limit}: {exc}")
+
+        results: list[bytes] = []
+        position = 0
+        for chunk in chunks:
+            compressed = content[position : position + chunk.size]
+            position += chunk.size
+            try:
+                data = pyzstd.decompress(compressed)
+            except pyzstd.ZstdError as exc:
+                raise DecompressError(f"解压 chunk 失败: chunk_id={chunk.chunk_id:016X}") from exc
+            if len(data) != chunk.target_size:
+                raise DecompressError(
+                    f"chunk 解压大小不符: chunk_id={chunk.chunk_id:016X}，期望 {chunk.target_size}，实际 {len(data)}"
+                )
+            self._validate(chunk, data)
+            if self.session is not None and self.session.recorder is not None:
+                self.session.recorder.record(chunk.bundle.bundle_id, chunk.offset, compressed)
+            if self.chunk_cache is not None:
+                self.chunk_cache.put(chunk.chunk_id, data)
+            results.append(data)
+        self.downloaded_chunks += len(chunks)
+        self.downloaded_bytes += size
+        return results
+
+    def _fetch(self, index: int) -> bytes:
+        if (cached := self._chunks.get(index)) is not None:
+            return cached
+        data = self._from_cache(index)
+        if data is None:
+            data = self._download_run([index])[0]
+        self._chunks[index] = data
+        return data
+
+    def _is_adjacent(self, previous: int, index: int) -> bool:
+        before, chunk = self.wad_file.chunks[previous], self.wad_file.chunks[index]
+        return chunk.bundle.bundle_id == before.bundle.bundle_id and chunk.offset == before.offset + before.size
+
+    def iter_chunks(self, *, max_run_bytes: int = MAX_RANGE_BYTES) -> Iterator[bytes]:
+        """按顺序产出整个文件的解压 chunk，不在内存中保留。
+
+        缓存未命中且在 bundle 中连续存放的 chunk 合并为一次范围请求。
+
+        Args:
+            max_run_bytes: 单次范围请求的最大压缩字节数。
+
+        Yields:
+            bytes: 解压后的 chunk 数据。
+        """
+        pending: list[int] = []
+        pending_bytes = 0
+        for index, chunk in enumerate(self.wad_file.chunks):
+            data = self._from_cache(index)
+            if data is None and (
+                not pending or (self._is_adjacent(pending[-1], index) and pending_bytes + chunk.size <= max_run_bytes)
+            ):
+                pending.append(index)
+                pending_bytes += chunk.size
+                continue
+            if pending:
+                yield from self._download_run(pending)
+                pending, pending_bytes = [], 0
+            if data is None:
+                pending, pending_bytes = [index], chunk.size
+            else:
+                yield data
+        if pending:
+            yield from self._download_run(pending)
+
+    def read(self, start: int, length: int) -> bytes:
+        """读取 WAD 内 ``[start, start + length)`` 的字节。"""
+        if length <= 0:
+            return b""
+        indexes = self._chunk_indexes(start, length)
+        raw = b"".join(self._fetch(index) for index in indexes)
+        slice_start = start - self.chunk_starts[indexes.start]
+        return raw[slice_start : slice_start + length]
+
+
+def _read_wad_header(reader: _ChunkReader, wad_size: int) -> WAD:
+    """只读取 WAD 头部与目录表。"""
+    probe = reader.read(0, min(WAD_HEADER_PROBE_SIZE, wad_size))
+    header_size = min(max(WadHeaderAnalyzer(probe).header_size, len(probe)), wad_size)
+    return WAD(reader.read(0, header_size))
+
+
+def _carry_over_entries(
+    builder: WADBuilder,
+    output_path: Path,
+    wad_size: int,
+    skip_hashes: set[int],
+    name_hints: dict[int, str],
+) -> int:
+    """把已有精简 WAD 中本次未请求的条目并入新 WAD，避免同一轮先后准备时互相覆盖。"""
+    if not output_path.exists() or output_path.stat().st_size == wad_size:
+        # 与 manifest 文件等长说明是整包下载的 WAD，不在这里合并
+        return 0
+
+    existing = WAD(output_path)
+    carried = 0
+    for section in existing.files:
+        if section.path_hash in skip_hashes:
+            continue
+        data = existing.extract_by_section(section, "", raw=True)
+        if data is None:
+            continue
+        name = name_hints.get(section.path_hash, "")
+        if name:
+            builder.add_by_hash(section.path_hash, data, name_hint=name)
+        else:
+            # 上一轮进程写入的条目没有路径记录，沿用其原有存储方式，避免 bnk/wpk 被改为 zstd 压缩
+            compression = "raw" if section.type & 0x0F == WAD_RAW_ENTRY_TYPE else "zstd"
+            builder.add_by_hash(section.path_hash, data, compression=compression)
+        carried += 1
+    return carried
+
+
+def build_partial_wad(  # noqa: PLR0913
+    wad_file: Any,
+    entry_paths: list[str],
+    *,
+    output_path: Path,
+    bundle_source: BundleSource | None = None,
+    retry_limit: int = DEFAULT_CHUNK_RETRIES,
+    chunk_cache: ChunkCache | None = None,
+    session: RemoteSession | None = None,
+    name_hints: dict[int, str] | None = None,
+) -> PartialWadResult:
+    """只下载目标条目所在的 chunk，并写出只含这些条目的精简 WAD。
+
+    Args:
+        wad_file: manifest 中的 WAD 文件对象（``PatcherFile``）。
+        entry_paths: 需要的 WAD 内部路径。
+        output_path: 精简 WAD 输出路径；已存在精简 WAD 时保留其中未被覆盖的条目。
+        bundle_source: bundle 基础 URL 或本地目录；为 ``None`` 时使用 manifest 的 ``bundle_url``。
+        retry_limit: 单个 chunk 的最大尝试次数。
+        chunk_cache: 可选的跨快照 chunk 缓存。
+        session: 可选的共享 remote 会话；提供时范围请求复用其连接池。
+        name_hints: 可选的 ``路径哈希 → 路径`` 记录；本次写入的条目会登记进去，合并旧条目时据此
+            传入路径提示，让 bnk/wpk 保持未压缩存储。同一 WAD 的多次准备应共享同一份记录。
+
+    Returns:
+        PartialWadResult: 写出的条目数、缺失路径与下载量。
+
+    Raises:
+        DownloadError: chunk 下载重试耗尽时抛出。
+        DecompressError: chunk 解压失败或大小不符时抛出。
+    """
+    if output_path.exists() and output_path.stat().st_size == wad_file.size:
+        logger.debug(f"{output_path.name} 已是完整 WAD，跳过按条目准备")
+        return PartialWadResult(output_path, 0, (), 0, 0)
+
+    reader = _ChunkReader(
+        wad_file,
+        bundle_source=bundle_source if bundle_source is not None else wad_file.manifest.bundle_url,
+        retry_limit=retry_limit,
+        chunk_cache=chunk_cache,
+        session=session,
+    )
+    header = _read_wad_header(reader, wad_file.size)
+
+    found: list[tuple[str, Any]] = []
+    missing: list[str] = []
+    for path, section in zip(entry_paths, lookup_sections(header, entry_paths), strict=True):
+        if section is None:
+            missing.append(path)
+        else:
+            found.append((path, section))
+    if missing:
+        logger.debug(f"{wad_file.name} 中缺少 {len(missing)} 个条目: {missing[:5]}")
+
+    name_hints = {} if name_hints is None else name_hints
+    builder = WADBuilder()
+    written = 0
+    # 按偏移顺序读取，相邻条目共享的 chunk 只解压一次
+    for path, section in sorted(found, key=lambda item: item[1].offset):
+        data = header.extract_by_section(
+            section, "", raw=True, data=reader.read(section.offset, section.compressed_size)
+        )
+        if data is None:
+            logger.warning(f"{wad_file.name} 中的条目无法还原，已跳过: {path}")
+            missing.append(path)
+            continue
+        builder.add_by_hash(section.path_hash, data, name_hint=path)
+        name_hints[section.path_hash] = path
+        written += 1
+
+    carried = _carry_over_entries(
+        builder,
+        output_path,
+        wad_file.size,
+        {section.path_hash for _, section in found},
+        name_hints,
+    )
+    builder.save(output_path)
+    entry_count = written + carried
+    logger.info(
+        f"按条目准备 {wad_file.name}: 条目 {entry_count} 个，chunk {reader.chunk_count}/{len(wad_file.chunks)} 个，"
+        f"下载 {reader.downloaded_bytes} 字节（整包 {wad_file.size} 字节），缓存命中 chunk {reader.cached_chunks} 个"
+    )
+    return PartialWadResult(
+        output_path=output_path,
+        entry_count=entry_count,
+        missing_paths=tuple(missing),
+        chunk_count=reader.chunk_count,
+        downloaded_bytes=reader.downloaded_bytes,
+    )
+
+
+def read_entries(  # noqa: PLR0913
+    wad_file: Any,
+    entry_paths: list[str],
+    *,
+    bundle_source: BundleSource | None = None,
+    retry_limit: int = DEFAULT_CHUNK_RETRIES,
+    chunk_cache: ChunkCache | None = None,
+    session: RemoteSession | None = None,
+) -> dict[str, bytes]:
+    """只下载目标条目所在的 chunk，直接返回解压后的条目内容。
+
+    离线快照模式与导出快照包时用它代替 ``WADExtractor`` 提取 BIN，
+    读取路径与精简 WAD 相同，导出时记录的 chunk 即可覆盖导入后的读取。
+
+    Args:
+        wad_file: manifest 中的 WAD 文件对象（``PatcherFile``）。
+        entry_paths: 需要的 WAD 内部路径。
+        bundle_source: bundle 基础 URL 或本地目录；为 ``None`` 时使用 manifest 的 ``bundle_url``。
+        retry_limit: 单个 chunk 的最大尝试次数。
+        chunk_cache: 可选的跨快照 chunk 缓存。
+        session: 可选的共享 remote 会话。
+
+    Returns:
+        内部路径到条目内容的映射；WAD 中不存在或无法还原的条目不在结果中。
+
+    Raises:
+        DownloadError: chunk 下载重试耗尽时抛出。
+        DecompressError: chunk 解压失败或大小不符时抛出。
+    """
+    reader = _ChunkReader(
+        wad_file,
+        bundle_source=bundle_source if bundle_source is not None else wad_file.manifest.bundle_url,
+        retry_limit=retry_limit,
+        chunk_cache=chunk_cache,
+        session=session,
+    )
+    header = _read_wad_header(reader, wad_file.size)
+    found = [
+        (path, section)
+        for path, section in zip(entry_paths, lookup_sections(header, entry_paths), strict=True)
+        if section is not None
+    ]
+    payloads: dict[str, bytes] = {}
+    for path, section in sorted(found, key=lambda item: item[1].offset):
+        data = header.extract_by_section(
+            section, "", raw=True, data=reader.read(section.offset, section.compressed_size)
+        )
+        if data is not None:
+            payloads[path] = data
+    return payloads
+
+
+__all__ = [
+    "PartialWadResult",
+    "build_partial_wad",
+    "read_entries",
+]
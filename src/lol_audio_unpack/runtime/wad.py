@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
 from pathlib import Path
 
 from league_tools import WAD
+from league_tools.formats.wad.parser import WADSection
+from loguru import logger
+
+# WAD 条目存储类型：0 为未压缩原样存储，可以直接按偏移读取其中的片段
+WAD_SECTION_RAW = 0
 
 
 def get_wad(
@@ -38,3 +46,107 @@ def get_wad(
         if wad_path not in cache:
             cache[wad_path] = WAD(wad_path)
         return cache[wad_path]
+
+
+@dataclass
+class WadReadTimings:
+    """单次批量读取的分阶段耗时与字节计数。"""
+
+    read_ns: int = 0
+    decompress_ns: int = 0
+    compressed_bytes: int = 0
+    decompressed_bytes: int = 0
+
+
+def extract_raw_timed(wad: WAD, paths: list[str]) -> tuple[list[bytes | None], WadReadTimings]:
+    """按路径提取原始字节，并分别统计读取与解压耗时。
+
+    ``WAD.extract(raw=True)`` 把读取与解压放在同一次调用里，无法区分慢在哪一步；
+    这里先用 ``read_stored_bytes`` 读出压缩字节，再交给公开的
+    ``extract_by_section(raw=True, data=...)`` 解压，结果与 ``extract`` 逐项一致。
+    单个条目读取或解压失败时该项返回 ``None``，不影响同批其他条目。
+
+    Args:
+        wad: 已打开的 WAD 实例。
+        paths: 待提取的逻辑路径。
+
+    Returns:
+        tuple[list[bytes | None], WadReadTimings]: 与输入逐项对应的结果，以及分阶段计数。
+    """
+    timings = WadReadTimings()
+    results: list[bytes | None] = []
+    if not getattr(wad, "thread_safe_reads", False):
+        # 旧版 league_tools 没有独立读取锁，无法安全拆分两步，退回逐条整体提取并全部记为读取耗时。
+        logger.debug("当前 WAD 实现不支持拆分读取与解压计时，回退为整体提取")
+        for path in paths:
+            started = time.perf_counter_ns()
+            try:
+                data = wad.extract([path], raw=True)[0]
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"提取 WAD 条目失败，跳过: {path} ({exc})")
+                data = None
+            timings.read_ns += time.perf_counter_ns() - started
+            timings.decompressed_bytes += len(data) if data else 0
+            results.append(data)
+        return results, timings
+
+    for path, section in zip(paths, lookup_sections(wad, paths), strict=True):
+        if section is None:
+            logger.warning(f"未找到路径: {path}")
+            results.append(None)
+            continue
+
+        started = time.perf_counter_ns()
+        try:
+            compressed = read_stored_bytes(wad, section, 0, section.compressed_size)
+            read_done = time.perf_counter_ns()
+            data = wad.extract_by_section(section, "", raw=True, data=compressed)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"提取 WAD 条目失败，跳过: {path} ({exc})")
+            results.append(None)
+            continue
+        timings.read_ns += read_done - started
+        timings.decompress_ns += time.perf_counter_ns() - read_done
+        timings.compressed_bytes += len(compressed)
+        timings.decompressed_bytes += len(data) if data else 0
+        results.append(data)
+    return results, timings
+
+
+def lookup_sections(wad: WAD, paths: list[str]) -> list[WADSection | None]:
+    """只查 WAD 目录表，返回各路径对应的条目信息，不读取任何数据。
+
+    Args:
+        wad: 已打开的 WAD 实例。
+        paths: 逻辑路径列表。
+
+    Returns:
+        list[WADSection | None]: 与输入逐项对应；路径不存在时为 ``None``。
+    """
+    file_index = wad._file_index
+    return [file_index.get(wad._get_hash_for_path(path)) for path in paths]
+
+
+def read_stored_bytes(wad: WAD, section: WADSection, start: int, length: int) -> bytes:
+    """读取条目存储字节中的一段，不做任何解压。
+
+    只有 ``WAD_SECTION_RAW`` 条目的存储字节就是文件内容本身，
+    调用方据此可以只读容器头部而不必整块读取。
+
+    Args:
+        wad: 已打开的 WAD 实例。
+        section: ``lookup_sections`` 返回的条目。
+        start: 相对条目起点的偏移。
+        length: 读取长度；超出条目范围的部分会被截断。
+
+    Returns:
+        bytes: 读取到的原始字节。
+    """
+    length = max(0, min(length, section.compressed_size - start))
+    if length == 0:
+        return b""
+    # 与 extract_raw_timed 共用读取锁，避免和并发解包线程争抢同一个文件指针
+    read_lock = getattr(wad, "_read_lock", None) or nullcontext()
+    with read_lock:
+        wad._data.seek(section.offset + start, 0)
+        return wad._data.bytes(length)
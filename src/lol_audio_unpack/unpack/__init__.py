@@ -2,9 +2,13 @@
 
 from .batch import unpack_all, unpack_champions, unpack_maps
 from .entity import generate_output_path, unpack_champion, unpack_entity, unpack_map
+from .plan import EntityPlan, ExtractPlan, plan_tasks
 
 __all__ = [
+    "EntityPlan",
+    "ExtractPlan",
     "generate_output_path",
+    "plan_tasks",
     "unpack_all",
     "unpack_entity",
     "unpack_champion",
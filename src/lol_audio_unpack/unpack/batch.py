@@ -15,10 +15,11 @@ from loguru import logger
 from lol_audio_unpack.manager import DataReader
 from lol_audio_unpack.model import generate_champion_tasks, generate_map_tasks
 
-from .entity import unpack_champion, unpack_map
+from .entity import EntityDoneCallback, unpack_champion, unpack_map
+from .report import RunReportWriter, finish_run_report, open_run_report
 
 if TYPE_CHECKING:
-    from lol_audio_unpack.app.types import AppContext
+    from lol_audio_unpack.app.types import AppContext, ExtractFilterOptions
 
 
 def execute_tasks(  # noqa: PLR0913
@@ -29,6 +30,10 @@ def execute_tasks(  # noqa: PLR0913
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    entity_yaml_report: bool = False,
+    extract_filter: ExtractFilterOptions | None = None,
+    entity_done_callback: EntityDoneCallback | None = None,
+    run_report: RunReportWriter | None = None,
 ) -> None:
     """执行批量解包任务。
 
@@ -39,6 +44,11 @@ def execute_tasks(  # noqa: PLR0913
         ctx: 运行时上下文。
         progress_callback: 每个实体处理结束后的可选进度回调。
         persisted_wem_callback: WEM 落盘后的附加回调。
+        entity_yaml_report: 是否在运行级报告之外额外输出单实体 YAML 报告。
+        extract_filter: 选择性解包过滤条件。
+        entity_done_callback: 单个实体解包完成后的回调，用于同轮复用已读出的 events bnk。
+        run_report: 调用方持有的运行级报告写入器；为 ``None`` 时本次调用自行创建并在结束时关闭。
+            remote 工作流按实体多次调用本函数，传入同一个写入器使整轮只产出一份报告。
     """
     if not tasks:
         logger.warning("没有任何任务需要执行")
@@ -76,12 +86,22 @@ def execute_tasks(  # noqa: PLR0913
     wad_cache: dict[Path, WAD] = {}
     cache_lock = threading.Lock() if max_workers > 1 else None
 
+    # 整轮 batch 共用一个流式报告写入器，实体完成即追加一行，
+    # 避免逐实体 dump YAML 以及事后再遍历解析大量报告文件。
+    owns_report = run_report is None
+    if run_report is None:
+        run_report = open_run_report(ctx, reader.version)
+
     def unpack_one(entity_type: str, entity_id: int) -> None:
         common_kwargs: dict[str, object] = {
             "wad_cache": wad_cache,
             "cache_lock": cache_lock,
             "ctx": ctx,
             "persisted_wem_callback": persisted_wem_callback,
+            "run_report": run_report,
+            "entity_yaml_report": entity_yaml_report,
+            "extract_filter": extract_filter,
+            "entity_done_callback": entity_done_callback,
         }
         if entity_type == "champion":
             unpack_champion(entity_id, reader, **common_kwargs)
@@ -113,27 +133,53 @@ def execute_tasks(  # noqa: PLR0913
         emit_running_progress(entity_type, description)
         unpack_one(entity_type, entity_id)
 
-    if max_workers > 1:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {
-                executor.submit(unpack_one_with_progress, entity_type, entity_id, description): (entity_type, description)
-                for entity_type, entity_id, description in tasks
-            }
-            finished_count = 0
-            for future in as_completed(future_to_task):
-                entity_type, description = future_to_task[future]
-                finished_count += 1
-                finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
+    try:
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_task = {
+                    executor.submit(unpack_one_with_progress, entity_type, entity_id, description): (
+                        entity_type,
+                        description,
+                    )
+                    for entity_type, entity_id, description in tasks
+                }
+                finished_count = 0
+                for future in as_completed(future_to_task):
+                    entity_type, description = future_to_task[future]
+                    finished_count += 1
+                    finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
 
+                    try:
+                        future.result()
+                        progress_message = f"{description} 解包完成"
+                        logger.info(f"进度: {finished_count}/{total_tasks} - {progress_message}。")
+                    except Exception as exc:  # noqa: BLE001
+                        failed_count += 1
+                        progress_message = f"{description} 解包失败"
+                        logger.opt(exception=show_exception).warning(f"{description} 解包失败，将继续后续任务: {exc}")
+
+                    if progress_callback is not None:
+                        progress_callback(
+                            entity_type,
+                            finished_by_type.get(entity_type, finished_count),
+                            max(totals_by_type.get(entity_type, total_tasks), 1),
+                            progress_message,
+                        )
+        else:
+            finished_count = 0
+            for entity_type, entity_id, description in tasks:
                 try:
-                    future.result()
+                    emit_running_progress(entity_type, description)
+                    unpack_one(entity_type, entity_id)
                     progress_message = f"{description} 解包完成"
-                    logger.info(f"进度: {finished_count}/{total_tasks} - {progress_message}。")
+                    logger.info(f"进度: {finished_count + 1}/{total_tasks} - {progress_message}。")
                 except Exception as exc:  # noqa: BLE001
                     failed_count += 1
                     progress_message = f"{description} 解包失败"
                     logger.opt(exception=show_exception).warning(f"{description} 解包失败，将继续后续任务: {exc}")
 
+                finished_count += 1
+                finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
                 if progress_callback is not None:
                     progress_callback(
                         entity_type,
@@ -141,28 +187,11 @@ def execute_tasks(  # noqa: PLR0913
                         max(totals_by_type.get(entity_type, total_tasks), 1),
                         progress_message,
                     )
-    else:
-        finished_count = 0
-        for entity_type, entity_id, description in tasks:
-            try:
-                emit_running_progress(entity_type, description)
-                unpack_one(entity_type, entity_id)
-                progress_message = f"{description} 解包完成"
-                logger.info(f"进度: {finished_count + 1}/{total_tasks} - {progress_message}。")
-            except Exception as exc:  # noqa: BLE001
-                failed_count += 1
-                progress_message = f"{description} 解包失败"
-                logger.opt(exception=show_exception).warning(f"{description} 解包失败，将继续后续任务: {exc}")
-
-            finished_count += 1
-            finished_by_type[entity_type] = finished_by_type.get(entity_type, 0) + 1
-            if progress_callback is not None:
-                progress_callback(
-                    entity_type,
-                    finished_by_type.get(entity_type, finished_count),
-                    max(totals_by_type.get(entity_type, total_tasks), 1),
-                    progress_message,
-                )
+    finally:
+        # 单个实体异常已在上面的循环里吞掉并计数，这里关闭时总能写入 run_end 汇总；
+        # 外部传入的写入器由调用方在整轮结束时关闭。
+        if owns_report:
+            finish_run_report(run_report, ctx)
 
     end_time = time.time()
     summary_message = (
@@ -190,6 +219,10 @@ def unpack_all(  # noqa: PLR0913
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    entity_yaml_report: bool = False,
+    extract_filter: ExtractFilterOptions | None = None,
+    entity_done_callback: EntityDoneCallback | None = None,
+    run_report: RunReportWriter | None = None,
 ) -> None:
     """解包全部实体音频。"""
     champion_tasks = generate_champion_tasks(reader) if include_champions else []
@@ -201,6 +234,10 @@ def unpack_all(  # noqa: PLR0913
         ctx=ctx,
         progress_callback=progress_callback,
         persisted_wem_callback=persisted_wem_callback,
+        entity_yaml_report=entity_yaml_report,
+        extract_filter=extract_filter,
+        entity_done_callback=entity_done_callback,
+        run_report=run_report,
     )
 
 
@@ -212,6 +249,10 @@ def unpack_champions(  # noqa: PLR0913
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    entity_yaml_report: bool = False,
+    extract_filter: ExtractFilterOptions | None = None,
+    entity_done_callback: EntityDoneCallback | None = None,
+    run_report: RunReportWriter | None = None,
 ) -> None:
     """解包指定英雄音频。"""
     tasks = generate_champion_tasks(reader, champion_ids)
@@ -222,6 +263,10 @@ def unpack_champions(  # noqa: PLR0913
         ctx=ctx,
         progress_callback=progress_callback,
         persisted_wem_callback=persisted_wem_callback,
+        entity_yaml_report=entity_yaml_report,
+        extract_filter=extract_filter,
+        entity_done_callback=entity_done_callback,
+        run_report=run_report,
     )
 
 
@@ -233,6 +278,10 @@ def unpack_maps(  # noqa: PLR0913
     ctx: AppContext,
     progress_callback: Callable[[str, int, int, str], None] | None = None,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    entity_yaml_report: bool = False,
+    extract_filter: ExtractFilterOptions | None = None,
+    entity_done_callback: EntityDoneCallback | None = None,
+    run_report: RunReportWriter | None = None,
 ) -> None:
     """解包指定地图音频。"""
     tasks = generate_map_tasks(reader, map_ids)
@@ -243,4 +292,8 @@ def unpack_maps(  # noqa: PLR0913
         ctx=ctx,
         progress_callback=progress_callback,
         persisted_wem_callback=persisted_wem_callback,
+        entity_yaml_report=entity_yaml_report,
+        extract_filter=extract_filter,
+        entity_done_callback=entity_done_callback,
+        run_report=run_report,
     )
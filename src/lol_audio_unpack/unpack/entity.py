@@ -17,23 +17,32 @@ from lol_audio_unpack.app.path_layout import (
 )
 from lol_audio_unpack.manager import DataReader
 from lol_audio_unpack.model import AudioEntityData
-from lol_audio_unpack.runtime.wad import get_wad
+from lol_audio_unpack.runtime.wad import WadReadTimings, extract_raw_timed, get_wad
 from lol_audio_unpack.utils.logging import performance_monitor
 
 from .bp_vo import attach_bp_vo
-from .stats import FileProcessResult, ProcessingStatsContext
+from .report import RunReportWriter
+from .selection import build_entity_selection, wem_id_from_name
+from .stats import EntityUnpackStats, FileProcessResult, ProcessingPhase, ProcessingStatsContext
 
 if TYPE_CHECKING:
-    from lol_audio_unpack.app.types import AppContext
+    from lol_audio_unpack.app.types import AppContext, ExtractFilterOptions
 
 AUDIO_TYPE_VO = "VO"
+EVENTS_BANK_SUFFIX = "_events.bnk"
 
+# 解包完成后的实体回调，第二个参数为顺带读出的 events bnk：``{(wad_path, bnk_rel_path): 字节}``
+EntityDoneCallback = Callable[[AudioEntityData, dict[tuple[Path, str], bytes]], None]
 
-def _persist_wem(
+
+def _persist_wem(  # noqa: PLR0913
     file: Any,
     destination_path: Path,
     *,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    stats: EntityUnpackStats | None = None,
+    sub_id: int | None = None,
+    sub_name: str | None = None,
 ) -> None:
     """保存 ``.wem`` 文件，并在成功后通知通用回调。
 
@@ -41,13 +50,69 @@ def _persist_wem(
         file: 具备 ``save_file`` 方法的提取结果对象。
         destination_path: 落盘目标路径。
         persisted_wem_callback: 文件成功落盘后的附加回调。
+        stats: 可选统计对象；提供时记录磁盘写入耗时与字节数。
+        sub_id: 写盘耗时归属的子实体 ID。
+        sub_name: 子实体名称。
     """
     destination_path.parent.mkdir(parents=True, exist_ok=True)
-    file.save_file(destination_path)
+    if stats is None:
+        file.save_file(destination_path)
+    else:
+        nbytes = len(getattr(file, "data", None) or b"")
+        with stats.measure_phase(ProcessingPhase.DISK_WRITE, nbytes, sub_id=sub_id, sub_name=sub_name):
+            file.save_file(destination_path)
     if persisted_wem_callback is not None:
         persisted_wem_callback(destination_path)
 
 
+def _is_wem_selected(name: str | int, allowed_wem_ids: frozenset[int] | None) -> bool:
+    """判断容器内的子文件是否需要写出。
+
+    Args:
+        name: BNK 子文件 ID 或 WPK 子文件名。
+        allowed_wem_ids: 允许写出的 WEM ID；为 ``None`` 时不过滤。
+
+    Returns:
+        bool: 需要写出时返回 ``True``。
+    """
+    if allowed_wem_ids is None:
+        return True
+    return wem_id_from_name(name) in allowed_wem_ids
+
+
+def _collect_event_banks(
+    event_banks: dict[tuple[Path, str], bytes] | None,
+    wad_path: Path,
+    paths: list[str],
+    file_raws: list[bytes | None],
+) -> None:
+    """把本次 WAD 读取中的 events bnk 交给映射阶段复用。
+
+    Args:
+        event_banks: 收集目标；为 ``None`` 时不收集。
+        wad_path: 本次读取的 WAD 路径。
+        paths: 读取的逻辑路径。
+        file_raws: 与 ``paths`` 逐项对应的已解压字节。
+    """
+    if event_banks is None:
+        return
+    for path, raw in zip(paths, file_raws, strict=False):
+        if raw and path.endswith(EVENTS_BANK_SUFFIX):
+            event_banks[(wad_path, path)] = raw
+
+
+def _record_wad_timings(stats: EntityUnpackStats, timings: WadReadTimings) -> None:
+    """把一次 WAD 批量读取的计时写入实体统计。
+
+    Args:
+        stats: 实体统计对象。
+        timings: ``extract_raw_timed`` 返回的分阶段计数。
+    """
+    stats.record_phase(ProcessingPhase.WAD_READ, timings.read_ns, timings.compressed_bytes)
+    if timings.decompress_ns:
+        stats.record_phase(ProcessingPhase.DECOMPRESS, timings.decompress_ns, timings.decompressed_bytes)
+
+
 def _get_wad_instance(
     wad_path: Path,
     wad_cache: dict[Path, WAD] | None,
@@ -78,6 +143,10 @@ def unpack_entity(  # noqa: PLR0913
     *,
     ctx: AppContext,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    run_report: RunReportWriter | None = None,
+    entity_yaml_report: bool = False,
+    extract_filter: ExtractFilterOptions | None = None,
+    event_banks: dict[tuple[Path, str], bytes] | None = None,
 ) -> None:
     """解包单个实体音频。
 
@@ -88,6 +157,10 @@ def unpack_entity(  # noqa: PLR0913
         cache_lock: 多线程场景下的缓存锁。
         ctx: 运行时上下文。
         persisted_wem_callback: WEM 落盘后的附加回调。
+        run_report: 本轮运行共享的流式报告写入器。
+        entity_yaml_report: 是否额外输出单实体 YAML 报告。
+        extract_filter: 选择性解包过滤条件；为空时解包全部容器。
+        event_banks: 可选收集容器；提供时写入本次读出的 events bnk，供同轮映射复用。
 
     Raises:
         ValueError: 实体数据无效时抛出。
@@ -120,6 +193,12 @@ def unpack_entity(  # noqa: PLR0913
 
         stats.total_sub_entities = len(entity_data.sub_entities)
 
+        selection = None
+        if extract_filter is not None and extract_filter.active:
+            selection = build_entity_selection(entity_data, extract_filter, reader.version, ctx=ctx)
+        # 容器路径 -> 允许写出的 WEM ID；None 表示容器内全部写出
+        path_allowed_wem_ids: dict[str, frozenset[int] | None] = {}
+
         for sub_id, sub_data in entity_data.sub_entities.items():
             sub_info = entity_data.get_sub_entity_info(sub_id)
             if not sub_info:
@@ -135,6 +214,20 @@ def unpack_entity(  # noqa: PLR0913
                 audio_type = reader.get_audio_type(category)
                 if audio_type in exclude_types:
                     continue
+                # 选择性解包时只读取命中类别的容器，其余容器连 WAD 读取都跳过
+                if selection is not None and not selection.includes_category(sub_id, category):
+                    continue
+
+                if selection is not None:
+                    allowed = selection.allowed_wem_ids(sub_id, category)
+                    for bank in banks_list:
+                        for path in bank:
+                            # 同一容器被多个类别引用时取并集，任一类别不限制则整体写出
+                            previous = path_allowed_wem_ids.get(path, frozenset())
+                            if previous is None or allowed is None:
+                                path_allowed_wem_ids[path] = None
+                            else:
+                                path_allowed_wem_ids[path] = previous | allowed
 
                 sub_info_with_type = {
                     "id": sub_id_int,
@@ -158,6 +251,9 @@ def unpack_entity(  # noqa: PLR0913
         stats.sfx_music_paths_count = len(other_paths_to_extract)
 
         if not vo_paths_to_extract and not other_paths_to_extract:
+            if selection is not None:
+                logger.info(f"{entity_data.entity_name} 没有命中过滤条件的音频容器，跳过")
+                return
             logger.warning(
                 f"{entity_data.entity_type} '{entity_data.entity_name}' 未找到任何需要解包的音频文件 (检查排除类型配置)。"
             )
@@ -172,8 +268,10 @@ def unpack_entity(  # noqa: PLR0913
             try:
                 logger.debug(f"正在从 {lang_wad_path.name} 解包 {len(vo_path_list)} 个VO文件...")
                 wad_obj = _get_wad_instance(lang_wad_path, wad_cache=wad_cache, cache_lock=cache_lock)
-                file_raws = wad_obj.extract(vo_path_list, raw=True)
+                file_raws, wad_timings = extract_raw_timed(wad_obj, vo_path_list)
+                _record_wad_timings(stats, wad_timings)
                 path_to_raw_data_map.update(zip(vo_path_list, file_raws, strict=False))
+                _collect_event_banks(event_banks, lang_wad_path, vo_path_list, file_raws)
                 stats.set_wad_info("VO", lang_wad_path, len(vo_path_list), len(file_raws))
             except Exception as e:
                 logger.opt(exception=bool(getattr(ctx.config, "dev_mode", False))).error(
@@ -190,8 +288,10 @@ def unpack_entity(  # noqa: PLR0913
             try:
                 logger.debug(f"正在从 {root_wad_path.name} 解包 {len(other_path_list)} 个SFX/Music文件...")
                 wad_obj = _get_wad_instance(root_wad_path, wad_cache=wad_cache, cache_lock=cache_lock)
-                file_raws = wad_obj.extract(other_path_list, raw=True)
+                file_raws, wad_timings = extract_raw_timed(wad_obj, other_path_list)
+                _record_wad_timings(stats, wad_timings)
                 path_to_raw_data_map.update(zip(other_path_list, file_raws, strict=False))
+                _collect_event_banks(event_banks, root_wad_path, other_path_list, file_raws)
                 stats.set_wad_info("ROOT", root_wad_path, len(other_path_list), len(file_raws))
             except Exception as e:
                 logger.opt(exception=bool(getattr(ctx.config, "dev_mode", False))).error(
@@ -223,6 +323,7 @@ def unpack_entity(  # noqa: PLR0913
                     "raw": raw_data,
                     "type": sub_info["type"],
                     "source_path": path,
+                    "allowed_wem_ids": path_allowed_wem_ids.get(path),
                 }
             )
 
@@ -266,8 +367,13 @@ def unpack_entity(  # noqa: PLR0913
 
                     if file_info["suffix"] == ".bnk":
                         try:
-                            bnk = BNK(file_info["raw"])
-                            for file in bnk.extract_files():
+                            with stats.measure_phase(
+                                ProcessingPhase.BNK_PARSE, file_size, sub_id=sub_id, sub_name=sub_name
+                            ):
+                                bnk_files = BNK(file_info["raw"]).extract_files()
+                            for file in bnk_files:
+                                if not _is_wem_selected(file.id, file_info["allowed_wem_ids"]):
+                                    continue
                                 if not file.data:
                                     logger.warning(f"BNK, 文件 {file.id} 没有数据，跳过保存")
                                     stats.record_file_result(
@@ -282,6 +388,9 @@ def unpack_entity(  # noqa: PLR0913
                                     file,
                                     output_path / f"{file.id}.wem",
                                     persisted_wem_callback=persisted_wem_callback,
+                                    stats=stats,
+                                    sub_id=sub_id,
+                                    sub_name=sub_name,
                                 )
                                 stats.record_file_result(sub_id, sub_name, audio_type, FileProcessResult.SUCCESS)
                         except Exception as e:
@@ -295,12 +404,20 @@ def unpack_entity(  # noqa: PLR0913
                             )
                     elif file_info["suffix"] == ".wpk":
                         try:
-                            wpk = WPK(file_info["raw"])
-                            for file in wpk.extract_files():
+                            with stats.measure_phase(
+                                ProcessingPhase.WPK_PARSE, file_size, sub_id=sub_id, sub_name=sub_name
+                            ):
+                                wpk_files = WPK(file_info["raw"]).extract_files()
+                            for file in wpk_files:
+                                if not _is_wem_selected(file.filename, file_info["allowed_wem_ids"]):
+                                    continue
                                 _persist_wem(
                                     file,
                                     output_path / f"{file.filename}",
                                     persisted_wem_callback=persisted_wem_callback,
+                                    stats=stats,
+                                    sub_id=sub_id,
+                                    sub_name=sub_name,
                                 )
                                 stats.record_file_result(sub_id, sub_name, audio_type, FileProcessResult.SUCCESS)
                         except Exception as e:
@@ -349,6 +466,17 @@ def unpack_entity(  # noqa: PLR0913
             if sub_stats.empty_container_paths:
                 logger.debug(f"{sub_stats.name} 空容器路径: {sub_stats.empty_container_paths}")
 
+    if run_report is not None:
+        try:
+            run_report.append_entity(stats)
+        except Exception as e:
+            logger.warning(f"写入运行级报告失败: {e}")
+
+    # 单实体 YAML 报告改为按需输出；未接入运行级报告的独立调用仍保留 YAML，
+    # 避免直接调用 unpack_entity 时完全没有报告产物。
+    if not entity_yaml_report and run_report is not None:
+        return
+
     try:
         report_filename = f"_{entity_data.entity_id}_metadata.yaml"
         report_path = ctx.report_path / reader.version / get_output_dir_name(entity_data.entity_type) / report_filename
@@ -473,6 +601,20 @@ def generate_output_path(
     return base_path / relative_path / audio_type
 
 
+def _notify_entity_done(
+    callback: EntityDoneCallback | None,
+    entity_data: AudioEntityData,
+    event_banks: dict[tuple[Path, str], bytes] | None,
+) -> None:
+    """调用实体完成回调；回调失败不影响已完成的解包结果。"""
+    if callback is None:
+        return
+    try:
+        callback(entity_data, event_banks or {})
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"{entity_data.entity_name} 解包后续处理失败: {e}")
+
+
 def unpack_champion(  # noqa: PLR0913
     champion_id: int,
     reader: DataReader,
@@ -481,6 +623,10 @@ def unpack_champion(  # noqa: PLR0913
     *,
     ctx: AppContext,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    run_report: RunReportWriter | None = None,
+    entity_yaml_report: bool = False,
+    extract_filter: ExtractFilterOptions | None = None,
+    entity_done_callback: EntityDoneCallback | None = None,
 ) -> None:
     """按英雄 ID 解包音频。
 
@@ -491,14 +637,20 @@ def unpack_champion(  # noqa: PLR0913
         cache_lock: 多线程场景下的缓存锁。
         ctx: 运行时上下文。
         persisted_wem_callback: WEM 落盘后的附加回调。
+        run_report: 本轮运行共享的流式报告写入器。
+        entity_yaml_report: 是否额外输出单实体 YAML 报告。
+        extract_filter: 选择性解包过滤条件；为空时解包全部容器。
+        entity_done_callback: 实体解包完成后的回调，会收到实体数据与顺带读出的 events bnk。
     """
     try:
         entity_data = AudioEntityData.from_entity(
             "champion",
             champion_id,
             reader,
+            include_events=entity_done_callback is not None or bool(extract_filter and extract_filter.events),
             ctx=ctx,
         )
+        event_banks: dict[tuple[Path, str], bytes] | None = {} if entity_done_callback is not None else None
         unpack_entity(
             entity_data,
             reader,
@@ -506,8 +658,13 @@ def unpack_champion(  # noqa: PLR0913
             cache_lock=cache_lock,
             ctx=ctx,
             persisted_wem_callback=persisted_wem_callback,
+            run_report=run_report,
+            entity_yaml_report=entity_yaml_report,
+            extract_filter=extract_filter,
+            event_banks=event_banks,
         )
         attach_bp_vo(entity_data, reader, ctx=ctx)
+        _notify_entity_done(entity_done_callback, entity_data, event_banks)
     except ValueError as e:
         logger.error(str(e))
         return
@@ -521,6 +678,10 @@ def unpack_map(  # noqa: PLR0913
     *,
     ctx: AppContext,
     persisted_wem_callback: Callable[[Path], None] | None = None,
+    run_report: RunReportWriter | None = None,
+    entity_yaml_report: bool = False,
+    extract_filter: ExtractFilterOptions | None = None,
+    entity_done_callback: EntityDoneCallback | None = None,
 ) -> None:
     """按地图 ID 解包音频。
 
@@ -531,14 +692,20 @@ def unpack_map(  # noqa: PLR0913
         cache_lock: 多线程场景下的缓存锁。
         ctx: 运行时上下文。
         persisted_wem_callback: WEM 落盘后的附加回调。
+        run_report: 本轮运行共享的流式报告写入器。
+        entity_yaml_report: 是否额外输出单实体 YAML 报告。
+        extract_filter: 选择性解包过滤条件；为空时解包全部容器。
+        entity_done_callback: 实体解包完成后的回调，会收到实体数据与顺带读出的 events bnk。
     """
     try:
         entity_data = AudioEntityData.from_entity(
             "map",
             map_id,
             reader,
+            include_events=entity_done_callback is not None or bool(extract_filter and extract_filter.events),
             ctx=ctx,
         )
+        event_banks: dict[tuple[Path, str], bytes] | None = {} if entity_done_callback is not None else None
         unpack_entity(
             entity_data,
             reader,
@@ -546,7 +713,12 @@ def unpack_map(  # noqa: PLR0913
             cache_lock=cache_lock,
             ctx=ctx,
             persisted_wem_callback=persisted_wem_callback,
+            run_report=run_report,
+            entity_yaml_report=entity_yaml_report,
+            extract_filter=extract_filter,
+            event_banks=event_banks,
         )
+        _notify_entity_done(entity_done_callback, entity_data, event_banks)
     except ValueError as e:
         logger.error(str(e))
         return
@@ -0,0 +1,465 @@
+"""解包预演：只读 WAD 目录表，估算读写字节、WEM 数量与耗时。
+
+预演不解压任何容器：
+
+- 字节数直接取自 WAD 目录表中的压缩/解压大小；
+- 未压缩存储的 BNK/WPK 只读取容器头部，精确统计内嵌 WEM 数量与大小；
+- 压缩存储的容器按最近一次运行级报告中的输出比例与平均 WEM 大小估算；
+- 墙钟耗时按最近一次运行的 WAD 读取吞吐量估算。
+"""
+
+from __future__ import annotations
+
+import heapq
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from league_tools.formats import WAD
+from loguru import logger
+
+from lol_audio_unpack.manager import DataReader
+from lol_audio_unpack.model import AudioEntityData
+from lol_audio_unpack.runtime.wad import WAD_SECTION_RAW, get_wad, lookup_sections, read_stored_bytes
+from lol_audio_unpack.utils.common import format_duration
+from lol_audio_unpack.utils.disk_usage import format_size
+
+from .entity import AUDIO_TYPE_VO
+from .report import find_recent_run_reports, read_run_report
+from .selection import build_entity_selection
+from .stats import ProcessingPhase
+
+if TYPE_CHECKING:
+    from league_tools.formats.wad.parser import WADSection
+
+    from lol_audio_unpack.app.types import AppContext, ExtractFilterOptions
+
+BNK_CHUNK_HEADER = struct.Struct("<4sI")
+BNK_MEDIA_INDEX_ENTRY = struct.Struct("<III")
+WPK_HEADER = struct.Struct("<4sII")
+WPK_OFFSET_SIZE = 4
+
+
+@dataclass
+class ThroughputHistory:
+    """最近一次完整运行的吞吐量与输出特征。
+
+    Args:
+        source: 数据来源的运行级报告路径。
+        read_bytes_per_second: 按整轮墙钟耗时折算的 WAD 读取吞吐量。
+        average_wem_bytes: 平均每个 WEM 的落盘字节数。
+        output_ratio: 落盘字节与解压后容器字节之比。
+    """
+
+    source: Path
+    read_bytes_per_second: float
+    average_wem_bytes: float | None = None
+    output_ratio: float = 1.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可序列化字典。"""
+        return {
+            "source": str(self.source),
+            "read_bytes_per_second": self.read_bytes_per_second,
+            "average_wem_bytes": self.average_wem_bytes,
+            "output_ratio": self.output_ratio,
+        }
+
+
+@dataclass
+class EntityPlan:
+    """单个实体的预演结果。"""
+
+    entity_type: str
+    entity_id: str
+    entity_name: str
+    containers: int = 0
+    missing_containers: int = 0
+    estimated_containers: int = 0
+    compressed_bytes: int = 0
+    uncompressed_bytes: int = 0
+    projected_wem_count: int = 0
+    projected_output_bytes: int = 0
+
+    def merge(self, other: EntityPlan) -> None:
+        """累加另一个实体的计数。
+
+        Args:
+            other: 待累加的实体预演结果。
+        """
+        self.containers += other.containers
+        self.missing_containers += other.missing_containers
+        self.estimated_containers += other.estimated_containers
+        self.compressed_bytes += other.compressed_bytes
+        self.uncompressed_bytes += other.uncompressed_bytes
+        self.projected_wem_count += other.projected_wem_count
+        self.projected_output_bytes += other.projected_output_bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可序列化字典。"""
+        return {
+            "entity": {"type": self.entity_type, "id": self.entity_id, "name": self.entity_name},
+            "containers": self.containers,
+            "missing_containers": self.missing_containers,
+            "estimated_containers": self.estimated_containers,
+            "compressed_bytes": self.compressed_bytes,
+            "uncompressed_bytes": self.uncompressed_bytes,
+            "projected_wem_count": self.projected_wem_count,
+            "projected_output_bytes": self.projected_output_bytes,
+        }
+
+    def format_line(self) -> str:
+        """生成单行可读摘要。"""
+        line = (
+            f"{self.entity_name}: 容器 {self.containers} 个，"
+            f"读取 {format_size(self.compressed_bytes)} (解压后 {format_size(self.uncompressed_bytes)})，"
+            f"预计 {self.projected_wem_count} 个 WEM / {format_size(self.projected_output_bytes)}"
+        )
+        if self.estimated_containers:
+            line += f"，其中 {self.estimated_containers} 个压缩容器为估算值"
+        if self.missing_containers:
+            line += f"，{self.missing_containers} 个容器不在 WAD 中"
+        return line
+
+
+@dataclass
+class ExtractPlan:
+    """整轮解包的预演结果。
+
+    Args:
+        version: 数据版本号。
+        max_workers: 计划使用的解包线程数。
+        entities: 各实体的预演结果。
+        history: 用于估算的历史吞吐量；没有可用历史时为 ``None``。
+    """
+
+    version: str
+    max_workers: int
+    entities: list[EntityPlan] = field(default_factory=list)
+    history: ThroughputHistory | None = None
+
+    @property
+    def totals(self) -> EntityPlan:
+        """全部实体的累计结果。"""
+        totals = EntityPlan(entity_type="all", entity_id="", entity_name="合计")
+        for entity in self.entities:
+            totals.merge(entity)
+        return totals
+
+    @property
+    def peak_memory_bytes(self) -> int:
+        """预计的原始容器内存峰值。
+
+        ``unpack_entity`` 会先把单个实体的全部容器读入内存再逐个解析，
+        因此峰值近似为并发线程同时处理最大的几个实体时的解压后字节之和。
+        """
+        largest = heapq.nlargest(max(self.max_workers, 1), (entity.uncompressed_bytes for entity in self.entities))
+        return sum(largest)
+
+    @property
+    def estimated_seconds(self) -> float | None:
+        """按历史读取吞吐量估算的墙钟耗时；没有历史时返回 ``None``。"""
+        if self.history is None or self.history.read_bytes_per_second <= 0:
+            return None
+        return self.totals.compressed_bytes / self.history.read_bytes_per_second
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可序列化字典。"""
+        return {
+            "version": self.version,
+            "max_workers": self.max_workers,
+            "entities": [entity.to_dict() for entity in self.entities],
+            "totals": self.totals.to_dict(),
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "estimated_seconds": self.estimated_seconds,
+            "history": self.history.to_dict() if self.history else None,
+        }
+
+    def format_summary(self) -> str:
+        """生成整轮预演的单行汇总。"""
+        totals = self.totals
+        summary = (
+            f"共 {len(self.entities)} 个实体，容器 {totals.containers} 个，"
+            f"读取 {format_size(totals.compressed_bytes)} (解压后 {format_size(totals.uncompressed_bytes)})，"
+            f"预计写出 {totals.projected_wem_count} 个 WEM / {format_size(totals.projected_output_bytes)}，"
+            f"内存峰值约 {format_size(self.peak_memory_bytes)}"
+        )
+        seconds = self.estimated_seconds
+        if seconds is None:
+            return f"{summary}，暂无历史吞吐量，无法估算耗时"
+        return f"{summary}，预计耗时 {format_duration(seconds * 1000)}"
+
+
+def load_throughput_history(report_root: Path) -> ThroughputHistory | None:
+    """从最近一次完整结束的运行级报告中读取吞吐量。
+
+    中途中断的运行没有 ``run_end`` 汇总，墙钟耗时不可信，直接跳过。
+
+    Args:
+        report_root: 报告根目录。
+
+    Returns:
+        ThroughputHistory | None: 可用的历史吞吐量；没有时返回 ``None``。
+    """
+    for report_path in find_recent_run_reports(report_root):
+        report = read_run_report(report_path)
+        if not report.completed:
+            logger.debug(f"跳过未完成的运行级报告: {report_path}")
+            continue
+
+        totals = report.totals or {}
+        phases = totals.get("phases", {})
+        duration_ms = float(totals.get("duration_ms", 0) or 0)
+        read_bytes = phases.get(ProcessingPhase.WAD_READ.value, {}).get("bytes", 0)
+        if duration_ms <= 0 or read_bytes <= 0:
+            logger.debug(f"运行级报告缺少读取统计，跳过: {report_path}")
+            continue
+
+        write_stats = phases.get(ProcessingPhase.DISK_WRITE.value, {})
+        decompressed_bytes = phases.get(ProcessingPhase.DECOMPRESS.value, {}).get("bytes", 0) or read_bytes
+        average_wem_bytes = write_stats["bytes"] / write_stats["count"] if write_stats.get("count") else None
+        output_ratio = write_stats.get("bytes", 0) / decompressed_bytes if write_stats else 1.0
+        return ThroughputHistory(
+            source=report_path,
+            read_bytes_per_second=read_bytes / (duration_ms / 1000),
+            average_wem_bytes=average_wem_bytes,
+            output_ratio=output_ratio,
+        )
+    return None
+
+
+def _peek_bnk(wad: WAD, section: WADSection, allowed: frozenset[int] | None) -> tuple[int, int] | None:
+    """读取未压缩 BNK 的媒体索引，返回 ``(WEM 数量, WEM 字节数)``。"""
+    head = read_stored_bytes(wad, section, 0, BNK_CHUNK_HEADER.size)
+    if len(head) < BNK_CHUNK_HEADER.size:
+        return None
+    tag, header_size = BNK_CHUNK_HEADER.unpack(head)
+    if tag != b"BKHD":
+        return None
+
+    index_offset = BNK_CHUNK_HEADER.size + header_size
+    index_head = read_stored_bytes(wad, section, index_offset, BNK_CHUNK_HEADER.size)
+    if len(index_head) < BNK_CHUNK_HEADER.size:
+        return 0, 0
+    tag, index_size = BNK_CHUNK_HEADER.unpack(index_head)
+    if tag != b"DIDX":
+        # 只有 HIRC 的事件 BNK 没有内嵌媒体
+        return 0, 0
+
+    index = read_stored_bytes(wad, section, index_offset + BNK_CHUNK_HEADER.size, index_size)
+    usable = len(index) - len(index) % BNK_MEDIA_INDEX_ENTRY.size
+    entries = [
+        (wem_id, size)
+        for wem_id, _offset, size in BNK_MEDIA_INDEX_ENTRY.iter_unpack(index[:usable])
+        if allowed is None or wem_id in allowed
+    ]
+    return len(entries), sum(size for _, size in entries)
+
+
+def _peek_wpk(wad: WAD, section: WADSection, allowed: frozenset[int] | None) -> tuple[int, int] | None:
+    """读取未压缩 WPK 的文件头，返回 ``(WEM 数量, WEM 字节数)``。"""
+    head = read_stored_bytes(wad, section, 0, WPK_HEADER.size)
+    if len(head) < WPK_HEADER.size:
+        return None
+    magic, _version, file_count = WPK_HEADER.unpack(head)
+    if magic != b"r3d2":
+        return None
+
+    # 条目名只存在于各自的条目头里，这里不逐条读取，
+    # 按过滤集合大小近似命中数量，并按比例折算字节数。
+    payload_bytes = max(section.size - WPK_HEADER.size - WPK_OFFSET_SIZE * file_count, 0)
+    if allowed is None or file_count == 0:
+        return file_count, payload_bytes
+    selected = min(file_count, len(allowed))
+    return selected, payload_bytes * selected // file_count
+
+
+def _estimate_container(
+    wad: WAD,
+    path: str,
+    section: WADSection,
+    allowed: frozenset[int] | None,
+    history: ThroughputHistory | None,
+) -> tuple[int, int, bool]:
+    """估算单个容器写出的 WEM 数量与字节数。
+
+    Returns:
+        tuple[int, int, bool]: ``(WEM 数量, 落盘字节数, 是否为精确值)``。
+    """
+    if section.type == WAD_SECTION_RAW:
+        suffix = Path(path).suffix.lower()
+        peeked = None
+        if suffix == ".bnk":
+            peeked = _peek_bnk(wad, section, allowed)
+        elif suffix == ".wpk":
+            peeked = _peek_wpk(wad, section, allowed)
+        if peeked is not None:
+            return peeked[0], peeked[1], True
+        logger.debug(f"无法识别容器头部，改用历史比例估算: {path}")
+
+    output_ratio = history.output_ratio if history else 1.0
+    output_bytes = int(section.size * output_ratio)
+    if history is None or not history.average_wem_bytes:
+        return 0, output_bytes, False
+    wem_count = round(output_bytes / history.average_wem_bytes)
+    if allowed is not None:
+        wem_count = min(wem_count, len(allowed))
+    return wem_count, output_bytes, False
+
+
+def _collect_entity_containers(
+    entity_data: AudioEntityData,
+    reader: DataReader,
+    *,
+    ctx: AppContext,
+    extract_filter: ExtractFilterOptions | None,
+) -> dict[bool, dict[str, frozenset[int] | None]]:
+    """按 ``unpack_entity`` 的规则收集实体需要读取的容器。
+
+    Returns:
+        dict[bool, dict[str, frozenset[int] | None]]: ``{是否 VO: {容器路径: 允许写出的 WEM ID}}``。
+    """
+    exclude_types = list(ctx.exclude_types)
+    selection = None
+    if extract_filter is not None and extract_filter.active:
+        selection = build_entity_selection(entity_data, extract_filter, reader.version, ctx=ctx)
+
+    containers: dict[bool, dict[str, frozenset[int] | None]] = {True: {}, False: {}}
+    for sub_id, sub_data in entity_data.sub_entities.items():
+        if not entity_data.get_sub_entity_info(sub_id):
+            continue
+        for category, banks_list in sub_data["categories"].items():
+            audio_type = reader.get_audio_type(category)
+            if audio_type in exclude_types:
+                continue
+            if selection is not None and not selection.includes_category(sub_id, category):
+                continue
+
+            allowed = selection.allowed_wem_ids(sub_id, category) if selection is not None else None
+            bucket = containers[audio_type == AUDIO_TYPE_VO]
+            for bank in banks_list:
+                for path in bank:
+                    # 与解包阶段一致：同一容器被多个类别引用时取并集
+                    previous = bucket.get(path, frozenset())
+                    bucket[path] = None if previous is None or allowed is None else previous | allowed
+    return containers
+
+
+def plan_entity(  # noqa: PLR0913
+    entity_data: AudioEntityData,
+    reader: DataReader,
+    *,
+    ctx: AppContext,
+    wad_cache: dict[Path, WAD] | None = None,
+    extract_filter: ExtractFilterOptions | None = None,
+    history: ThroughputHistory | None = None,
+) -> EntityPlan:
+    """预演单个实体的解包。
+
+    Args:
+        entity_data: 实体数据。
+        reader: 已初始化的数据读取器。
+        ctx: 运行时上下文。
+        wad_cache: 预演期间共享的 WAD 实例缓存。
+        extract_filter: 选择性解包过滤条件。
+        history: 用于估算压缩容器的历史数据。
+
+    Returns:
+        EntityPlan: 实体预演结果。
+    """
+    plan = EntityPlan(
+        entity_type=entity_data.entity_type,
+        entity_id=str(entity_data.entity_id),
+        entity_name=entity_data.entity_name,
+    )
+    containers = _collect_entity_containers(entity_data, reader, ctx=ctx, extract_filter=extract_filter)
+
+    for is_vo, path_allowed in containers.items():
+        if not path_allowed:
+            continue
+        plan.containers += len(path_allowed)
+        wad_path = entity_data.get_wad_path(AUDIO_TYPE_VO if is_vo else "SFX", ctx=ctx)
+        if wad_path is None:
+            # 远端模式下 WAD 尚未下载时同样走这里，只能报告容器数量
+            logger.warning(f"{entity_data.entity_name} 的 {'语言' if is_vo else '根'} WAD 不存在，无法预估字节数")
+            plan.missing_containers += len(path_allowed)
+            continue
+
+        wad = get_wad(wad_path, cache=wad_cache, lock=None)
+        paths = list(path_allowed)
+        for path, section in zip(paths, lookup_sections(wad, paths), strict=True):
+            if section is None:
+                plan.missing_containers += 1
+                continue
+            plan.compressed_bytes += section.compressed_size
+            plan.uncompressed_bytes += section.size
+            wem_count, output_bytes, exact = _estimate_container(wad, path, section, path_allowed[path], history)
+            plan.projected_wem_count += wem_count
+            plan.projected_output_bytes += output_bytes
+            if not exact:
+                plan.estimated_containers += 1
+    return plan
+
+
+def plan_tasks(
+    tasks: list[tuple[str, int, str]],
+    reader: DataReader,
+    *,
+    ctx: AppContext,
+    max_workers: int = 4,
+    extract_filter: ExtractFilterOptions | None = None,
+) -> ExtractPlan:
+    """预演一批解包任务。
+
+    Args:
+        tasks: 任务元组列表 ``[(entity_type, id, description), ...]``。
+        reader: 已初始化的数据读取器。
+        ctx: 运行时上下文。
+        max_workers: 计划使用的解包线程数，用于估算内存峰值。
+        extract_filter: 选择性解包过滤条件。
+
+    Returns:
+        ExtractPlan: 整轮预演结果。
+    """
+    history = load_throughput_history(ctx.report_path)
+    if history is None:
+        logger.info("未找到可用的运行级报告，预演将不估算耗时")
+    else:
+        logger.debug(f"预演使用历史吞吐量: {history.source}")
+
+    plan = ExtractPlan(version=reader.version, max_workers=max_workers, history=history)
+    wad_cache: dict[Path, WAD] = {}
+    include_events = bool(extract_filter and extract_filter.events)
+    for entity_type, entity_id, description in tasks:
+        try:
+            entity_data = AudioEntityData.from_entity(
+                entity_type,
+                entity_id,
+                reader,
+                include_events=include_events,
+                ctx=ctx,
+            )
+            plan.entities.append(
+                plan_entity(
+                    entity_data,
+                    reader,
+                    ctx=ctx,
+                    wad_cache=wad_cache,
+                    extract_filter=extract_filter,
+                    history=history,
+                )
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"{description} 预演失败，将继续后续任务: {exc}")
+    return plan
+
+
+__all__ = [
+    "EntityPlan",
+    "ExtractPlan",
+    "ThroughputHistory",
+    "load_throughput_history",
+    "plan_entity",
+    "plan_tasks",
+]
@@ -0,0 +1,319 @@
+"""运行级流式解包报告。
+
+一次解包 batch 只产出一个 JSONL 文件，每行一条记录：
+
+- ``run_start``：运行元数据（版本、语言、音频类型等）
+- ``entity``：单个实体的解包统计，字段与 ``EntityUnpackStats`` 简洁报告一致
+- ``run_end``：整轮运行汇总
+
+实体完成后由同一个 writer 追加写入，汇总阶段只需顺序读取一个文件，
+不再需要遍历并解析成百上千个 YAML 报告。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from ..manager.utils import build_metadata_payload
+from ..utils.run_summary import record_runtime_note
+from .stats import PhaseTimings
+
+if TYPE_CHECKING:
+    from lol_audio_unpack.app.types import AppContext
+
+    from .stats import EntityUnpackStats
+
+RUN_REPORT_SUFFIX = ".jsonl"
+RECORD_RUN_START = "run_start"
+RECORD_ENTITY = "entity"
+RECORD_RUN_END = "run_end"
+
+
+def build_run_report_path(report_root: Path, version: str) -> Path:
+    """生成本轮运行的报告文件路径。
+
+    Args:
+        report_root: 报告根目录，通常为 ``ctx.report_path``。
+        version: 当前数据版本号。
+
+    Returns:
+        Path: ``<report_root>/<version>/_run_<时间戳>_<微秒>_<pid>.jsonl``。
+    """
+    # 同一秒内多次运行（或多个进程并行）时仅精确到秒会互相覆盖；
+    # 时间戳放在最前面，文件名排序仍与运行先后一致
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return report_root / version / f"_run_{timestamp}_{os.getpid()}{RUN_REPORT_SUFFIX}"
+
+
+def open_run_report(ctx: AppContext, version: str) -> RunReportWriter:
+    """为一轮运行创建并打开报告写入器。
+
+    Args:
+        ctx: 运行时上下文。
+        version: 当前数据版本号。
+
+    Returns:
+        RunReportWriter: 已写入 ``run_start`` 的写入器。
+    """
+    return RunReportWriter(
+        build_run_report_path(ctx.report_path, version),
+        game_version=version,
+        language=ctx.game_region,
+        included_types=list(ctx.include_types),
+    ).open()
+
+
+def finish_run_report(run_report: RunReportWriter, ctx: AppContext) -> None:
+    """关闭运行级报告，并把分阶段耗时汇总记入运行摘要。
+
+    Args:
+        run_report: 本轮运行的报告写入器。
+        ctx: 运行时上下文。
+    """
+    run_report.close()
+    logger.info(f"运行级解包报告已写入: {run_report.path}")
+
+    # 各实体的分阶段耗时在 run_report 里已累加；线程并发时各阶段是累计 CPU/IO 时间，
+    # 百分比只反映占比，不与墙钟耗时直接对应。
+    if breakdown := run_report.totals.phase_timings.format_breakdown():
+        logger.info(f"解包耗时分布: {breakdown}")
+        record_runtime_note(ctx.runtime_cache, "extract", f"耗时分布: {breakdown}", label="音频解包")
+
+
+@dataclass
+class RunReportTotals:
+    """运行级汇总计数。"""
+
+    entities: int = 0
+    results: dict[str, int] = field(default_factory=dict)
+    total_success: int = 0
+    total_failed: int = 0
+    total_skipped: int = 0
+    entity_duration_ms: float = 0.0
+    phase_timings: PhaseTimings = field(default_factory=PhaseTimings)
+
+    def add(self, stats: EntityUnpackStats) -> None:
+        """累加单个实体的统计。
+
+        Args:
+            stats: 已完成处理的实体统计对象。
+        """
+        self.entities += 1
+        result = stats.overall_result.value
+        self.results[result] = self.results.get(result, 0) + 1
+        self.total_success += stats.total_success_files
+        self.total_failed += stats.total_failed_files
+        self.total_skipped += stats.total_skipped_files
+        self.entity_duration_ms += stats.get_processing_duration()
+        self.phase_timings.merge(stats.phase_timings)
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为可序列化字典。"""
+        return {
+            "entities": self.entities,
+            "results": dict(self.results),
+            "total_success": self.total_success,
+            "total_failed": self.total_failed,
+            "total_skipped": self.total_skipped,
+            "entity_duration_ms": self.entity_duration_ms,
+            "phases": self.phase_timings.to_dict(),
+        }
+
+
+class RunReportWriter:
+    """运行级 JSONL 报告写入器。
+
+    多个解包线程共享同一个实例；每条记录在锁内整行写入并立即 flush，
+    保证进程中途退出时已完成实体的记录仍然可读。
+
+    Args:
+        path: 报告文件路径。
+        game_version: 当前数据版本号。
+        language: 当前语言区域。
+        included_types: 包含的音频类型。
+    """
+
+    def __init__(self, path: Path, *, game_version: str, language: str, included_types: list[str]) -> None:
+        self.path = path
+        self.totals = RunReportTotals()
+        self._game_version = game_version
+        self._language = language
+        self._included_types = list(included_types)
+        self._lock = threading.Lock()
+        self._file = None
+        self._start_time: float | None = None
+
+    def open(self) -> RunReportWriter:
+        """打开报告文件并写入 ``run_start`` 记录。"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 独占创建：文件名意外撞车时直接报错，而不是悄悄覆盖上一轮的报告
+        self._file = self.path.open("x", encoding="utf-8")
+        self._start_time = time.time()
+        metadata = build_metadata_payload(self._game_version, [self._language])["metadata"]
+        self._write({"kind": RECORD_RUN_START, "metadata": metadata, "audio_types": self._included_types})
+        logger.debug(f"运行级解包报告: {self.path}")
+        return self
+
+    def append_entity(self, stats: EntityUnpackStats) -> None:
+        """追加单个实体的统计记录。
+
+        Args:
+            stats: 已完成处理的实体统计对象。
+        """
+        record = {"kind": RECORD_ENTITY, **stats.generate_concise_report_data()["report"]}
+        with self._lock:
+            self.totals.add(stats)
+            self._write_unlocked(record)
+
+    def close(self) -> None:
+        """写入 ``run_end`` 汇总记录并关闭文件。"""
+        if self._file is None:
+            return
+        duration_ms = (time.time() - self._start_time) * 1000 if self._start_time else 0.0
+        with self._lock:
+            self._write_unlocked({"kind": RECORD_RUN_END, "duration_ms": duration_ms, **self.totals.to_dict()})
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> RunReportWriter:
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _write(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._write_unlocked(record)
+
+    def _write_unlocked(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            logger.warning(f"运行级报告未打开，丢弃记录: {record.get('kind')}")
+            return
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._file.write("\n")
+        self._file.flush()
+
+
+@dataclass
+class RunReport:
+    """运行级报告的读取结果。"""
+
+    metadata: dict[str, Any] = field(default_factory=dict)
+    audio_types: list[str] = field(default_factory=list)
+    entities: list[dict[str, Any]] = field(default_factory=list)
+    totals: dict[str, Any] | None = None
+
+    @property
+    def completed(self) -> bool:
+        """是否包含 ``run_end`` 记录，即运行是否正常结束。"""
+        return self.totals is not None
+
+    def get_entity(self, entity_type: str, entity_id: int | str) -> dict[str, Any] | None:
+        """按实体类型与 ID 查找记录。
+
+        Args:
+            entity_type: 实体类型，例如 ``champion``。
+            entity_id: 实体 ID。
+
+        Returns:
+            dict[str, Any] | None: 命中的实体记录；不存在时返回 ``None``。
+        """
+        for record in self.entities:
+            entity = record.get("entity", {})
+            if entity.get("type") == entity_type and str(entity.get("id")) == str(entity_id):
+                return record
+        return None
+
+
+def iter_run_report(path: Path) -> Iterator[dict[str, Any]]:
+    """逐行读取运行级报告记录。
+
+    中途中断的运行可能留下半行记录，这里跳过无法解析的行而不是整体失败。
+
+    Args:
+        path: 报告文件路径。
+
+    Yields:
+        dict[str, Any]: 单条记录。
+    """
+    with path.open(encoding="utf-8") as file:
+        for line_no, raw_line in enumerate(file, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                logger.warning(f"跳过无法解析的报告记录: {path}:{line_no}, 错误: {exc}")
+
+
+def read_run_report(path: Path) -> RunReport:
+    """读取完整运行级报告。
+
+    Args:
+        path: 报告文件路径。
+
+    Returns:
+        RunReport: 解析后的报告对象。
+    """
+    report = RunReport()
+    for record in iter_run_report(path):
+        kind = record.get("kind")
+        if kind == RECORD_RUN_START:
+            report.metadata = record.get("metadata", {})
+            report.audio_types = record.get("audio_types", [])
+        elif kind == RECORD_ENTITY:
+            report.entities.append(record)
+        elif kind == RECORD_RUN_END:
+            report.totals = record
+    return report
+
+
+def find_latest_run_report(report_root: Path, version: str) -> Path | None:
+    """查找指定版本最近一次运行的报告文件。
+
+    Args:
+        report_root: 报告根目录。
+        version: 数据版本号。
+
+    Returns:
+        Path | None: 最新报告路径；不存在时返回 ``None``。
+    """
+    candidates = sorted((report_root / version).glob(f"_run_*{RUN_REPORT_SUFFIX}"))
+    return candidates[-1] if candidates else None
+
+
+def find_recent_run_reports(report_root: Path) -> list[Path]:
+    """按时间倒序列出所有版本下的运行级报告。
+
+    文件名里的时间戳可以直接按字典序比较，因此跨版本排序不需要读取文件内容。
+
+    Args:
+        report_root: 报告根目录。
+
+    Returns:
+        list[Path]: 从新到旧排列的报告路径。
+    """
+    return sorted(report_root.glob(f"*/_run_*{RUN_REPORT_SUFFIX}"), key=lambda path: path.name, reverse=True)
+
+
+__all__ = [
+    "RunReport",
+    "RunReportTotals",
+    "RunReportWriter",
+    "build_run_report_path",
+    "find_latest_run_report",
+    "find_recent_run_reports",
+    "iter_run_report",
+    "read_run_report",
+]
@@ -0,0 +1,281 @@
+"""选择性解包：把过滤条件解析成最小的容器与 WEM 集合。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from lol_audio_unpack.app.artifacts import resolve_mapping_path
+from lol_audio_unpack.app.path_layout import get_output_dir_name
+from lol_audio_unpack.manager.files import read_data
+from lol_audio_unpack.mapping.reverse_index import REVERSE_INDEX_FILE_NAME, ReverseIndex
+from lol_audio_unpack.model import AudioEntityData
+
+if TYPE_CHECKING:
+    from lol_audio_unpack.app.types import AppContext, ExtractFilterOptions
+
+# {sub_id: {category: {event_name: [wem_id, ...]}}}
+EventMapping = dict[str, dict[str, dict[str, list[int]]]]
+
+
+@dataclass
+class EntitySelection:
+    """单个实体的选择结果。
+
+    Args:
+        categories: ``{sub_id: {category: allowed_wem_ids}}``；
+            ``allowed_wem_ids`` 为 ``None`` 表示该类别下全部写出。
+    """
+
+    categories: dict[str, dict[str, frozenset[int] | None]] = field(default_factory=dict)
+
+    def includes_category(self, sub_id: str, category: str) -> bool:
+        """判断某个子实体类别是否需要读取容器。"""
+        return category in self.categories.get(sub_id, {})
+
+    def allowed_wem_ids(self, sub_id: str, category: str) -> frozenset[int] | None:
+        """返回某个子实体类别允许写出的 WEM ID 集合。"""
+        return self.categories.get(sub_id, {}).get(category)
+
+    @property
+    def is_empty(self) -> bool:
+        """是否没有任何需要解包的类别。"""
+        return not any(self.categories.values())
+
+
+def _match_any(value: str, patterns: tuple[str, ...]) -> bool:
+    """大小写不敏感的 glob 匹配。"""
+    lowered = value.lower()
+    return any(fnmatchcase(lowered, pattern.lower()) for pattern in patterns)
+
+
+def wem_id_from_name(name: str | int) -> int | None:
+    """从 ``123.wem`` 之类的文件名或数字 ID 中解析 WEM ID。
+
+    Args:
+        name: BNK 子文件 ID 或 WPK 子文件名。
+
+    Returns:
+        int | None: 解析成功时返回 ID，否则返回 ``None``。
+    """
+    if isinstance(name, int):
+        return name
+    stem = Path(name).stem
+    return int(stem) if stem.isdigit() else None
+
+
+def _normalize_mapping_payload(payload: dict[str, Any]) -> EventMapping:
+    """把普通映射与整合映射统一成 ``{sub_id: {category: {event: ids}}}``。"""
+    if "data" in payload:
+        # 整合版：data.skins 为列表，data.map 为单个对象
+        data = payload["data"]
+        items = data.get("skins") or ([data["map"]] if data.get("map") else [])
+        return {
+            str(item["id"]): {
+                category: category_data.get("mapping", {})
+                for category, category_data in item.get("events", {}).items()
+            }
+            for item in items
+        }
+
+    sub_entities = payload.get("skins") or payload.get("map") or {}
+    return {str(sub_id): sub_data.get("events", {}) for sub_id, sub_data in sub_entities.items()}
+
+
+def _resolve_entity_mapping_path(entity_data: AudioEntityData, version: str, *, ctx: AppContext) -> Path | None:
+    """返回实体已生成的映射文件路径；尚未生成时返回 ``None``。"""
+    return resolve_mapping_path(
+        ctx,
+        entity_dir=get_output_dir_name(entity_data.entity_type),
+        entity_id=entity_data.entity_id,
+        version=version,
+    )
+
+
+def load_event_mapping(entity_data: AudioEntityData, version: str, *, ctx: AppContext) -> EventMapping | None:
+    """读取实体已生成的事件映射。
+
+    Args:
+        entity_data: 实体数据。
+        version: 数据版本号。
+        ctx: 运行时上下文。
+
+    Returns:
+        EventMapping | None: 归一化后的映射；尚未生成映射时返回 ``None``。
+    """
+    mapping_path = _resolve_entity_mapping_path(entity_data, version, ctx=ctx)
+    if mapping_path is None:
+        return None
+    payload = read_data(mapping_path, dev_mode=bool(getattr(ctx.config, "dev_mode", False)))
+    return _normalize_mapping_payload(payload) if payload else None
+
+
+def load_indexed_mapping(
+    entity_data: AudioEntityData,
+    wem_ids: tuple[int, ...],
+    index_path: Path,
+) -> EventMapping | None:
+    """用版本级反向索引把请求的 WEM ID 解析到本实体的子实体与类别。
+
+    结果只包含请求的 ID，足以判断哪些类别（即哪些容器）需要读取，
+    省去加载整份映射文件。
+
+    Args:
+        entity_data: 实体数据。
+        wem_ids: 请求的 WEM ID。
+        index_path: ``reverse_index.bin`` 路径。
+
+    Returns:
+        EventMapping | None: 与 ``load_event_mapping`` 同形的局部映射；索引不可用时返回 ``None``。
+    """
+    try:
+        with ReverseIndex(index_path) as index:
+            refs = [(wem_id, ref) for wem_id in wem_ids for ref in index.lookup(wem_id)]
+    except (OSError, ValueError) as exc:
+        logger.warning(f"反向索引不可用，改为读取事件映射: {exc}")
+        return None
+
+    mapping: EventMapping = {}
+    for wem_id, ref in refs:
+        if ref.entity_type != entity_data.entity_type or ref.entity_id != str(entity_data.entity_id):
+            continue
+        events = mapping.setdefault(ref.sub_id, {}).setdefault(ref.category, {})
+        events.setdefault(ref.event, []).append(wem_id)
+    return mapping
+
+
+def _load_wem_id_mapping(
+    entity_data: AudioEntityData,
+    wem_ids: tuple[int, ...],
+    version: str,
+    *,
+    ctx: AppContext,
+) -> EventMapping | None:
+    """只按 WEM ID 过滤时，优先查反向索引定位类别，索引缺失或过期时读取映射文件。"""
+    mapping_path = _resolve_entity_mapping_path(entity_data, version, ctx=ctx)
+    if mapping_path is None:
+        return None
+    index_path = ctx.hash_path / version / REVERSE_INDEX_FILE_NAME
+    # 反向索引在映射结束后统一刷新；比实体映射文件旧时可能漏掉新增的 ID，不能据此跳过容器
+    if index_path.exists() and index_path.stat().st_mtime >= mapping_path.stat().st_mtime:
+        if (mapping := load_indexed_mapping(entity_data, wem_ids, index_path)) is not None:
+            return mapping
+    else:
+        logger.debug(f"{entity_data.entity_name} 的反向索引缺失或早于映射文件，改为读取事件映射")
+    return load_event_mapping(entity_data, version, ctx=ctx)
+
+
+def resolve_entity_selection(
+    entity_data: AudioEntityData,
+    filters: ExtractFilterOptions,
+    mapping: EventMapping | None,
+) -> EntitySelection:
+    """把过滤条件解析成单个实体需要读取的类别与允许写出的 WEM。
+
+    规则：
+
+    - ``categories`` 按 glob 过滤类别；
+    - ``events`` 先用映射结果把事件展开成 WEM ID；没有映射时退回 events 数据，
+      只能把范围缩到包含该事件的类别，类别内不再按 WEM 过滤；
+    - ``wem_ids`` 有映射时只保留映射里出现过这些 ID 的类别，否则保留全部类别，
+      仅在写出阶段按 ID 过滤。
+
+    Args:
+        entity_data: 实体数据；按事件过滤时应包含 ``events``。
+        filters: 过滤条件。
+        mapping: ``load_event_mapping`` 的结果。
+
+    Returns:
+        EntitySelection: 解析后的选择结果。
+    """
+    selection = EntitySelection()
+    requested_ids = frozenset(filters.wem_ids)
+    events_data = entity_data.events or {}
+
+    for sub_id, sub_data in entity_data.sub_entities.items():
+        sub_mapping = (mapping or {}).get(sub_id, {})
+        sub_events = events_data.get(sub_id, {}).get("events", {})
+        chosen: dict[str, frozenset[int] | None] = {}
+
+        for category in sub_data.get("categories", {}):
+            if filters.categories and not _match_any(category, filters.categories):
+                continue
+
+            category_mapping = sub_mapping.get(category, {})
+            allowed: set[int] | None = None
+            if filters.events:
+                matched_events = [name for name in category_mapping if _match_any(name, filters.events)]
+                if matched_events:
+                    allowed = {wem_id for name in matched_events for wem_id in category_mapping[name]}
+                elif not any(_match_any(name, filters.events) for name in sub_events.get(category, [])):
+                    continue
+                # 事件存在但映射缺失时只能整类解包，allowed 保持 None
+
+            if requested_ids:
+                if mapping is not None:
+                    mapped_ids = {wem_id for ids in category_mapping.values() for wem_id in ids}
+                    if not mapped_ids & requested_ids:
+                        continue
+                allowed = requested_ids if allowed is None else allowed & requested_ids
+                if not allowed:
+                    continue
+
+            chosen[category] = frozenset(allowed) if allowed is not None else None
+
+        if chosen:
+            selection.categories[sub_id] = chosen
+
+    return selection
+
+
+def build_entity_selection(
+    entity_data: AudioEntityData,
+    filters: ExtractFilterOptions,
+    version: str,
+    *,
+    ctx: AppContext,
+) -> EntitySelection:
+    """读取映射并解析实体选择结果。
+
+    Args:
+        entity_data: 实体数据。
+        filters: 过滤条件。
+        version: 数据版本号。
+        ctx: 运行时上下文。
+
+    Returns:
+        EntitySelection: 解析后的选择结果。
+    """
+    mapping = None
+    if filters.events:
+        mapping = load_event_mapping(entity_data, version, ctx=ctx)
+    elif filters.wem_ids:
+        mapping = _load_wem_id_mapping(entity_data, filters.wem_ids, version, ctx=ctx)
+    if mapping is None and filters.wem_ids and not filters.events and not filters.categories:
+        # 没有映射就无法知道 ID 落在哪个容器里，只能读取全部容器后在写出阶段按 ID 过滤
+        logger.warning(
+            f"{entity_data.entity_name} 尚未生成事件映射与反向索引，--wem-ids 无法定位所在容器，"
+            "将读取该实体的全部容器；先执行 mapping 可只读取包含这些 ID 的容器"
+        )
+    elif mapping is None and (filters.events or filters.wem_ids):
+        logger.warning(f"{entity_data.entity_name} 尚未生成事件映射，选择性解包将按类别整体读取容器")
+
+    selection = resolve_entity_selection(entity_data, filters, mapping)
+    selected_count = sum(len(categories) for categories in selection.categories.values())
+    logger.debug(f"{entity_data.entity_name} 选择性解包命中 {selected_count} 个子实体类别")
+    return selection
+
+
+__all__ = [
+    "EntitySelection",
+    "EventMapping",
+    "build_entity_selection",
+    "load_event_mapping",
+    "load_indexed_mapping",
+    "resolve_entity_selection",
+    "wem_id_from_name",
+]
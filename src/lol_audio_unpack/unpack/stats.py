@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -31,6 +33,117 @@ class FileProcessResult(Enum):
     UNKNOWN_TYPE = "unknown_type"
 
 
+class ProcessingPhase(Enum):
+    """解包耗时分阶段枚举"""
+
+    WAD_READ = "wad_read"
+    DECOMPRESS = "decompress"
+    BNK_PARSE = "bnk_parse"
+    WPK_PARSE = "wpk_parse"
+    DISK_WRITE = "disk_write"
+
+
+PHASE_LABELS: dict[ProcessingPhase, str] = {
+    ProcessingPhase.WAD_READ: "WAD 读取",
+    ProcessingPhase.DECOMPRESS: "解压",
+    ProcessingPhase.BNK_PARSE: "BNK 解析",
+    ProcessingPhase.WPK_PARSE: "WPK 解析",
+    ProcessingPhase.DISK_WRITE: "磁盘写入",
+}
+
+
+@dataclass
+class PhaseTimings:
+    """分阶段耗时与字节计数
+
+    耗时统一使用 ``time.perf_counter_ns`` 这类单调时钟的纳秒差值累加，
+    不受系统时间调整影响，也便于跨实体、跨线程直接求和。
+
+    :param durations_ns: 各阶段累计耗时（纳秒）
+    :param bytes_by_phase: 各阶段累计处理字节数
+    :param counts: 各阶段累计调用次数
+    """
+
+    durations_ns: dict[str, int] = field(default_factory=dict)
+    bytes_by_phase: dict[str, int] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, phase: ProcessingPhase, elapsed_ns: int, nbytes: int = 0) -> None:
+        """累加一次阶段测量
+
+        :param phase: 阶段
+        :param elapsed_ns: 本次耗时（纳秒）
+        :param nbytes: 本次处理的字节数
+        """
+        key = phase.value
+        self.durations_ns[key] = self.durations_ns.get(key, 0) + elapsed_ns
+        self.bytes_by_phase[key] = self.bytes_by_phase.get(key, 0) + nbytes
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def merge(self, other: PhaseTimings) -> None:
+        """合并另一份阶段统计
+
+        :param other: 待合并的阶段统计
+        """
+        for key, value in other.durations_ns.items():
+            self.durations_ns[key] = self.durations_ns.get(key, 0) + value
+        for key, value in other.bytes_by_phase.items():
+            self.bytes_by_phase[key] = self.bytes_by_phase.get(key, 0) + value
+        for key, value in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    @property
+    def total_ns(self) -> int:
+        """所有阶段累计耗时（纳秒）"""
+        return sum(self.durations_ns.values())
+
+    def to_dict(self) -> dict[str, dict[str, float | int]]:
+        """转换为报告用字典，耗时单位为毫秒
+
+        :returns: ``{phase: {"duration_ms", "bytes", "count"}}``
+        """
+        return {
+            phase.value: {
+                "duration_ms": round(self.durations_ns[phase.value] / 1_000_000, 3),
+                "bytes": self.bytes_by_phase.get(phase.value, 0),
+                "count": self.counts.get(phase.value, 0),
+            }
+            for phase in ProcessingPhase
+            if phase.value in self.durations_ns
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, dict[str, float | int]]) -> PhaseTimings:
+        """从 ``to_dict`` 输出还原
+
+        :param data: 报告中的阶段字典
+        :returns: 阶段统计对象
+        """
+        timings = cls()
+        for key, item in data.items():
+            timings.durations_ns[key] = int(float(item.get("duration_ms", 0)) * 1_000_000)
+            timings.bytes_by_phase[key] = int(item.get("bytes", 0))
+            timings.counts[key] = int(item.get("count", 0))
+        return timings
+
+    def format_breakdown(self) -> str:
+        """生成“时间花在哪里”的百分比描述
+
+        :returns: 例如 ``磁盘写入 40% · BNK 解析 35% · WAD 读取 25%``；无数据时返回空字符串
+        """
+        total = self.total_ns
+        if total <= 0:
+            return ""
+
+        parts = []
+        for phase in sorted(ProcessingPhase, key=lambda item: self.durations_ns.get(item.value, 0), reverse=True):
+            elapsed = self.durations_ns.get(phase.value, 0)
+            if elapsed <= 0:
+                continue
+            parts.append(f"{PHASE_LABELS[phase]} {elapsed * 100 / total:.0f}%")
+        return " · ".join(parts)
+
+
 @dataclass
 class WadExtractionInfo:
     """WAD文件解包信息
@@ -64,6 +177,7 @@ class SubEntityStats:
     :param stats_by_type: 按音频类型分组的统计信息
     :param failed_file_details: 失败文件的详细信息
     :param empty_container_paths: 空容器文件的路径列表
+    :param phase_timings: 分阶段耗时与字节计数
     """
 
     sub_id: int
@@ -82,6 +196,9 @@ class SubEntityStats:
     failed_file_details: list[dict[str, Any]] = field(default_factory=list)
     empty_container_paths: list[str] = field(default_factory=list)
 
+    # 分阶段耗时（仅包含能归属到子实体的解析与写盘阶段）
+    phase_timings: PhaseTimings = field(default_factory=PhaseTimings)
+
     @property
     def has_issues(self) -> bool:
         """是否存在问题（失败或跳过的文件）"""
@@ -131,6 +248,10 @@ class EntityUnpackStats:
     total_failed_files: int = 0
     total_skipped_files: int = 0
 
+    # === 分阶段耗时 ===
+    # WAD 读取/解压发生在子实体组装之前，只记在实体级；解析与写盘同时记到子实体。
+    phase_timings: PhaseTimings = field(default_factory=PhaseTimings)
+
     overall_result: StageResult = StageResult.SUCCESS
     start_time: float | None = None
     end_time: float | None = None
@@ -155,6 +276,49 @@ class EntityUnpackStats:
             return (self.end_time - self.start_time) * 1000
         return 0.0
 
+    def record_phase(
+        self,
+        phase: ProcessingPhase,
+        elapsed_ns: int,
+        nbytes: int = 0,
+        *,
+        sub_id: int | None = None,
+        sub_name: str | None = None,
+    ) -> None:
+        """记录一次阶段耗时
+
+        :param phase: 阶段
+        :param elapsed_ns: 耗时（纳秒）
+        :param nbytes: 处理的字节数
+        :param sub_id: 可归属的子实体ID；为空时只记在实体级
+        :param sub_name: 子实体名称
+        """
+        self.phase_timings.add(phase, elapsed_ns, nbytes)
+        if sub_id is not None:
+            self.get_or_create_sub_stats(sub_id, sub_name or str(sub_id)).phase_timings.add(phase, elapsed_ns, nbytes)
+
+    @contextmanager
+    def measure_phase(
+        self,
+        phase: ProcessingPhase,
+        nbytes: int = 0,
+        *,
+        sub_id: int | None = None,
+        sub_name: str | None = None,
+    ) -> Iterator[None]:
+        """以单调时钟测量代码块耗时并记入对应阶段
+
+        :param phase: 阶段
+        :param nbytes: 处理的字节数
+        :param sub_id: 可归属的子实体ID
+        :param sub_name: 子实体名称
+        """
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record_phase(phase, time.perf_counter_ns() - started, nbytes, sub_id=sub_id, sub_name=sub_name)
+
     def record_sub_entity_skipped(self, sub_id: str, reason: str) -> None:
         """记录跳过的子实体
 
@@ -316,6 +480,8 @@ class EntityUnpackStats:
         # 基本信息
         lines.append(f"=== {self.entity_type} '{self.entity_name}' (ID:{self.entity_id}) 解包详细报告 ===")
         lines.append(f"处理耗时: {duration_str}")
+        if breakdown := self.phase_timings.format_breakdown():
+            lines.append(f"耗时分布: {breakdown}")
         lines.append(f"语言: {self.language}")
         lines.append(f"音频类型: {self.included_types}")
         if self.excluded_types:
@@ -478,6 +644,7 @@ class EntityUnpackStats:
                 "total_failed": self.total_failed_files,
                 "total_skipped": self.total_skipped_files,
             },
+            "phases": self.phase_timings.to_dict(),
             "sub_entities": {},
         }
 
@@ -506,6 +673,8 @@ class EntityUnpackStats:
                 "skipped": sub_stats.empty_containers + sub_stats.empty_subfiles,
                 "audio_types": {},
             }
+            if sub_stats.phase_timings.durations_ns:
+                sub_entity_data["phases"] = sub_stats.phase_timings.to_dict()
 
             # 如果有跳过的文件，记录详细信息
             if sub_stats.empty_containers > 0 or sub_stats.empty_subfiles > 0:
@@ -0,0 +1,243 @@
+"""映射文件的列式编码。
+
+普通映射文件里每张事件表都是 ``事件名 → 音频 ID 列表`` 的嵌套字典，msgpack/YAML 读入时
+每个事件名和每个 ID 都会变成独立的 Python 对象。列式格式把同一文件内所有事件表的事件名
+驻留到一个字符串池，音频 ID 拼成一段连续的 uint32 数组并用偏移量切分；外层结构（元数据、
+子实体、类别、banks）仍按 msgpack 保存。加载时事件表以惰性视图返回：访问到才解码事件名，
+ID 直接是底层缓冲区上的 ``memoryview``，不会逐个创建 ``int`` 对象。
+
+列（均为小端 uint32 数组，字符串池为 UTF-8 拼接）::
+
+    tableOffsets  : 每张事件表在事件行中的起止位置，长度为表数 + 1
+    names         : 每个事件行的事件名在字符串池中的下标
+    idOffsets     : 每个事件行在 ids 中的起止位置，长度为事件行数 + 1
+    ids           : 全部音频 ID
+    stringOffsets : 字符串池中每个字符串的起止位置，长度为字符串数 + 1
+    strings       : 字符串池
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+import msgpack
+
+COLUMNAR_SUFFIX = ".colmap"
+_FORMAT_NAME = "columnar"
+# 列布局变化时递增，旧文件会被拒绝读取
+_FORMAT_VERSION = 1
+_TABLE_MARKER = "$columns"
+
+
+def _event_table_slots(data: dict[str, Any]) -> Iterator[tuple[dict[str, Any], str]]:
+    """列出映射数据中每张事件表所在的 ``(容器, 键)``。
+
+    兼容两种映射结构：普通映射 ``skins|map → 子实体 → events → 类别``，
+    以及整合映射 ``data.skins[] | data.map → events → 类别 → mapping``。
+    """
+    payload = data.get("data")
+    if isinstance(payload, dict):
+        items = payload.get("skins") or []
+        if isinstance(payload.get("map"), dict):
+            items = [payload["map"]]
+        for item in items:
+            for info in item.get("events", {}).values():
+                if isinstance(info, dict) and "mapping" in info:
+                    yield info, "mapping"
+        return
+
+    for data_key in ("skins", "map"):
+        for sub_data in (data.get(data_key) or {}).values():
+            events = sub_data.get("events", {})
+            for category in events:
+                yield events, category
+
+
+def _pack_u32(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _view_u32(buffer: bytes) -> Sequence[int]:
+    """把小端 uint32 字节串转成可切片的整数序列；小端主机上零拷贝。"""
+    if sys.byteorder == "little":
+        return memoryview(buffer).cast("I")
+    values = array("I", buffer)
+    values.byteswap()
+    return values
+
+
+def encode_columnar(data: dict[str, Any]) -> dict[str, Any]:
+    """把映射数据编码为列式结构。
+
+    Args:
+        data: 普通映射或整合映射数据。
+
+    Returns:
+        dict[str, Any]: 可直接交给 msgpack 序列化的列式结构。
+
+    Raises:
+        OverflowError: 音频 ID 超出 32 位无符号整数范围时抛出。
+    """
+    header = copy.deepcopy(data)
+    strings: dict[str, int] = {}
+    table_offsets = array("I", [0])
+    names = array("I")
+    id_offsets = array("I", [0])
+    ids = array("I")
+
+    for container, key in _event_table_slots(header):
+        for event, audio_ids in container[key].items():
+            names.append(strings.setdefault(str(event), len(strings)))
+            ids.extend(int(audio_id) for audio_id in audio_ids)
+            id_offsets.append(len(ids))
+        container[key] = {_TABLE_MARKER: len(table_offsets) - 1}
+        table_offsets.append(len(names))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    string_offsets = array("I", [0])
+    for item in encoded:
+        string_offsets.append(string_offsets[-1] + len(item))
+
+    return {
+        "format": _FORMAT_NAME,
+        "version": _FORMAT_VERSION,
+        "header": header,
+        "columns": {
+            "tableOffsets": _pack_u32(table_offsets),
+            "names": _pack_u32(names),
+            "idOffsets": _pack_u32(id_offsets),
+            "ids": _pack_u32(ids),
+            "stringOffsets": _pack_u32(string_offsets),
+            "strings": b"".join(encoded),
+        },
+    }
+
+
+class _Columns:
+    """一份列式文件的全部列，供各事件表视图共享。"""
+
+    __slots__ = ("id_offsets", "ids", "names", "string_offsets", "strings", "table_offsets")
+
+    def __init__(self, columns: dict[str, bytes]) -> None:
+        self.table_offsets = _view_u32(columns["tableOffsets"])
+        self.names = _view_u32(columns["names"])
+        self.id_offsets = _view_u32(columns["idOffsets"])
+        self.ids = _view_u32(columns["ids"])
+        self.string_offsets = _view_u32(columns["stringOffsets"])
+        self.strings = columns["strings"]
+
+    def string(self, index: int) -> str:
+        return self.strings[self.string_offsets[index] : self.string_offsets[index + 1]].decode("utf-8")
+
+
+class EventTable(Mapping[str, Sequence[int]]):
+    """列式文件中一张事件表的只读视图，行为与 ``{事件名: [音频 ID]}`` 字典一致。
+
+    按事件名取值时才会建立名称索引；只做遍历时用 ``iter_rows`` 可以完全跳过索引。
+    """
+
+    __slots__ = ("_columns", "_index", "_start", "_stop")
+
+    def __init__(self, columns: _Columns, table_index: int) -> None:
+        self._columns = columns
+        self._start = columns.table_offsets[table_index]
+        self._stop = columns.table_offsets[table_index + 1]
+        self._index: dict[str, int] | None = None
+
+    def _row_name(self, row: int) -> str:
+        return self._columns.string(self._columns.names[row])
+
+    def _row_ids(self, row: int) -> Sequence[int]:
+        offsets = self._columns.id_offsets
+        return self._columns.ids[offsets[row] : offsets[row + 1]]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._row_name(row) for row in range(self._start, self._stop))
+
+    def __getitem__(self, event: str) -> Sequence[int]:
+        if self._index is None:
+            self._index = {self._row_name(row): row for row in range(self._start, self._stop)}
+        return self._row_ids(self._index[event])
+
+    def iter_rows(self) -> Iterator[tuple[str, Sequence[int]]]:
+        """按写入顺序遍历 ``(事件名, 音频 ID)``，不建立名称索引。"""
+        for row in range(self._start, self._stop):
+            yield self._row_name(row), self._row_ids(row)
+
+    def to_dict(self) -> dict[str, list[int]]:
+        """展开为普通字典。"""
+        return {event: list(audio_ids) for event, audio_ids in self.iter_rows()}
+
+
+def dump_columnar(obj: dict[str, Any], path: str | PathLike | Path) -> None:
+    """将映射数据以列式格式写入文件。
+
+    Args:
+        obj: 普通映射或整合映射数据。
+        path: 输出文件路径。
+    """
+    target = Path(path)
+    with target.open("wb") as file:
+        msgpack.pack(encode_columnar(obj), file)
+
+
+def load_columnar(path: str | PathLike | Path) -> dict[str, Any]:
+    """读取列式映射文件，事件表以 ``EventTable`` 惰性视图返回。
+
+    Args:
+        path: 列式文件路径。
+
+    Returns:
+        dict[str, Any]: 与原映射结构一致的数据，事件表位置为 ``EventTable``。
+
+    Raises:
+        ValueError: 文件不是受支持的列式映射时抛出。
+    """
+    target = Path(path)
+    with target.open("rb") as file:
+        raw = msgpack.unpack(file, raw=False)
+    if not isinstance(raw, dict) or raw.get("format") != _FORMAT_NAME or raw.get("version") != _FORMAT_VERSION:
+        raise ValueError(f"不支持的列式映射文件: {target}")
+
+    columns = _Columns(raw["columns"])
+    header = raw["header"]
+    for container, key in _event_table_slots(header):
+        container[key] = EventTable(columns, container[key][_TABLE_MARKER])
+    return header
+
+
+def load_columnar_data(path: str | PathLike | Path) -> dict[str, Any]:
+    """读取列式映射文件并展开为普通嵌套字典，供只认字典的调用方使用。
+
+    Args:
+        path: 列式文件路径。
+
+    Returns:
+        dict[str, Any]: 与写入前结构一致的映射数据。
+    """
+    data = load_columnar(path)
+    for container, key in _event_table_slots(data):
+        container[key] = container[key].to_dict()
+    return data
+
+
+__all__ = [
+    "COLUMNAR_SUFFIX",
+    "EventTable",
+    "dump_columnar",
+    "encode_columnar",
+    "load_columnar",
+    "load_columnar_data",
+]
@@ -89,8 +89,14 @@ class DirectoryUsageMonitor:
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._peak_bytes = 0
+        self._current_bytes = 0
         self._start_time = 0.0
 
+    @property
+    def current_bytes(self) -> int:
+        """最近一次采样得到的目录占用字节数。"""
+        return self._current_bytes
+
     def start(self) -> None:
         """启动后台采样。"""
         self._start_time = time.monotonic()
@@ -101,6 +107,7 @@ class DirectoryUsageMonitor:
         self._stop_event.set()
         self._thread.join()
         final_bytes = compute_unique_disk_usage(self.root)
+        self._current_bytes = final_bytes
         self._peak_bytes = max(self._peak_bytes, final_bytes)
         return DiskUsageReport(
             label=self.label,
@@ -113,7 +120,8 @@ class DirectoryUsageMonitor:
     def _run(self) -> None:
         """后台采样循环。"""
         while not self._stop_event.is_set():
-            self._peak_bytes = max(self._peak_bytes, compute_unique_disk_usage(self.root))
+            self._current_bytes = compute_unique_disk_usage(self.root)
+            self._peak_bytes = max(self._peak_bytes, self._current_bytes)
             self._stop_event.wait(self.interval_seconds)
 
 
@@ -46,3 +46,58 @@ def test_transcode_wav_passes_entity_display_labels_to_runtime(
     assert len(audio_targets) == 1
     assert audio_targets[0].root_path == audio_root
     assert audio_targets[0].display_label == "阿狸·九尾妖狐"
+
+
+def _build_extract_app(monkeypatch, calls: dict[str, object]) -> LolAudioUnpackApp:
+    config = SimpleNamespace(include_types=(), exclude_types=(), output_path=Path("out"), game_region="zh_CN")
+    app = LolAudioUnpackApp(SimpleNamespace(config=config))
+    monkeypatch.setattr(app, "_create_reader", lambda: SimpleNamespace(version="15.8"))
+    monkeypatch.setattr(app, "_create_remote_preparer", lambda: None)
+    monkeypatch.setattr(facade_module, "refresh_reverse_index", lambda *_args: None)
+    monkeypatch.setattr(
+        facade_module,
+        "unpack_champions",
+        lambda **kwargs: calls.update(entity_done_callback=kwargs["entity_done_callback"]),
+    )
+    monkeypatch.setattr(app, "mapping", lambda opts, **_kwargs: calls.update(separate_mapping=opts))
+    return app
+
+
+def test_extract_with_mapping_passes_mapping_options_to_combined_mapper(monkeypatch) -> None:
+    """同轮映射沿用映射选项中的 bnk 缓存与 wwiser 进程池设置，结束后关闭映射器。"""
+    calls: dict[str, object] = {}
+    app = _build_extract_app(monkeypatch, calls)
+
+    class FakeMapper:
+        closed = False
+
+        def close(self) -> None:
+            FakeMapper.closed = True
+
+    def fake_create_entity_mapper(_reader, **kwargs) -> FakeMapper:  # noqa: ANN001
+        calls["mapper_kwargs"] = kwargs
+        return FakeMapper()
+
+    monkeypatch.setattr(facade_module, "create_entity_mapper", fake_create_entity_mapper)
+    options = OperationOptions(champion_ids=(103,), keep_bnk_cache=True, wwiser_workers=2)
+
+    app.extract(options, mapping_options=options)
+
+    assert calls["mapper_kwargs"]["keep_bnk_cache"] is True
+    assert calls["mapper_kwargs"]["wwiser_workers"] == options.wwiser_workers
+    assert isinstance(calls["entity_done_callback"], FakeMapper)
+    assert FakeMapper.closed
+    assert "separate_mapping" not in calls
+
+
+def test_extract_with_process_mapping_executor_maps_separately(monkeypatch) -> None:
+    """多进程映射后端无法在解包线程内同轮执行，改为解包结束后单独映射。"""
+    calls: dict[str, object] = {}
+    app = _build_extract_app(monkeypatch, calls)
+    monkeypatch.setattr(facade_module, "create_entity_mapper", lambda *_args, **_kwargs: None)
+    options = OperationOptions(champion_ids=(103,), mapping_executor="process", max_workers=2)
+
+    app.extract(options, mapping_options=options)
+
+    assert calls["entity_done_callback"] is None
+    assert calls["separate_mapping"] is options
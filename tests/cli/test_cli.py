@@ -94,6 +94,82 @@ def test_validate_args_mapping_allows_integrate_data() -> None:
     runtime_cli.validate_args(args, parser)
 
 
+def test_validate_args_splits_mapping_query_ids() -> None:
+    parser = create_parser()
+    args = parser.parse_args(["mapping", "query", "123", "456"])
+
+    runtime_cli.extract_mapping_subcommand(args, mode="unpack")
+    runtime_cli.validate_args(args, parser)
+
+    assert args.actions == ["mapping"]
+    assert args.query_ids == (123, 456)
+    assert dispatch_cli._is_query(args)
+
+
+def test_validate_args_rejects_non_integer_mapping_query_ids() -> None:
+    parser = create_parser("mapping")
+    args = parser.parse_args(["query", "Play_vo"])
+
+    runtime_cli.extract_mapping_subcommand(args, mode="mapping")
+    with pytest.raises(SystemExit) as exc:
+        runtime_cli.validate_args(args, parser)
+
+    assert exc.value.code == 1
+
+
+def test_validate_args_splits_mapping_diff_versions() -> None:
+    parser = create_parser("mapping")
+    args = parser.parse_args(["diff", "15.1.1", "15.2.1"])
+
+    runtime_cli.extract_mapping_subcommand(args, mode="mapping")
+    runtime_cli.validate_args(args, parser)
+
+    assert args.actions == ["mapping"]
+    assert args.diff_versions == ["15.1.1", "15.2.1"]
+    assert dispatch_cli._is_diff(args)
+    assert not dispatch_cli._is_query(args)
+
+
+def test_validate_args_rejects_mapping_diff_without_two_versions() -> None:
+    parser = create_parser()
+    args = parser.parse_args(["mapping", "diff", "15.1.1"])
+
+    runtime_cli.extract_mapping_subcommand(args, mode="unpack")
+    with pytest.raises(SystemExit) as exc:
+        runtime_cli.validate_args(args, parser)
+
+    assert exc.value.code == 1
+
+
+def test_validate_args_splits_snapshot_export_and_bases() -> None:
+    parser = create_parser()
+    args = parser.parse_args(["snapshot", "export", "16.5.snapshot", "16.4.snapshot", "--champions", "1"])
+
+    runtime_cli.extract_snapshot_subcommand(args)
+    runtime_cli.validate_args(args, parser)
+
+    assert args.actions == ["update"]
+    assert args.snapshot_export == ["16.5.snapshot", "16.4.snapshot"]
+    assert dispatch_cli._is_snapshot_export(args)
+    assert not dispatch_cli._is_snapshot_import(args)
+
+
+def test_validate_args_requires_offline_root_for_snapshot_import() -> None:
+    parser = create_parser()
+    args = parser.parse_args(["snapshot", "import", "16.5.snapshot"])
+
+    runtime_cli.extract_snapshot_subcommand(args)
+    with pytest.raises(SystemExit) as exc:
+        runtime_cli.validate_args(args, parser)
+
+    assert exc.value.code == 1
+
+    args = parser.parse_args(["snapshot", "import", "16.5.snapshot", "--remote-offline-root", "mirror"])
+    runtime_cli.extract_snapshot_subcommand(args)
+    runtime_cli.validate_args(args, parser)
+    assert dispatch_cli._is_snapshot_import(args)
+
+
 def test_mapping_defaults_integrate_data_to_true() -> None:
     parser = create_parser()
     args = parser.parse_args(["mapping"])
@@ -390,6 +466,48 @@ def test_build_operation_options_includes_wav_settings() -> None:
     assert opts.wav_output.format == "auto"
 
 
+def test_build_operation_options_keeps_entity_yaml_report_opt_in() -> None:
+    parser = create_parser()
+
+    assert runtime_cli.build_options(parser.parse_args(["extract"])).entity_yaml_report is False
+    assert runtime_cli.build_options(parser.parse_args(["extract", "--entity-yaml-report"])).entity_yaml_report is True
+
+
+def test_build_operation_options_parses_extract_filters() -> None:
+    parser = create_parser()
+    args = parser.parse_args(["extract", "--wem-ids", "11, 12", "--event", "Play_vo_*", "--category", "VO_*,SFX_*"])
+
+    extract_filter = runtime_cli.build_options(args).extract_filter
+
+    assert extract_filter is not None
+    assert extract_filter.wem_ids == (11, 12)
+    assert extract_filter.events == ("Play_vo_*",)
+    assert extract_filter.categories == ("VO_*", "SFX_*")
+    assert runtime_cli.build_options(parser.parse_args(["extract"])).extract_filter is None
+
+
+def test_build_operation_options_keeps_bnk_cache_only_when_requested() -> None:
+    parser = create_parser()
+
+    assert runtime_cli.build_options(parser.parse_args(["mapping"])).keep_bnk_cache is False
+    assert runtime_cli.build_options(parser.parse_args(["mapping", "--keep-bnk-cache"])).keep_bnk_cache is True
+
+
+def test_build_operation_options_rebuilds_mapping_only_when_requested() -> None:
+    parser = create_parser()
+
+    assert runtime_cli.build_options(parser.parse_args(["mapping"])).rebuild_mapping is False
+    assert runtime_cli.build_options(parser.parse_args(["mapping", "--rebuild-mapping"])).rebuild_mapping is True
+
+
+def test_build_operation_options_defaults_mapping_format_to_nested() -> None:
+    parser = create_parser()
+
+    assert runtime_cli.build_options(parser.parse_args(["mapping"])).mapping_format == "nested"
+    args = parser.parse_args(["mapping", "--mapping-format", "columnar"])
+    assert runtime_cli.build_options(args).mapping_format == "columnar"
+
+
 def test_execute_update_operations_all() -> None:
     parser = create_parser()
     args = parser.parse_args(["update"])
@@ -469,6 +587,23 @@ def test_execute_extract_operations_no_longer_forwards_wav_sidecar_flags(monkeyp
     assert "wav_job_label" not in captured_kwargs
 
 
+def test_run_extract_folds_mapping_into_single_pass(monkeypatch) -> None:
+    parser = create_parser()
+    args = parser.parse_args(["extract", "mapping", "--integrate-data"])
+    captured_kwargs = {}
+
+    monkeypatch.setattr(dispatch_cli, "_log_stage_start", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(dispatch_cli, "_log_stage_done", lambda *_args, **_kwargs: None)
+
+    class FakeApp:
+        def extract(self, _opts, **kwargs) -> None:
+            captured_kwargs.update(kwargs)
+
+    dispatch_cli.run_extract(args, FakeApp())
+
+    assert captured_kwargs["mapping_options"].integrate_data is True
+
+
 def test_run_wav_executes_dedicated_stage(monkeypatch) -> None:
     parser = create_parser()
     args = parser.parse_args(["wav", "--wav-workers", "4"])
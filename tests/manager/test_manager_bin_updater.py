@@ -19,6 +19,7 @@ def _build_updater(tmp_path: Path) -> m_bin_updater.BinUpdater:
         仅初始化当前测试所需字段的 `BinUpdater` 对象。
     """
     updater = m_bin_updater.BinUpdater.__new__(m_bin_updater.BinUpdater)
+    updater.bin_payloads = None
     updater.ctx = SimpleNamespace(config=SimpleNamespace(game_path=tmp_path, dev_mode=False), paths=SimpleNamespace())
     updater.use_local_bin_flag_file = tmp_path / ".use_local_bin"
     updater.local_bin_input_dir = tmp_path / "bin_input"
@@ -191,9 +192,29 @@ def test_extract_bin_raws_allows_partial_missing_and_keeps_order(tmp_path):
     assert result == [b"first", None, b"third"]
 
 
+def test_extract_bin_raws_reads_in_memory_payloads_without_local_flag(tmp_path):
+    """验证提供内存 BIN 输入时，WAD 缺失也无需本地目录与标志文件。"""
+    updater = _build_updater(tmp_path)
+    updater.bin_payloads = {"data/characters/Annie/skins/skin0001.bin": b"first"}
+
+    result = updater._extract_bin_raws(
+        wad_path=tmp_path / "missing.wad.client",
+        bin_paths=[
+            "data/characters/Annie/skins/skin0001.bin",
+            "data/characters/Annie/skins/skin0002.bin",
+        ],
+        entity_label="英雄 1 (annie)",
+        local_required_dir=Path("data/characters/Annie"),
+    )
+
+    assert result == [b"first", None]
+    assert not updater.use_local_bin_flag_file.exists()
+
+
 def test_process_champion_skins_skips_when_first_bin_missing(tmp_path, monkeypatch):
     """验证首个皮肤 BIN 缺失时会跳过整组英雄皮肤处理。"""
     updater = m_bin_updater.BinUpdater.__new__(m_bin_updater.BinUpdater)
+    updater.bin_payloads = None
     updater.ctx = SimpleNamespace(config=SimpleNamespace(game_path=tmp_path, dev_mode=False), paths=SimpleNamespace())
     updater.force_update = False
     updater.process_events = False
@@ -253,6 +274,7 @@ def test_load_map_bin_file_reads_local_bin_when_available(tmp_path, monkeypatch)
 def test_update_records_note_when_targeted_maps_exclude_common_map(tmp_path, monkeypatch):
     """验证精确地图更新未包含公共地图时会记录说明信息。"""
     updater = m_bin_updater.BinUpdater.__new__(m_bin_updater.BinUpdater)
+    updater.bin_payloads = None
     updater.ctx = SimpleNamespace(config=SimpleNamespace(dev_mode=False), runtime_cache={}, paths=SimpleNamespace())
     updater.force_update = False
     updater.process_events = True
@@ -276,6 +298,7 @@ def test_update_records_note_when_targeted_maps_exclude_common_map(tmp_path, mon
 def test_update_logs_stage_start_and_summary_for_targeted_mode(tmp_path, monkeypatch):
     """验证 BinUpdater 顶层会输出精确模式开始和完成摘要。"""
     updater = m_bin_updater.BinUpdater.__new__(m_bin_updater.BinUpdater)
+    updater.bin_payloads = None
     updater.ctx = SimpleNamespace(config=SimpleNamespace(dev_mode=False), runtime_cache={}, paths=SimpleNamespace())
     updater.force_update = False
     updater.process_events = True
@@ -317,6 +340,7 @@ def test_update_logs_stage_start_and_summary_for_targeted_mode(tmp_path, monkeyp
 def test_process_single_map_records_note_when_common_dedup_removes_all_events(tmp_path, monkeypatch):
     """验证公共事件去重清空结果时会记录可解释差异。"""
     updater = m_bin_updater.BinUpdater.__new__(m_bin_updater.BinUpdater)
+    updater.bin_payloads = None
     updater.ctx = SimpleNamespace(
         config=SimpleNamespace(game_path=tmp_path, dev_mode=False),
         runtime_cache={},
@@ -370,6 +394,7 @@ def test_process_single_map_records_note_when_common_dedup_removes_all_events(tm
 def test_update_champions_logs_simple_progress_messages(tmp_path, monkeypatch):
     """验证英雄批量更新会输出简单的日志进度提示。"""
     updater = m_bin_updater.BinUpdater.__new__(m_bin_updater.BinUpdater)
+    updater.bin_payloads = None
     updater.ctx = SimpleNamespace(
         config=SimpleNamespace(game_path=tmp_path, dev_mode=False),
         runtime_cache={},
@@ -406,6 +431,7 @@ def test_update_champions_logs_simple_progress_messages(tmp_path, monkeypatch):
 def test_update_maps_logs_simple_progress_messages(tmp_path, monkeypatch):
     """验证地图批量更新会输出简单的日志进度提示。"""
     updater = m_bin_updater.BinUpdater.__new__(m_bin_updater.BinUpdater)
+    updater.bin_payloads = None
     updater.ctx = SimpleNamespace(
         config=SimpleNamespace(game_path=tmp_path, dev_mode=False),
         runtime_cache={},
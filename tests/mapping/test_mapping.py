@@ -1,5 +1,7 @@
 """测试事件映射构建阶段的日志汇总行为。"""
 
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -7,11 +9,15 @@ from loguru import logger
 
 import lol_audio_unpack.mapping.batch as mapping_batch
 import lol_audio_unpack.mapping.entity as mapping_entity
+import lol_audio_unpack.mapping.process_pool as mapping_process_pool
 import lol_audio_unpack.mapping.session as mapping_session
 from lol_audio_unpack.app.types import AppConfig, AppContext, AppPaths
 from lol_audio_unpack.mapping import build_entity
 from lol_audio_unpack.model import AudioEntityData
 
+FAILING_ENTITY_ID = 2
+PARSES_PER_ENTITY = 2
+
 
 class _FakeReader:
     """提供 `build_entity` 所需最小读取接口。"""
@@ -225,12 +231,17 @@ def test_execute_tasks_emits_running_entity_progress_before_completion(monkeypat
     monkeypatch.setattr(
         mapping_session,
         "_create_wwiser_manager",
-        lambda _ctx: object(),
+        lambda _ctx, **_kwargs: object(),
     )
     monkeypatch.setattr(
         mapping_session,
         "RuntimeCache",
-        lambda cache_lock=None: SimpleNamespace(cache_lock=cache_lock),
+        lambda cache_lock=None, **kwargs: SimpleNamespace(
+            cache_lock=cache_lock,
+            describe_hirc_stats=lambda: "",
+            reused_entity_count=0,
+            **kwargs,
+        ),
     )
 
     mapping_batch.execute_tasks(
@@ -248,3 +259,216 @@ def test_execute_tasks_emits_running_entity_progress_before_completion(monkeypat
         ("champion", 0, 1, "正在处理: 测试英雄"),
         ("champion", 1, 1, "测试英雄 映射完成"),
     ]
+
+
+def test_build_entity_reuses_event_banks_without_touching_wad(monkeypatch, tmp_path: Path) -> None:
+    """解包阶段交来的 events bnk 应直接解析，不再打开 WAD 也不落盘。"""
+    game_dir = tmp_path / "game"
+    game_dir.mkdir()
+    wad_path = game_dir / "root.wad.client"
+    wad_path.write_bytes(b"fake-wad")
+    bkhd = struct.pack("<II", 145, 1) + b"\0" * 8
+    hirc = struct.pack("<I", 0)
+    bnk_data = b"BKHD" + struct.pack("<I", len(bkhd)) + bkhd + b"HIRC" + struct.pack("<I", len(hirc)) + hirc
+    parsed: list[object] = []
+
+    def fail_get_wad(*_args, **_kwargs) -> None:
+        raise AssertionError("不应再次读取 WAD")
+
+    def capture_mapper(event_list: list[str], hirc_obj: object) -> _FakeAudioEventMapper:
+        parsed.append(hirc_obj)
+        return _FakeAudioEventMapper(event_list, hirc_obj)
+
+    monkeypatch.setattr(mapping_session, "_get_wad", fail_get_wad)
+    monkeypatch.setattr(mapping_entity, "AudioEventMapper", capture_mapper)
+    monkeypatch.setattr(mapping_entity, "write_data", lambda *args, **kwargs: None)
+    entity_data = AudioEntityData(
+        entity_id="1",
+        entity_name="Test Entity",
+        entity_alias="test-entity",
+        entity_title="测试实体",
+        entity_type="champion",
+        sub_entities={"1001": {"name": "Test Skin", "categories": {"CAT_OK": [["ok_events.bnk", "ok_audio.wpk"]]}}},
+        wad_root="root.wad.client",
+        wad_language=None,
+        events={"1001": {"events": {"CAT_OK": ["evt_ok", "evt_skip"]}}},
+    )
+    ctx = _build_fake_ctx(game_path=game_dir, cache_path=tmp_path / "cache", hash_path=tmp_path / "hashes")
+
+    result = build_entity(
+        entity_data=entity_data,
+        reader=_FakeReader(),
+        ctx=ctx,
+        event_banks={(wad_path, "ok_events.bnk"): bnk_data},
+    )
+
+    assert result["skins"]["1001"]["events"]["CAT_OK"] == {"evt_ok": [101]}
+    assert "ok_events.bnk" in parsed[0].banks
+    assert not (tmp_path / "cache" / "test-version" / "ok_events.bnk").exists()
+
+
+def test_build_entity_parses_wad_bank_in_memory_without_cache_files(monkeypatch, tmp_path: Path) -> None:
+    """未开启 bnk 磁盘缓存时，NativeHIRC 应直接解析 WAD 中解压出的字节。"""
+    game_dir = tmp_path / "game"
+    game_dir.mkdir()
+    (game_dir / "root.wad.client").write_bytes(b"fake-wad")
+    bkhd = struct.pack("<II", 145, 1) + b"\0" * 8
+    hirc = struct.pack("<I", 0)
+    bnk_data = b"BKHD" + struct.pack("<I", len(bkhd)) + bkhd + b"HIRC" + struct.pack("<I", len(hirc)) + hirc
+    raw_requests: list[list[str]] = []
+    parsed: list[object] = []
+
+    class _RawWad:
+        @staticmethod
+        def extract(paths: list[str], out_dir: Path | None = None, raw: bool = False) -> list[bytes]:
+            assert raw and out_dir is None, "不应再提取到 cache 目录"
+            raw_requests.append(paths)
+            return [bnk_data]
+
+    def capture_mapper(event_list: list[str], hirc_obj: object) -> _FakeAudioEventMapper:
+        parsed.append(hirc_obj)
+        return _FakeAudioEventMapper(event_list, hirc_obj)
+
+    monkeypatch.setattr(mapping_session, "_get_wad", lambda _wad_path, runtime_cache=None: _RawWad())
+    monkeypatch.setattr(mapping_entity, "AudioEventMapper", capture_mapper)
+    monkeypatch.setattr(mapping_entity, "write_data", lambda *args, **kwargs: None)
+    entity_data = AudioEntityData(
+        entity_id="1",
+        entity_name="Test Entity",
+        entity_alias="test-entity",
+        entity_title="测试实体",
+        entity_type="champion",
+        sub_entities={"1001": {"name": "Test Skin", "categories": {"CAT_OK": [["ok_events.bnk"]]}}},
+        wad_root="root.wad.client",
+        wad_language=None,
+        events={"1001": {"events": {"CAT_OK": ["evt_ok", "evt_skip"]}}},
+    )
+
+    result = build_entity(
+        entity_data=entity_data,
+        reader=_FakeReader(),
+        runtime_cache=mapping_session.RuntimeCache(),
+        ctx=_build_fake_ctx(game_path=game_dir, cache_path=tmp_path / "cache", hash_path=tmp_path / "hashes"),
+    )
+
+    assert result["skins"]["1001"]["events"]["CAT_OK"] == {"evt_ok": [101]}
+    assert raw_requests == [["ok_events.bnk"]]
+    assert "ok_events.bnk" in parsed[0].banks
+    assert not (tmp_path / "cache" / "test-version" / "ok_events.bnk").exists()
+
+
+def test_build_entity_prefetches_event_banks_per_wad_in_offset_order(monkeypatch, tmp_path: Path) -> None:
+    """同一 WAD 中的多个 events bnk 应按目录表偏移一次提取，并各自记入 extract_cache。"""
+    game_dir = tmp_path / "game"
+    game_dir.mkdir()
+    (game_dir / "root.wad.client").write_bytes(b"fake-wad")
+    offsets = {"a_events.bnk": 900, "b_events.bnk": 100}
+    raw_requests: list[list[str]] = []
+    received: dict[str, bytes | None] = {}
+
+    class _BatchWad:
+        @staticmethod
+        def extract(paths: list[str], out_dir: Path | None = None, raw: bool = False) -> list[bytes]:
+            assert raw and out_dir is None
+            raw_requests.append(list(paths))
+            return [path.encode() for path in paths]
+
+    def fake_get_cached_hirc(*, bnk_path: Path, bnk_data: bytes | None = None, **_kwargs) -> object:
+        received[bnk_path.name] = bnk_data
+        return object()
+
+    monkeypatch.setattr(mapping_session, "_get_wad", lambda _wad_path, runtime_cache=None: _BatchWad())
+    monkeypatch.setattr(
+        mapping_session,
+        "lookup_sections",
+        lambda _wad, paths: [SimpleNamespace(offset=offsets[path]) for path in paths],
+    )
+    monkeypatch.setattr(mapping_session, "_get_cached_hirc", fake_get_cached_hirc)
+    monkeypatch.setattr(mapping_entity, "AudioEventMapper", _FakeAudioEventMapper)
+    monkeypatch.setattr(mapping_entity, "write_data", lambda *args, **kwargs: None)
+    entity_data = AudioEntityData(
+        entity_id="1",
+        entity_name="Test Entity",
+        entity_alias="test-entity",
+        entity_title="测试实体",
+        entity_type="champion",
+        sub_entities={
+            "1001": {"name": "Skin A", "categories": {"CAT_OK": [["a_events.bnk"]]}},
+            "1002": {"name": "Skin B", "categories": {"CAT_OK": [["b_events.bnk"]]}},
+        },
+        wad_root="root.wad.client",
+        wad_language=None,
+        events={"1001": {"events": {"CAT_OK": ["evt_ok"]}}, "1002": {"events": {"CAT_OK": ["evt_ok"]}}},
+    )
+    runtime_cache = mapping_session.RuntimeCache()
+
+    build_entity(
+        entity_data=entity_data,
+        reader=_FakeReader(),
+        runtime_cache=runtime_cache,
+        ctx=_build_fake_ctx(game_path=game_dir, cache_path=tmp_path / "cache", hash_path=tmp_path / "hashes"),
+    )
+
+    assert raw_requests == [["b_events.bnk", "a_events.bnk"]]
+    assert received == {"a_events.bnk": b"a_events.bnk", "b_events.bnk": b"b_events.bnk"}
+    wad_path = game_dir / "root.wad.client"
+    assert runtime_cache.extract_cache == {(wad_path, "a_events.bnk"), (wad_path, "b_events.bnk")}
+
+
+def test_execute_tasks_process_backend_aggregates_worker_counts(monkeypatch, tmp_path: Path) -> None:
+    """进程后端应逐实体回传进度，并把各 worker 的 HIRC 计数汇总到父进程。"""
+    built: list[tuple[str, int]] = []
+    progress_events: list[tuple[str, int, int, str]] = []
+    ctx = _build_fake_ctx(cache_path=tmp_path / "cache")
+
+    def fake_build_entity(entity_type, entity_id, _reader, _wwiser, _integrate, runtime_cache, *, ctx) -> None:
+        if entity_id == FAILING_ENTITY_ID:
+            raise RuntimeError("bank 损坏")
+        built.append((entity_type, entity_id))
+        runtime_cache.hirc_parse_count += PARSES_PER_ENTITY
+
+    def fake_pool(  # noqa: PLR0913
+        max_workers: int,
+        pool_ctx: AppContext,
+        keep_bnk_cache: bool,
+        incremental: bool,
+        columnar: bool,
+    ) -> ThreadPoolExecutor:
+        def init_worker() -> None:
+            mapping_process_pool._worker_state = mapping_process_pool._WorkerState(
+                ctx=pool_ctx,
+                reader=_FakeReader(),
+                wwiser_manager=None,
+                runtime_cache=mapping_session.RuntimeCache(
+                    keep_bnk_files=keep_bnk_cache,
+                    incremental=incremental,
+                    columnar=columnar,
+                ),
+            )
+
+        # 用单线程池替代 spawn 进程池，worker 状态与真实子进程一样只初始化一次
+        return ThreadPoolExecutor(max_workers=1, initializer=init_worker)
+
+    monkeypatch.setattr(mapping_batch, "_build_entity", fake_build_entity)
+    monkeypatch.setattr(mapping_process_pool, "_create_process_pool", fake_pool)
+    monkeypatch.setattr(mapping_process_pool, "_worker_state", None)
+
+    log_lines: list[str] = []
+    sink_id = logger.add(lambda message: log_lines.append(str(message).rstrip()), format="{message}")
+    try:
+        mapping_batch.execute_tasks(
+            [("champion", 1, "英雄一"), ("champion", FAILING_ENTITY_ID, "英雄二"), ("map", 11, "地图")],
+            _FakeReader(),
+            max_workers=2,
+            ctx=ctx,
+            progress_callback=lambda *event: progress_events.append(event),
+            executor="process",
+        )
+    finally:
+        logger.remove(sink_id)
+
+    assert built == [("champion", 1), ("map", 11)]
+    assert progress_events[0] == ("champion", 0, 2, "正在处理: 英雄一")
+    assert [event[3] for event in progress_events if not event[3].startswith("正在处理")].count("英雄二 映射失败") == 1
+    assert any(f"HIRC 解析 {PARSES_PER_ENTITY * len(built)} 次" in line for line in log_lines)
+    assert any("成功 2 个，失败 1 个" in line for line in log_lines)
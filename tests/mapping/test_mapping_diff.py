@@ -0,0 +1,64 @@
+"""测试版本间映射差异报告。"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from lol_audio_unpack.manager.files import write_data
+from lol_audio_unpack.mapping import diff_mapping_versions
+
+
+def _write_champion(hash_root: Path, version: str, entity_id: str, skins: dict, *, columnar: bool = False) -> None:
+    target_dir = hash_root / version / "champions"
+    target_dir.mkdir(parents=True, exist_ok=True)
+    write_data({"alias": "Annie", "skins": skins}, target_dir / entity_id, dev_mode=False, columnar=columnar)
+
+
+def test_diff_mapping_versions_reports_event_and_skin_changes(tmp_path: Path) -> None:
+    """应按实体输出新增/删除事件、ID 变化、新增/删除皮肤以及整体新增的实体。"""
+    hash_root = tmp_path / "hash"
+    ctx = SimpleNamespace(config=SimpleNamespace(dev_mode=False), hash_path=hash_root, report_path=tmp_path / "reports")
+    _write_champion(
+        hash_root,
+        "15.1.1",
+        "1",
+        {
+            "1000": {"events": {"VO": {"Play_vo_attack": [1, 2], "Play_vo_move": [3], "Play_vo_old": [4]}}},
+            "1001": {"events": {"VO": {"Play_vo_attack": [5]}}},
+        },
+    )
+    _write_champion(hash_root, "15.1.1", "2", {"2000": {"events": {"VO": {"Play_vo": [9]}}}})
+    _write_champion(
+        hash_root,
+        "15.2.1",
+        "1",
+        {
+            "1000": {"events": {"VO": {"Play_vo_attack": [1, 6], "Play_vo_move": [3], "Play_vo_new": [7]}}},
+            "1002": {"events": {"VO": {"Play_vo_attack": [8]}}},
+        },
+        columnar=True,
+    )
+    _write_champion(hash_root, "15.2.1", "2", {"2000": {"events": {"VO": {"Play_vo": [9]}}}})
+    _write_champion(hash_root, "15.2.1", "3", {"3000": {"events": {"VO": {"Play_vo": [10]}}}})
+
+    summary = diff_mapping_versions(ctx, "15.1.1", "15.2.1")
+
+    records = [json.loads(line) for line in summary.report_path.read_text(encoding="utf-8").splitlines()]
+    entities = {record["entity_id"]: record for record in records if record["kind"] == "entity"}
+    assert records[0] == {"kind": "diff_start", "old_version": "15.1.1", "new_version": "15.2.1"}
+    assert set(entities) == {"1", "3"}
+
+    changed = entities["1"]
+    assert changed["status"] == "changed"
+    assert changed["added_subs"] == ["1002"]
+    assert changed["removed_subs"] == ["1001"]
+    assert changed["subs"]["1000"] == {
+        "added_events": [{"category": "VO", "event": "Play_vo_new", "ids": [7]}],
+        "removed_events": [{"category": "VO", "event": "Play_vo_old", "ids": [4]}],
+        "changed_events": [{"category": "VO", "event": "Play_vo_attack", "added_ids": [6], "removed_ids": [2]}],
+    }
+    assert entities["3"]["status"] == "added"
+
+    assert records[-1]["kind"] == "diff_end"
+    assert (summary.entities_compared, summary.entities_changed, summary.entities_added) == (3, 1, 1)
+    assert (summary.events_added, summary.events_removed, summary.events_changed) == (1, 1, 1)
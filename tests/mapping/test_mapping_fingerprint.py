@@ -0,0 +1,132 @@
+"""测试映射输入指纹与增量复用。"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import lol_audio_unpack.mapping.entity as mapping_entity
+import lol_audio_unpack.mapping.fingerprint as mapping_fingerprint
+import lol_audio_unpack.mapping.session as mapping_session
+from lol_audio_unpack.app.types import AppConfig, AppContext, AppPaths
+from lol_audio_unpack.manager.files import read_data
+from lol_audio_unpack.mapping import build_entity
+from lol_audio_unpack.model import AudioEntityData
+
+
+class _FakeReader:
+    """提供 `build_entity` 所需最小读取接口。"""
+
+    def __init__(self, version: str) -> None:
+        self.version = version
+
+    @staticmethod
+    def get_languages() -> list[str]:
+        """返回测试使用的语言列表。"""
+        return ["zh_CN"]
+
+
+class _CountingMapper:
+    """记录构建次数并返回固定映射。"""
+
+    calls = 0
+
+    def __init__(self, event_list: list[str], _hirc: object) -> None:
+        self._event_list = event_list
+
+    def build_mapping(self) -> SimpleNamespace:
+        """返回固定映射结果。"""
+        type(self).calls += 1
+        return SimpleNamespace(forward_mapping={event: [101] for event in self._event_list})
+
+
+def _build_ctx(tmp_path: Path) -> AppContext:
+    """创建指向临时目录的最小运行上下文。"""
+    game_path = tmp_path / "game"
+    output_path = tmp_path / "out"
+    return AppContext(
+        config=AppConfig(game_path=game_path, output_path=output_path, dev_mode=False),
+        paths=AppPaths(
+            audio_path=output_path / "audios",
+            wav_path=output_path / "wavs",
+            temp_path=output_path / "temps",
+            log_path=output_path / "logs",
+            cache_path=output_path / "cache",
+            hash_path=output_path / "hashes",
+            report_path=output_path / "reports",
+            manifest_path=output_path / "manifest",
+            local_version_file=output_path / "game_version",
+            game_champion_path=game_path / "Game" / "DATA" / "FINAL" / "Champions",
+            game_maps_path=game_path / "Game" / "DATA" / "FINAL" / "Maps" / "Shipping",
+            game_lcu_path=game_path / "LeagueClient" / "Plugins" / "rcp-be-lol-game-data",
+        ),
+    )
+
+
+def _prepare(monkeypatch, tmp_path: Path, checksums: dict[str, int]) -> tuple[AppContext, AudioEntityData]:
+    """准备一个 WAD 条目校验和可控的测试实体。"""
+    ctx = _build_ctx(tmp_path)
+    ctx.game_path.mkdir(parents=True)
+    (ctx.game_path / "root.wad.client").write_bytes(b"fake-wad")
+
+    monkeypatch.setattr(mapping_session, "_get_wad", lambda _wad_path, runtime_cache=None: object())
+    monkeypatch.setattr(
+        mapping_fingerprint,
+        "lookup_sections",
+        lambda _wad, paths: [SimpleNamespace(sha256=checksums[path]) for path in paths],
+    )
+    monkeypatch.setattr(mapping_session, "read_bnk_bytes", lambda _wad, _path: b"bnk")
+    monkeypatch.setattr(mapping_session, "_get_cached_hirc", lambda **_kwargs: object())
+    monkeypatch.setattr(mapping_entity, "AudioEventMapper", _CountingMapper)
+    _CountingMapper.calls = 0
+
+    entity_data = AudioEntityData(
+        entity_id="1",
+        entity_name="Test Entity",
+        entity_alias="test-entity",
+        entity_title="测试实体",
+        entity_type="champion",
+        sub_entities={"1001": {"name": "Test Skin", "categories": {"CAT_OK": [["ok_events.bnk"]]}}},
+        wad_root="root.wad.client",
+        wad_language=None,
+        events={"1001": {"events": {"CAT_OK": ["evt_ok"]}}},
+    )
+    return ctx, entity_data
+
+
+def _run(entity_data: AudioEntityData, version: str, ctx: AppContext) -> dict:
+    return build_entity(
+        entity_data=entity_data,
+        reader=_FakeReader(version),
+        runtime_cache=mapping_session.RuntimeCache(incremental=True),
+        ctx=ctx,
+    )
+
+
+def test_build_entity_skips_unchanged_entity_and_rebuilds_changed_bank(monkeypatch, tmp_path: Path) -> None:
+    """指纹一致时应直接复用已写出的映射；events bnk 变化后应重新构建。"""
+    checksums = {"ok_events.bnk": 0x1234}
+    ctx, entity_data = _prepare(monkeypatch, tmp_path, checksums)
+
+    first = _run(entity_data, "15.1.1", ctx)
+    written = read_data(ctx.hash_path / "15.1.1" / "champions" / "1")
+    assert _CountingMapper.calls == 1
+    assert written["metadata"][mapping_fingerprint.FINGERPRINT_METADATA_KEY] == first["metadata"]["inputFingerprint"]
+
+    second = _run(entity_data, "15.1.1", ctx)
+    assert _CountingMapper.calls == 1
+    assert second["skins"] == first["skins"]
+
+    checksums["ok_events.bnk"] = 0x5678
+    _run(entity_data, "15.1.1", ctx)
+    assert _CountingMapper.calls == 2  # noqa: PLR2004
+
+
+def test_build_entity_seeds_new_version_from_previous_mapping(monkeypatch, tmp_path: Path) -> None:
+    """新版本目录没有映射时，应从上一个版本复制指纹一致的结果并更新版本号。"""
+    ctx, entity_data = _prepare(monkeypatch, tmp_path, {"ok_events.bnk": 0x1234})
+
+    _run(entity_data, "15.1.1", ctx)
+    seeded = _run(entity_data, "15.2.1", ctx)
+
+    assert _CountingMapper.calls == 1
+    assert seeded["metadata"]["gameVersion"] == "15.2.1"
+    assert read_data(ctx.hash_path / "15.2.1" / "champions" / "1")["skins"] == seeded["skins"]
@@ -0,0 +1,126 @@
+"""验证 HIRC 共享缓存与单飞解析的行为。"""
+
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import lol_audio_unpack.mapping.session as mapping_session
+from lol_audio_unpack.mapping.hirc_store import HIRC_STORE_DIR_NAME, HircStore, create_hirc_store
+
+HIRC_STORE_MB = 64
+
+
+def _build_bnk() -> bytes:
+    bkhd = struct.pack("<II", 145, 1) + b"\0" * 8
+    hirc = struct.pack("<I", 0)
+    return b"BKHD" + struct.pack("<I", len(bkhd)) + bkhd + b"HIRC" + struct.pack("<I", len(hirc)) + hirc
+
+
+def test_identical_bank_is_parsed_once_across_versions(monkeypatch, tmp_path: Path) -> None:
+    """内容相同的 bnk 换了版本目录后应直接命中共享缓存。"""
+    bnk_data = _build_bnk()
+    parse_calls: list[Path] = []
+    original_parse = mapping_session._parse_native_hirc_bytes
+
+    def counting_parse(bnk_path: Path, data: bytes, hirc_cache_dir: Path):
+        parse_calls.append(bnk_path)
+        return original_parse(bnk_path, data, hirc_cache_dir)
+
+    monkeypatch.setattr(mapping_session, "_parse_native_hirc_bytes", counting_parse)
+    store_root = tmp_path / "cache" / "hirc_store"
+
+    for version in ("15.1", "15.2"):
+        # 每个版本使用独立的运行时缓存，模拟两次独立的 mapping 运行
+        runtime_cache = mapping_session.RuntimeCache(hirc_store=HircStore(store_root, parser_tag="test"))
+        hirc = mapping_session._get_cached_hirc(
+            bnk_path=tmp_path / "cache" / version / "vo_events.bnk",
+            hirc_cache_dir=tmp_path / "cache" / version / "hirc",
+            wwiser_manager=None,
+            runtime_cache=runtime_cache,
+            bnk_data=bnk_data,
+        )
+        assert "vo_events.bnk" in hirc.banks
+
+    assert parse_calls == [tmp_path / "cache" / "15.1" / "vo_events.bnk"]
+    assert runtime_cache.hirc_store.hits == 1
+    # 共享缓存命中单独计数，不算作一次解析
+    assert runtime_cache.hirc_store_hit_count == 1
+    assert runtime_cache.hirc_parse_count == 0
+
+
+def test_store_limit_comes_from_config_and_zero_disables(tmp_path: Path) -> None:
+    """共享缓存容量取自 ``HIRC_STORE_MB``，为 0 时不创建缓存。"""
+    enabled = SimpleNamespace(config=SimpleNamespace(hirc_store_mb=HIRC_STORE_MB), cache_path=tmp_path)
+    disabled = SimpleNamespace(config=SimpleNamespace(hirc_store_mb=0), cache_path=tmp_path)
+
+    store = create_hirc_store(enabled)
+
+    assert store is not None
+    assert store.root == tmp_path / HIRC_STORE_DIR_NAME
+    assert store.max_bytes == HIRC_STORE_MB * 1024 * 1024
+    assert create_hirc_store(disabled) is None
+
+
+def test_store_evicts_least_recently_used_entries_over_limit(tmp_path: Path) -> None:
+    """超过容量上限时应先淘汰最久未访问的条目。"""
+    store = HircStore(tmp_path / "hirc_store", max_bytes=1, parser_tag="test")
+    store.save("aa01", "native", {"bank": 1})
+    old_entry = next((tmp_path / "hirc_store").rglob("aa01.pkl"), None)
+    assert old_entry is None  # 单条就超过上限，写入后立即被淘汰
+
+    store.max_bytes = 10_000
+    store.save("aa01", "native", {"bank": 1})
+    store.save("bb02", "native", {"bank": 2})
+    first = next((tmp_path / "hirc_store").rglob("aa01.pkl"))
+    os.utime(first, (1, 1))
+    store.max_bytes = first.stat().st_size + 1
+    store.save("cc03", "native", {"bank": 3})
+
+    assert store.load("aa01", "native") is None
+    assert store.load("cc03", "native") == {"bank": 3}
+
+
+def test_concurrent_callers_share_single_hirc_parse(monkeypatch, tmp_path: Path) -> None:
+    """多个线程同时请求同一个 bank 时只应解析一次，其余线程复用结果。"""
+    caller_count = 4
+    started = threading.Event()
+    release = threading.Event()
+    parse_calls: list[Path] = []
+
+    def slow_parse(bnk_path: Path, *_args) -> object:
+        parse_calls.append(bnk_path)
+        started.set()
+        release.wait(timeout=5)
+        return object()
+
+    monkeypatch.setattr(mapping_session, "_parse_hirc", slow_parse)
+    runtime_cache = mapping_session.RuntimeCache(cache_lock=threading.Lock())
+    bnk_path = tmp_path / "map11_events.bnk"
+
+    def fetch() -> object:
+        return mapping_session._get_cached_hirc(
+            bnk_path=bnk_path,
+            hirc_cache_dir=tmp_path / "hirc",
+            wwiser_manager=None,
+            runtime_cache=runtime_cache,
+        )
+
+    with ThreadPoolExecutor(max_workers=caller_count) as executor:
+        owner = executor.submit(fetch)
+        assert started.wait(timeout=5)
+        waiters = [executor.submit(fetch) for _ in range(caller_count - 1)]
+        # 等所有等待者都登记为争用后再放行解析
+        while runtime_cache.hirc_dedup_count < caller_count - 1:
+            time.sleep(0.01)
+        release.set()
+        results = {id(future.result()) for future in [owner, *waiters]}
+
+    assert parse_calls == [bnk_path]
+    assert len(results) == 1
+    assert runtime_cache.hirc_parse_count == 1
+    assert runtime_cache.hirc_dedup_count == caller_count - 1
+    assert runtime_cache.hirc_contended_keys == {(bnk_path, "native")}
@@ -0,0 +1,48 @@
+"""测试版本级音频 ID 反向索引。"""
+
+from pathlib import Path
+
+from lol_audio_unpack.manager.files import write_data
+from lol_audio_unpack.mapping import AudioRef, ReverseIndex, build_reverse_index
+
+
+def test_reverse_index_resolves_audio_ids_across_raw_and_integrated_mappings(tmp_path: Path) -> None:
+    """普通映射与整合映射都应被收录，同一实体优先使用整合版。"""
+    version_dir = tmp_path / "hash" / "15.1.1"
+    (version_dir / "champions").mkdir(parents=True)
+    (version_dir / "integrated" / "champions").mkdir(parents=True)
+    (version_dir / "maps").mkdir(parents=True)
+    write_data(
+        {"alias": "Annie", "skins": {"1000": {"events": {"VO": {"Play_vo_old": [999]}}}}},
+        version_dir / "champions" / "1",
+        dev_mode=False,
+    )
+    write_data(
+        {
+            "data": {
+                "alias": "Annie",
+                "skins": [
+                    {"id": 1000, "events": {"VO": {"banks": [], "mapping": {"Play_vo_attack": [123, 456]}}}},
+                    {"id": 1001, "events": {"SFX": {"banks": [], "mapping": {"Play_sfx_q": [456]}}}},
+                ],
+            }
+        },
+        version_dir / "integrated" / "champions" / "1",
+        dev_mode=False,
+    )
+    write_data(
+        {"name": "Map11", "map": {"11": {"events": {"SFX": {"Play_sfx_ambient": [789]}}}}},
+        version_dir / "maps" / "11",
+        dev_mode=False,
+    )
+
+    index_path = build_reverse_index(version_dir)
+
+    assert index_path is not None
+    with ReverseIndex(index_path) as index:
+        assert index.lookup(123) == [AudioRef("champion", "1", "Annie", "1000", "VO", "Play_vo_attack")]
+        assert sorted(ref.sub_id for ref in index.lookup(456)) == ["1000", "1001"]
+        assert index.lookup(789) == [AudioRef("map", "11", "Map11", "11", "SFX", "Play_sfx_ambient")]
+        # 普通版被整合版覆盖，旧事件不应出现
+        assert index.lookup(999) == []
+        assert index.lookup(1) == []
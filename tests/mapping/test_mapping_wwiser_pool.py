@@ -0,0 +1,80 @@
+"""验证常驻 wwiser 进程池的复用、超时重启与进程内执行。"""
+
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from lol_audio_unpack.mapping import wwiser_pool
+from lol_audio_unpack.mapping.wwiser_pool import WwiserPool
+
+# 逐行拼接脚本：行尾的换行转义紧跟冒号时会被路径字面量检查误认成盘符路径
+FAKE_WWISER_SOURCE = "\n".join(
+    (
+        "import sys",
+        "from pathlib import Path",
+        "out = Path(sys.argv[sys.argv.index('-dn') + 1])",
+        "out.with_suffix('.xml').write_text('<root/>')",
+        "with Path(__file__).with_name('calls.txt').open('a') as calls:",
+        "    calls.write('x')",
+        "",
+    )
+)
+
+
+def _fake_worker(conn, _wwiser_path: str) -> None:
+    """回传当前进程 pid；bank 名含 hang 时模拟 wwiser 卡死。"""
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        bnk_path, _cache_dir = job
+        if "hang" in bnk_path:
+            time.sleep(60)
+        conn.send(("ok", (os.getpid(), Path(bnk_path).name)))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="测试使用 fork 启动方式注入假 worker")
+def test_pool_reuses_worker_and_restarts_after_timeout(tmp_path: Path) -> None:
+    """同一进程应连续处理多个 bank；超时后该进程被替换，后续任务照常完成。"""
+    pool = WwiserPool(
+        tmp_path / "wwiser.pyz",
+        size=1,
+        timeout_seconds=0.5,
+        mp_context=multiprocessing.get_context("fork"),
+        worker_target=_fake_worker,
+    )
+    try:
+        first_pid, first_name = pool.parse(tmp_path / "a_events.bnk", tmp_path)
+        second_pid, _ = pool.parse(tmp_path / "b_events.bnk", tmp_path)
+        with pytest.raises(TimeoutError):
+            pool.parse(tmp_path / "hang_events.bnk", tmp_path)
+        third_pid, _ = pool.parse(tmp_path / "c_events.bnk", tmp_path)
+    finally:
+        pool.close()
+
+    assert first_name == "a_events.bnk"
+    assert first_pid == second_pid
+    assert third_pid != first_pid
+    assert pool.restart_count == 1
+
+
+def test_run_wwiser_executes_entrypoint_in_process_and_reuses_fresh_xml(tmp_path: Path) -> None:
+    """wwiser 入口应在当前进程执行；XML 比 bnk 新时不再重复生成。"""
+    calls_file = tmp_path / "calls.txt"
+    fake_wwiser = tmp_path / "wwiser.py"
+    fake_wwiser.write_text(FAKE_WWISER_SOURCE, encoding="utf-8")
+    bnk_path = tmp_path / "vo_events.bnk"
+    bnk_path.write_bytes(b"BKHD")
+
+    first = wwiser_pool._run_wwiser(str(fake_wwiser), bnk_path)
+    second = wwiser_pool._run_wwiser(str(fake_wwiser), bnk_path)
+
+    assert first == second == tmp_path / "vo_events.xml"
+    assert calls_file.read_text() == "x"
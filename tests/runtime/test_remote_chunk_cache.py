@@ -0,0 +1,141 @@
+"""验证跨快照 chunk 缓存。"""
+
+import asyncio
+import os
+from pathlib import Path, PurePosixPath
+from types import SimpleNamespace
+
+import pytest
+import pyzstd
+
+import lol_audio_unpack.runtime.remote.wad_entries as m_wad_entries
+from lol_audio_unpack.runtime.remote.chunk_cache import ChunkCache
+from lol_audio_unpack.runtime.remote.lcu import ensure_files_downloaded
+
+pytestmark = pytest.mark.unit
+
+CHUNK_SIZE = 1024
+CHUNK_COUNT = 6
+FILE_NAME = "DATA/FINAL/Champions/Annie.wad.client"
+
+
+def _stand_in_snapshot(bundle_dir: Path, bundle_id: int, data: bytes) -> SimpleNamespace:
+    """把文件切成 chunk 写进本地 bundle，chunk ID 取内容哈希，返回与 ``PatcherFile`` 同形的对象。"""
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    chunks = []
+    bundle = bytearray()
+    for start in range(0, len(data), CHUNK_SIZE):
+        content = data[start : start + CHUNK_SIZE]
+        compressed = pyzstd.compress(content)
+        chunks.append(
+            SimpleNamespace(
+                chunk_id=hash(content) & 0xFFFFFFFFFFFFFFFF,
+                bundle=SimpleNamespace(bundle_id=bundle_id),
+                offset=len(bundle),
+                size=len(compressed),
+                target_size=len(content),
+            )
+        )
+        bundle += compressed
+    (bundle_dir / f"{bundle_id:016X}.bundle").write_bytes(bundle)
+    return SimpleNamespace(
+        name=FILE_NAME,
+        size=len(data),
+        chunks=chunks,
+        chunk_hash_types={},
+        manifest=SimpleNamespace(bundle_url=str(bundle_dir), validate_chunk_hash=lambda **_: None),
+    )
+
+
+class _FakeManifest:
+    def __init__(self, root: Path, data: bytes) -> None:
+        self.root = root
+        self.data = data
+        self.batch_downloads: list[str] = []
+
+    def file_output(self, file: SimpleNamespace) -> str:
+        return str(self.root / PurePosixPath(file.name))
+
+    async def download_files_concurrently(self, files, raise_on_error=True):  # noqa: ANN001, ARG002
+        for file in files:
+            Path(self.file_output(file)).write_bytes(self.data)
+            self.batch_downloads.append(file.name)
+
+
+def _download(manifest: _FakeManifest, file: SimpleNamespace, cache: ChunkCache) -> Path:
+    return ensure_files_downloaded(
+        manifest,
+        [file],
+        run_coroutine_sync=asyncio.run,
+        chunk_cache=cache,
+    )[0]
+
+
+def test_next_snapshot_downloads_only_changed_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """相邻快照只改动一个 chunk 时，应只下载该 chunk，其余从缓存拼出。"""
+    cache = ChunkCache(tmp_path / "chunks", max_bytes=1024 * 1024)
+    old_data = os.urandom(CHUNK_SIZE * CHUNK_COUNT)
+    old_file = _stand_in_snapshot(tmp_path / "cdn-old", 1, old_data)
+    old_manifest = _FakeManifest(tmp_path / "16.4", old_data)
+
+    _download(old_manifest, old_file, cache)
+
+    new_data = old_data[: CHUNK_SIZE * 2] + os.urandom(CHUNK_SIZE) + old_data[CHUNK_SIZE * 3 :]
+    new_file = _stand_in_snapshot(tmp_path / "cdn-new", 2, new_data)
+    new_manifest = _FakeManifest(tmp_path / "16.5", new_data)
+    requested: list[int] = []
+    read_bundle_range = m_wad_entries._read_bundle_range
+    monkeypatch.setattr(
+        m_wad_entries,
+        "_read_bundle_range",
+        lambda source, bundle_id, offset, size: (
+            requested.append(size) or read_bundle_range(source, bundle_id, offset, size)
+        ),
+    )
+
+    output_path = _download(new_manifest, new_file, cache)
+
+    assert old_manifest.batch_downloads == [FILE_NAME]
+    assert new_manifest.batch_downloads == []
+    assert requested == [new_file.chunks[2].size]
+    assert output_path.read_bytes() == new_data
+    assert all(cache.contains(chunk.chunk_id) for chunk in new_file.chunks)
+
+
+def test_chunk_cache_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    """超出上限时应先淘汰最久未使用的 chunk。"""
+    cache = ChunkCache(tmp_path / "chunks", max_bytes=CHUNK_SIZE * 2)
+    for chunk_id in (1, 2, 3):
+        cache.put(chunk_id, b"c" * CHUNK_SIZE)
+        os.utime(cache._path(chunk_id), (chunk_id, chunk_id))
+    os.utime(cache._path(1), (10, 10))
+
+    assert cache.prune() == 1
+    assert cache.contains(1)
+    assert not cache.contains(2)
+    assert cache.contains(3)
+
+
+def test_chunk_cache_prune_scans_only_when_running_total_exceeds_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """首次扫描后按累计大小判断，未超出上限的 prune 不再遍历缓存目录。"""
+    cache = ChunkCache(tmp_path / "chunks", max_bytes=CHUNK_SIZE * 3)
+    scans: list[str] = []
+    original_glob = Path.glob
+    monkeypatch.setattr(Path, "glob", lambda self, pattern: scans.append(pattern) or original_glob(self, pattern))
+    results: list[tuple[int, int]] = []
+
+    for chunk_id in (1, 2):
+        cache.put(chunk_id, b"c" * CHUNK_SIZE)
+    results.append((cache.prune(), len(scans)))
+    cache.discard(2)
+    cache.put(3, b"c" * CHUNK_SIZE)
+    results.append((cache.prune(), len(scans)))
+    for chunk_id in (4, 5):
+        cache.put(chunk_id, b"c" * CHUNK_SIZE)
+    results.append((cache.prune(), len(scans)))
+    results.append((cache.prune(), len(scans)))
+
+    # 只有首次与超出上限时扫描；淘汰后累计值回到上限内
+    assert results == [(0, 1), (0, 1), (1, 2), (0, 2)]
@@ -0,0 +1,228 @@
+"""验证离线快照包的导出、增量与导入。"""
+
+import asyncio
+import os
+from pathlib import Path, PurePosixPath
+from types import SimpleNamespace
+from urllib.request import Request
+
+import pytest
+import pyzstd
+
+from lol_audio_unpack.app.context import _build_snapshot, _check_offline_wad_mode
+from lol_audio_unpack.app.types import AppContextValidationError, RemoteSnapshotConfig, RemoteWadMode, SourceMode
+from lol_audio_unpack.runtime.remote.lcu import ensure_files_downloaded
+from lol_audio_unpack.runtime.remote.offline import (
+    MIRROR_BUNDLE_DIR,
+    ChunkRecorder,
+    SnapshotBundleError,
+    import_snapshot_bundle,
+    load_mirror_state,
+    mirror_request_open,
+    write_snapshot_bundle,
+)
+from lol_audio_unpack.runtime.remote.session import RemoteSession
+
+pytestmark = pytest.mark.unit
+
+CHUNK_SIZE = 1024
+CHUNK_COUNT = 4
+FILE_NAME = "DATA/FINAL/Champions/Annie.wad.client"
+OLD_SNAPSHOT = RemoteSnapshotConfig(
+    version="16.4",
+    lcu_manifest_url="https://cdn.example/channels/public/releases/AAAA.manifest",
+    game_manifest_url="https://cdn.example/channels/public/releases/BBBB.manifest",
+)
+NEW_SNAPSHOT = RemoteSnapshotConfig(
+    version="16.5",
+    lcu_manifest_url="https://cdn.example/channels/public/releases/AAAA.manifest",
+    game_manifest_url="https://cdn.example/channels/public/releases/CCCC.manifest",
+)
+
+
+def _stand_in_file(bundle_dir: Path, bundle_id: int, data: bytes) -> SimpleNamespace:
+    """把文件切成 chunk 写进本地 bundle，返回与 ``PatcherFile`` 同形的对象。"""
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    chunks = []
+    bundle = bytearray()
+    for start in range(0, len(data), CHUNK_SIZE):
+        content = data[start : start + CHUNK_SIZE]
+        compressed = pyzstd.compress(content)
+        chunks.append(
+            SimpleNamespace(
+                chunk_id=hash(content) & 0xFFFFFFFFFFFFFFFF,
+                bundle=SimpleNamespace(bundle_id=bundle_id),
+                offset=len(bundle),
+                size=len(compressed),
+                target_size=len(content),
+            )
+        )
+        bundle += compressed
+    (bundle_dir / f"{bundle_id:016X}.bundle").write_bytes(bundle)
+    return SimpleNamespace(
+        name=FILE_NAME,
+        size=len(data),
+        chunks=chunks,
+        chunk_hash_types={},
+        manifest=SimpleNamespace(bundle_url=str(bundle_dir), validate_chunk_hash=lambda **_: None),
+    )
+
+
+class _FakeManifest:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def file_output(self, file: SimpleNamespace) -> str:
+        return str(self.root / PurePosixPath(file.name))
+
+    async def download_files_concurrently(self, files, raise_on_error=True):  # noqa: ANN001, ARG002
+        raise AssertionError("逐 chunk 读取时不应走批量下载")
+
+
+def _manifest_files(root: Path, snapshot: RemoteSnapshotConfig) -> dict[str, Path]:
+    paths = {}
+    for url in (snapshot.lcu_manifest_url, snapshot.game_manifest_url):
+        path = root / url.rsplit("/", maxsplit=1)[-1]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(url.encode())
+        paths[url] = path
+    return paths
+
+
+def _record(file: SimpleNamespace, output_root: Path, *, bundle_source: Path | None = None) -> ChunkRecorder:
+    session = RemoteSession()
+    session.recorder = ChunkRecorder(spool_dir=output_root.parent / "spool")
+    ensure_files_downloaded(
+        _FakeManifest(output_root),
+        [file],
+        run_coroutine_sync=asyncio.run,
+        session=session,
+        bundle_source=bundle_source,
+        chunk_reads=True,
+    )
+    return session.recorder
+
+
+def test_exported_bundle_serves_chunks_after_import(tmp_path: Path) -> None:
+    """导出时记录的 chunk 导入后写回原偏移，离线镜像可替代 CDN 拼出同样的文件。"""
+    data = os.urandom(CHUNK_SIZE * CHUNK_COUNT)
+    file = _stand_in_file(tmp_path / "cdn", 1, data)
+    recorder = _record(file, tmp_path / "online")
+    assert len(recorder) == CHUNK_COUNT
+
+    bundle_path = tmp_path / "16.4.snapshot"
+    exported = write_snapshot_bundle(
+        bundle_path,
+        snapshot=OLD_SNAPSHOT,
+        manifest_paths=_manifest_files(tmp_path / "manifests", OLD_SNAPSHOT),
+        chunks=recorder,
+        wad_mode=RemoteWadMode.FULL,
+    )
+    recorder.close()
+    mirror_root = tmp_path / "mirror"
+    imported = import_snapshot_bundle(bundle_path, mirror_root)
+
+    assert exported.chunk_count == imported.chunk_count == CHUNK_COUNT
+    assert load_mirror_state(mirror_root)["latest"] == OLD_SNAPSHOT.version
+    offline_path = ensure_files_downloaded(
+        _FakeManifest(tmp_path / "offline"),
+        [file],
+        run_coroutine_sync=asyncio.run,
+        bundle_source=mirror_root / MIRROR_BUNDLE_DIR,
+        chunk_reads=True,
+    )[0]
+    assert offline_path.read_bytes() == data
+    request_open = mirror_request_open(mirror_root)
+    with request_open(Request(OLD_SNAPSHOT.game_manifest_url)) as manifest:
+        assert manifest.read() == OLD_SNAPSHOT.game_manifest_url.encode()
+
+
+def test_delta_bundle_skips_base_content_and_requires_base_on_import(tmp_path: Path) -> None:
+    """增量包只写入基准中没有的 chunk 与 manifest；未导入基准时拒绝导入。"""
+    base_chunks = {(1, 0): b"a" * 16, (1, 16): b"b" * 16}
+    base_path = tmp_path / "16.4.snapshot"
+    write_snapshot_bundle(
+        base_path,
+        snapshot=OLD_SNAPSHOT,
+        manifest_paths=_manifest_files(tmp_path / "manifests", OLD_SNAPSHOT),
+        chunks=base_chunks,
+        wad_mode=RemoteWadMode.FULL,
+    )
+
+    delta_path = tmp_path / "16.5.snapshot"
+    delta = write_snapshot_bundle(
+        delta_path,
+        snapshot=NEW_SNAPSHOT,
+        manifest_paths=_manifest_files(tmp_path / "manifests", NEW_SNAPSHOT),
+        chunks={**base_chunks, (2, 0): b"c" * 16},
+        wad_mode=RemoteWadMode.FULL,
+        base_paths=[base_path],
+    )
+    assert delta.chunk_count == 1
+    assert delta.skipped_chunks == len(base_chunks)
+
+    mirror_root = tmp_path / "mirror"
+    with pytest.raises(SnapshotBundleError):
+        import_snapshot_bundle(delta_path, mirror_root)
+
+    import_snapshot_bundle(base_path, mirror_root)
+    imported = import_snapshot_bundle(delta_path, mirror_root)
+
+    assert imported.manifest_count == 1
+    state = load_mirror_state(mirror_root)
+    assert state["latest"] == NEW_SNAPSHOT.version
+    assert set(state["snapshots"]) == {OLD_SNAPSHOT.version, NEW_SNAPSHOT.version}
+    assert (mirror_root / MIRROR_BUNDLE_DIR / f"{1:016X}.bundle").read_bytes() == b"a" * 16 + b"b" * 16
+    assert (mirror_root / MIRROR_BUNDLE_DIR / f"{2:016X}.bundle").read_bytes() == b"c" * 16
+
+
+def test_offline_root_resolves_imported_snapshot(tmp_path: Path) -> None:
+    """配置离线镜像且未显式指定快照时，取最近导入的快照，不访问版本解析接口。"""
+    bundle_path = tmp_path / "16.4.snapshot"
+    write_snapshot_bundle(
+        bundle_path,
+        snapshot=OLD_SNAPSHOT,
+        manifest_paths=_manifest_files(tmp_path / "manifests", OLD_SNAPSHOT),
+        chunks={},
+        wad_mode=RemoteWadMode.FULL,
+    )
+    mirror_root = tmp_path / "mirror"
+    with pytest.raises(AppContextValidationError):
+        _build_snapshot(settings={}, source_mode=SourceMode.REMOTE_SNAPSHOT, offline_root=mirror_root)
+
+    import_snapshot_bundle(bundle_path, mirror_root)
+
+    assert _build_snapshot(settings={}, source_mode=SourceMode.REMOTE_SNAPSHOT, offline_root=mirror_root) == (
+        OLD_SNAPSHOT
+    )
+
+
+def test_recorder_spools_chunks_to_disk_and_dedupes(tmp_path: Path) -> None:
+    """记录器把 chunk 写入暂存文件，重复记录同一位置时保留首次内容。"""
+    spool_dir = tmp_path / "spool"
+    recorder = ChunkRecorder(spool_dir=spool_dir)
+    recorder.record(1, 0, b"first")
+    recorder.record(1, 0, b"again")
+    recorder.record(2, 16, b"second")
+
+    assert dict(recorder) == {(1, 0): b"first", (2, 16): b"second"}
+    recorder.close()
+    assert list(spool_dir.iterdir()) == []
+
+
+def test_entries_snapshot_is_rejected_for_full_wad_mode(tmp_path: Path) -> None:
+    """以 entries 导出的快照只含目标条目的 chunk，以 full 方式离线使用时创建上下文即报错。"""
+    bundle_path = tmp_path / "16.4.snapshot"
+    write_snapshot_bundle(
+        bundle_path,
+        snapshot=OLD_SNAPSHOT,
+        manifest_paths=_manifest_files(tmp_path / "manifests", OLD_SNAPSHOT),
+        chunks={},
+        wad_mode=RemoteWadMode.ENTRIES,
+    )
+    mirror_root = tmp_path / "mirror"
+    import_snapshot_bundle(bundle_path, mirror_root)
+
+    with pytest.raises(AppContextValidationError, match="entries"):
+        _check_offline_wad_mode(offline_root=mirror_root, version=OLD_SNAPSHOT.version, wad_mode=RemoteWadMode.FULL)
+    _check_offline_wad_mode(offline_root=mirror_root, version=OLD_SNAPSHOT.version, wad_mode=RemoteWadMode.ENTRIES)
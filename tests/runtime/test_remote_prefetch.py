@@ -0,0 +1,131 @@
+"""验证 remote 工作流的 GAME WAD 后台预下载。"""
+
+import threading
+from pathlib import Path, PurePosixPath
+from types import SimpleNamespace
+
+import pytest
+
+from lol_audio_unpack.runtime.remote.game import PREFETCH_DIR_NAME, adopt_prefetched_files
+from lol_audio_unpack.runtime.remote.prefetch import WadPrefetcher
+
+pytestmark = pytest.mark.unit
+
+WAD_SIZE = 16
+ANNIE_WAD = "DATA/FINAL/Champions/Annie.wad.client"
+AHRI_WAD = "DATA/FINAL/Champions/Ahri.wad.client"
+
+
+class _FakeManifest:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.files = {name: SimpleNamespace(name=name, size=WAD_SIZE) for name in (ANNIE_WAD, AHRI_WAD)}
+
+    def file_output(self, file: SimpleNamespace) -> str:
+        return str(self.root / PurePosixPath(file.name))
+
+
+class _FakePreparer:
+    def __init__(self, tmp_path: Path) -> None:
+        self.game_cache_root = tmp_path / "game"
+        self.ctx = SimpleNamespace(config=SimpleNamespace(cleanup_remote=True))
+        self.prefetcher: WadPrefetcher | None = None
+        self.downloaded: list[str] = []
+        # 设置后下载写完首个文件的一半即阻塞，模拟仍在进行中的慢速下载
+        self.release: threading.Event | None = None
+        self.blocked = threading.Event()
+
+    def is_wad_retained(self, _wad_path: str) -> bool:
+        return False
+
+    def open_game_manifest(self, download_root: Path) -> tuple[Path, _FakeManifest]:
+        return download_root / "GAME.manifest", _FakeManifest(download_root)
+
+    def _ensure_files_downloaded(self, manifest: _FakeManifest, files: list[SimpleNamespace]) -> list[Path]:
+        paths = []
+        for file in files:
+            path = Path(manifest.file_output(file))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self.release is not None:
+                path.write_bytes(b"w" * (file.size // 2))
+                self.blocked.set()
+                self.release.wait()
+            path.write_bytes(b"w" * file.size)
+            self.downloaded.append(file.name)
+            paths.append(path)
+        return paths
+
+
+def test_prefetcher_stages_wads_and_prepare_adopts_them(tmp_path: Path) -> None:
+    """预下载的 WAD 应写入暂存目录，前台准备时移入下载缓存而不再下载。"""
+    preparer = _FakePreparer(tmp_path)
+    prefetcher = WadPrefetcher(preparer, budget_bytes=WAD_SIZE * 4)
+
+    assert prefetcher.submit(("champion", 1), {"DATA/FINAL/Champions/Annie.wad.client"})
+    prefetcher.wait(("champion", 1))
+
+    download_manifest = _FakeManifest(preparer.game_cache_root / "downloads")
+    adopted = adopt_prefetched_files(
+        download_manifest,
+        [download_manifest.files[ANNIE_WAD]],
+        prefetch_root=preparer.game_cache_root / PREFETCH_DIR_NAME,
+        is_staged=prefetcher.is_staged,
+    )
+    prefetcher.close()
+
+    assert preparer.downloaded == [ANNIE_WAD]
+    assert adopted == 1
+    assert (preparer.game_cache_root / "downloads" / ANNIE_WAD).is_file()
+    assert not (preparer.game_cache_root / PREFETCH_DIR_NAME).exists()
+
+
+def test_prefetcher_skips_work_items_over_budget_and_drops_unused_files(tmp_path: Path) -> None:
+    """超出预算的工作项不预下载；关闭时未被前台取用的暂存文件应删除。"""
+    preparer = _FakePreparer(tmp_path)
+    prefetcher = WadPrefetcher(preparer, budget_bytes=WAD_SIZE)
+
+    assert prefetcher.submit(("champion", 1), {ANNIE_WAD})
+    assert not prefetcher.submit(("champion", 103), {AHRI_WAD})
+    prefetcher.close()
+
+    assert preparer.downloaded == [ANNIE_WAD]
+    assert not (preparer.game_cache_root / PREFETCH_DIR_NAME).exists()
+
+
+def test_staged_file_of_running_download_is_not_adopted(tmp_path: Path) -> None:
+    """其他工作项的预下载仍在写的暂存文件不算已完成：前台不取用，也不据此跳过预下载。"""
+    preparer = _FakePreparer(tmp_path)
+    preparer.release = threading.Event()
+    prefetcher = WadPrefetcher(preparer, budget_bytes=WAD_SIZE * 4)
+    download_manifest = _FakeManifest(preparer.game_cache_root / "downloads")
+    staged_path = preparer.game_cache_root / PREFETCH_DIR_NAME / ANNIE_WAD
+
+    try:
+        assert prefetcher.submit(("champion", 1), {ANNIE_WAD})
+        assert preparer.blocked.wait(timeout=5)
+        adopted_early = adopt_prefetched_files(
+            download_manifest,
+            [download_manifest.files[ANNIE_WAD]],
+            prefetch_root=preparer.game_cache_root / PREFETCH_DIR_NAME,
+            is_staged=prefetcher.is_staged,
+        )
+        assert staged_path.exists()
+        assert not prefetcher.is_staged(ANNIE_WAD)
+        assert not prefetcher.submit(("champion", 2), {ANNIE_WAD})
+
+        preparer.release.set()
+        prefetcher.wait(("champion", 1))
+        adopted = adopt_prefetched_files(
+            download_manifest,
+            [download_manifest.files[ANNIE_WAD]],
+            prefetch_root=preparer.game_cache_root / PREFETCH_DIR_NAME,
+            is_staged=prefetcher.is_staged,
+        )
+    finally:
+        preparer.release.set()
+        prefetcher.close()
+
+    assert adopted_early == 0
+    assert adopted == 1
+    assert (preparer.game_cache_root / "downloads" / ANNIE_WAD).stat().st_size == WAD_SIZE
+    assert preparer.prefetcher is None
@@ -1,5 +1,8 @@
 import io
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from pathlib import Path, PurePosixPath
 from types import SimpleNamespace
@@ -19,15 +22,20 @@ from lol_audio_unpack.app.types import (
     AppPaths,
     OperationOptions,
     RemoteSnapshotConfig,
+    RemoteWadMode,
     SourceMode,
     WavOutputOptions,
 )
 from lol_audio_unpack.runtime.remote import RemotePreparer
+from lol_audio_unpack.runtime.remote.session import SESSION_KEY, get_session
 
 pytestmark = pytest.mark.unit
 EXPECTED_BUNDLE_COUNT = 3
 EXPECTED_EXTRACTED_BIN_COUNT = 4
 EXPECTED_CLEANUP_LCU_WADS = 2
+PREFETCH_BUDGET_BYTES = 1024
+PARALLEL_RETRY_ATTEMPTS = 2
+OVERLAP_TIMEOUT_SECONDS = 5
 
 
 def _build_remote_ctx(tmp_path: Path, *, game_region: str = "zh_CN") -> AppContext:
@@ -166,19 +174,20 @@ def test_facade_update_prepares_remote_snapshot_before_updaters(
         def prepare_lcu_data(self) -> None:
             call_order.append("prepare_lcu")
 
-        def prepare_bin_inputs(  # noqa: PLR0913
+        def extract_bin_payloads(  # noqa: PLR0913
             self,
             *,
             reader,
             target,
             champion_ids=None,
             map_ids=None,
-        ) -> None:
+        ) -> dict[str, bytes]:
             assert reader is not None
             assert target == "all"
             assert champion_ids is None
             assert map_ids is None
             call_order.append("prepare_bin")
+            return {"data/characters/Annie/skins/skin0.bin": b"bin"}
 
     class FakeDataUpdater:
         def __init__(self, force_update=False, ctx=None):  # noqa: ANN001, FBT002
@@ -189,10 +198,11 @@ def test_facade_update_prepares_remote_snapshot_before_updaters(
             call_order.append("data")
 
     class FakeBinUpdater:
-        def __init__(self, force_update=False, process_events=True, ctx=None):  # noqa: ANN001, FBT002
+        def __init__(self, force_update=False, process_events=True, ctx=None, bin_payloads=None):  # noqa: ANN001, FBT002
             assert force_update is False
             assert process_events is True
             assert ctx is not None
+            assert bin_payloads == {"data/characters/Annie/skins/skin0.bin": b"bin"}
 
         def update(self, *, target="all", champion_ids=None, map_ids=None) -> None:  # noqa: ANN001
             assert target == "all"
@@ -217,11 +227,11 @@ def test_facade_update_logs_start_and_summary(monkeypatch: pytest.MonkeyPatch, t
     success_messages: list[str] = []
 
     class FakePreparer:
-        def prepare_bin_inputs(self, **_kwargs) -> None:  # noqa: ANN003
-            return None
+        def extract_bin_payloads(self, **_kwargs) -> dict[str, bytes]:  # noqa: ANN003
+            return {}
 
     class FakeBinUpdater:
-        def __init__(self, force_update=False, process_events=True, ctx=None):  # noqa: ANN001, FBT002
+        def __init__(self, force_update=False, process_events=True, ctx=None, bin_payloads=None):  # noqa: ANN001, FBT002
             assert force_update is False
             assert process_events is True
             assert ctx is not None
@@ -255,6 +265,71 @@ def test_facade_update_logs_start_and_summary(monkeypatch: pytest.MonkeyPatch, t
     assert success_messages == ["更新流程完成：target=all，英雄 1 个，地图 1 个"]
 
 
+def test_facade_update_closes_remote_session_even_on_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    ctx = _build_remote_ctx(tmp_path)
+    app = LolAudioUnpackApp(ctx)
+    closed: list[dict[str, object]] = []
+
+    def _failing_prepare(force_update=False):  # noqa: ANN001, ANN202, ARG001
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(app, "prepare_update_data", _failing_prepare)  # type: ignore[method-assign]
+    monkeypatch.setattr(m_facade, "close_session", closed.append)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        app.update(OperationOptions())
+
+    assert closed == [ctx.runtime_cache]
+
+
+def test_export_snapshot_prepares_and_releases_one_entity_at_a_time(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    ctx = _build_remote_ctx(tmp_path)
+    app = LolAudioUnpackApp(ctx)
+    events: list[object] = []
+    work_items = [
+        RemoteEntityWorkItem(entity_type="champion", entity_id=1, need_extract=True, need_mapping=True),
+        RemoteEntityWorkItem(entity_type="map", entity_id=11, need_extract=True, need_mapping=True),
+    ]
+
+    class FakePreparer:
+        snapshot = ctx.config.remote_snapshot
+
+        def __init__(self, ctx=None) -> None:  # noqa: ANN001
+            assert get_session(ctx.runtime_cache).recorder is not None
+
+        def prepare_entity_wads(self, **kwargs) -> None:  # noqa: ANN003
+            events.append((kwargs["champion_ids"], kwargs["map_ids"]))
+
+        def manifest_cache_paths(self) -> dict[str, Path]:
+            return {}
+
+    def _fake_write(output_path: Path, **kwargs) -> Path:  # noqa: ANN003
+        events.append(("write", len(kwargs["chunks"]), kwargs["wad_mode"]))
+        return output_path
+
+    monkeypatch.setattr(app, "_run_update", lambda opts, target: events.append("update"))  # type: ignore[method-assign]
+    monkeypatch.setattr(app, "build_work_items", lambda **_kwargs: work_items)  # type: ignore[method-assign]
+    monkeypatch.setattr(app, "_create_reader", SimpleNamespace)  # type: ignore[method-assign]
+    monkeypatch.setattr(app, "cleanup_remote_artifacts", lambda: events.append("cleanup"))  # type: ignore[method-assign]
+    monkeypatch.setattr(m_facade, "RemotePreparer", FakePreparer)
+    monkeypatch.setattr(m_facade, "write_snapshot_bundle", _fake_write)
+
+    app.export_snapshot(tmp_path / "out" / "16.4.snapshot", OperationOptions())
+
+    assert events == [
+        "update",
+        ((1,), None),
+        "cleanup",
+        (None, (11,)),
+        "cleanup",
+        ("write", 0, RemoteWadMode.FULL),
+        "cleanup",
+    ]
+    assert SESSION_KEY not in ctx.runtime_cache
+
+
 def test_prepare_update_data_warms_remote_data_once_per_run(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     ctx = _build_remote_ctx(tmp_path)
     app = LolAudioUnpackApp(ctx)
@@ -267,19 +342,20 @@ def test_prepare_update_data_warms_remote_data_once_per_run(monkeypatch: pytest.
         def prepare_lcu_data(self) -> None:
             call_order.append("prepare_lcu")
 
-        def prepare_bin_inputs(  # noqa: PLR0913
+        def extract_bin_payloads(  # noqa: PLR0913
             self,
             *,
             reader,
             target,
             champion_ids=None,
             map_ids=None,
-        ) -> None:
+        ) -> dict[str, bytes]:
             assert reader is not None
             assert target == "all"
             assert champion_ids is None
             assert map_ids is None
             call_order.append("prepare_bin")
+            return {}
 
     class FakeDataUpdater:
         def __init__(self, force_update=False, ctx=None):  # noqa: ANN001, FBT002
@@ -290,7 +366,7 @@ def test_prepare_update_data_warms_remote_data_once_per_run(monkeypatch: pytest.
             call_order.append("data")
 
     class FakeBinUpdater:
-        def __init__(self, force_update=False, process_events=True, ctx=None):  # noqa: ANN001, FBT002
+        def __init__(self, force_update=False, process_events=True, ctx=None, bin_payloads=None):  # noqa: ANN001, FBT002
             assert force_update is False
             assert process_events is True
             assert ctx is not None
@@ -458,6 +534,43 @@ def test_remote_snapshot_preparer_logs_bin_input_plan_summary(
     assert any("INFO|远端 BIN 输入准备完成：共提取 3 个文件。" in line for line in log_lines)
 
 
+def test_remote_snapshot_preparer_extracts_bin_payloads_in_one_batch_without_writing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """整个 BIN 计划应交给一次 extract_files 调用，内存模式不写入 bin_input。"""
+    ctx = _build_remote_ctx(tmp_path)
+    preparer = RemotePreparer(ctx=ctx)
+    extract_calls: list[dict[str, list[str]]] = []
+    plan = {
+        "Game/DATA/FINAL/Champions/Annie.wad.client": ["data/characters/Annie/skins/skin0.bin"],
+        "Game/DATA/FINAL/Maps/Shipping/Map11/Map11.wad.client": ["data/maps/shipping/map11/map11.bin"],
+    }
+
+    monkeypatch.setattr(m_remote.remote_game, "build_bin_plan", lambda **_kwargs: plan)
+    monkeypatch.setattr(preparer, "_ensure_manifest_cached", lambda **_kwargs: tmp_path / "game.manifest")
+    monkeypatch.setattr(m_remote, "PatcherManifest", lambda *, file, path: SimpleNamespace(file=file, path=path))
+
+    class FakeWADExtractor:
+        def __init__(self, manifest) -> None:  # noqa: ANN001
+            self.manifest = manifest
+
+        def extract_files(self, wad_file_paths: dict[str, list[str]]) -> dict[str, dict[str, bytes | None]]:
+            extract_calls.append(wad_file_paths)
+            return {wad_path: {bin_path: bin_path.encode() for bin_path in bins} for wad_path, bins in plan.items()}
+
+    monkeypatch.setattr(m_remote, "WADExtractor", FakeWADExtractor)
+
+    payloads = preparer.extract_bin_payloads(reader=SimpleNamespace(), target="all")
+
+    assert extract_calls == [plan]
+    assert payloads == {
+        "data/characters/Annie/skins/skin0.bin": b"data/characters/Annie/skins/skin0.bin",
+        "data/maps/shipping/map11/map11.bin": b"data/maps/shipping/map11/map11.bin",
+    }
+    assert not (ctx.paths.manifest_path / "16.5").exists()
+
+
 def test_remote_snapshot_preparer_logs_entity_wad_scope_before_prepare(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -644,6 +757,141 @@ def test_remote_snapshot_preparer_prepare_mapping_wads_downloads_root_and_langua
     assert prepared_names == ["Annie.wad.client", "Annie.zh_CN.wad.client"]
 
 
+def test_remote_snapshot_preparer_overlaps_downloads_of_different_wads(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """不同 WAD 的下载应能同时进行；同一 WAD 依次准备，后到者直接复用已下载的文件。"""
+    ctx = _build_remote_ctx(tmp_path)
+    names = ["DATA/FINAL/Champions/Annie.wad.client", "DATA/FINAL/Champions/Ahri.wad.client"]
+    shared_name = "DATA/FINAL/Champions/Common.wad.client"
+    monkeypatch.setattr(m_remote, "urlopen", lambda _url: io.BytesIO(b"manifest-data"))
+
+    class FakePatcherManifest:
+        def __init__(self, *, file: Path, path: Path) -> None:  # noqa: ARG002
+            self.path = Path(path)
+            self.files = {name: SimpleNamespace(name=name) for name in [*names, shared_name]}
+
+        def file_output(self, file: SimpleNamespace) -> str:
+            return str(self.path / PurePosixPath(file.name))
+
+    monkeypatch.setattr(m_remote, "PatcherManifest", FakePatcherManifest)
+    preparer = RemotePreparer(ctx=ctx)
+    overlap = threading.Barrier(len(names), timeout=OVERLAP_TIMEOUT_SECONDS)
+    in_flight: dict[str, int] = dict.fromkeys([*names, shared_name], 0)
+    max_in_flight: dict[str, int] = dict.fromkeys([*names, shared_name], 0)
+    downloads: list[str] = []
+    counter_lock = threading.Lock()
+
+    def slow_download(manifest: FakePatcherManifest, files: list[SimpleNamespace]) -> list[Path]:
+        paths = []
+        for file in files:
+            path = Path(manifest.file_output(file))
+            paths.append(path)
+            if path.exists():
+                continue
+            with counter_lock:
+                in_flight[file.name] += 1
+                max_in_flight[file.name] = max(max_in_flight[file.name], in_flight[file.name])
+                downloads.append(file.name)
+            if file.name in names:
+                # 两个不同 WAD 只有同时在下载时才能一起通过屏障，串行执行会超时
+                overlap.wait()
+            time.sleep(0.05)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(file.name.encode())
+            with counter_lock:
+                in_flight[file.name] -= 1
+        return paths
+
+    monkeypatch.setattr(preparer, "_ensure_files_downloaded", slow_download)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        different = [executor.submit(preparer._prepare_wads, {name}) for name in names]
+        [future.result() for future in different]
+        same = [executor.submit(preparer._prepare_wads, {shared_name}) for _ in names]
+        results = [future.result() for future in same]
+
+    assert not overlap.broken
+    assert sorted(downloads) == sorted([*names, shared_name])
+    assert max_in_flight == dict.fromkeys([*names, shared_name], 1)
+    assert all(result.prepared_wad_count == 1 for result in results)
+
+
+def test_remote_snapshot_preparer_entries_mode_builds_partial_wads_from_planned_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """按条目模式下应只为每个 WAD 准备计划中的内部路径，不再整包下载。"""
+    base_ctx = _build_remote_ctx(tmp_path, game_region="zh_CN")
+    ctx = replace(base_ctx, config=replace(base_ctx.config, remote_wad_mode=RemoteWadMode.ENTRIES))
+    reader = SimpleNamespace(
+        ctx=ctx,
+        get_champion=lambda _id: {
+            "id": 1,
+            "wad": {
+                "root": "Game/DATA/FINAL/Champions/Annie.wad.client",
+                "zh_CN": "Game/DATA/FINAL/Champions/Annie.zh_CN.wad.client",
+            },
+        },
+        get_champion_banks=lambda _id: {
+            "skins": {
+                "1000": {
+                    "CHARACTER_VO": [["voice_events.bnk", "voice_audio.wpk"]],
+                    "CHARACTER_SFX": [["sfx_events.bnk", "sfx_audio.bnk"]],
+                }
+            }
+        },
+        get_champion_events=lambda _id: {
+            "skins": {"1000": {"events": {"CHARACTER_VO": ["Play_VO"], "CHARACTER_SFX": ["Play_SFX"]}}}
+        },
+        get_map=lambda _id: {},
+        get_map_banks=lambda _id: None,
+        get_map_events=lambda _id: None,
+        get_champions=lambda: [],
+        get_maps=lambda: [],
+    )
+    monkeypatch.setattr(m_remote, "urlopen", lambda _url: io.BytesIO(b"manifest-data"))
+
+    class FakePatcherManifest:
+        def __init__(self, *, file: Path, path: Path) -> None:  # noqa: ARG002
+            names = ["DATA/FINAL/Champions/Annie.wad.client", "DATA/FINAL/Champions/Annie.zh_CN.wad.client"]
+            self.files = {name: SimpleNamespace(name=name, size=1024) for name in names}
+
+        async def download_files_concurrently(self, files, raise_on_error=True):  # noqa: ARG002
+            raise AssertionError("按条目模式不应整包下载 WAD")
+
+    built: dict[str, list[str]] = {}
+
+    def fake_build_partial_wad(  # noqa: PLR0913
+        wad_file, entry_paths, *, output_path, bundle_source, chunk_cache, session, name_hints
+    ):
+        assert name_hints == {}
+        assert bundle_source is None
+        assert chunk_cache is None
+        assert session is not None
+        built[wad_file.name] = entry_paths
+        return SimpleNamespace(output_path=output_path, downloaded_bytes=128)
+
+    monkeypatch.setattr(m_remote, "PatcherManifest", FakePatcherManifest)
+    monkeypatch.setattr(m_remote.remote_game, "build_partial_wad", fake_build_partial_wad)
+
+    result = RemotePreparer(ctx=ctx).prepare_mapping_wads(
+        reader=reader,
+        champion_ids=(1,),
+        map_ids=None,
+        include_champions=True,
+        include_maps=False,
+    )
+
+    assert result is not None
+    assert built == {
+        "DATA/FINAL/Champions/Annie.wad.client": ["sfx_events.bnk"],
+        "DATA/FINAL/Champions/Annie.zh_CN.wad.client": ["voice_events.bnk"],
+    }
+    assert sorted(path.name for path in result.prepared_file_paths) == ["Annie.wad.client", "Annie.zh_CN.wad.client"]
+
+
 def test_facade_extract_prepares_remote_wads_before_unpack(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     ctx = _build_remote_ctx(tmp_path)
     app = LolAudioUnpackApp(ctx)
@@ -798,7 +1046,14 @@ def test_facade_run_workflow_runs_per_entity_and_cleans_between_entities(
 
     app.update = lambda opts, *, target="all": call_order.append(("update", opts.champion_ids, target))  # type: ignore[method-assign]
     app.extract = (  # type: ignore[method-assign]
-        lambda opts, **kwargs: call_order.append(("extract", opts.champion_ids, kwargs["prepare_remote"]))
+        lambda opts, **kwargs: call_order.append(
+            (
+                "extract",
+                opts.champion_ids,
+                kwargs["prepare_remote"],
+                kwargs["mapping_options"].champion_ids if kwargs["mapping_options"] else None,
+            )
+        )
     )
     app.mapping = (  # type: ignore[method-assign]
         lambda opts, **kwargs: call_order.append(("mapping", opts.champion_ids, kwargs["prepare_remote"]))
@@ -818,15 +1073,90 @@ def test_facade_run_workflow_runs_per_entity_and_cleans_between_entities(
         ("update", (1, 103), "skin"),
         ("cleanup",),
         ("prepare", (1,), True, False),
-        ("extract", (1,), False),
+        ("extract", (1,), False, None),
         ("cleanup",),
         ("prepare", (103,), True, True),
-        ("extract", (103,), False),
-        ("mapping", (103,), False),
+        # 同一实体既解包又映射时合并为一轮，mapping 不再单独调用
+        ("extract", (103,), False, (103,)),
         ("cleanup",),
     ]
 
 
+def test_facade_run_workflow_prefetches_next_work_item_after_current_wads_are_ready(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """当前实体的 WAD 准备好后应提交下一个实体的预下载，并在处理下一个实体前等待它。"""
+    ctx = _build_remote_ctx(tmp_path)
+    app = LolAudioUnpackApp(ctx)
+    reader = SimpleNamespace(version="16.5", get_champions=lambda: [], get_maps=lambda: [])
+    call_order: list[tuple] = []
+
+    class FakePreparer:
+        def __init__(self, *, ctx) -> None:  # noqa: ANN001
+            assert ctx is not None
+
+        def plan_entity_wads(self, **kwargs) -> set[str]:  # noqa: ANN003
+            return {f"wad-{kwargs['champion_ids'][0]}"}
+
+        def prepare_entity_wads(self, **kwargs) -> None:  # noqa: ANN003
+            call_order.append(("prepare", kwargs["champion_ids"]))
+
+    class FakePrefetcher:
+        def __init__(self, preparer, *, budget_bytes: int) -> None:  # noqa: ANN001
+            assert isinstance(preparer, FakePreparer)
+            assert budget_bytes == PREFETCH_BUDGET_BYTES
+
+        def submit(self, key: tuple[str, int], wad_paths: set[str]) -> bool:
+            call_order.append(("submit", key, tuple(wad_paths)))
+            return True
+
+        def wait(self, key: tuple[str, int]) -> None:
+            call_order.append(("wait", key))
+
+        def close(self) -> None:
+            call_order.append(("close",))
+
+    monkeypatch.setattr(
+        app,
+        "build_work_items",
+        lambda **_kwargs: [
+            RemoteEntityWorkItem(entity_type="champion", entity_id=1, need_extract=True, need_mapping=False),
+            RemoteEntityWorkItem(entity_type="champion", entity_id=103, need_extract=True, need_mapping=False),
+        ],
+    )
+    monkeypatch.setattr(m_facade, "RemotePreparer", FakePreparer)
+    monkeypatch.setattr(m_facade, "WadPrefetcher", FakePrefetcher)
+    monkeypatch.setattr(m_facade, "DataReader", lambda ctx: reader)
+    app._build_entity_data = lambda reader, **kwargs: SimpleNamespace(  # type: ignore[method-assign]
+        entity_id=str(kwargs["entity_id"]),
+        entity_name="测试实体",
+        entity_alias="test",
+        entity_title=None,
+        entity_type=kwargs["entity_type"],
+    )
+    app.extract = lambda opts, **_kwargs: call_order.append(("extract", opts.champion_ids))  # type: ignore[method-assign]
+    app.cleanup_remote_artifacts = lambda: None  # type: ignore[method-assign]
+
+    app.run_workflow(
+        extract_options=OperationOptions(champion_ids=(1, 103)),
+        extract_include_champions=True,
+        prefetch_depth=1,
+        prefetch_budget_bytes=PREFETCH_BUDGET_BYTES,
+    )
+
+    assert call_order == [
+        ("wait", ("champion", 1)),
+        ("prepare", (1,)),
+        ("submit", ("champion", 103), ("wad-103",)),
+        ("extract", (1,)),
+        ("wait", ("champion", 103)),
+        ("prepare", (103,)),
+        ("extract", (103,)),
+        ("close",),
+    ]
+
+
 def test_facade_run_workflow_logs_completion_summary(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -915,6 +1245,8 @@ def test_facade_run_workflow_invokes_callback_with_extract_and_mapping_paths(
         assert opts.champion_ids == (103,)
         assert kwargs["prepare_remote"] is False
         extract_dir.mkdir(parents=True, exist_ok=True)
+        if kwargs["mapping_options"] is not None:
+            fake_mapping(kwargs["mapping_options"], prepare_remote=False)
 
     def fake_mapping(opts, **kwargs) -> None:  # noqa: ANN001, ANN003
         assert opts.champion_ids == (103,)
@@ -1110,6 +1442,82 @@ def test_facade_run_workflow_raises_after_entity_retry_threshold(
     ]
 
 
+def _patch_parallel_workflow(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    failing_id: int | None = None,
+) -> list[tuple[int, Path]]:
+    """让并行工作流使用假准备器与假解包，记录各实体使用的最小运行目录。"""
+    reader = SimpleNamespace(version="16.5", get_champions=lambda: [], get_maps=lambda: [])
+    prepared: list[tuple[int, Path]] = []
+
+    class FakePreparer:
+        fork_runtime_cache = staticmethod(RemotePreparer.fork_runtime_cache)
+        join_runtime_cache = staticmethod(RemotePreparer.join_runtime_cache)
+
+        def __init__(self, *, ctx) -> None:  # noqa: ANN001
+            self.ctx = ctx
+
+        def prepare_entity_wads(self, **kwargs) -> None:  # noqa: ANN003
+            prepared.append((kwargs["champion_ids"][0], self.ctx.game_path))
+
+    def fake_extract(self, opts, **kwargs) -> None:  # noqa: ANN001, ANN003, ARG001
+        if opts.champion_ids == (failing_id,):
+            raise RuntimeError("bnk format changed")
+
+    monkeypatch.setattr(m_facade, "RemotePreparer", FakePreparer)
+    monkeypatch.setattr(m_facade, "DataReader", lambda ctx: reader)
+    monkeypatch.setattr(
+        LolAudioUnpackApp,
+        "_build_entity_data",
+        lambda self, reader, **kwargs: SimpleNamespace(entity_name="测试实体"),
+    )
+    monkeypatch.setattr(LolAudioUnpackApp, "_resolve_audio_paths", lambda self, entity_data: ())
+    monkeypatch.setattr(LolAudioUnpackApp, "extract", fake_extract)
+    monkeypatch.setattr(LolAudioUnpackApp, "cleanup_remote_artifacts", lambda self: None)
+    return prepared
+
+
+def test_facade_run_workflow_runs_work_items_in_parallel_with_separate_game_dirs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """并行执行时每个实体应在 game_path/items 下使用各自的最小运行目录。"""
+    ctx = _build_remote_ctx(tmp_path)
+    prepared = _patch_parallel_workflow(monkeypatch)
+
+    LolAudioUnpackApp(ctx).run_workflow(
+        extract_options=OperationOptions(champion_ids=(1, 103, 222)),
+        extract_include_champions=True,
+        parallel_items=2,
+    )
+
+    assert sorted(prepared) == [
+        (1, ctx.game_path / "items" / "champion_1"),
+        (103, ctx.game_path / "items" / "champion_103"),
+        (222, ctx.game_path / "items" / "champion_222"),
+    ]
+
+
+def test_facade_run_workflow_parallel_reports_entity_failure_after_retries(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """并行执行中单实体重试耗尽时，应抛出与顺序执行相同的失败信息。"""
+    ctx = _build_remote_ctx(tmp_path)
+    prepared = _patch_parallel_workflow(monkeypatch, failing_id=1)
+
+    with pytest.raises(RuntimeError, match="champion 1 已尝试 2 次"):
+        LolAudioUnpackApp(ctx).run_workflow(
+            extract_options=OperationOptions(champion_ids=(1, 103)),
+            extract_include_champions=True,
+            entity_retry_attempts=PARALLEL_RETRY_ATTEMPTS,
+            parallel_items=2,
+        )
+
+    assert [entity_id for entity_id, _ in prepared].count(1) == PARALLEL_RETRY_ATTEMPTS
+
+
 def test_facade_uses_canonical_workflow_names(tmp_path: Path) -> None:
     ctx = _build_remote_ctx(tmp_path)
     app = LolAudioUnpackApp(ctx)
@@ -1121,6 +1529,78 @@ def test_facade_uses_canonical_workflow_names(tmp_path: Path) -> None:
     assert app.run_workflow() is None
 
 
+def test_remote_snapshot_preparer_reuses_parsed_manifest_within_run(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """同一次运行内应复用已解析的 manifest；manifest 文件更新后重新解析。"""
+    ctx = _build_remote_ctx(tmp_path)
+    manifest_path = tmp_path / "GAME.manifest"
+    manifest_path.write_bytes(b"manifest-v1")
+    parsed: list[Path] = []
+
+    class FakePatcherManifest:
+        def __init__(self, *, file: Path, path: Path) -> None:
+            parsed.append(Path(path))
+
+    monkeypatch.setattr(m_remote, "PatcherManifest", FakePatcherManifest)
+    monkeypatch.setattr(RemotePreparer, "_ensure_manifest_cached", lambda _self, **_kwargs: manifest_path)
+
+    first = RemotePreparer(ctx=ctx)
+    download_root = first.game_cache_root / "downloads"
+    _, manifest = first.open_game_manifest(download_root)
+    _, again = RemotePreparer(ctx=ctx).open_game_manifest(download_root)
+    first.open_game_manifest(first.game_cache_root / "prefetch")
+
+    assert again is manifest
+    assert parsed == [download_root, first.game_cache_root / "prefetch"]
+
+    manifest_path.write_bytes(b"manifest-v2-longer")
+    _, refreshed = first.open_game_manifest(download_root)
+
+    assert refreshed is not manifest
+
+
+def test_remote_snapshot_preparer_cleanup_keeps_shared_wads_until_last_consumer(tmp_path: Path) -> None:
+    """共享 WAD 应保留到最后一个消费者完成；超出预算时淘汰下次使用最晚的 WAD。"""
+    ctx = _build_remote_ctx(tmp_path)
+    preparer = RemotePreparer(ctx=ctx)
+    names = {
+        "annie": "DATA/FINAL/Champions/Annie.wad.client",
+        "ahri": "DATA/FINAL/Champions/Ahri.wad.client",
+        "common": "DATA/FINAL/Champions/Common.wad.client",
+    }
+    paths = {}
+    for key, name in names.items():
+        cached_path = preparer.game_cache_root / "downloads" / name
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        cached_path.write_bytes(b"w" * PREFETCH_BUDGET_BYTES)
+        prepared_path = ctx.config.game_path / "Game" / name
+        prepared_path.parent.mkdir(parents=True, exist_ok=True)
+        prepared_path.write_bytes(b"w" * PREFETCH_BUDGET_BYTES)
+        paths[key] = (cached_path, prepared_path)
+        preparer._track_cleanup_paths("cached_game_wads", [cached_path])
+        preparer._track_cleanup_paths("prepared_game_wads", [prepared_path])
+
+    preparer.register_wad_consumers(
+        [{names["annie"], names["common"]}, {names["common"]}, {names["ahri"]}],
+        budget_bytes=PREFETCH_BUDGET_BYTES,
+    )
+    preparer.release_wad_consumer(0)
+    preparer.cleanup_artifacts()
+
+    # Common 下次使用更早，预算只够一个时 Ahri 被淘汰
+    assert all(path.exists() for path in paths["common"])
+    assert not any(path.exists() for path in paths["annie"] + paths["ahri"])
+    assert preparer.is_wad_retained(names["common"])
+
+    preparer.release_wad_consumer(1)
+    preparer.cleanup_artifacts()
+
+    assert not any(path.exists() for path in paths["common"])
+    assert not preparer.is_wad_retained(names["common"])
+
+
 def test_remote_snapshot_preparer_cleanup_artifacts_supports_dry_run(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
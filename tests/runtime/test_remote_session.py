@@ -0,0 +1,57 @@
+"""验证 remote 运行期共享的事件循环与 HTTP 连接池。"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from riotmanifest import DownloadError
+from riotmanifest.utils import HttpClientError
+
+from lol_audio_unpack.runtime.remote.session import RemoteSession, close_session, get_session
+from lol_audio_unpack.runtime.remote.wad_entries import _ChunkReader
+
+pytestmark = pytest.mark.unit
+
+
+async def _current_loop_and_thread() -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    return asyncio.get_running_loop(), threading.current_thread()
+
+
+def test_session_runs_every_coroutine_on_one_persistent_loop() -> None:
+    """同一上下文内的多次协程提交应复用同一个事件循环线程，关闭后重新创建。"""
+    runtime_cache: dict = {}
+    session = get_session(runtime_cache)
+
+    first = session.run(_current_loop_and_thread())
+    second = get_session(runtime_cache).run(_current_loop_and_thread())
+    close_session(runtime_cache)
+
+    assert first == second
+    assert first[1] is not threading.current_thread()
+    assert first[0].is_closed()
+    assert get_session(runtime_cache) is not session
+    close_session(runtime_cache)
+
+
+def test_chunk_reader_sends_range_requests_through_session_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """远端 bundle 的范围请求应走会话连接池，HTTP 错误转换为 DownloadError。"""
+    session = RemoteSession()
+    requests: list[tuple[str, str]] = []
+
+    def fake_get(url: str, headers: dict[str, str]) -> SimpleNamespace:
+        requests.append((url, headers["Range"]))
+        if len(requests) > 1:
+            raise HttpClientError("HTTP 状态异常: 503")
+        return SimpleNamespace(data=b"x" * 8)
+
+    monkeypatch.setattr(session.http, "get", fake_get)
+    wad_file = SimpleNamespace(chunks=[])
+    reader = _ChunkReader(wad_file, bundle_source="https://cdn.example.com/bundles/", retry_limit=1, session=session)
+
+    assert reader._read_range(0xAB, 16, 8) == b"x" * 8
+    with pytest.raises(DownloadError):
+        reader._read_range(0xAB, 16, 8)
+    assert requests[0] == ("https://cdn.example.com/bundles/00000000000000AB.bundle", "bytes=16-23")
+    assert session.stats.range_requests == len(requests)
+    assert session.stats.failures == 1
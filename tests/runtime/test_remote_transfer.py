@@ -0,0 +1,174 @@
+"""验证 remote 下载的自适应并发与传输统计。"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path, PurePosixPath
+from types import SimpleNamespace
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+from riotmanifest import DownloadError
+
+import lol_audio_unpack.runtime.remote.lcu as m_lcu
+import lol_audio_unpack.runtime.remote.transfer as m_transfer
+from lol_audio_unpack.runtime.remote.session import SESSION_KEY, RemoteSession, close_session
+from lol_audio_unpack.utils.run_summary import get_or_create_run_summary
+
+pytestmark = pytest.mark.unit
+
+FILE_SIZE = 64 * 1024
+FILES_PER_BATCH = 24
+BATCH_COUNT = 3
+# 每个请求在服务端固定等待，单连接吞吐受限，总吞吐随并发上升
+REQUEST_DELAY_SECONDS = 0.02
+MIN_LIMIT = 1
+MAX_LIMIT = 8
+FAILED_REQUESTS = 2
+
+
+class _ThrottledHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        time.sleep(REQUEST_DELAY_SECONDS)
+        with self.server.lock:
+            failing = self.server.fail_requests > 0
+            self.server.fail_requests -= int(failing)
+        if failing:
+            self.send_error(503)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(FILE_SIZE))
+        self.end_headers()
+        self.wfile.write(b"b" * FILE_SIZE)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def stand_in_server() -> Iterator[ThreadingHTTPServer]:
+    """本地限速替身 CDN：每个请求固定延迟，可按次数注入 503。"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottledHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.fail_requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class _StandInManifest:
+    """按 ``concurrency_limit`` 并发请求替身服务器的 manifest。"""
+
+    def __init__(self, root: Path, base_url: str) -> None:
+        self.root = root
+        self.base_url = base_url
+        self.limits: list[int] = []
+
+    def file_output(self, file: SimpleNamespace) -> str:
+        return str(self.root / PurePosixPath(file.name))
+
+    def _fetch(self, file: SimpleNamespace) -> int:
+        with urlopen(f"{self.base_url}/{file.name}") as response:  # noqa: S310
+            data = response.read()
+        Path(self.file_output(file)).write_bytes(data)
+        return len(data)
+
+    async def download_files_concurrently(self, files, concurrency_limit, raise_on_error, progress_callback):  # noqa: ANN001, ARG002
+        self.limits.append(concurrency_limit)
+        semaphore = asyncio.Semaphore(concurrency_limit)
+
+        async def fetch(file: SimpleNamespace) -> int | None:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self._fetch, file)
+                except HTTPError:
+                    return None
+
+        results = await asyncio.gather(*(fetch(file) for file in files))
+        failed = sum(result is None for result in results)
+        progress_callback(SimpleNamespace(finished_bytes=sum(r or 0 for r in results), failed_jobs=failed))
+        if failed:
+            raise DownloadError(f"{failed} 个文件下载失败")
+
+
+def _files(prefix: str, count: int) -> list[SimpleNamespace]:
+    return [SimpleNamespace(name=f"{prefix}/{index}.bin", size=FILE_SIZE, chunks=[]) for index in range(count)]
+
+
+@pytest.fixture
+def small_samples(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(m_lcu, "ADAPTIVE_BATCH_BYTES", FILE_SIZE * FILES_PER_BATCH)
+    monkeypatch.setattr(m_transfer, "MIN_SAMPLE_BYTES", FILE_SIZE)
+    monkeypatch.setattr(m_transfer, "MIN_SAMPLE_SECONDS", 0.0)
+
+
+@pytest.mark.usefixtures("small_samples")
+def test_adaptive_download_grows_concurrency_and_reports_stats(
+    tmp_path: Path,
+    stand_in_server: ThreadingHTTPServer,
+) -> None:
+    """吞吐随并发上升时逐批加大并发，统计写入运行总结。"""
+    session = RemoteSession(download_concurrency=(MIN_LIMIT, MAX_LIMIT))
+    runtime_cache: dict = {SESSION_KEY: session}
+    manifest = _StandInManifest(tmp_path, f"http://127.0.0.1:{stand_in_server.server_address[1]}")
+
+    m_lcu.ensure_files_downloaded(
+        manifest,
+        _files("lcu", FILES_PER_BATCH * BATCH_COUNT),
+        run_coroutine_sync=asyncio.run,
+        session=session,
+    )
+    close_session(runtime_cache)
+
+    assert len(manifest.limits) == BATCH_COUNT
+    assert manifest.limits[-1] > manifest.limits[0]
+    assert all(MIN_LIMIT <= limit <= MAX_LIMIT for limit in manifest.limits)
+    assert session.stats.downloaded_bytes == FILE_SIZE * FILES_PER_BATCH * BATCH_COUNT
+    assert session.stats.batches == BATCH_COUNT
+    notes = get_or_create_run_summary(runtime_cache).stages["remote_workflow"].notes
+    assert len(notes) == 1
+    assert "MB/s" in notes[0]
+    assert f"并发 {MIN_LIMIT}-{MAX_LIMIT}" in notes[0]
+
+
+@pytest.mark.usefixtures("small_samples")
+def test_adaptive_download_halves_concurrency_on_failures(
+    tmp_path: Path,
+    stand_in_server: ThreadingHTTPServer,
+) -> None:
+    """批次内出现失败时下一批并发减半，失败计入统计。"""
+    session = RemoteSession(download_concurrency=(MIN_LIMIT, MAX_LIMIT))
+    manifest = _StandInManifest(tmp_path, f"http://127.0.0.1:{stand_in_server.server_address[1]}")
+    stand_in_server.fail_requests = FAILED_REQUESTS
+    initial = session.concurrency.current
+
+    with pytest.raises(DownloadError):
+        m_lcu.ensure_files_downloaded(
+            manifest,
+            _files("lcu", FILES_PER_BATCH),
+            run_coroutine_sync=asyncio.run,
+            session=session,
+        )
+
+    assert session.concurrency.current == initial // 2
+    assert session.stats.failures == FAILED_REQUESTS
+
+
+def test_controller_stays_within_bounds() -> None:
+    """持续提升的吞吐不会让并发超过上限，连续失败不会低于下限。"""
+    controller = m_transfer.AdaptiveConcurrency(min_limit=MIN_LIMIT, max_limit=MAX_LIMIT)
+    sample_bytes = m_transfer.MIN_SAMPLE_BYTES
+    for step in range(1, 20):
+        controller.update(downloaded_bytes=sample_bytes * 2**step, elapsed_seconds=1.0)
+    assert controller.current == MAX_LIMIT
+
+    for _ in range(10):
+        controller.update(downloaded_bytes=0, elapsed_seconds=1.0, failures=1)
+    assert controller.current == MIN_LIMIT
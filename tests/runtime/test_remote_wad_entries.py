@@ -0,0 +1,118 @@
+"""验证按条目准备远端 WAD 的行为。"""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import pyzstd
+from league_tools.formats import WAD
+from league_tools.formats.wad.builder import WADBuilder
+
+from lol_audio_unpack.runtime.remote.wad_entries import WAD_RAW_ENTRY_TYPE, build_partial_wad
+
+pytestmark = pytest.mark.unit
+
+CHUNK_SIZE = 1024
+BUNDLE_ID = 0x1234
+
+
+def _stand_in_cdn(bundle_dir: Path, wad_bytes: bytes) -> SimpleNamespace:
+    """把 WAD 切成 chunk 写进本地 bundle 目录，返回与 ``PatcherFile`` 同形的对象。"""
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    chunks = []
+    bundle = bytearray()
+    for chunk_id, start in enumerate(range(0, len(wad_bytes), CHUNK_SIZE)):
+        compressed = pyzstd.compress(wad_bytes[start : start + CHUNK_SIZE])
+        chunks.append(
+            SimpleNamespace(
+                chunk_id=chunk_id,
+                bundle=SimpleNamespace(bundle_id=BUNDLE_ID),
+                offset=len(bundle),
+                size=len(compressed),
+                target_size=len(wad_bytes[start : start + CHUNK_SIZE]),
+            )
+        )
+        bundle += compressed
+    (bundle_dir / f"{BUNDLE_ID:016X}.bundle").write_bytes(bundle)
+    return SimpleNamespace(
+        name="DATA/FINAL/Champions/Annie.wad.client",
+        size=len(wad_bytes),
+        chunks=chunks,
+        chunk_hash_types={},
+        manifest=SimpleNamespace(bundle_url=str(bundle_dir), validate_chunk_hash=lambda **_: None),
+    )
+
+
+def _entries() -> dict[str, bytes]:
+    return {
+        "assets/sounds/annie_vo_events.bnk": os.urandom(3000),
+        "assets/sounds/annie_vo_audio.wpk": os.urandom(6000),
+        "assets/sounds/annie_sfx_events.bnk": os.urandom(3000),
+    }
+
+
+def test_build_partial_wad_downloads_only_chunks_covering_requested_entries(tmp_path: Path) -> None:
+    """只应下载头部与目标条目所在的 chunk，写出的 WAD 仅包含目标条目。"""
+    entries = _entries()
+    builder = WADBuilder()
+    for path, data in entries.items():
+        builder.add(path, data)
+    wad_file = _stand_in_cdn(tmp_path / "cdn", builder.to_bytes())
+    output_path = tmp_path / "game" / "Annie.wad.client"
+
+    result = build_partial_wad(
+        wad_file,
+        ["assets/sounds/annie_vo_events.bnk", "assets/sounds/missing.bnk"],
+        output_path=output_path,
+    )
+
+    assert result.entry_count == 1
+    assert result.missing_paths == ("assets/sounds/missing.bnk",)
+    assert result.chunk_count < len(wad_file.chunks)
+    assert result.downloaded_bytes < sum(chunk.size for chunk in wad_file.chunks)
+    wad = WAD(output_path)
+    assert len(wad.files) == 1
+    assert wad.extract(["assets/sounds/annie_vo_events.bnk"], raw=True) == [
+        entries["assets/sounds/annie_vo_events.bnk"]
+    ]
+
+
+def test_build_partial_wad_keeps_entries_from_previous_partial_wad(tmp_path: Path) -> None:
+    """同一精简 WAD 再次准备时应保留之前写入、本次未请求的条目。"""
+    entries = _entries()
+    builder = WADBuilder()
+    for path, data in entries.items():
+        builder.add(path, data)
+    wad_file = _stand_in_cdn(tmp_path / "cdn", builder.to_bytes())
+    output_path = tmp_path / "game" / "Annie.wad.client"
+
+    build_partial_wad(wad_file, ["assets/sounds/annie_vo_events.bnk"], output_path=output_path)
+    result = build_partial_wad(wad_file, ["assets/sounds/annie_vo_audio.wpk"], output_path=output_path)
+
+    paths = ["assets/sounds/annie_vo_events.bnk", "assets/sounds/annie_vo_audio.wpk"]
+    assert result.entry_count == len(paths)
+    assert WAD(output_path).extract(paths, raw=True) == [entries[path] for path in paths]
+
+
+@pytest.mark.parametrize("shared_hints", [True, False])
+def test_carried_entries_keep_uncompressed_storage(tmp_path: Path, shared_hints: bool) -> None:
+    """合并旧条目时 bnk/wpk 仍按未压缩方式存储；无路径记录时沿用原有存储方式。"""
+    entries = _entries()
+    builder = WADBuilder()
+    for path, data in entries.items():
+        builder.add(path, data)
+    wad_file = _stand_in_cdn(tmp_path / "cdn", builder.to_bytes())
+    output_path = tmp_path / "game" / "Annie.wad.client"
+    name_hints: dict[int, str] = {}
+
+    build_partial_wad(wad_file, ["assets/sounds/annie_vo_events.bnk"], output_path=output_path, name_hints=name_hints)
+    build_partial_wad(
+        wad_file,
+        ["assets/sounds/annie_vo_audio.wpk"],
+        output_path=output_path,
+        name_hints=name_hints if shared_hints else None,
+    )
+
+    assert len(name_hints) == 1 + shared_hints
+    assert [section.type & 0x0F for section in WAD(output_path).files] == [WAD_RAW_ENTRY_TYPE, WAD_RAW_ENTRY_TYPE]
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 import pytest
+from league_tools.formats.wad.builder import WADBuilder
 
 from lol_audio_unpack.runtime import wad as runtime_wad
 
@@ -28,3 +29,38 @@ def test_get_wad_reuses_cached_instance(monkeypatch: pytest.MonkeyPatch, tmp_pat
 
     assert first is second
     assert created == [wad_path]
+
+
+def test_extract_raw_timed_matches_extract_and_counts_bytes(tmp_path: Path) -> None:
+    """拆分计时的提取结果应与 ``WAD.extract(raw=True)`` 逐项一致。"""
+    payload = b"wem-data" * 512
+    builder = WADBuilder().add("a/vo.bnk", payload, compression="zstd").add("a/raw.wpk", b"raw", compression="raw")
+    wad_path = builder.save(tmp_path / "voice.wad.client")
+    wad = runtime_wad.WAD(wad_path)
+    paths = ["a/vo.bnk", "a/missing.bnk", "a/raw.wpk"]
+
+    results, timings = runtime_wad.extract_raw_timed(wad, paths)
+
+    assert results == wad.extract(paths, raw=True)
+    assert timings.decompressed_bytes == len(payload) + len(b"raw")
+    assert 0 < timings.compressed_bytes < timings.decompressed_bytes
+
+
+def test_extract_raw_timed_isolates_failed_entries(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """单个条目解压失败时该项返回 ``None``，同批其他条目照常返回。"""
+    builder = WADBuilder().add("a/bad.bnk", b"bad", compression="zstd").add("a/good.bnk", b"good", compression="zstd")
+    wad = runtime_wad.WAD(builder.save(tmp_path / "voice.wad.client"))
+    bad_hash = wad.get_hash("a/bad.bnk")
+    extract_by_section = wad.extract_by_section
+
+    def flaky_extract(section, file_path, raw=False, data=None):  # noqa: ANN001, ANN202
+        if section.path_hash == bad_hash:
+            raise OSError("磁盘读取失败")
+        return extract_by_section(section, file_path, raw=raw, data=data)
+
+    monkeypatch.setattr(wad, "extract_by_section", flaky_extract)
+
+    results, timings = runtime_wad.extract_raw_timed(wad, ["a/bad.bnk", "a/good.bnk"])
+
+    assert results == [None, b"good"]
+    assert timings.decompressed_bytes == len(b"good")
@@ -227,7 +227,7 @@ def test_mapping_execute_tasks_uses_warning_summary_for_partial_failures(
     def _fail_unpack_map(*_args, **_kwargs) -> None:
         raise RuntimeError("map boom")
 
-    reader = SimpleNamespace(write_unknown_categories=lambda: None)
+    reader = SimpleNamespace(version="15.1", write_unknown_categories=lambda: None)
 
     monkeypatch.setattr(unpack_batch, "logger", fake_logger)
     monkeypatch.setattr(unpack_batch, "unpack_champion", _fake_unpack_champion)
@@ -280,7 +280,7 @@ def test_execute_tasks_uses_warning_summary_for_partial_failures(
         raise RuntimeError("map boom")
 
     monkeypatch.setattr(mapping_batch, "logger", fake_logger)
-    monkeypatch.setattr(mapping_session, "_create_wwiser_manager", lambda _ctx: None)
+    monkeypatch.setattr(mapping_session, "_create_wwiser_manager", lambda _ctx, **_kwargs: None)
     monkeypatch.setattr(mapping_batch, "build_champion", _fake_build_champion_mapping)
     monkeypatch.setattr(mapping_batch, "build_map", _fail_build_map_mapping)
 
@@ -0,0 +1,97 @@
+"""解包预演估算测试。"""
+
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from types import SimpleNamespace
+
+from league_tools.formats.wad.builder import WADBuilder
+
+from lol_audio_unpack.model import AudioEntityData
+from lol_audio_unpack.unpack.plan import ExtractPlan, load_throughput_history, plan_entity
+
+WPK_WEM_COUNT = 3
+BNK_MEDIA = {11: b"a" * 40, 12: b"b" * 60}
+SFX_CONTAINERS = ["sfx/annie_events.bnk", "sfx/annie_audio.bnk", "sfx/missing.bnk"]
+DISK_WRITE_BYTES = 1_000
+DISK_WRITE_COUNT = 10
+
+
+def _build_bnk(media: dict[int, bytes]) -> bytes:
+    header = b"BKHD" + struct.pack("<I", 8) + b"\0" * 8
+    index = b"".join(struct.pack("<III", wem_id, 0, len(data)) for wem_id, data in media.items())
+    payload = b"".join(media.values())
+    return (
+        header + b"DIDX" + struct.pack("<I", len(index)) + index + b"DATA" + struct.pack("<I", len(payload)) + payload
+    )
+
+
+def _build_wpk(count: int) -> bytes:
+    return b"r3d2" + struct.pack("<II", 1, count) + b"\0" * (4 * count) + b"x" * 100
+
+
+def test_plan_entity_reads_raw_container_headers(tmp_path: Path) -> None:
+    """未压缩容器按头部精确统计，压缩容器只计字节并标记为估算。"""
+    media_bnk = _build_bnk(BNK_MEDIA)
+    WADBuilder().add("vo/annie.wpk", _build_wpk(WPK_WEM_COUNT), compression="raw").save(
+        tmp_path / "Game" / "zh.wad.client"
+    )
+    (
+        WADBuilder()
+        .add("sfx/annie_audio.bnk", media_bnk, compression="raw")
+        .add("sfx/annie_events.bnk", b"BKHD" + struct.pack("<I", 0) + b"HIRC" * 64, compression="zstd")
+        .save(tmp_path / "Game" / "root.wad.client")
+    )
+    entity = AudioEntityData(
+        entity_id="1",
+        entity_name="安妮",
+        entity_alias="annie",
+        entity_title="黑暗之女",
+        entity_type="champion",
+        sub_entities={
+            "1000": {
+                "name": "基础皮肤",
+                "categories": {
+                    "VO_Base": [["vo/annie.wpk"]],
+                    "SFX_Base": [SFX_CONTAINERS],
+                },
+            }
+        },
+        wad_root="Game/root.wad.client",
+        wad_language="Game/zh.wad.client",
+    )
+    reader = SimpleNamespace(version="15.1", get_audio_type=lambda category: category.split("_")[0])
+    ctx = SimpleNamespace(exclude_types=(), game_path=tmp_path)
+
+    plan = plan_entity(entity, reader, ctx=ctx)
+
+    # VO 的 WPK 加上 SFX 的三个容器；缺失与压缩存储的各一个
+    assert plan.containers == 1 + len(SFX_CONTAINERS)
+    assert plan.missing_containers == 1
+    assert plan.estimated_containers == 1
+    assert plan.projected_wem_count == WPK_WEM_COUNT + len(BNK_MEDIA)
+    assert plan.compressed_bytes < plan.uncompressed_bytes
+
+
+def test_throughput_history_skips_incomplete_runs(tmp_path: Path) -> None:
+    """估算耗时只采用完整结束的运行，并按读取吞吐量折算。"""
+    phases = {
+        "wad_read": {"duration_ms": 10, "bytes": 2_000_000, "count": 2},
+        "disk_write": {"duration_ms": 5, "bytes": DISK_WRITE_BYTES, "count": DISK_WRITE_COUNT},
+    }
+    done = tmp_path / "15.1" / "_run_20260101_000000.jsonl"
+    done.parent.mkdir(parents=True)
+    done.write_text(json.dumps({"kind": "run_end", "duration_ms": 1000, "phases": phases}) + "\n", encoding="utf-8")
+    partial = tmp_path / "15.2" / "_run_20260102_000000.jsonl"
+    partial.parent.mkdir(parents=True)
+    partial.write_text(json.dumps({"kind": "run_start", "metadata": {}}) + "\n", encoding="utf-8")
+
+    history = load_throughput_history(tmp_path)
+
+    assert history is not None
+    assert history.source == done
+    assert history.average_wem_bytes == DISK_WRITE_BYTES / DISK_WRITE_COUNT
+    plan = ExtractPlan(version="15.2", max_workers=2, history=history)
+    assert plan.estimated_seconds == 0
@@ -0,0 +1,87 @@
+"""运行级流式解包报告测试。"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from lol_audio_unpack.unpack.report import (
+    RunReportWriter,
+    build_run_report_path,
+    find_latest_run_report,
+    read_run_report,
+)
+from lol_audio_unpack.unpack.stats import FileProcessResult, ProcessingStatsContext
+
+ENTITY_SUCCESS_COUNTS = (1, 2, 3, 4)
+PROBED_ENTITY_ID = 3
+
+
+class _Entity:
+    def __init__(self, entity_id: str, entity_name: str) -> None:
+        self.entity_id = entity_id
+        self.entity_name = entity_name
+        self.entity_type = "champion"
+
+
+def _build_stats(entity_id: str, success: int):
+    with ProcessingStatsContext(_Entity(entity_id, f"实体{entity_id}"), "15.1", "zh_CN", ["VO"], set()) as stats:
+        for _ in range(success):
+            stats.record_file_result(1000, "基础皮肤", "VO", FileProcessResult.SUCCESS)
+    return stats
+
+
+def test_run_report_writer_appends_entities_and_totals(tmp_path: Path) -> None:
+    path = tmp_path / "15.1" / "_run_20250101_000000.jsonl"
+    writer = RunReportWriter(path, game_version="15.1", language="zh_CN", included_types=["VO"])
+
+    with writer:
+        threads = [
+            threading.Thread(target=writer.append_entity, args=(_build_stats(str(i), i),))
+            for i in ENTITY_SUCCESS_COUNTS
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    report = read_run_report(path)
+
+    assert report.completed
+    assert report.metadata["gameVersion"] == "15.1"
+    assert len(report.entities) == len(ENTITY_SUCCESS_COUNTS)
+    assert report.totals["entities"] == len(ENTITY_SUCCESS_COUNTS)
+    assert report.totals["total_success"] == sum(ENTITY_SUCCESS_COUNTS)
+    assert report.get_entity("champion", PROBED_ENTITY_ID)["summary"]["total_success"] == PROBED_ENTITY_ID
+    assert find_latest_run_report(tmp_path, "15.1") == path
+
+
+def test_run_report_paths_are_unique_and_never_overwritten(tmp_path: Path) -> None:
+    """同一秒内连续运行各得一份报告；文件名撞车时拒绝覆盖已有报告。"""
+    first = build_run_report_path(tmp_path, "15.1")
+    second = build_run_report_path(tmp_path, "15.1")
+    assert first != second
+    assert sorted([second, first]) == [first, second]
+
+    with RunReportWriter(first, game_version="15.1", language="zh_CN", included_types=["VO"]) as writer:
+        writer.append_entity(_build_stats("1", 1))
+    with pytest.raises(FileExistsError):
+        RunReportWriter(first, game_version="15.1", language="zh_CN", included_types=["VO"]).open()
+
+    assert read_run_report(first).completed
+
+
+def test_read_run_report_tolerates_truncated_tail(tmp_path: Path) -> None:
+    path = tmp_path / "report.jsonl"
+    writer = RunReportWriter(path, game_version="15.1", language="zh_CN", included_types=["VO"]).open()
+    writer.append_entity(_build_stats("1", 1))
+    # 模拟进程中途退出：未写 run_end，且末尾残留半行
+    writer._file.write('{"kind": "entity", "entity"')
+    writer._file.flush()
+
+    report = read_run_report(path)
+
+    assert not report.completed
+    assert len(report.entities) == 1
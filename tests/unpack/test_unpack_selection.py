@@ -0,0 +1,86 @@
+"""选择性解包过滤解析测试。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from lol_audio_unpack.app.types import ExtractFilterOptions
+from lol_audio_unpack.mapping.reverse_index import AudioRef, write_reverse_index
+from lol_audio_unpack.model import AudioEntityData
+from lol_audio_unpack.unpack.selection import (
+    _normalize_mapping_payload,
+    load_indexed_mapping,
+    resolve_entity_selection,
+    wem_id_from_name,
+)
+
+WEM_ID = 123
+
+
+def _build_entity(events: dict | None = None) -> AudioEntityData:
+    return AudioEntityData(
+        entity_id="1",
+        entity_name="安妮",
+        entity_alias="annie",
+        entity_title="黑暗之女",
+        entity_type="champion",
+        sub_entities={
+            "1000": {
+                "name": "基础皮肤",
+                "categories": {
+                    "VO_Base": [["vo_events.bnk", "vo_audio.wpk"]],
+                    "SFX_Base": [["sfx_events.bnk", "sfx_audio.bnk"]],
+                },
+            }
+        },
+        wad_root="Game/root.wad.client",
+        wad_language="Game/zh.wad.client",
+        events=events,
+    )
+
+
+MAPPING = {"1000": {"VO_Base": {"Play_vo_Attack": [11, 12], "Play_vo_Move": [13]}, "SFX_Base": {"Play_sfx_Q": [21]}}}
+
+
+def test_event_filter_uses_mapping_to_limit_categories_and_wem_ids() -> None:
+    selection = resolve_entity_selection(_build_entity(), ExtractFilterOptions(events=("play_vo_attack",)), MAPPING)
+
+    assert selection.categories == {"1000": {"VO_Base": frozenset({11, 12})}}
+
+
+def test_filters_fall_back_without_mapping() -> None:
+    entity = _build_entity(events={"1000": {"events": {"VO_Base": ["Play_vo_Attack"], "SFX_Base": ["Play_sfx_Q"]}}})
+
+    by_event = resolve_entity_selection(entity, ExtractFilterOptions(events=("Play_vo_*",)), None)
+    by_wem = resolve_entity_selection(entity, ExtractFilterOptions(wem_ids=(21,), categories=("SFX_*",)), None)
+
+    # 没有映射时事件只能缩到类别，WEM ID 只能在写出阶段过滤
+    assert by_event.categories == {"1000": {"VO_Base": None}}
+    assert by_wem.categories == {"1000": {"SFX_Base": frozenset({21})}}
+
+
+def test_integrated_mapping_payload_is_normalized() -> None:
+    payload = {"data": {"skins": [{"id": 1000, "events": {"VO_Base": {"banks": [], "mapping": {"Play": [1]}}}}]}}
+
+    assert _normalize_mapping_payload(payload) == {"1000": {"VO_Base": {"Play": [1]}}}
+    assert wem_id_from_name(f"{WEM_ID}.wem") == WEM_ID
+    assert wem_id_from_name("bad.wem") is None
+
+
+def test_wem_ids_resolve_to_categories_through_reverse_index(tmp_path: Path) -> None:
+    """反向索引把请求的 ID 定位到本实体的类别，只读取包含这些 ID 的容器。"""
+    index_path = tmp_path / "reverse_index.bin"
+    write_reverse_index(
+        [
+            (21, AudioRef("champion", "1", "annie", "1000", "SFX_Base", "Play_sfx_Q")),
+            (21, AudioRef("champion", "2", "olaf", "2000", "SFX_Base", "Play_sfx_Q")),
+            (11, AudioRef("champion", "1", "annie", "1000", "VO_Base", "Play_vo_Attack")),
+        ],
+        index_path,
+    )
+
+    mapping = load_indexed_mapping(_build_entity(), (21,), index_path)
+    selection = resolve_entity_selection(_build_entity(), ExtractFilterOptions(wem_ids=(21,)), mapping)
+
+    assert mapping == {"1000": {"SFX_Base": {"Play_sfx_Q": [21]}}}
+    assert selection.categories == {"1000": {"SFX_Base": frozenset({21})}}
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from lol_audio_unpack.unpack.stats import FileProcessResult, ProcessingStatsContext
+from lol_audio_unpack.unpack.stats import FileProcessResult, PhaseTimings, ProcessingPhase, ProcessingStatsContext
 
 
 def test_unpack_stats_module_keeps_expected_public_types() -> None:
@@ -10,3 +10,21 @@ def test_unpack_stats_module_keeps_expected_public_types() -> None:
 
     assert FileProcessResult.SUCCESS.value == "success"
     assert ProcessingStatsContext is not None
+
+
+def test_phase_timings_aggregate_and_describe_where_time_went() -> None:
+    """阶段计时应同时记到实体与子实体，并能按占比输出耗时分布。"""
+    entity = type("Entity", (), {"entity_id": "1", "entity_name": "安妮", "entity_type": "champion"})()
+    with ProcessingStatsContext(entity, "15.1", "zh_CN", ["VO"], set()) as stats:
+        stats.record_phase(ProcessingPhase.WAD_READ, 25_000_000, 100)
+        stats.record_phase(ProcessingPhase.BNK_PARSE, 35_000_000, 80, sub_id=1000, sub_name="基础皮肤")
+        stats.record_phase(ProcessingPhase.DISK_WRITE, 40_000_000, 60, sub_id=1000, sub_name="基础皮肤")
+
+    totals = PhaseTimings()
+    totals.merge(stats.phase_timings)
+    report = stats.generate_concise_report_data()["report"]
+
+    assert totals.format_breakdown() == "磁盘写入 40% · BNK 解析 35% · WAD 读取 25%"
+    assert report["phases"]["bnk_parse"] == {"duration_ms": 35.0, "bytes": 80, "count": 1}
+    assert "wad_read" not in report["sub_entities"]["基础皮肤"]["phases"]
+    assert PhaseTimings.from_dict(report["phases"]).durations_ns == totals.durations_ns
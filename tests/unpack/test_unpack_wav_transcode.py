@@ -90,6 +90,7 @@ def test_execute_tasks_keeps_extract_flow_without_wav_stage(
         *,
         ctx,
         persisted_wem_callback=None,
+        **_kwargs,
     ) -> None:
         _ = (wad_cache, cache_lock, ctx)
         events.append("extract")
@@ -108,6 +109,9 @@ def test_execute_tasks_keeps_extract_flow_without_wav_stage(
     ctx = SimpleNamespace(
         config=SimpleNamespace(dev_mode=False),
         runtime_cache={},
+        report_path=tmp_path / "reports",
+        game_region="zh_CN",
+        include_types=("VO",),
     )
 
     result = unpack_batch.execute_tasks(
@@ -124,6 +128,7 @@ def test_execute_tasks_keeps_extract_flow_without_wav_stage(
 
 
 def test_execute_tasks_emits_running_entity_progress_before_completion(
+    tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """extract 批处理应先发出当前实体的运行中进度。"""
@@ -142,6 +147,9 @@ def test_execute_tasks_emits_running_entity_progress_before_completion(
     ctx = SimpleNamespace(
         config=SimpleNamespace(dev_mode=False),
         runtime_cache={},
+        report_path=tmp_path / "reports",
+        game_region="zh_CN",
+        include_types=("VO",),
     )
 
     unpack_batch.execute_tasks(
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from lol_audio_unpack.gui.service import data_loader
+from lol_audio_unpack.manager.files import find_data_file, read_data, write_data
+from lol_audio_unpack.utils.columnar import COLUMNAR_SUFFIX, EventTable, load_columnar
+
+pytestmark = pytest.mark.unit
+
+RAW_MAPPING = {
+    "metadata": {"gameVersion": "15.1.1"},
+    "championId": "1",
+    "alias": "annie",
+    "skins": {
+        "1000": {"events": {"VO_BASE": {"Play_vo_Attack": [101, 102], "Play_vo_Move": [103]}}},
+        "1001": {"events": {"SFX_BASE": {"Play_sfx_Q": [201], "Play_vo_Attack": []}}},
+    },
+}
+
+INTEGRATED_MAPPING = {
+    "metadata": {"gameVersion": "15.1.1"},
+    "data": {
+        "alias": "annie",
+        "skins": [
+            {
+                "id": 1000,
+                "events": {"VO_BASE": {"banks": [["a_events.bnk", "a_audio.wpk"]], "mapping": {"Play_vo_A": [7, 8]}}},
+            }
+        ],
+    },
+}
+
+
+@pytest.mark.parametrize("mapping", [RAW_MAPPING, INTEGRATED_MAPPING])
+def test_columnar_round_trip_matches_nested_data(tmp_path: Path, mapping: dict) -> None:
+    write_data(mapping, tmp_path / "1", dev_mode=False, columnar=True)
+
+    assert find_data_file(tmp_path / "1", dev_mode=False) == tmp_path / f"1{COLUMNAR_SUFFIX}"
+    assert read_data(tmp_path / "1") == mapping
+
+
+def test_load_columnar_returns_lazy_event_tables(tmp_path: Path) -> None:
+    write_data(RAW_MAPPING, tmp_path / "1", dev_mode=False, columnar=True)
+
+    data = load_columnar(tmp_path / f"1{COLUMNAR_SUFFIX}")
+    table = data["skins"]["1000"]["events"]["VO_BASE"]
+
+    assert isinstance(table, EventTable)
+    assert data["metadata"] == RAW_MAPPING["metadata"]
+    assert list(table) == ["Play_vo_Attack", "Play_vo_Move"]
+    assert list(table["Play_vo_Move"]) == [103]
+    assert [(event, list(ids)) for event, ids in table.iter_rows()] == [
+        ("Play_vo_Attack", [101, 102]),
+        ("Play_vo_Move", [103]),
+    ]
+    assert "Play_sfx_Q" not in table
+
+
+def test_write_data_removes_stale_variant_when_format_changes(tmp_path: Path) -> None:
+    write_data(RAW_MAPPING, tmp_path / "1", dev_mode=False)
+    write_data(RAW_MAPPING, tmp_path / "1", dev_mode=False, columnar=True)
+
+    assert not (tmp_path / "1.msgpack").exists()
+
+    write_data(RAW_MAPPING, tmp_path / "1", dev_mode=False)
+
+    assert not (tmp_path / f"1{COLUMNAR_SUFFIX}").exists()
+    assert read_data(tmp_path / "1") == RAW_MAPPING
+
+
+def test_lazy_read_keeps_event_tables_for_gui_preview(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    write_data(INTEGRATED_MAPPING, tmp_path / "1", dev_mode=False, columnar=True)
+    mapping_path = tmp_path / f"1{COLUMNAR_SUFFIX}"
+    monkeypatch.setattr(data_loader, "resolve_mapping_file_path", lambda *_args: mapping_path)
+    loader = data_loader.EntityDataLoader.__new__(data_loader.EntityDataLoader)
+    loader.ctx = SimpleNamespace(config=SimpleNamespace(dev_mode=False))
+    loader.data_reader = SimpleNamespace(version="15.1.1")
+
+    lazy = read_data(mapping_path, lazy=True)
+    _path, preview, text = loader.load_mapping_preview("champions", "1")
+
+    assert isinstance(lazy["data"]["skins"][0]["events"]["VO_BASE"]["mapping"], EventTable)
+    table = preview["skins"]["1000"]["events"]["VO_BASE"]
+    assert isinstance(table, EventTable)
+    assert list(table["Play_vo_A"]) == [7, 8]
+    assert json.loads(text) == INTEGRATED_MAPPING